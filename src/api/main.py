@@ -1,5 +1,8 @@
 # src/api/main.py
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, PlainTextResponse, JSONResponse
 # Remova ou comente as importações dos routers específicos se for usar SÓ o genérico por agora
 # from src.databases.cassandra import api as cassandra_api
 # from src.databases.mongo import api as mongo_api
@@ -8,13 +11,59 @@ from fastapi import FastAPI
 
 # Importe o novo router genérico
 from src.api.routers.v1 import generic_router # Certifique-se que o caminho está correto
+from src.databases.conexoes import abrir_conexoes, fechar_conexoes, abrir_conexoes_async, fechar_conexoes_async
+from src.core.executores import encerrar_executores
+from src.core.db_config import MODO_DRIVER, SERVER_TIMING_ATIVO, AQUECIMENTO_ATIVO, AQUECIMENTO_EM_SEGUNDO_PLANO
+from src.api.server_timing import ServerTimingMiddleware
+from src.api.metricas import MetricasMiddleware
+from src.core.metricas import exportar_metricas
+from src.core.rastreamento import configurar_logs
+from src.services.aquecimento import aquecer_api, marcar_pronto, estado_prontidao
+
+# Nível dos logs (LOG_NIVEL): os diagnósticos dos CRUDs só aparecem em DEBUG
+configurar_logs()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Abre (uma única vez) os clientes/pools de todos os bancos, fora do event loop
+    await asyncio.to_thread(abrir_conexoes)
+    # No modo async os clientes asyncio são criados aqui, presos ao event loop da API
+    if MODO_DRIVER == "async":
+        await abrir_conexoes_async()
+    # Aquecimento: a primeira requisição real não paga conexões, prepares e planos frios
+    tarefa_aquecimento = None
+    if not AQUECIMENTO_ATIVO:
+        marcar_pronto()
+    elif AQUECIMENTO_EM_SEGUNDO_PLANO:
+        tarefa_aquecimento = asyncio.create_task(aquecer_api())
+    else:
+        await aquecer_api()
+    yield
+    if tarefa_aquecimento is not None and not tarefa_aquecimento.done():
+        tarefa_aquecimento.cancel()
+    # Encerra os executores por banco e fecha os pools ao desligar a API
+    if MODO_DRIVER == "async":
+        await fechar_conexoes_async()
+    encerrar_executores()
+    await asyncio.to_thread(fechar_conexoes)
+
 
 app = FastAPI(
     title="IMDB NoSQL API Genérica",
     description="API para testes com MongoDB, Cassandra, Neo4j e Redis, usando endpoints genéricos.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse # orjson no lugar do json da stdlib nas respostas que ainda passam pelo response_model
 )
 
+# Detalhamento do tempo de cada resposta por fase e por banco (cabeçalho Server-Timing)
+if SERVER_TIMING_ATIVO:
+    app.add_middleware(ServerTimingMiddleware)
+
+# Histogramas/contadores por rota, banco e operação, expostos em /metrics
+app.add_middleware(MetricasMiddleware)
+
 # Inclui o router genérico com um prefixo /api/v1
 app.include_router(generic_router.router, prefix="/api/v1", tags=["Operações Genéricas v1"])
 
@@ -29,4 +78,23 @@ app.include_router(generic_router.router, prefix="/api/v1", tags=["Operações G
 # Adicione um endpoint raiz simples para verificar se a API está no ar
 @app.get("/", tags=["Root"])
 async def read_root():
-    return {"message": "Bem-vindo à API Genérica IMDB NoSQL!"}
\ No newline at end of file
+    return {"message": "Bem-vindo à API Genérica IMDB NoSQL!"}
+
+
+@app.get("/health/live", tags=["Root"])
+async def vivo():
+    """O processo está no ar (não depende dos bancos nem do aquecimento)."""
+    return {"status": "vivo"}
+
+
+@app.get("/health/ready", tags=["Root"])
+async def pronto():
+    """200 só depois do aquecimento; antes disso 503, com as etapas já concluídas."""
+    estado = estado_prontidao()
+    return JSONResponse(status_code=200 if estado["pronto"] else 503, content=estado)
+
+
+@app.get("/metrics", tags=["Root"], include_in_schema=False)
+async def metricas_prometheus():
+    """Métricas no formato texto do Prometheus (latência, erros, em andamento e tamanho dos resultados)."""
+    return PlainTextResponse(exportar_metricas(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,33 @@
+# src/api/metricas.py
+"""
+Middleware ASGI que registra a duração de cada requisição HTTP (por rota, método e status) e
+deixa o escopo da requisição numa contextvar, de onde as métricas por banco tiram o rótulo endpoint.
+"""
+import time
+
+from src.core.metricas import definir_escopo_requisicao, restaurar_escopo_requisicao, endpoint_do_escopo, duracao_requisicao
+
+
+class MetricasMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = definir_escopo_requisicao(scope)
+        inicio = time.perf_counter()
+        status = "500" # Se a aplicação estourar antes de responder
+
+        async def enviar_com_status(mensagem):
+            nonlocal status
+            if mensagem["type"] == "http.response.start":
+                status = str(mensagem["status"])
+            await send(mensagem)
+
+        try:
+            await self.app(scope, receive, enviar_com_status)
+        finally:
+            duracao_requisicao.observar(time.perf_counter() - inicio, endpoint_do_escopo(scope), scope["method"], status)
+            restaurar_escopo_requisicao(token)
@@ -1,28 +1,221 @@
 # src/api/routers/v1/generic_router.py
-from fastapi import APIRouter, Query, HTTPException, Path, Body
-from typing import List, Optional, Dict, Any, Union # Adicionado Union
+import hashlib
+import logging
+import os
+from fastapi import APIRouter, Query, HTTPException, Path, Body, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Dict, Any, Set, Union, AsyncIterator # Adicionado Union
+import orjson
+import time
 
 from src.models.api_models import (
     FiltrosBuscaAvancadaPayload, FilmePayload, CarregarBasePayload,
-    AtualizarFilmePayload,
+    AtualizarFilmePayload, AtualizarCamposFilmePayload, BuscarFilmesPorIdsPayload, InserirFilmesLotePayload,
+    AtualizarFilmesPorFiltroPayload, RemoverFilmesPorFiltroPayload, ExecutarLotePayload, ConsultaFederadaPayload,
     FilmeResponse, AtorResponse, ContagemPorAnoResponse, MediaGeneroResponse, OperacaoStatusResponse
 )
 from src.services.query_service import (
     servico_geral_busca_avancada_filmes,
     servico_geral_carregar_base,
     servico_geral_inserir_filme,
+    servico_inserir_filmes_em_lote,
     servico_buscar_detalhes_filme,
+    servico_buscar_filmes_por_ids,
     servico_buscar_atores_de_filme,
     servico_atualizar_filme,
+    servico_atualizar_campos_filme,
     servico_remover_filme,
+    servico_atualizar_filmes_por_filtro,
+    servico_remover_filmes_por_filtro,
     servico_listar_filmes_por_ator,
     servico_contar_filmes_por_ano,
-    servico_media_notas_por_genero
+    servico_media_notas_por_genero,
+    servico_estatisticas_cache,
+    servico_estado_disjuntores,
+    servico_estado_roteamento,
+    servico_transmitir_busca_avancada,
+    servico_transmitir_filmes_por_ator,
+    servico_paginar_busca_avancada,
+    servico_paginar_filmes_por_ator,
+    servico_transmitir_por_banco,
+    servico_versao_dados
 )
+from src.services.operacoes_lote import servico_executar_lote
+from src.services.planejador_federado import servico_consulta_federada
 from src.utils.responses import tratar_erros, resposta_sucesso
+from src.utils.serializacao import serializar_lista, serializar_item, resposta_rapida
+from src.core.projecao import normalizar_campos
+from src.core.exceptions import DataValidationError
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Operações Genéricas v1"])
 
+# Alvos em que o serviço escolhe o banco e devolve {"banco_vencedor": ..., "data": ...}
+ALVOS_COM_VENCEDOR = ("mais_rapido", "auto")
+
+def _resposta_mais_rapido(resultado_servico: Dict[str, Any], dados_formatados: Any, descricao: str):
+    """
+    Envelopa a resposta de banco=mais_rapido (qual banco respondeu primeiro) ou de banco=auto
+    (para qual banco a operação foi roteada e por quê: p95, exploracao, poucas_amostras, alternativa).
+    """
+    banco_vencedor = resultado_servico["banco_vencedor"]
+    if "criterio" in resultado_servico:
+        return resposta_rapida(resposta_sucesso(
+            mensagem=f"{descricao} roteada para '{banco_vencedor}' ({resultado_servico['criterio']}).",
+            dados={"banco_vencedor": banco_vencedor, "criterio": resultado_servico["criterio"], "data": dados_formatados}
+        ))
+    return resposta_rapida(resposta_sucesso(
+        mensagem=f"{descricao} respondida primeiro por '{banco_vencedor}'.",
+        dados={"banco_vencedor": banco_vencedor, "data": dados_formatados}
+    ))
+
+def _formatar_por_banco(resultados_servico: Dict[str, Any], modelo, campos_saida: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Formata o "data" de cada banco no modo "todos"; erros ou estruturas inesperadas passam como estão."""
+    resposta_formatada_todos: Dict[str, Any] = {}
+    for nome_banco_chave, res_banco in resultados_servico.items():
+        if "data" in res_banco and isinstance(res_banco["data"], list):
+            resposta_formatada_todos[nome_banco_chave] = {
+                "data": serializar_lista(modelo, res_banco["data"], campos=campos_saida),
+                "message": res_banco.get("message", "")
+            }
+        else: # Caso de erro ou estrutura inesperada para um banco específico no modo "todos"
+            resposta_formatada_todos[nome_banco_chave] = res_banco
+    return resposta_formatada_todos
+
+DESCRICAO_CAMPOS = (
+    "Campos do filme a devolver, separados por vírgula (ex.: titulo,nota). O id vem sempre; "
+    "sem o parâmetro, todos os campos."
+)
+
+def _ler_campos(campos: Optional[str]) -> Optional[List[str]]:
+    """Valida o parâmetro `campos` (400 se houver campo desconhecido)."""
+    try:
+        return normalizar_campos(campos)
+    except DataValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def _campos_saida(campos: Optional[List[str]]) -> Optional[List[str]]:
+    """Campos do FilmeResponse mantidos na resposta: o id e os pedidos (None = todos)."""
+    return None if campos is None else ["id", *campos]
+
+MIDIA_NDJSON = "application/x-ndjson"
+
+def _pediu_ndjson(request: Request) -> bool:
+    """True se o cliente pediu streaming (Accept: application/x-ndjson)."""
+    return MIDIA_NDJSON in request.headers.get("accept", "")
+
+async def _linhas_ndjson(lotes: AsyncIterator[List[Dict[str, Any]]], campos_saida: Optional[List[str]] = None) -> AsyncIterator[bytes]:
+    """
+    Serializa cada lote de filmes como linhas JSON (um FilmeResponse por linha).
+    Um erro depois do início da resposta não pode mais mudar o status HTTP: vira uma
+    última linha {"error": ...}.
+    """
+    try:
+        async for lote in lotes:
+            filmes = serializar_lista(FilmeResponse, lote, por_alias=True, campos=campos_saida)
+            yield b"".join(orjson.dumps(filme) + b"\n" for filme in filmes)
+    except Exception as e:
+        detalhe = e.detail if isinstance(e, HTTPException) else str(e)
+        yield orjson.dumps({"error": detalhe}) + b"\n"
+
+def _resposta_ndjson(lotes: AsyncIterator[List[Dict[str, Any]]], campos_saida: Optional[List[str]] = None) -> StreamingResponse:
+    return StreamingResponse(_linhas_ndjson(lotes, campos_saida), media_type=MIDIA_NDJSON)
+
+MIDIA_SSE = "text/event-stream"
+
+def _pediu_sse(request: Request) -> bool:
+    """True se o cliente pediu entrega progressiva por banco (Accept: text/event-stream)."""
+    return MIDIA_SSE in request.headers.get("accept", "")
+
+async def _eventos_sse(resultados: AsyncIterator[Dict[str, Any]], modelo, campos_saida: Optional[List[str]] = None) -> AsyncIterator[bytes]:
+    """
+    Um evento "banco" por banco, na ordem em que terminam ({"banco", "status_code", "duracao_ms",
+    "data"/"error"}, com "data" no formato do modo "todos"), e um evento "fim" com a duração total.
+    """
+    inicio = time.perf_counter()
+    async for resultado in resultados:
+        if "data" in resultado:
+            resultado["data"] = serializar_lista(modelo, resultado["data"], campos=campos_saida)
+        yield b"event: banco\ndata: " + orjson.dumps(resultado) + b"\n\n"
+    yield b"event: fim\ndata: " + orjson.dumps({"duracao_total_ms": round((time.perf_counter() - inicio) * 1000, 3)}) + b"\n\n"
+
+def _resposta_sse(resultados: AsyncIterator[Dict[str, Any]], modelo, campos_saida: Optional[List[str]] = None) -> StreamingResponse:
+    # X-Accel-Buffering: proxies como o nginx não seguram os eventos até o fim da resposta
+    return StreamingResponse(
+        _eventos_sse(resultados, modelo, campos_saida), media_type=MIDIA_SSE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# Os contadores de versão recomeçam do zero a cada inicialização: a instância entra na ETag
+# para que uma ETag de antes do reinício nunca confira com dados que podem ter mudado.
+# A versão (e o cache de resultados) é do processo: ETags e cache pressupõem um único worker
+# do uvicorn. Com vários workers, uma escrita só muda a versão do worker que a atendeu.
+_INSTANCIA_ETAG = os.urandom(8).hex()
+
+def _etag_leitura(request: Request, banco: str) -> Optional[str]:
+    """
+    ETag forte de uma leitura: muda com a versão dos dados dos bancos lidos (toda escrita),
+    com o caminho/parâmetros da requisição e com o reinício da API. None para mais_rapido e
+    auto, cuja resposta depende do banco escolhido na hora.
+    """
+    versao = servico_versao_dados(banco)
+    if versao is None:
+        return None
+    base = f"{_INSTANCIA_ETAG}|{request.url.path}|{sorted(request.query_params.multi_items())}|{versao}"
+    return '"' + hashlib.blake2b(base.encode(), digest_size=12).hexdigest() + '"'
+
+def _etags_pedidas(request: Request) -> Set[str]:
+    # Para If-None-Match a comparação é fraca: W/"x" confere com "x"
+    pedidas = request.headers.get("if-none-match") or ""
+    return {valor.strip().removeprefix("W/") for valor in pedidas.split(",") if valor.strip()}
+
+def _resposta_304(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+def _nao_modificado(request: Request, etag: Optional[str]) -> Optional[Response]:
+    """
+    304 (sem consultar o banco) se o If-None-Match do cliente confere com a ETag atual.
+    "*" não vale aqui: só confere depois que o recurso foi encontrado (ver _com_etag).
+    """
+    if etag is not None and etag in _etags_pedidas(request):
+        return _resposta_304(etag)
+    return None
+
+def _com_etag(request: Request, resposta: Response, etag: Optional[str]) -> Response:
+    """
+    Anexa a ETag (no-cache: o cliente pode guardar, mas revalida a cada uso). Com a
+    representação em mãos, If-None-Match: * vira 304; recurso inexistente já saiu como 404.
+    """
+    if etag is None:
+        return resposta
+    if "*" in _etags_pedidas(request):
+        return _resposta_304(etag)
+    resposta.headers["ETag"] = etag
+    resposta.headers["Cache-Control"] = "no-cache"
+    return resposta
+
+def _todos_sem_erro(resultados_por_banco: Dict[str, Any]) -> bool:
+    """No modo "todos" só recebe ETag a resposta em que todos os bancos responderam normalmente."""
+    return all(
+        isinstance(res, dict) and "error" not in res and not res.get("degradado")
+        for res in resultados_por_banco.values()
+    )
+
+def _resposta_pagina(pagina: Dict[str, Any], descricao: str, campos_saida: Optional[List[str]] = None):
+    """
+    Envelopa uma página da paginação por cursor: filmes, token da próxima página (null na
+    última) e a ordem real das páginas (no Cassandra, a da chave, não a de ordenar_por).
+    """
+    return resposta_rapida(resposta_sucesso(
+        mensagem=f"{descricao}: página com {len(pagina['data'])} filmes.",
+        dados={
+            "data": serializar_lista(FilmeResponse, pagina["data"], campos=campos_saida),
+            "proximo_cursor": pagina["proximo_cursor"],
+            "ordenacao": pagina["ordenacao"]
+        }
+    ))
+
 # --- Endpoints "Gerais" (já lidam com "todos" e retornam Dict[str, Any]) ---
 # src/api/routers/v1/generic_router.py
 # ... (imports, certifique-se que Union está em typing) ...
@@ -32,45 +225,63 @@ router = APIRouter(tags=["Operações Genéricas v1"])
             tags=["Busca Avançada"]) # Melhor tag
 @tratar_erros
 async def endpoint_busca_avancada_filmes_generico(
+    request: Request,
     filtros: FiltrosBuscaAvancadaPayload,
-    banco: str = Query("todos", enum=["mongo", "cassandra", "neo4j", "redis", "todos"])
+    banco: str = Query("todos", enum=["mongo", "cassandra", "neo4j", "redis", "todos", "mais_rapido", "auto"]),
+    tamanho_pagina: Optional[int] = Query(None, ge=1, le=500, description="Ativa a paginação por cursor (apenas banco específico)."),
+    cursor: Optional[str] = Query(None, description="Token 'proximo_cursor' devolvido pela página anterior."),
+    campos: Optional[str] = Query(None, description=DESCRICAO_CAMPOS)
 ):
+    lista_campos = _ler_campos(campos)
+    campos_saida = _campos_saida(lista_campos)
+    if _pediu_sse(request):
+        # Entrega progressiva: o resultado de cada banco sai assim que ele termina
+        return _resposta_sse(servico_transmitir_por_banco(
+            banco, "busca avançada", lambda nome: servico_geral_busca_avancada_filmes(filtros, nome, lista_campos)
+        ), FilmeResponse, campos_saida)
+    if _pediu_ndjson(request):
+        # Streaming: um filme por linha, lido do banco em lotes (apenas banco específico)
+        return _resposta_ndjson(
+            await servico_transmitir_busca_avancada(filtros=filtros, banco_alvo=banco, campos=lista_campos), campos_saida
+        )
+    if tamanho_pagina is not None or cursor is not None:
+        pagina = await servico_paginar_busca_avancada(
+            filtros=filtros, banco_alvo=banco, tamanho_pagina=tamanho_pagina, cursor=cursor, campos=lista_campos
+        )
+        return _resposta_pagina(pagina, "Busca avançada", campos_saida)
+
     # O serviço servico_geral_busca_avancada_filmes agora retorna:
     # - List[Dict[str, Any]] (lista de filmes) se banco_alvo != "todos"
     # - Dict[str, Any] (com resultados por banco) se banco_alvo == "todos"
-    resultados_servico = await servico_geral_busca_avancada_filmes(filtros=filtros, banco_alvo=banco)
+    # - {"banco_vencedor": ..., "data": [...]} se banco_alvo == "mais_rapido" ou "auto"
+    resultados_servico = await servico_geral_busca_avancada_filmes(filtros=filtros, banco_alvo=banco, campos=lista_campos)
     
+    if banco.lower() in ALVOS_COM_VENCEDOR:
+        return _resposta_mais_rapido(
+            resultados_servico, serializar_lista(FilmeResponse, resultados_servico["data"], campos=campos_saida),
+            "Busca avançada"
+        )
     if banco.lower() != "todos":
         # Para banco único, o serviço retorna a lista de dicionários de filmes diretamente.
         # Precisamos converter para List[FilmeResponse].
         if not isinstance(resultados_servico, list):
             # Se o serviço não retornou uma lista como esperado (ex: um erro não pego que virou dict)
-            print(f"ERRO ROUTER (Busca Avançada Banco Único): Esperava lista do serviço, recebeu {type(resultados_servico)}")
+            logger.error("ERRO ROUTER (Busca Avançada Banco Único): Esperava lista do serviço, recebeu %s", type(resultados_servico))
             if isinstance(resultados_servico, dict) and "error" in resultados_servico: # Checa se é um dict de erro
                 raise HTTPException(status_code=resultados_servico.get("status_code_interno", 500), detail=resultados_servico["error"])
             raise HTTPException(status_code=500, detail="Resposta inesperada do serviço para busca avançada em banco único.")
         
-        # Retorna a lista de FilmeResponse diretamente
-        return [FilmeResponse(**filme) for filme in resultados_servico]
+        # Retorna a lista no formato de FilmeResponse (por alias, como o response_model fazia)
+        return resposta_rapida(serializar_lista(FilmeResponse, resultados_servico, por_alias=True, campos=campos_saida))
     else:
         # Para "todos", o serviço retorna Dict[str, Dict[str, Union[List,str]]]
         # (Ex: {"mongo": {"data": [lista_filmes_mongo], "message": "..."}, ...})
         # Precisamos formatar o "data" interno de cada banco para List[FilmeResponse] (serializado)
         # e então envelopar com resposta_sucesso.
-        resposta_formatada_todos: Dict[str, Any] = {}
-        for nome_banco_chave, res_banco in resultados_servico.items(): # resultados_servico é o dict de bancos
-            if "data" in res_banco and isinstance(res_banco["data"], list):
-                resposta_formatada_todos[nome_banco_chave] = {
-                    "data": [FilmeResponse(**filme).model_dump() for filme in res_banco["data"]],
-                    "message": res_banco.get("message", "")
-                }
-            else: # Caso de erro ou estrutura inesperada para um banco específico no modo "todos"
-                resposta_formatada_todos[nome_banco_chave] = res_banco 
-        
-        return resposta_sucesso(
+        return resposta_rapida(resposta_sucesso(
             mensagem=f"Busca avançada para '{banco}' processada.",
-            dados=resposta_formatada_todos # O payload "dados" da resposta_sucesso será o dict dos bancos
-        )
+            dados=_formatar_por_banco(resultados_servico, FilmeResponse, campos_saida) # O payload "dados" da resposta_sucesso será o dict dos bancos
+        ))
 
 # --- Endpoint de Listagem de Filmes por Ator (MODIFICADO para "todos") ---
 @router.get("/atores/{id_ator}/filmes",
@@ -78,12 +289,35 @@ async def endpoint_busca_avancada_filmes_generico(
             tags=["Atores", "Filmes"])
 @tratar_erros
 async def endpoint_listar_filmes_por_ator(
+    request: Request,
     id_ator: str = Path(..., min_length=1, description="O ID (_id) do ator."),
-    banco: str = Query("mongo", enum=["mongo", "cassandra", "neo4j", "redis", "todos"]),
+    banco: str = Query("mongo", enum=["mongo", "cassandra", "neo4j", "redis", "todos", "mais_rapido", "auto"]),
     ordenar_por: Optional[str] = Query("nota", description="Campo para ordenação dos filmes."),
     ordem: Optional[int] = Query(-1, description="Ordem: 1 para ASC, -1 para DESC."),
-    limite: Optional[int] = Query(100, ge=1, le=1000)
+    limite: Optional[int] = Query(100, ge=1, le=1000),
+    tamanho_pagina: Optional[int] = Query(None, ge=1, le=500, description="Ativa a paginação por cursor (apenas banco específico)."),
+    cursor: Optional[str] = Query(None, description="Token 'proximo_cursor' devolvido pela página anterior."),
+    campos: Optional[str] = Query(None, description=DESCRICAO_CAMPOS)
 ):
+    lista_campos = _ler_campos(campos)
+    campos_saida = _campos_saida(lista_campos)
+    if _pediu_sse(request):
+        return _resposta_sse(servico_transmitir_por_banco(
+            banco, "listar filmes por ator",
+            lambda nome: servico_listar_filmes_por_ator(id_ator, nome, ordenar_por, ordem, limite, lista_campos)
+        ), FilmeResponse, campos_saida)
+    if _pediu_ndjson(request):
+        return _resposta_ndjson(await servico_transmitir_filmes_por_ator(
+            identificador_ator=id_ator, banco_alvo=banco, ordenar_por=ordenar_por, ordem=ordem, limite=limite,
+            campos=lista_campos
+        ), campos_saida)
+    if tamanho_pagina is not None or cursor is not None:
+        pagina = await servico_paginar_filmes_por_ator(
+            identificador_ator=id_ator, banco_alvo=banco, ordenar_por=ordenar_por, ordem=ordem,
+            tamanho_pagina=tamanho_pagina, cursor=cursor, campos=lista_campos
+        )
+        return _resposta_pagina(pagina, f"Filmes do ator '{id_ator}'", campos_saida)
+
     # O serviço servico_listar_filmes_por_ator retorna:
     # - List[Dict[str, Any]] se banco != "todos"
     # - Dict[str, Any] (com resultados por banco) se banco == "todos"
@@ -92,36 +326,31 @@ async def endpoint_listar_filmes_por_ator(
         banco_alvo=banco, 
         ordenar_por=ordenar_por, 
         ordem=ordem, 
-        limite=limite
+        limite=limite,
+        campos=lista_campos
     )
 
+    if banco.lower() in ALVOS_COM_VENCEDOR:
+        return _resposta_mais_rapido(
+            resultado_servico, serializar_lista(FilmeResponse, resultado_servico["data"], campos=campos_saida),
+            f"Listagem de filmes do ator '{id_ator}'"
+        )
     if banco.lower() != "todos":
         # Para banco único, o serviço retorna a lista de dicionários de filmes.
         # Convertemos para List[FilmeResponse] como antes.
         # Isso vai bater com a parte List[FilmeResponse] do Union.
         if not isinstance(resultado_servico, list): # Segurança extra
              raise HTTPException(status_code=500, detail="Resposta inesperada do serviço para listagem de filmes por ator em banco único.")
-        return [FilmeResponse(**filme) for filme in resultado_servico]
+        return resposta_rapida(serializar_lista(FilmeResponse, resultado_servico, por_alias=True, campos=campos_saida))
     else:
         # Para "todos", o serviço retorna Dict[str, Dict[str, Union[List,str]]]
         # Ex: {"mongo": {"data": [lista_filmes_mongo], "message": "..."}, ...}
         # Precisamos formatar o "data" interno de cada banco para List[FilmeResponse]
         # e depois envelopar com resposta_sucesso, que retorna um Dict[str, Any].
-        # Isso vai bater com a parte Dict[str, Any] do Union.
-        resposta_formatada_todos: Dict[str, Any] = {}
-        for nome_banco_chave, res_banco in resultado_servico.items(): # resultado_servico aqui é o dict de bancos
-            if "data" in res_banco and isinstance(res_banco["data"], list):
-                resposta_formatada_todos[nome_banco_chave] = {
-                    "data": [FilmeResponse(**filme).model_dump() for filme in res_banco["data"]], # Converte para o modelo e depois para dict
-                    "message": res_banco.get("message", "")
-                }
-            else: # Caso de erro ou estrutura inesperada para um banco específico no modo "todos"
-                resposta_formatada_todos[nome_banco_chave] = res_banco 
-
-        return resposta_sucesso(
+        return resposta_rapida(resposta_sucesso(
             mensagem=f"Listagem de filmes para o ator ID '{id_ator}' em 'todos' os bancos processada.",
-            dados=resposta_formatada_todos # Este é o Dict[str, Dict[str, Any]] que será parte do Dict[str, Any] final
-        )
+            dados=_formatar_por_banco(resultado_servico, FilmeResponse, campos_saida) # Este é o Dict[str, Dict[str, Any]] que será parte do Dict[str, Any] final
+        ))
 
 @router.post("/admin/carregar-base", response_model=Dict[str, Any])
 @tratar_erros
@@ -135,6 +364,30 @@ async def endpoint_carregar_base_generico(
         dados=resultados_servico
     )
 
+@router.get("/admin/cache/estatisticas", response_model=Dict[str, Any], tags=["Admin"])
+@tratar_erros
+async def endpoint_estatisticas_cache():
+    return resposta_sucesso(
+        mensagem="Estatísticas do cache de resultados.",
+        dados={"cache": servico_estatisticas_cache()}
+    )
+
+@router.get("/admin/disjuntores", response_model=Dict[str, Any], tags=["Admin"])
+@tratar_erros
+async def endpoint_estado_disjuntores():
+    return resposta_sucesso(
+        mensagem="Estado dos disjuntores por banco.",
+        dados={"disjuntores": servico_estado_disjuntores()}
+    )
+
+@router.get("/admin/roteamento", response_model=Dict[str, Any], tags=["Admin"])
+@tratar_erros
+async def endpoint_estado_roteamento():
+    return resposta_sucesso(
+        mensagem="Latência recente (p95) e escolhas do banco=auto por operação.",
+        dados={"roteamento": servico_estado_roteamento()}
+    )
+
 @router.post("/filmes", response_model=Dict[str, Any], status_code=201)
 @tratar_erros
 async def endpoint_inserir_filme_generico(
@@ -147,24 +400,203 @@ async def endpoint_inserir_filme_generico(
         dados=resultados_servico
     )
 
+@router.post("/filmes/lote", response_model=Dict[str, Any], tags=["Filmes"])
+@tratar_erros
+async def endpoint_inserir_filmes_em_lote(
+    payload: InserirFilmesLotePayload = Body(...),
+    banco: str = Query("todos", enum=["mongo", "cassandra", "neo4j", "redis", "todos"])
+):
+    """Insere vários filmes de uma vez; o resultado traz o status de cada filme (201, 409, 400 ou 500)."""
+    resultados_servico = await servico_inserir_filmes_em_lote(filmes_payload=payload.filmes, banco_alvo=banco)
+    return resposta_sucesso(
+        mensagem=f"Inserção em lote de {len(payload.filmes)} filmes para '{banco}' processada.",
+        dados=resultados_servico
+    )
+
+@router.post("/filmes/atualizar-por-filtro", response_model=Dict[str, Any], tags=["Filmes"])
+@tratar_erros
+async def endpoint_atualizar_filmes_por_filtro(
+    payload: AtualizarFilmesPorFiltroPayload = Body(...),
+    banco: str = Query("mongo", enum=["mongo", "cassandra", "neo4j", "redis", "todos"])
+):
+    """Aplica a atualização a todos os filmes que casam com os filtros da busca avançada (sem limite)."""
+    resultados_servico = await servico_atualizar_filmes_por_filtro(
+        filtros=payload.filtros,
+        atualizacoes=payload.atualizacoes.model_dump(exclude_unset=True, exclude_none=True),
+        banco_alvo=banco
+    )
+    return resposta_sucesso(
+        mensagem=f"Atualização por filtro em '{banco}' processada.",
+        dados=resultados_servico
+    )
+
+@router.post("/filmes/remover-por-filtro", response_model=Dict[str, Any], tags=["Filmes"])
+@tratar_erros
+async def endpoint_remover_filmes_por_filtro(
+    payload: RemoverFilmesPorFiltroPayload = Body(...),
+    banco: str = Query("mongo", enum=["mongo", "cassandra", "neo4j", "redis", "todos"])
+):
+    """Remove todos os filmes que casam com os filtros da busca avançada (sem limite)."""
+    resultados_servico = await servico_remover_filmes_por_filtro(filtros=payload.filtros, banco_alvo=banco)
+    return resposta_sucesso(
+        mensagem=f"Remoção por filtro em '{banco}' processada.",
+        dados=resultados_servico
+    )
+
+# Modelo de resposta (e se o banco único sai por alias, como no endpoint equivalente) de cada operação do lote
+_FORMATO_OPERACOES_LOTE = {
+    "busca_avancada": (FilmeResponse, True),
+    "detalhes_filme": (FilmeResponse, True),
+    "filmes_por_ids": (FilmeResponse, True),
+    "atores_de_filme": (AtorResponse, True),
+    "filmes_por_ator": (FilmeResponse, True),
+    "contagem_por_ano": (ContagemPorAnoResponse, False),
+    "media_notas_por_genero": (MediaGeneroResponse, False),
+}
+
+def _formatar_resultado_lote(resultado: Dict[str, Any], campos: Optional[Any]) -> Dict[str, Any]:
+    """Serializa o "data" de uma operação do lote no mesmo formato do endpoint equivalente."""
+    if "data" not in resultado:
+        return resultado
+    modelo, por_alias = _FORMATO_OPERACOES_LOTE[resultado["operacao"]]
+    campos_saida = _campos_saida(normalizar_campos(campos))
+    dados = resultado["data"]
+    banco = resultado["banco"].lower()
+    if banco == "todos":
+        dados = _formatar_por_banco(dados, modelo, campos_saida)
+    elif banco in ALVOS_COM_VENCEDOR:
+        vencedor = dados["data"]
+        dados = {
+            **dados,
+            "data": serializar_item(modelo, vencedor, campos=campos_saida) if isinstance(vencedor, dict)
+            else serializar_lista(modelo, vencedor, campos=campos_saida)
+        }
+    elif isinstance(dados, dict):
+        dados = serializar_item(modelo, dados, por_alias=por_alias, campos=campos_saida)
+    else:
+        dados = serializar_lista(modelo, dados, por_alias=por_alias, campos=campos_saida)
+    return {**resultado, "data": dados}
+
+@router.post("/batch", response_model=Dict[str, Any], tags=["Lote"])
+@tratar_erros
+async def endpoint_executar_lote(payload: ExecutarLotePayload = Body(...)):
+    """
+    Várias leituras numa única requisição, executadas em paralelo no servidor. Cada item de
+    "resultados" (na ordem do payload) traz operacao, banco, status_code, duracao_ms e data ou error.
+    """
+    inicio = time.perf_counter()
+    resultados = await servico_executar_lote([operacao.model_dump() for operacao in payload.operacoes])
+    resultados = [
+        _formatar_resultado_lote(resultado, operacao.parametros.get("campos"))
+        for resultado, operacao in zip(resultados, payload.operacoes)
+    ]
+    sucessos = sum(1 for resultado in resultados if resultado["status_code"] == 200)
+    return resposta_rapida(resposta_sucesso(
+        mensagem=f"{sucessos} de {len(resultados)} operações concluídas com sucesso.",
+        dados={"resultados": resultados, "duracao_total_ms": round((time.perf_counter() - inicio) * 1000, 3)}
+    ))
+
+@router.post("/consultas/federadas", response_model=Dict[str, Any], tags=["Consultas Federadas"])
+@tratar_erros
+async def endpoint_consulta_federada(payload: ConsultaFederadaPayload = Body(...)):
+    """
+    Responde uma pergunta composta (filmes do ator com filtros, ordenação e elenco) dividindo-a
+    em etapas, cada uma no banco mais indicado. "plano" descreve as etapas, o banco escolhido,
+    o critério, os custos considerados e a duração de cada uma.
+    """
+    lista_campos = _ler_campos(payload.campos)
+    campos_saida = _campos_saida(lista_campos)
+    inicio = time.perf_counter()
+    resultado = await servico_consulta_federada(
+        filtros=payload.filtros, id_ator=payload.id_ator, limite=payload.limite,
+        incluir_elenco=payload.incluir_elenco, campos=lista_campos,
+        bancos_fixados=payload.bancos, somente_plano=payload.somente_plano
+    )
+    dados: Dict[str, Any] = {"plano": resultado["plano"]}
+    if resultado["data"] is not None:
+        dados["data"] = serializar_lista(FilmeResponse, resultado["data"], campos=campos_saida)
+    if "elenco" in resultado:
+        dados["elenco"] = {
+            id_filme: serializar_lista(AtorResponse, atores) for id_filme, atores in resultado["elenco"].items()
+        }
+    dados["duracao_total_ms"] = round((time.perf_counter() - inicio) * 1000, 3)
+    return resposta_rapida(resposta_sucesso(
+        mensagem="Plano da consulta federada." if payload.somente_plano
+        else f"Consulta federada concluída com {len(dados['data'])} filmes.",
+        dados=dados
+    ))
+
 # --- Endpoints para operações em UM banco específico (mantêm-se como estão) ---
-@router.get("/filmes/{id_filme}", response_model=FilmeResponse, tags=["Filmes"])
+async def _responder_filmes_por_ids(ids_filmes: List[str], banco: str, campos: Optional[str]):
+    lista_campos = _ler_campos(campos)
+    campos_saida = _campos_saida(lista_campos)
+    filmes = await servico_buscar_filmes_por_ids(ids_filmes=ids_filmes, banco_alvo=banco, campos=lista_campos)
+    if banco.lower() in ALVOS_COM_VENCEDOR:
+        return _resposta_mais_rapido(
+            filmes, serializar_lista(FilmeResponse, filmes["data"], campos=campos_saida),
+            f"Busca de {len(filmes['data'])} filmes por ID"
+        )
+    return resposta_rapida(serializar_lista(FilmeResponse, filmes, por_alias=True, campos=campos_saida))
+
+@router.get("/filmes", response_model=Union[List[FilmeResponse], Dict[str, Any]], tags=["Filmes"])
+@tratar_erros
+async def endpoint_buscar_filmes_por_ids(
+    ids: str = Query(..., min_length=1, description="IDs (_id) dos filmes separados por vírgula, ex.: tt0111161,tt0068646."),
+    banco: str = Query("mongo", enum=["mongo", "cassandra", "neo4j", "redis", "mais_rapido", "auto"]),
+    campos: Optional[str] = Query(None, description=DESCRICAO_CAMPOS)
+):
+    return await _responder_filmes_por_ids(ids.split(","), banco, campos)
+
+@router.post("/filmes/buscar-por-ids", response_model=Union[List[FilmeResponse], Dict[str, Any]], tags=["Filmes"])
+@tratar_erros
+async def endpoint_buscar_filmes_por_ids_post(
+    payload: BuscarFilmesPorIdsPayload = Body(...),
+    banco: str = Query("mongo", enum=["mongo", "cassandra", "neo4j", "redis", "mais_rapido", "auto"]),
+    campos: Optional[str] = Query(None, description=DESCRICAO_CAMPOS)
+):
+    """Mesma busca de GET /filmes?ids=..., para listas de ids longas demais para a URL."""
+    return await _responder_filmes_por_ids(payload.ids, banco, campos)
+
+@router.get("/filmes/{id_filme}", response_model=Union[FilmeResponse, Dict[str, Any]], tags=["Filmes"])
 @tratar_erros
 async def endpoint_buscar_detalhes_filme(
+    request: Request,
     id_filme: str = Path(..., min_length=1, description="O ID (_id) do filme a ser buscado."),
-    banco: str = Query("mongo", enum=["mongo", "cassandra", "neo4j", "redis"]) # Não tem "todos"
+    banco: str = Query("mongo", enum=["mongo", "cassandra", "neo4j", "redis", "mais_rapido", "auto"]), # Não tem "todos"
+    campos: Optional[str] = Query(None, description=DESCRICAO_CAMPOS)
 ):
-    detalhes_filme_dict = await servico_buscar_detalhes_filme(id_filme=id_filme, banco_alvo=banco)
-    return FilmeResponse(**detalhes_filme_dict)
+    lista_campos = _ler_campos(campos)
+    campos_saida = _campos_saida(lista_campos)
+    etag = _etag_leitura(request, banco)
+    nao_modificado = _nao_modificado(request, etag)
+    if nao_modificado is not None:
+        return nao_modificado
+    detalhes_filme_dict = await servico_buscar_detalhes_filme(id_filme=id_filme, banco_alvo=banco, campos=lista_campos)
+    if banco.lower() in ALVOS_COM_VENCEDOR:
+        return _resposta_mais_rapido(
+            detalhes_filme_dict, serializar_item(FilmeResponse, detalhes_filme_dict["data"], campos=campos_saida),
+            f"Busca do filme '{id_filme}'"
+        )
+    return _com_etag(request, resposta_rapida(serializar_item(FilmeResponse, detalhes_filme_dict, por_alias=True, campos=campos_saida)), etag)
 
-@router.get("/filmes/{id_filme}/atores", response_model=List[AtorResponse], tags=["Filmes", "Atores"])
+@router.get("/filmes/{id_filme}/atores", response_model=Union[List[AtorResponse], Dict[str, Any]], tags=["Filmes", "Atores"])
 @tratar_erros
 async def endpoint_buscar_atores_de_filme(
+    request: Request,
     id_filme: str = Path(..., min_length=1, description="O ID (_id) do filme para listar atores."),
-    banco: str = Query("mongo", enum=["mongo", "cassandra", "neo4j", "redis"]) # Não tem "todos"
+    banco: str = Query("mongo", enum=["mongo", "cassandra", "neo4j", "redis", "mais_rapido", "auto"]) # Não tem "todos"
 ):
+    etag = _etag_leitura(request, banco)
+    nao_modificado = _nao_modificado(request, etag)
+    if nao_modificado is not None:
+        return nao_modificado
     lista_atores_dicts = await servico_buscar_atores_de_filme(id_filme=id_filme, banco_alvo=banco)
-    return [AtorResponse(**ator) for ator in lista_atores_dicts]
+    if banco.lower() in ALVOS_COM_VENCEDOR:
+        return _resposta_mais_rapido(
+            lista_atores_dicts, serializar_lista(AtorResponse, lista_atores_dicts["data"]),
+            f"Busca de atores do filme '{id_filme}'"
+        )
+    return _com_etag(request, resposta_rapida(serializar_lista(AtorResponse, lista_atores_dicts, por_alias=True)), etag)
 
 # src/api/routers/v1/generic_router.py
 # ... (imports e outros endpoints) ...
@@ -187,38 +619,43 @@ async def endpoint_atualizar_filme(
     )
     
     if banco.lower() != "todos":
-        # Para banco único, o serviço retorna {"data": filme_dict, "message": ...}
-        # E o response_model do endpoint original era FilmeResponse.
-        # Vamos manter a conversão para FilmeResponse para o caso de banco único.
+        # Para banco único, o serviço retorna {"data": filme_dict, "message": ...} (erros já saem como HTTPException)
         if "data" in resultados_servico and isinstance(resultados_servico["data"], dict):
-            # Retorna o objeto FilmeResponse diretamente se for banco único e sucesso
-            return FilmeResponse(**resultados_servico["data"]) 
-        else: 
-            # Se não tem "data" ou não é dict, algo deu errado no serviço que não foi HTTPException
-            # ou o "error" já foi tratado pelo @tratar_erros ou pelo serviço.
-            # Esta parte pode precisar de refinamento dependendo do retorno exato do serviço em erro.
-            # Se o serviço sempre levanta HTTPException em erro para banco único, este else pode não ser atingido.
-            # Se resultados_servico for um erro já formatado por resposta_erro, @tratar_erros pode já ter retornado.
-            # Por segurança, se chegou aqui e não tem data, é um problema.
-            raise HTTPException(status_code=500, detail=resultados_servico.get("message", "Falha ao obter filme atualizado após update."))
-    else:
-        # Para "todos", o serviço retorna Dict[str, Dict[str,Union[Dict,str,None]]]
-        # Ex: {"mongo": {"data": filme_mongo, "message": msg}, "cassandra": {"error": err_msg, "data": None}}
-        # Precisamos garantir que o "data" interno seja FilmeResponse onde aplicável
-        resposta_formatada_todos: Dict[str, Any] = {}
-        for nome_banco_chave, res_banco in resultados_servico.items():
-            if "data" in res_banco and isinstance(res_banco["data"], dict):
-                resposta_formatada_todos[nome_banco_chave] = {
-                    "data": FilmeResponse(**res_banco["data"]).model_dump(), # Converte para o modelo e depois para dict
-                    "message": res_banco.get("message", "")
-                }
-            else: # Preserva a estrutura de erro ou mensagem sem data
-                resposta_formatada_todos[nome_banco_chave] = res_banco
-        
-        return resposta_sucesso(
-            mensagem=f"Operação de atualização para o filme '{id_filme}' em 'todos' os bancos processada.",
-            dados=resposta_formatada_todos
-        )
+            return resposta_rapida(serializar_item(FilmeResponse, resultados_servico["data"], por_alias=True))
+        raise HTTPException(status_code=500, detail=resultados_servico.get("message", "Falha ao obter filme atualizado após update."))
+    # Para "todos": {"mongo": {"data": filme, "message": msg}, "cassandra": {"error": err_msg, "data": None}, ...}
+    return resposta_rapida(resposta_sucesso(
+        mensagem=f"Operação de atualização para o filme '{id_filme}' em 'todos' os bancos processada.",
+        dados={
+            nome_banco: {"data": serializar_item(FilmeResponse, res_banco["data"]), "message": res_banco.get("message", "")}
+            if isinstance(res_banco.get("data"), dict) else res_banco # Preserva a estrutura de erro
+            for nome_banco, res_banco in resultados_servico.items()
+        }
+    ))
+
+@router.patch("/filmes/{id_filme}", response_model=Dict[str, Any], tags=["Filmes"])
+@tratar_erros
+async def endpoint_atualizar_campos_filme(
+    id_filme: str = Path(..., min_length=1),
+    payload: AtualizarCamposFilmePayload = Body(...),
+    banco: str = Query("mongo", enum=["mongo", "cassandra", "neo4j", "redis", "todos"])
+):
+    """Atualiza vários campos do filme numa única escrita e devolve o filme atualizado."""
+    resultados_servico = await servico_atualizar_campos_filme(
+        id_filme=id_filme,
+        atualizacoes=payload.model_dump(exclude_unset=True, exclude_none=True),
+        banco_alvo=banco
+    )
+    if banco.lower() != "todos":
+        return resposta_rapida(serializar_item(FilmeResponse, resultados_servico["data"], por_alias=True))
+    return resposta_sucesso(
+        mensagem=f"Atualização parcial do filme '{id_filme}' em 'todos' os bancos processada.",
+        dados={
+            nome_banco: {"data": serializar_item(FilmeResponse, res_banco["data"]), "message": res_banco["message"]}
+            if res_banco.get("data") else res_banco
+            for nome_banco, res_banco in resultados_servico.items()
+        }
+    )
 
 # Você precisará aplicar uma lógica similar para:
 # - endpoint_remover_filme
@@ -237,10 +674,10 @@ async def endpoint_remover_filme(
     id_filme: str = Path(..., min_length=1),
     banco: str = Query("mongo", enum=["mongo", "cassandra", "neo4j", "redis", "todos"])
 ):
-    print(f"DEBUG ROUTER (Remover Filme): Recebido id_filme='{id_filme}', banco='{banco}'") # DEBUG INICIAL
+    logger.debug("DEBUG ROUTER (Remover Filme): Recebido id_filme='%s', banco='%s'", id_filme, banco)
     resultado_servico = await servico_remover_filme(id_filme=id_filme, banco_alvo=banco)
     
-    print(f"DEBUG ROUTER (Remover Filme): Resultado do serviço para banco='{banco}': {resultado_servico}") # DEBUG CRUCIAL
+    logger.debug("DEBUG ROUTER (Remover Filme): Resultado do serviço para banco='%s': %s", banco, resultado_servico)
 
     if banco.lower() != "todos":
         if isinstance(resultado_servico, dict) and \
@@ -251,19 +688,19 @@ async def endpoint_remover_filme(
                 status="sucesso", 
                 message=resultado_servico.get("message", f"Filme {id_filme} processado.") # Fallback para message
             )
-            print(f"DEBUG ROUTER (Remover Filme): Retornando OperacaoStatusResponse para banco único.") # DEBUG
+            logger.debug("DEBUG ROUTER (Remover Filme): Retornando OperacaoStatusResponse para banco único.")
             return operacao_status.model_dump()
         elif isinstance(resultado_servico, dict) and "error" in resultado_servico:
             # Se o serviço para banco único já formatou um erro (menos comum, ele deveria levantar HTTPExc)
-            print(f"DEBUG ROUTER (Remover Filme): Erro retornado pelo serviço para banco único: {resultado_servico}") # DEBUG
+            logger.debug("DEBUG ROUTER (Remover Filme): Erro retornado pelo serviço para banco único: %s", resultado_servico)
             raise HTTPException(status_code=resultado_servico.get("status_code_interno", 500), detail=resultado_servico["error"])
         else: 
             # Se chegou aqui, o resultado_servico não é o esperado para sucesso nem um erro formatado
-            print(f"ERRO DEBUG ROUTER (Remover Filme): Resposta INESPERADA do serviço para banco único: {resultado_servico}") # DEBUG
+            logger.error("ERRO DEBUG ROUTER (Remover Filme): Resposta INESPERADA do serviço para banco único: %s", resultado_servico)
             raise HTTPException(status_code=500, detail="Resposta inesperada do serviço de remoção para banco único.")
     else:
         # Para "todos", o serviço retorna o dicionário de resultados por banco
-        print(f"DEBUG ROUTER (Remover Filme): Retornando resultado para 'todos' os bancos.") # DEBUG
+        logger.debug("DEBUG ROUTER (Remover Filme): Retornando resultado para 'todos' os bancos.")
         return resposta_sucesso(
             mensagem=f"Tentativa de remoção do filme ID '{id_filme}' em 'todos' os bancos processada.",
             dados=resultado_servico 
@@ -275,69 +712,71 @@ async def endpoint_remover_filme(
             tags=["Analytics"])
 @tratar_erros
 async def endpoint_contar_filmes_por_ano(
-    banco: str = Query("todos", enum=["mongo", "cassandra", "neo4j", "redis", "todos"]) # "todos" adicionado
+    request: Request,
+    banco: str = Query("todos", enum=["mongo", "cassandra", "neo4j", "redis", "todos", "auto"]) # "todos" adicionado
 ):
+    if _pediu_sse(request):
+        return _resposta_sse(servico_transmitir_por_banco(banco, "contagem por ano", servico_contar_filmes_por_ano), ContagemPorAnoResponse)
+    etag = _etag_leitura(request, banco)
+    nao_modificado = _nao_modificado(request, etag)
+    if nao_modificado is not None:
+        return nao_modificado # Nenhuma escrita desde a última resposta: o banco nem é consultado
     # servico_contar_filmes_por_ano agora retorna Union[List[Dict], Dict[str, Any]]
     resultado_servico = await servico_contar_filmes_por_ano(banco_alvo=banco)
     
+    if banco.lower() == "auto":
+        return _resposta_mais_rapido(
+            resultado_servico, serializar_lista(ContagemPorAnoResponse, resultado_servico["data"]), "Contagem de filmes por ano"
+        )
     if banco.lower() != "todos":
         # Se for um banco específico, o serviço retorna List[Dict]
         # Precisamos converter para List[ContagemPorAnoResponse]
         # e envelopar com resposta_sucesso
-        dados_formatados = [ContagemPorAnoResponse(**item).model_dump() for item in resultado_servico]
-        return resposta_sucesso(
+        dados_formatados = serializar_lista(ContagemPorAnoResponse, resultado_servico)
+        return _com_etag(request, resposta_rapida(resposta_sucesso(
             mensagem=f"Contagem de filmes por ano para '{banco}' processada.",
             dados={"contagem_por_ano": dados_formatados} # Streamlit espera "contagem_por_ano" ou "data"
-        )
+        )), etag)
     else:
         # Se for "todos", o serviço retorna Dict[str, Dict[str, Union[List, str]]]
         # Onde cada valor é {"data": [...], "message": "..."} ou {"error": ..., "data": []}
         # Precisamos formatar o "data" interno de cada banco
-        resposta_formatada_para_todos: Dict[str, Any] = {}
-        for nome_banco_chave, res_banco in resultado_servico.items():
-            if "data" in res_banco and isinstance(res_banco["data"], list):
-                resposta_formatada_para_todos[nome_banco_chave] = {
-                    "data": [ContagemPorAnoResponse(**item).model_dump() for item in res_banco["data"]],
-                    "message": res_banco.get("message", "")
-                }
-            else: # Caso de erro para um banco específico no modo "todos"
-                resposta_formatada_para_todos[nome_banco_chave] = res_banco
-        
-        return resposta_sucesso(
+        return _com_etag(request, resposta_rapida(resposta_sucesso(
             mensagem="Contagem de filmes por ano para 'todos' os bancos processada.",
-            dados=resposta_formatada_para_todos # Este é o Dict[str, Dict[str, Any]]
-        )
+            dados=_formatar_por_banco(resultado_servico, ContagemPorAnoResponse) # Este é o Dict[str, Dict[str, Any]]
+        )), etag if _todos_sem_erro(resultado_servico) else None)
 
 @router.get("/analytics/filmes/media-notas-por-genero", 
             response_model=Dict[str, Any], # Alterado para Dict[str, Any]
             tags=["Analytics"])
 @tratar_erros
 async def endpoint_media_notas_por_genero(
-    banco: str = Query("todos", enum=["mongo", "cassandra", "neo4j", "redis", "todos"]) # "todos" adicionado
+    request: Request,
+    banco: str = Query("todos", enum=["mongo", "cassandra", "neo4j", "redis", "todos", "auto"]) # "todos" adicionado
 ):
+    if _pediu_sse(request):
+        return _resposta_sse(servico_transmitir_por_banco(banco, "média de notas por gênero", servico_media_notas_por_genero), MediaGeneroResponse)
+    etag = _etag_leitura(request, banco)
+    nao_modificado = _nao_modificado(request, etag)
+    if nao_modificado is not None:
+        return nao_modificado
     # servico_media_notas_por_genero agora retorna Union[List[Dict], Dict[str, Any]]
     resultado_servico = await servico_media_notas_por_genero(banco_alvo=banco)
 
+    if banco.lower() == "auto":
+        return _resposta_mais_rapido(
+            resultado_servico, serializar_lista(MediaGeneroResponse, resultado_servico["data"]), "Média de notas por gênero"
+        )
     if banco.lower() != "todos":
         # Se for um banco específico, o serviço retorna List[Dict]
-        dados_formatados = [MediaGeneroResponse(**item).model_dump() for item in resultado_servico]
-        return resposta_sucesso(
+        dados_formatados = serializar_lista(MediaGeneroResponse, resultado_servico)
+        return _com_etag(request, resposta_rapida(resposta_sucesso(
             mensagem=f"Média de notas por gênero para '{banco}' processada.",
             dados={"media_notas_por_genero": dados_formatados} # Streamlit espera "media_notas_por_genero" ou "data"
-        )
+        )), etag)
     else:
         # Se for "todos", o serviço retorna Dict[str, Dict[str, Union[List, str]]]
-        resposta_formatada_para_todos: Dict[str, Any] = {}
-        for nome_banco_chave, res_banco in resultado_servico.items():
-            if "data" in res_banco and isinstance(res_banco["data"], list):
-                resposta_formatada_para_todos[nome_banco_chave] = {
-                    "data": [MediaGeneroResponse(**item).model_dump() for item in res_banco["data"]],
-                    "message": res_banco.get("message", "")
-                }
-            else: 
-                resposta_formatada_para_todos[nome_banco_chave] = res_banco
-        
-        return resposta_sucesso(
+        return _com_etag(request, resposta_rapida(resposta_sucesso(
             mensagem="Média de notas por gênero para 'todos' os bancos processada.",
-            dados=resposta_formatada_para_todos
-        )
\ No newline at end of file
+            dados=_formatar_por_banco(resultado_servico, MediaGeneroResponse)
+        )), etag if _todos_sem_erro(resultado_servico) else None)
\ No newline at end of file
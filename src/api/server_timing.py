@@ -0,0 +1,33 @@
+# src/api/server_timing.py
+"""
+Middleware ASGI que abre o registro de fases (src/core/tempos.py) de cada requisição HTTP
+e devolve o detalhamento no cabeçalho Server-Timing. Nas respostas em streaming (NDJSON)
+o cabeçalho sai antes do corpo, então só traz as fases concluídas até o primeiro lote.
+"""
+import time
+
+from src.core.tempos import iniciar_medicoes, encerrar_medicoes, medicoes_atuais, cabecalho_server_timing
+
+
+class ServerTimingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = iniciar_medicoes()
+        medicoes = medicoes_atuais()
+        inicio = time.perf_counter()
+
+        async def enviar_com_tempos(mensagem):
+            if mensagem["type"] == "http.response.start":
+                valor = cabecalho_server_timing(medicoes, (time.perf_counter() - inicio) * 1000)
+                mensagem = {**mensagem, "headers": [*mensagem.get("headers", []), (b"server-timing", valor.encode("latin-1"))]}
+            await send(mensagem)
+
+        try:
+            await self.app(scope, receive, enviar_com_tempos)
+        finally:
+            encerrar_medicoes(token)
@@ -0,0 +1,119 @@
+# src/core/cache.py
+"""
+Cache em memória dos resultados de leitura (busca avançada e analytics).
+
+Os dados só mudam pelas funções de escrita do serviço (inserir/atualizar/remover/carregar),
+então cada banco tem o seu próprio TTLCache (LRU limitado por tamanho + expiração por TTL)
+e as escritas invalidam apenas o cache do banco afetado. Um contador de geração por banco
+impede que uma leitura iniciada antes de uma escrita grave no cache um resultado já velho;
+o mesmo contador serve de versão dos dados do banco nas ETags das leituras.
+Cache e contadores vivem na memória do processo: valem para um único worker do uvicorn (o
+padrão do Dockerfile e do docker-compose). Com vários workers cada um teria o seu cache e a
+sua versão, e uma escrita não invalidaria o cache nem mudaria a ETag dos outros.
+"""
+import json
+import threading
+from typing import Any, Dict, Tuple
+
+from cachetools import TTLCache
+
+from src.core.db_config import CACHE_RESULTADOS_ATIVO, CACHE_RESULTADOS_MAX_ITENS, CACHE_RESULTADOS_TTL_SEGUNDOS
+
+
+def chave_cache(operacao: str, parametros: Dict[str, Any]) -> str:
+    """Chave estável para (operação, parâmetros): independe da ordem das chaves do dict."""
+    return f"{operacao}:{json.dumps(parametros, sort_keys=True, default=str, ensure_ascii=False)}"
+
+
+class CacheResultados:
+    def __init__(self, max_itens: int, ttl_segundos: float, ativo: bool = True):
+        self.max_itens = max_itens
+        self.ttl_segundos = ttl_segundos
+        self.ativo = ativo and max_itens > 0 and ttl_segundos > 0
+        self._caches: Dict[str, TTLCache] = {}
+        self._geracoes: Dict[str, int] = {}
+        self._contadores: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._lock = threading.Lock()
+
+    def _cache_do_banco(self, nome_banco: str) -> TTLCache:
+        cache = self._caches.get(nome_banco)
+        if cache is None:
+            cache = TTLCache(maxsize=self.max_itens, ttl=self.ttl_segundos)
+            self._caches[nome_banco] = cache
+        return cache
+
+    def _contar(self, nome_banco: str, operacao: str, tipo: str):
+        contadores_op = self._contadores.setdefault(nome_banco, {}).setdefault(operacao, {"hits": 0, "misses": 0})
+        contadores_op[tipo] += 1
+
+    def buscar(self, nome_banco: str, operacao: str, chave: str) -> Tuple[bool, Any]:
+        """
+        Retorna (encontrado, valor). O valor é compartilhado entre as requisições
+        e deve ser tratado como somente leitura.
+        """
+        if not self.ativo:
+            return False, None
+        with self._lock:
+            cache = self._cache_do_banco(nome_banco)
+            if chave in cache:
+                self._contar(nome_banco, operacao, "hits")
+                return True, cache[chave]
+            self._contar(nome_banco, operacao, "misses")
+            return False, None
+
+    def geracao(self, nome_banco: str) -> int:
+        """Geração atual do banco (incrementada a cada invalidação, isto é, a cada escrita)."""
+        with self._lock:
+            return self._geracoes.get(nome_banco, 0)
+
+    def guardar(self, nome_banco: str, chave: str, valor: Any, geracao: int):
+        """Guarda o valor se não houve invalidação do banco desde que a leitura começou."""
+        if not self.ativo:
+            return
+        with self._lock:
+            if self._geracoes.get(nome_banco, 0) != geracao:
+                return
+            self._cache_do_banco(nome_banco)[chave] = valor
+
+    def invalidar(self, nome_banco: str):
+        """Descarta todos os resultados em cache do banco."""
+        with self._lock:
+            self._geracoes[nome_banco] = self._geracoes.get(nome_banco, 0) + 1
+            cache = self._caches.get(nome_banco)
+            if cache is not None:
+                cache.clear()
+
+    def estatisticas(self) -> Dict[str, Any]:
+        """Contadores de hits/misses por banco e operação, e o número de itens em cache."""
+        with self._lock:
+            por_banco = {}
+            total_hits = total_misses = 0
+            for nome_banco, operacoes in self._contadores.items():
+                hits = sum(c["hits"] for c in operacoes.values())
+                misses = sum(c["misses"] for c in operacoes.values())
+                total_hits += hits
+                total_misses += misses
+                cache = self._caches.get(nome_banco)
+                por_banco[nome_banco] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "itens": len(cache) if cache is not None else 0,
+                    "operacoes": {op: dict(c) for op, c in operacoes.items()},
+                }
+            consultas = total_hits + total_misses
+            return {
+                "ativo": self.ativo,
+                "max_itens_por_banco": self.max_itens,
+                "ttl_segundos": self.ttl_segundos,
+                "hits": total_hits,
+                "misses": total_misses,
+                "taxa_acerto": round(total_hits / consultas, 4) if consultas else 0.0,
+                "bancos": por_banco,
+            }
+
+
+cache_resultados = CacheResultados(
+    max_itens=CACHE_RESULTADOS_MAX_ITENS,
+    ttl_segundos=CACHE_RESULTADOS_TTL_SEGUNDOS,
+    ativo=CACHE_RESULTADOS_ATIVO
+)
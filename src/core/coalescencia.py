@@ -0,0 +1,51 @@
+# src/core/coalescencia.py
+"""
+Coalescência ("single-flight") de leituras idênticas em andamento.
+
+Quando várias requisições pedem a mesma operação, no mesmo banco e com os mesmos
+parâmetros enquanto a primeira ainda está executando, todas aguardam essa mesma
+execução em vez de disparar uma nova varredura no banco. Vive no event loop da API
+(não é thread-safe, nem precisa: só é usado pelas funções async do serviço).
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class ExecucaoUnica:
+    def __init__(self):
+        self._em_andamento: Dict[str, asyncio.Future] = {}
+        self.execucoes = 0
+        self.coalescidas = 0
+
+    async def executar(self, chave: str, funcao: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Executa funcao() uma única vez por chave enquanto houver execução em andamento;
+        as chamadas concorrentes com a mesma chave recebem o mesmo resultado (ou exceção).
+        """
+        futuro = self._em_andamento.get(chave)
+        if futuro is None:
+            self.execucoes += 1
+            futuro = asyncio.ensure_future(funcao())
+            self._em_andamento[chave] = futuro
+            futuro.add_done_callback(lambda f: self._ao_terminar(chave, f))
+        else:
+            self.coalescidas += 1
+        # shield: se uma das requisições for cancelada (cliente desconectou), a execução
+        # compartilhada continua para as demais
+        return await asyncio.shield(futuro)
+
+    def _ao_terminar(self, chave: str, futuro: asyncio.Future):
+        if self._em_andamento.get(chave) is futuro:
+            del self._em_andamento[chave]
+        if not futuro.cancelled():
+            futuro.exception() # Marca a exceção como consumida se todos os interessados desistiram
+
+    def estatisticas(self) -> Dict[str, int]:
+        return {
+            "execucoes": self.execucoes,
+            "coalescidas": self.coalescidas,
+            "em_andamento": len(self._em_andamento),
+        }
+
+
+execucao_unica = ExecucaoUnica()
@@ -0,0 +1,43 @@
+# src/core/cursores.py
+"""
+Cursores opacos da paginação por keyset (busca avançada e filmes por ator).
+
+O cliente recebe um token e o devolve para pedir a página seguinte. Dentro dele vai a
+posição da última linha entregue, no formato de cada banco (valor de ordenação + _id no
+MongoDB e no Neo4j, paging_state no Cassandra, membro/score do ZSET no Redis), junto com
+uma assinatura do banco e dos parâmetros da consulta: um cursor não serve para outra busca.
+"""
+import base64
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from src.core.cache import chave_cache
+from src.core.exceptions import DataValidationError
+
+
+def assinatura_consulta(nome_banco: str, operacao: str, parametros: Dict[str, Any]) -> str:
+    """Assinatura curta de (banco, operação, parâmetros), conferida ao receber o cursor de volta."""
+    return hashlib.sha1(chave_cache(f"{nome_banco}:{operacao}", parametros).encode("utf-8")).hexdigest()[:16]
+
+
+def codificar_cursor(assinatura: str, posicao: Any) -> str:
+    """Token base64 (seguro para URL) com a assinatura da consulta e a posição no banco."""
+    conteudo = json.dumps({"a": assinatura, "p": posicao}, separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(conteudo.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decodificar_cursor(cursor: Optional[str], assinatura: str) -> Optional[Any]:
+    """
+    Posição guardada no cursor (None para a primeira página). Levanta DataValidationError
+    se o token estiver corrompido ou tiver sido gerado para outra consulta.
+    """
+    if not cursor:
+        return None
+    try:
+        conteudo = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as e:
+        raise DataValidationError("Cursor de paginação inválido.") from e
+    if not isinstance(conteudo, dict) or conteudo.get("a") != assinatura:
+        raise DataValidationError("Cursor de paginação não corresponde a esta consulta (banco, filtros ou ordenação diferentes).")
+    return conteudo.get("p")
@@ -26,4 +26,89 @@ NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD")
 
 REDIS_HOST = os.getenv("REDIS_HOST")
 REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
-REDIS_DB = int(os.getenv("REDIS_DB", "0"))
\ No newline at end of file
+REDIS_DB = int(os.getenv("REDIS_DB", "0"))
+
+# Pools de conexão (compartilhados por todo o processo da API)
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "50"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+
+CASSANDRA_EXECUTOR_THREADS = int(os.getenv("CASSANDRA_EXECUTOR_THREADS", "2"))
+CASSANDRA_CONNECT_TIMEOUT = float(os.getenv("CASSANDRA_CONNECT_TIMEOUT", "10"))
+
+NEO4J_MAX_POOL_SIZE = int(os.getenv("NEO4J_MAX_POOL_SIZE", "50"))
+NEO4J_CONNECTION_ACQUISITION_TIMEOUT = float(os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "60"))
+
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "20"))
+
+# Executores (threads) dedicados por banco para as chamadas bloqueantes dos drivers
+EXECUTOR_MAX_WORKERS_MONGO = int(os.getenv("EXECUTOR_MAX_WORKERS_MONGO", "16"))
+EXECUTOR_MAX_WORKERS_CASSANDRA = int(os.getenv("EXECUTOR_MAX_WORKERS_CASSANDRA", "16"))
+EXECUTOR_MAX_WORKERS_NEO4J = int(os.getenv("EXECUTOR_MAX_WORKERS_NEO4J", "16"))
+EXECUTOR_MAX_WORKERS_REDIS = int(os.getenv("EXECUTOR_MAX_WORKERS_REDIS", "16"))
+
+# Cache em memória dos resultados de leitura (busca avançada e analytics), por banco.
+# Desative (CACHE_RESULTADOS_ATIVO=false) ao medir o tempo dos próprios bancos nos testes.
+CACHE_RESULTADOS_ATIVO = os.getenv("CACHE_RESULTADOS_ATIVO", "true").strip().lower() in ("1", "true", "sim")
+CACHE_RESULTADOS_MAX_ITENS = int(os.getenv("CACHE_RESULTADOS_MAX_ITENS", "256"))
+CACHE_RESULTADOS_TTL_SEGUNDOS = float(os.getenv("CACHE_RESULTADOS_TTL_SEGUNDOS", "300"))
+
+# Prazos (segundos) por tipo de operação, com sobrescrita opcional por banco:
+# PRAZO_<TIPO>_SEGUNDOS vale para todos os bancos e PRAZO_<TIPO>_<BANCO>_SEGUNDOS só para um.
+# 0 desativa o prazo (padrão da carga em lote, que é longa por natureza).
+PRAZOS_PADRAO_POR_TIPO = {"leitura": "10", "analytics": "30", "escrita": "10", "carga": "0"}
+PRAZOS_OPERACAO = {
+    banco: {
+        tipo: float(os.getenv(f"PRAZO_{tipo.upper()}_{banco.upper()}_SEGUNDOS", os.getenv(f"PRAZO_{tipo.upper()}_SEGUNDOS", padrao)))
+        for tipo, padrao in PRAZOS_PADRAO_POR_TIPO.items()
+    }
+    for banco in ("mongo", "cassandra", "neo4j", "redis")
+}
+# Timeout de socket do Redis (não há prazo por comando no redis-py)
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "10"))
+
+# Disjuntor por banco: abre após N falhas seguidas e falha rápido durante o tempo aberto
+DISJUNTOR_LIMITE_FALHAS = int(os.getenv("DISJUNTOR_LIMITE_FALHAS", "5"))
+DISJUNTOR_TEMPO_ABERTO_SEGUNDOS = float(os.getenv("DISJUNTOR_TEMPO_ABERTO_SEGUNDOS", "30"))
+
+# Bancos consultados em paralelo quando banco=mais_rapido (vence a primeira resposta válida)
+BANCOS_MAIS_RAPIDO = [b.strip().lower() for b in os.getenv("BANCOS_MAIS_RAPIDO", "mongo,cassandra,neo4j,redis").split(",") if b.strip()]
+
+# Roteamento de banco=auto (src/core/roteamento.py): cada operação vai para o banco com o menor
+# p95 nas últimas ROTEAMENTO_JANELA leituras; ROTEAMENTO_EXPLORACAO é a fração das chamadas
+# enviada a outro banco para manter as janelas de todos atualizadas.
+ROTEAMENTO_JANELA = int(os.getenv("ROTEAMENTO_JANELA", "200"))
+ROTEAMENTO_MIN_AMOSTRAS = int(os.getenv("ROTEAMENTO_MIN_AMOSTRAS", "5"))
+ROTEAMENTO_EXPLORACAO = float(os.getenv("ROTEAMENTO_EXPLORACAO", "0.05"))
+
+# Validação das listas de filmes/atores/analytics nas respostas de leitura (src/utils/serializacao.py):
+#   "completa" -> TypeAdapter do pydantic validando a lista inteira de uma vez
+#   "nenhuma"  -> a saída dos CRUDs é confiável: só projeta os campos do modelo, sem coerção de tipos
+VALIDACAO_RESPOSTAS = os.getenv("VALIDACAO_RESPOSTAS", "completa").strip().lower()
+
+# Cabeçalho Server-Timing em todas as respostas (conexão, fila, driver, decodificação,
+# filtragem em Python e serialização, por banco). Custa alguns perf_counter por linha lida.
+SERVER_TIMING_ATIVO = os.getenv("SERVER_TIMING_ATIVO", "true").strip().lower() in ("1", "true", "sim")
+
+# Aquecimento na inicialização (src/services/aquecimento.py): pools, prepares do Cassandra e uma
+# passada por cada consulta de leitura antes de /health/ready responder 200.
+#   AQUECIMENTO_EM_SEGUNDO_PLANO=false -> a API só aceita requisições depois do aquecimento
+#   AQUECIMENTO_EM_SEGUNDO_PLANO=true  -> sobe na hora e /health/ready responde 503 até terminar
+AQUECIMENTO_ATIVO = os.getenv("AQUECIMENTO_ATIVO", "true").strip().lower() in ("1", "true", "sim")
+AQUECIMENTO_EM_SEGUNDO_PLANO = os.getenv("AQUECIMENTO_EM_SEGUNDO_PLANO", "false").strip().lower() in ("1", "true", "sim")
+AQUECIMENTO_CONEXOES_POR_BANCO = int(os.getenv("AQUECIMENTO_CONEXOES_POR_BANCO", "8"))
+# Inclui contagem por ano e média por gênero (varrem a base inteira; no Redis é um SCAN completo)
+AQUECIMENTO_ANALYTICS = os.getenv("AQUECIMENTO_ANALYTICS", "true").strip().lower() in ("1", "true", "sim")
+
+# Nível dos logs da API (DEBUG mostra os diagnósticos que antes eram print nos CRUDs)
+LOG_NIVEL = os.getenv("LOG_NIVEL", "WARNING").strip().upper()
+
+# Rastreamento (src/core/rastreamento.py): fração das operações rastreadas, sorteada no
+# span raiz (0 desliga, 1 rastreia tudo) e arquivo JSONL de saída dos spans (vazio -> log DEBUG)
+RASTREAMENTO_AMOSTRAGEM = float(os.getenv("RASTREAMENTO_AMOSTRAGEM", "0"))
+RASTREAMENTO_ARQUIVO = os.getenv("RASTREAMENTO_ARQUIVO", "")
+
+# Modo de acesso aos bancos nas consultas de leitura:
+#   "sincrono" -> drivers síncronos rodando nos executores por banco (src/core/executores.py)
+#   "async"    -> drivers asyncio nativos (src/databases/*/async_crud.py)
+MODO_DRIVER = os.getenv("MODO_DRIVER", "sincrono").strip().lower()
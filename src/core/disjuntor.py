@@ -0,0 +1,85 @@
+# src/core/disjuntor.py
+"""
+Disjuntor (circuit breaker) por banco.
+
+Depois de DISJUNTOR_LIMITE_FALHAS falhas seguidas (erros de banco ou prazos estourados),
+o disjuntor abre e as chamadas para aquele banco falham na hora com BancoIndisponivelError,
+sem ocupar threads nem esperar timeouts. Passado DISJUNTOR_TEMPO_ABERTO_SEGUNDOS, uma única
+chamada de teste é liberada (meio aberto): se der certo o disjuntor fecha, senão reabre.
+Usado apenas no event loop da API.
+"""
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from src.core.db_config import DISJUNTOR_LIMITE_FALHAS, DISJUNTOR_TEMPO_ABERTO_SEGUNDOS
+from src.core.exceptions import BancoIndisponivelError
+
+logger = logging.getLogger(__name__)
+
+FECHADO = "fechado"
+ABERTO = "aberto"
+MEIO_ABERTO = "meio_aberto"
+
+
+class Disjuntor:
+    def __init__(self, nome_banco: str, limite_falhas: int, tempo_aberto: float):
+        self.nome_banco = nome_banco
+        self.limite_falhas = limite_falhas
+        self.tempo_aberto = tempo_aberto
+        self.estado = FECHADO
+        self.falhas_seguidas = 0
+        self.aberto_em: Optional[float] = None
+        self.ultimo_erro: Optional[str] = None
+        self._teste_em_andamento = False
+
+    def verificar(self):
+        """Levanta BancoIndisponivelError se a chamada não deve ir ao banco agora."""
+        if self.estado == ABERTO:
+            if time.monotonic() - self.aberto_em < self.tempo_aberto:
+                raise BancoIndisponivelError(
+                    f"({self.nome_banco.capitalize()}) Banco marcado como degradado após {self.falhas_seguidas} falhas seguidas. "
+                    f"Último erro: {self.ultimo_erro}"
+                )
+            self.estado = MEIO_ABERTO
+        if self.estado == MEIO_ABERTO:
+            if self._teste_em_andamento:
+                raise BancoIndisponivelError(f"({self.nome_banco.capitalize()}) Banco degradado, aguardando chamada de teste.")
+            self._teste_em_andamento = True
+
+    def registrar_sucesso(self):
+        self.estado = FECHADO
+        self.falhas_seguidas = 0
+        self.aberto_em = None
+        self._teste_em_andamento = False
+
+    def registrar_falha(self, erro: Exception):
+        self.falhas_seguidas += 1
+        self.ultimo_erro = str(erro)
+        self._teste_em_andamento = False
+        if self.estado == MEIO_ABERTO or self.falhas_seguidas >= self.limite_falhas:
+            if self.estado != ABERTO:
+                logger.warning("ALERTA: disjuntor de %s aberto após %s falhas seguidas: %s", self.nome_banco, self.falhas_seguidas, erro)
+            self.estado = ABERTO
+            self.aberto_em = time.monotonic()
+
+    def registrar_cancelamento(self):
+        """A chamada foi cancelada antes de terminar (ex.: perdeu no modo mais_rapido): não conta."""
+        self._teste_em_andamento = False
+
+    @property
+    def degradado(self) -> bool:
+        return self.estado != FECHADO
+
+    def resumo(self) -> Dict[str, Any]:
+        return {
+            "estado": self.estado,
+            "falhas_seguidas": self.falhas_seguidas,
+            "ultimo_erro": self.ultimo_erro,
+        }
+
+
+disjuntores: Dict[str, Disjuntor] = {
+    nome: Disjuntor(nome, DISJUNTOR_LIMITE_FALHAS, DISJUNTOR_TEMPO_ABERTO_SEGUNDOS)
+    for nome in ("mongo", "cassandra", "neo4j", "redis")
+}
@@ -23,4 +23,12 @@ class DatabaseInteractionError(DatabaseOperationError):
 
 class ValidationError(DatabaseOperationError):
     """Levantado para problemas gerais de interação com o banco de dados."""
-    pass
\ No newline at end of file
+    pass
+
+class TempoEsgotadoError(DatabaseInteractionError):
+    """Levantado quando uma operação excede o prazo configurado para o banco."""
+    pass
+
+class BancoIndisponivelError(DatabaseInteractionError):
+    """Levantado quando o disjuntor do banco está aberto (falha rápida, sem chamar o banco)."""
+    pass
@@ -0,0 +1,77 @@
+# src/core/executores.py
+"""
+Executores de threads dedicados por banco.
+
+Os CRUDs usam drivers síncronos (pymongo, cassandra-driver, neo4j, redis-py). Para não
+bloquear o event loop, as chamadas são enviadas para um ThreadPoolExecutor próprio de
+cada banco, com limite de threads configurável. Assim, um banco lento ou saturado só
+enfileira as requisições destinadas a ele, sem consumir as threads dos outros.
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from src.core.tempos import registrar_fase
+from src.core.db_config import (
+    EXECUTOR_MAX_WORKERS_MONGO,
+    EXECUTOR_MAX_WORKERS_CASSANDRA,
+    EXECUTOR_MAX_WORKERS_NEO4J,
+    EXECUTOR_MAX_WORKERS_REDIS
+)
+
+MAX_WORKERS_POR_BANCO: Dict[str, int] = {
+    "mongo": EXECUTOR_MAX_WORKERS_MONGO,
+    "cassandra": EXECUTOR_MAX_WORKERS_CASSANDRA,
+    "neo4j": EXECUTOR_MAX_WORKERS_NEO4J,
+    "redis": EXECUTOR_MAX_WORKERS_REDIS,
+}
+
+_executores: Dict[str, ThreadPoolExecutor] = {}
+_lock_executores = threading.Lock()
+
+
+def obter_executor(nome_banco: str) -> ThreadPoolExecutor:
+    """Retorna o executor do banco, criando-o no primeiro uso."""
+    executor = _executores.get(nome_banco)
+    if executor is None:
+        if nome_banco not in MAX_WORKERS_POR_BANCO:
+            raise ValueError(f"Não há executor configurado para o banco '{nome_banco}'.")
+        with _lock_executores:
+            executor = _executores.get(nome_banco)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=MAX_WORKERS_POR_BANCO[nome_banco],
+                    thread_name_prefix=f"exec-{nome_banco}"
+                )
+                _executores[nome_banco] = executor
+    return executor
+
+
+async def executar_bloqueante(nome_banco: str, funcao: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Executa funcao(*args, **kwargs) no executor do banco e aguarda o resultado.
+    As contextvars da requisição são copiadas para a thread (como em asyncio.to_thread).
+    A espera por uma thread livre entra na fase "fila" do Server-Timing.
+    """
+    loop = asyncio.get_running_loop()
+    contexto = contextvars.copy_context()
+    enfileirada_em = time.perf_counter()
+
+    def _executar():
+        registrar_fase("fila", nome_banco, (time.perf_counter() - enfileirada_em) * 1000)
+        return funcao(*args, **kwargs)
+
+    chamada = functools.partial(contexto.run, _executar)
+    return await loop.run_in_executor(obter_executor(nome_banco), chamada)
+
+
+def encerrar_executores():
+    """Encerra todos os executores, descartando tarefas ainda não iniciadas."""
+    with _lock_executores:
+        for executor in _executores.values():
+            executor.shutdown(wait=True, cancel_futures=True)
+        _executores.clear()
@@ -0,0 +1,76 @@
+# src/core/filtros_filme.py
+"""
+Filtros da busca avançada aplicados em Python sobre filmes já lidos do banco.
+
+Usados quando o banco não consegue filtrar tudo na consulta (colunas fora da chave no
+Cassandra) e pelo planejador de consultas federadas, que filtra os candidatos do ator em
+memória. A regra dos filmes futuros é a mesma dos endpoints: sem avaliação ainda, eles não
+são barrados por nota mínima ou duração mínima.
+"""
+from typing import Any, Dict
+
+
+def filme_atende_filtros(
+    filme: Dict[str, Any],
+    filtros_python: Dict[str, Any],
+    ano_corte_futuro: int = 2025
+) -> bool:
+    """
+    Se o filme passa nos filtros Python (titulo_contem, tipo, generos_contem_todos,
+    ano_lancamento_min, nota_min, duracao_min). Filmes a partir de ano_corte_futuro sem nota
+    nem votos não são barrados pelos filtros de desempenho (nota/duração).
+    """
+    if not filtros_python:
+        return True # Passa se não há filtros Python
+
+    match = True
+    ano_lancamento_filme = filme.get("ano_lancamento")
+    nota_filme = filme.get("nota")
+    votos_filme = filme.get("numero_votos") # Supondo que você tenha esse campo
+
+    # Verifica se é um filme "futuro/sem avaliação"
+    is_filme_futuro_sem_avaliacao = False
+    if ano_lancamento_filme is not None and ano_lancamento_filme >= ano_corte_futuro:
+        if (nota_filme is None or nota_filme == 0 or nota_filme == 0.0) and \
+           (votos_filme is None or votos_filme == 0):
+            is_filme_futuro_sem_avaliacao = True
+
+    for campo_filtro, valor_filtro in filtros_python.items():
+        if valor_filtro is None: continue # Ignora filtros com valor None
+
+        # Campos que são sempre aplicados
+        if campo_filtro == "titulo_contem" and isinstance(valor_filtro, str):
+            if valor_filtro.lower() not in str(filme.get("titulo", "")).lower():
+                match = False; break
+        elif campo_filtro == "tipo" and isinstance(valor_filtro, str):
+            if filme.get("tipo", "").lower() != valor_filtro.lower():
+                match = False; break
+        elif campo_filtro == "generos_contem_todos" and isinstance(valor_filtro, list) and valor_filtro:
+            filme_generos_set = set(g.lower() for g in filme.get("generos", []))
+            filtro_generos_set = set(g.lower() for g in valor_filtro)
+            if not filtro_generos_set.issubset(filme_generos_set):
+                match = False; break
+        elif campo_filtro == "ano_lancamento_min" and isinstance(valor_filtro, int): # Filtro de ano_min sempre aplicado
+            if ano_lancamento_filme is None or ano_lancamento_filme < valor_filtro:
+                match = False; break
+        
+        # Campos de "performance" que são ignorados para filmes futuros sem avaliação
+        elif campo_filtro in ["nota_min", "numero_votos_min", "duracao_min"]:
+            if is_filme_futuro_sem_avaliacao:
+                continue # Pula este filtro para filmes futuros sem avaliação
+
+            # Aplica o filtro normalmente para outros filmes
+            if campo_filtro == "nota_min" and isinstance(valor_filtro, (int, float)):
+                if nota_filme is None or nota_filme < valor_filtro:
+                    match = False; break
+            # elif campo_filtro == "numero_votos_min" and isinstance(valor_filtro, int):
+            #     if votos_filme is None or votos_filme < valor_filtro:
+            #         match = False; break
+            elif campo_filtro == "duracao_min" and isinstance(valor_filtro, int):
+                tipo_filme = filme.get("tipo", "").lower()
+                if tipo_filme != "jogo": # Duração não se aplica a jogos
+                    if filme.get("duracao") is None or filme.get("duracao") < valor_filtro:
+                        match = False; break
+        # Filtro desconhecido: ignorado
+
+    return match
@@ -0,0 +1,29 @@
+# src/core/lote.py
+"""
+Resultado por item das escritas em lote (POST /filmes/lote).
+
+Cada CRUD devolve uma lista alinhada com a entrada: um item por filme, com o _id e o
+status HTTP que aquele filme teria recebido numa inserção avulsa (201, 409, 400 ou 500),
+para que uma falha num filme não derrube o lote inteiro.
+"""
+from typing import Any, Dict
+
+from src.core.exceptions import DataValidationError, ItemAlreadyExistsError
+
+
+def item_inserido(id_filme: Any) -> Dict[str, Any]:
+    return {"_id": str(id_filme), "status_code": 201}
+
+
+def item_com_erro(id_filme: Any, erro: Exception) -> Dict[str, Any]:
+    if isinstance(erro, ItemAlreadyExistsError):
+        status_code = 409
+    elif isinstance(erro, DataValidationError):
+        status_code = 400
+    else:
+        status_code = 500
+    return {"_id": str(id_filme) if id_filme is not None else None, "status_code": status_code, "error": str(erro)}
+
+
+def item_duplicado(id_filme: Any) -> Dict[str, Any]:
+    return item_com_erro(id_filme, ItemAlreadyExistsError(f"Filme com _id '{id_filme}' já existe."))
@@ -0,0 +1,235 @@
+# src/core/metricas.py
+"""
+Métricas da API no formato texto do Prometheus (exposto em GET /metrics).
+
+Registro próprio, sem dependência externa: histogramas, contadores e medidores com rótulos,
+protegidos por lock (as chamadas vêm tanto do event loop quanto das threads dos executores).
+Métricas por operação de banco, registradas em _executar_protegido (src/services/query_service.py):
+  nosql_operacao_duracao_segundos     histograma  {endpoint, banco, operacao}
+  nosql_operacao_itens                histograma  {endpoint, banco, operacao}  tamanho do resultado
+  nosql_operacao_erros_total          contador    {endpoint, banco, operacao, erro}
+  nosql_operacao_em_andamento         medidor     {endpoint, banco, operacao}
+e por requisição HTTP (src/api/metricas.py):
+  nosql_http_requisicao_duracao_segundos  histograma  {endpoint, metodo, status}
+O rótulo `operacao` segue o nome do servico_* (busca_avancada, contagem_por_ano, carregar_base...),
+definido com @operacao_medida; `endpoint` é o caminho da rota (ex.: /api/v1/filmes/{id_filme}).
+"""
+import functools
+import math
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.core.rastreamento import span
+
+BALDES_DURACAO = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+BALDES_ITENS = (0, 1, 5, 10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000)
+
+OPERACAO_DESCONHECIDA = "desconhecida"
+ENDPOINT_FORA_DE_REQUISICAO = "nenhum"
+
+_operacao_atual: ContextVar[str] = ContextVar("operacao_metricas", default=OPERACAO_DESCONHECIDA)
+_escopo_requisicao: ContextVar[Optional[Dict[str, Any]]] = ContextVar("escopo_requisicao_metricas", default=None)
+_contabilizar: ContextVar[bool] = ContextVar("contabilizar_metricas", default=True)
+
+
+def _escapar(valor: Any) -> str:
+    return str(valor).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _formatar_rotulos(nomes: Sequence[str], valores: Sequence[Any], extra: Optional[Tuple[str, str]] = None) -> str:
+    pares = [f'{nome}="{_escapar(valor)}"' for nome, valor in zip(nomes, valores)]
+    if extra:
+        pares.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pares) + "}" if pares else ""
+
+
+def _formatar_numero(valor: float) -> str:
+    if math.isinf(valor):
+        return "+Inf" if valor > 0 else "-Inf"
+    return repr(float(valor)) if not float(valor).is_integer() else str(int(valor))
+
+
+class _Metrica:
+    tipo = ""
+
+    def __init__(self, nome: str, descricao: str, rotulos: Sequence[str]):
+        self.nome = nome
+        self.descricao = descricao
+        self.rotulos = tuple(rotulos)
+        self._lock = threading.Lock()
+
+    def _linhas(self) -> List[str]:
+        raise NotImplementedError
+
+    def exportar(self) -> str:
+        cabecalho = [f"# HELP {self.nome} {self.descricao}", f"# TYPE {self.nome} {self.tipo}"]
+        with self._lock:
+            return "\n".join(cabecalho + self._linhas())
+
+
+class Contador(_Metrica):
+    tipo = "counter"
+
+    def __init__(self, nome: str, descricao: str, rotulos: Sequence[str]):
+        super().__init__(nome, descricao, rotulos)
+        self._valores: Dict[Tuple[str, ...], float] = {}
+
+    def incrementar(self, *valores_rotulos: str, quantidade: float = 1.0):
+        with self._lock:
+            self._valores[valores_rotulos] = self._valores.get(valores_rotulos, 0.0) + quantidade
+
+    def _linhas(self) -> List[str]:
+        return [f"{self.nome}{_formatar_rotulos(self.rotulos, chave)} {_formatar_numero(v)}" for chave, v in self._valores.items()]
+
+
+class Medidor(Contador):
+    tipo = "gauge"
+
+    def decrementar(self, *valores_rotulos: str):
+        self.incrementar(*valores_rotulos, quantidade=-1.0)
+
+
+class Histograma(_Metrica):
+    tipo = "histogram"
+
+    def __init__(self, nome: str, descricao: str, rotulos: Sequence[str], baldes: Sequence[float]):
+        super().__init__(nome, descricao, rotulos)
+        self.baldes = tuple(baldes)
+        # Por combinação de rótulos: [contagem por balde (não cumulativa)..., soma, total]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observar(self, valor: float, *valores_rotulos: str):
+        with self._lock:
+            serie = self._series.get(valores_rotulos)
+            if serie is None:
+                serie = self._series[valores_rotulos] = [0.0] * (len(self.baldes) + 2)
+            for indice, limite in enumerate(self.baldes):
+                if valor <= limite:
+                    serie[indice] += 1
+                    break
+            serie[-2] += valor
+            serie[-1] += 1
+
+    def _linhas(self) -> List[str]:
+        linhas = []
+        for chave, serie in self._series.items():
+            acumulado = 0.0
+            for limite, contagem in zip(self.baldes, serie):
+                acumulado += contagem
+                rotulos = _formatar_rotulos(self.rotulos, chave, ("le", _formatar_numero(limite)))
+                linhas.append(f"{self.nome}_bucket{rotulos} {_formatar_numero(acumulado)}")
+            linhas.append(f"{self.nome}_bucket{_formatar_rotulos(self.rotulos, chave, ('le', '+Inf'))} {_formatar_numero(serie[-1])}")
+            linhas.append(f"{self.nome}_sum{_formatar_rotulos(self.rotulos, chave)} {_formatar_numero(serie[-2])}")
+            linhas.append(f"{self.nome}_count{_formatar_rotulos(self.rotulos, chave)} {_formatar_numero(serie[-1])}")
+        return linhas
+
+
+ROTULOS_OPERACAO = ("endpoint", "banco", "operacao")
+
+duracao_operacao = Histograma(
+    "nosql_operacao_duracao_segundos", "Duração das chamadas aos bancos (prazo e disjuntor incluídos).", ROTULOS_OPERACAO, BALDES_DURACAO
+)
+itens_operacao = Histograma(
+    "nosql_operacao_itens", "Quantidade de itens devolvidos por chamada ao banco.", ROTULOS_OPERACAO, BALDES_ITENS
+)
+erros_operacao = Contador(
+    "nosql_operacao_erros_total", "Chamadas aos bancos que terminaram em exceção, por tipo de erro.", ROTULOS_OPERACAO + ("erro",)
+)
+operacoes_em_andamento = Medidor(
+    "nosql_operacao_em_andamento", "Chamadas aos bancos em andamento.", ROTULOS_OPERACAO
+)
+duracao_requisicao = Histograma(
+    "nosql_http_requisicao_duracao_segundos", "Duração das requisições HTTP, da chegada ao fim da resposta.",
+    ("endpoint", "metodo", "status"), BALDES_DURACAO
+)
+
+METRICAS: List[_Metrica] = [duracao_operacao, itens_operacao, erros_operacao, operacoes_em_andamento, duracao_requisicao]
+
+
+def exportar_metricas() -> str:
+    """Todas as métricas no formato texto de exposição do Prometheus (versão 0.0.4)."""
+    return "\n".join(metrica.exportar() for metrica in METRICAS) + "\n"
+
+
+# --- Rótulos vindos do contexto da requisição ---
+
+def operacao_medida(operacao: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorador dos servico_*: as chamadas aos bancos feitas dentro dele levam o rótulo operacao
+    e, quando amostrada, a chamada vira o span raiz do rastreamento.
+    """
+    def decorador(funcao: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(funcao)
+        async def envolver(*args, **kwargs):
+            token = _operacao_atual.set(operacao)
+            try:
+                with span(f"servico.{operacao}", endpoint=endpoint_atual()):
+                    return await funcao(*args, **kwargs)
+            finally:
+                _operacao_atual.reset(token)
+        return envolver
+    return decorador
+
+
+def operacao_atual() -> str:
+    return _operacao_atual.get()
+
+
+@contextmanager
+def na_operacao(operacao: str) -> Iterator[None]:
+    """Reativa o rótulo operacao fora do servico_* (ex.: lotes de streaming lidos depois que ele retornou)."""
+    token = _operacao_atual.set(operacao)
+    try:
+        yield
+    finally:
+        _operacao_atual.reset(token)
+
+
+@contextmanager
+def sem_contabilidade() -> Iterator[None]:
+    """
+    Chamadas aos bancos feitas dentro do bloco (e nas tarefas/threads que ele cria) ficam fora
+    de /metrics, da janela do roteador de latência e do disjuntor. Usado pelo aquecimento.
+    """
+    token = _contabilizar.set(False)
+    try:
+        yield
+    finally:
+        _contabilizar.reset(token)
+
+
+def contabilizando() -> bool:
+    return _contabilizar.get()
+
+
+def definir_escopo_requisicao(escopo: Dict[str, Any]):
+    return _escopo_requisicao.set(escopo)
+
+
+def restaurar_escopo_requisicao(token):
+    _escopo_requisicao.reset(token)
+
+
+def endpoint_do_escopo(escopo: Optional[Dict[str, Any]]) -> str:
+    """Caminho da rota (com {parametros}, para não explodir a cardinalidade) ou "nao_roteado"."""
+    if escopo is None:
+        return ENDPOINT_FORA_DE_REQUISICAO
+    caminho = getattr(escopo.get("route"), "path", None) # O FastAPI guarda a rota casada em scope["route"]
+    return caminho if caminho is not None else "nao_roteado"
+
+
+def endpoint_atual() -> str:
+    return endpoint_do_escopo(_escopo_requisicao.get())
+
+
+def tamanho_resultado(resultado: Any) -> int:
+    """Itens no resultado de um CRUD: listas, páginas (filmes, posição) e lotes; 1 para os demais."""
+    if resultado is None:
+        return 0
+    if isinstance(resultado, tuple) and resultado and isinstance(resultado[0], list):
+        return len(resultado[0])
+    if isinstance(resultado, (list, tuple)):
+        return len(resultado)
+    return 1
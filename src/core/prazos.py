@@ -0,0 +1,65 @@
+# src/core/prazos.py
+"""
+Prazos (deadlines) por banco e por tipo de operação.
+
+O prazo da operação em andamento fica numa ContextVar, que é copiada para a thread do
+executor (ver executar_bloqueante) e lida pelos drivers:
+  - MongoDB: pymongo.timeout() -> maxTimeMS em cada comando;
+  - Cassandra: timeout de cada statement (sessão devolvida por get_cassandra_session);
+  - Neo4j: timeout da transação em execute_read/execute_write (driver de get_neo4j_driver);
+  - Redis: não tem prazo por comando; o cliente de get_redis_client confere o prazo antes de
+    cada comando e de cada pipeline (verificar_prazo) e o REDIS_SOCKET_TIMEOUT limita um comando.
+Além disso, o serviço deixa de esperar (asyncio.wait_for) quando o prazo estoura, mesmo que
+o driver ainda não tenha desistido. A thread abandonada no executor para no próximo comando
+Redis em vez de seguir ocupando uma vaga até o fim da operação.
+"""
+import asyncio
+import contextlib
+import contextvars
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import pymongo
+
+from src.core.db_config import PRAZOS_OPERACAO
+from src.core.exceptions import TempoEsgotadoError
+
+_prazo_atual: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("prazo_atual", default=None)
+_limite_atual: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("limite_prazo", default=None) # time.monotonic()
+
+
+def prazo_para(nome_banco: str, tipo_operacao: str) -> Optional[float]:
+    """Prazo em segundos configurado para (banco, tipo de operação), ou None se desativado."""
+    prazo = PRAZOS_OPERACAO.get(nome_banco, {}).get(tipo_operacao, 0)
+    return prazo if prazo and prazo > 0 else None
+
+
+def prazo_atual() -> Optional[float]:
+    """Prazo da operação em andamento neste contexto (None fora de executar_com_prazo)."""
+    return _prazo_atual.get()
+
+
+def verificar_prazo(nome_banco: str):
+    """Levanta TempoEsgotadoError se o prazo da operação em andamento já passou (checagem entre comandos)."""
+    limite = _limite_atual.get()
+    if limite is not None and time.monotonic() >= limite:
+        raise TempoEsgotadoError(f"({nome_banco.capitalize()}) Prazo de {_prazo_atual.get():g}s excedido; comando não enviado.")
+
+
+async def executar_com_prazo(nome_banco: str, tipo_operacao: str, executar: Callable[[], Awaitable[Any]]) -> Any:
+    """Executa executar() com o prazo de (banco, tipo); levanta TempoEsgotadoError se estourar."""
+    prazo = prazo_para(nome_banco, tipo_operacao)
+    if prazo is None:
+        return await executar()
+
+    token = _prazo_atual.set(prazo)
+    token_limite = _limite_atual.set(time.monotonic() + prazo)
+    try:
+        # pymongo.timeout também é uma ContextVar: vale para o cliente síncrono (na thread) e o async
+        with pymongo.timeout(prazo) if nome_banco == "mongo" else contextlib.nullcontext():
+            return await asyncio.wait_for(executar(), timeout=prazo)
+    except asyncio.TimeoutError as e:
+        raise TempoEsgotadoError(f"({nome_banco.capitalize()}) Prazo de {prazo:g}s excedido na operação de {tipo_operacao}.") from e
+    finally:
+        _limite_atual.reset(token_limite)
+        _prazo_atual.reset(token)
@@ -0,0 +1,67 @@
+# src/core/projecao.py
+"""
+Projeção de campos (parâmetro `campos=`) nas leituras de filmes.
+
+O cliente escolhe quais campos do filme quer receber (o _id vem sempre) e cada CRUD traduz
+a lista para a forma nativa do banco: projeção no MongoDB, map projection no Cypher, lista
+explícita de colunas no CQL e HMGET no Redis. Assim campos grandes como a sinopse nem saem
+do banco quando a tela não precisa deles. campos=None mantém o comportamento de sempre
+(todos os campos).
+"""
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from src.core.exceptions import DataValidationError
+
+CAMPOS_FILME = ("titulo", "tipo", "ano_lancamento", "generos", "nota", "numero_votos", "duracao", "sinopse")
+
+
+def normalizar_campos(campos: Optional[Union[str, Iterable[str]]]) -> Optional[List[str]]:
+    """
+    Campos pedidos pelo cliente ("titulo,nota" ou lista), sem repetição e na ordem de
+    CAMPOS_FILME; None quando o parâmetro não foi enviado. O _id é sempre incluído e não
+    precisa ser pedido. Levanta DataValidationError para campos que o filme não tem.
+    """
+    if campos is None:
+        return None
+    if isinstance(campos, str):
+        campos = campos.split(",")
+    pedidos = {c.strip() for c in campos if c and c.strip()} - {"_id", "id", "titulo_id"}
+    invalidos = sorted(pedidos - set(CAMPOS_FILME))
+    if invalidos:
+        raise DataValidationError(
+            f"Campos inválidos em 'campos': {', '.join(invalidos)}. Disponíveis: {', '.join(CAMPOS_FILME)}."
+        )
+    return [c for c in CAMPOS_FILME if c in pedidos]
+
+
+def validar_campos_atualizacao(atualizacoes: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Confere que a atualização parcial só mexe em campos do filme (nunca no _id), já que os
+    nomes viram colunas/propriedades na query. Levanta DataValidationError se estiver vazia.
+    """
+    if not atualizacoes:
+        raise DataValidationError("Informe ao menos um campo para atualizar.")
+    invalidos = sorted(set(atualizacoes) - set(CAMPOS_FILME))
+    if invalidos:
+        raise DataValidationError(
+            f"Campos não atualizáveis: {', '.join(invalidos)}. Disponíveis: {', '.join(CAMPOS_FILME)}."
+        )
+    return atualizacoes
+
+
+def campos_leitura(campos: Optional[List[str]], *necessarios: Optional[str]) -> Optional[List[str]]:
+    """
+    Campos a ler do banco: os pedidos mais os que a própria consulta usa (campo de ordenação,
+    filtros aplicados no Python). None continua significando todos os campos.
+    """
+    if campos is None:
+        return None
+    extras = [c for c in necessarios if c in CAMPOS_FILME and c not in campos]
+    return campos + list(dict.fromkeys(extras))
+
+
+def projetar_filme(filme: Dict[str, Any], campos: Optional[List[str]]) -> Dict[str, Any]:
+    """O filme só com o _id e os campos pedidos: tira os extras lidos por campos_leitura."""
+    if campos is None:
+        return filme
+    return {chave: valor for chave, valor in filme.items() if chave == "_id" or chave in campos}
@@ -0,0 +1,127 @@
+# src/core/rastreamento.py
+"""
+Rastreamento amostrado (spans) das chamadas de serviço e de CRUD.
+
+Cada servico_* abre um span "servico.<operacao>" (via operacao_medida) e cada chamada a um
+banco um span filho "banco.<nome>" (via _executar_protegido). A amostragem é decidida uma
+única vez, no span raiz (head-based): com RASTREAMENTO_AMOSTRAGEM=0.1, 10% das operações
+são rastreadas por inteiro e as demais não custam mais que uma leitura de contextvar.
+Com a amostragem em 0 (padrão) span() devolve sempre o mesmo objeto nulo.
+
+Os spans amostrados vão para RASTREAMENTO_ARQUIVO (uma linha JSON por span) ou, sem
+arquivo, para o logger deste módulo em nível DEBUG.
+"""
+import json
+import logging
+import os
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Union
+
+from src.core.db_config import RASTREAMENTO_AMOSTRAGEM, RASTREAMENTO_ARQUIVO, LOG_NIVEL
+
+logger = logging.getLogger(__name__)
+
+_NAO_AMOSTRADO = object() # Marca a árvore inteira como descartada (filhos não sorteiam de novo)
+
+_span_atual: ContextVar[Union["_Span", object, None]] = ContextVar("span_rastreamento", default=None)
+
+_trava_arquivo = threading.Lock()
+
+
+def configurar_logs():
+    """Nível e formato dos logs da API (LOG_NIVEL); os prints de diagnóstico viraram logger.debug."""
+    logging.basicConfig(
+        level=getattr(logging, LOG_NIVEL, logging.WARNING),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+
+class _SpanNulo:
+    """Span que não mede nada: usado com o rastreamento desligado e dentro de traces não amostrados."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def definir(self, **atributos):
+        pass
+
+
+_SPAN_NULO = _SpanNulo()
+
+
+class _RaizDescartada(_SpanNulo):
+    """Raiz que perdeu o sorteio: marca o contexto para que os spans filhos também sejam nulos."""
+    __slots__ = ("_token",)
+
+    def __enter__(self):
+        self._token = _span_atual.set(_NAO_AMOSTRADO)
+        return self
+
+    def __exit__(self, *exc):
+        _span_atual.reset(self._token)
+        return False
+
+
+class _Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "nome", "atributos", "_inicio", "_inicio_epoch", "_token")
+
+    def __init__(self, nome: str, pai: Optional["_Span"], atributos: Dict[str, Any]):
+        self.nome = nome
+        self.trace_id = pai.trace_id if pai is not None else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = pai.span_id if pai is not None else None
+        self.atributos = atributos
+
+    def __enter__(self):
+        self._token = _span_atual.set(self)
+        self._inicio_epoch = time.time()
+        self._inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo_exc, exc, tb):
+        duracao_ms = (time.perf_counter() - self._inicio) * 1000
+        _span_atual.reset(self._token)
+        _exportar({
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "nome": self.nome,
+            "inicio": self._inicio_epoch,
+            "duracao_ms": round(duracao_ms, 3),
+            "atributos": self.atributos,
+            "erro": f"{tipo_exc.__name__}: {exc}" if tipo_exc is not None else None,
+        })
+        return False
+
+    def definir(self, **atributos):
+        """Acrescenta atributos conhecidos só no fim da chamada (ex.: quantidade de itens)."""
+        self.atributos.update(atributos)
+
+
+def span(nome: str, **atributos: Any) -> Union[_Span, _SpanNulo]:
+    """Span para usar com `with`; o sorteio da amostragem só acontece quando não há span pai."""
+    if RASTREAMENTO_AMOSTRAGEM <= 0:
+        return _SPAN_NULO
+    pai = _span_atual.get()
+    if pai is _NAO_AMOSTRADO:
+        return _SPAN_NULO
+    if pai is None and random.random() >= RASTREAMENTO_AMOSTRAGEM:
+        return _RaizDescartada()
+    return _Span(nome, pai, atributos)
+
+
+def _exportar(registro: Dict[str, Any]):
+    linha = json.dumps(registro, ensure_ascii=False, default=str)
+    if RASTREAMENTO_ARQUIVO:
+        with _trava_arquivo:
+            with open(RASTREAMENTO_ARQUIVO, "a", encoding="utf-8") as arquivo:
+                arquivo.write(linha + "\n")
+    else:
+        logger.debug("span %s", linha)
@@ -0,0 +1,102 @@
+# src/core/roteamento.py
+"""
+Roteamento adaptativo de banco=auto pela latência recente de cada banco.
+
+Toda leitura que chega a um banco (leitura ou analytics, fora do cache) registra a sua duração
+(nas falhas do banco, pelo menos o prazo da operação; cancelamentos não contam) numa janela deslizante das últimas ROTEAMENTO_JANELA chamadas de (operação, banco). No modo
+auto cada operação vai para o banco com o menor p95 nessa janela, de modo que a busca avançada
+e as agregações sigam para quem está ganhando nelas e filmes por ator para quem ganha ali, sem
+fixar um banco no código. Para que a escolha acompanhe mudanças de desempenho:
+  - bancos com menos de ROTEAMENTO_MIN_AMOSTRAS na janela são testados antes dos demais;
+  - uma fração ROTEAMENTO_EXPLORACAO das chamadas vai para outro banco, sorteado;
+  - bancos com o disjuntor aberto/meio aberto só são usados se não houver outro.
+Usado apenas no event loop da API.
+"""
+import random
+from collections import deque
+from typing import Any, Deque, Dict, List, Sequence, Tuple
+
+from src.core.db_config import ROTEAMENTO_EXPLORACAO, ROTEAMENTO_JANELA, ROTEAMENTO_MIN_AMOSTRAS
+from src.core.disjuntor import disjuntores
+
+CRITERIO_P95 = "p95"
+CRITERIO_EXPLORACAO = "exploracao"
+CRITERIO_POUCAS_AMOSTRAS = "poucas_amostras"
+CRITERIO_ALTERNATIVA = "alternativa" # O banco escolhido falhou e a chamada seguiu para o próximo
+
+
+def _percentil(valores: Sequence[float], fracao: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(fracao * len(ordenados)))]
+
+
+class RoteadorLatencia:
+    def __init__(self, janela: int, min_amostras: int, exploracao: float):
+        self.janela = janela
+        self.min_amostras = max(1, min_amostras)
+        self.exploracao = exploracao
+        self._duracoes: Dict[Tuple[str, str], Deque[float]] = {}
+        self._escolhas: Dict[Tuple[str, str, str], int] = {}
+
+    def registrar(self, operacao: str, nome_banco: str, duracao_s: float):
+        """Duração de uma leitura no banco (nas falhas do banco, pelo menos o prazo da operação)."""
+        duracoes = self._duracoes.get((operacao, nome_banco))
+        if duracoes is None:
+            duracoes = self._duracoes[(operacao, nome_banco)] = deque(maxlen=self.janela)
+        duracoes.append(duracao_s)
+
+    def amostras(self, operacao: str, nome_banco: str) -> int:
+        return len(self._duracoes.get((operacao, nome_banco), ()))
+
+    def p95(self, operacao: str, nome_banco: str) -> float:
+        """p95 (segundos) da janela; infinito enquanto não houver amostras."""
+        duracoes = self._duracoes.get((operacao, nome_banco))
+        return _percentil(duracoes, 0.95) if duracoes else float("inf")
+
+    def ordenar(self, operacao: str, bancos: Sequence[str]) -> Tuple[List[str], str]:
+        """
+        Bancos na ordem em que devem ser tentados para a operação e o critério da escolha
+        do primeiro (os seguintes servem de alternativa se ele falhar).
+        """
+        saudaveis = [nome for nome in bancos if not disjuntores[nome].degradado]
+        degradados = [nome for nome in bancos if disjuntores[nome].degradado]
+        ordem = sorted(saudaveis, key=lambda nome: self.p95(operacao, nome)) + degradados
+        criterio = CRITERIO_P95
+
+        poucas_amostras = [nome for nome in saudaveis if self.amostras(operacao, nome) < self.min_amostras]
+        if poucas_amostras:
+            escolhido = min(poucas_amostras, key=lambda nome: self.amostras(operacao, nome))
+            criterio = CRITERIO_POUCAS_AMOSTRAS
+        elif len(saudaveis) > 1 and random.random() < self.exploracao:
+            escolhido = random.choice([nome for nome in saudaveis if nome != ordem[0]])
+            criterio = CRITERIO_EXPLORACAO
+        else:
+            escolhido = ordem[0]
+        ordem.remove(escolhido)
+        ordem.insert(0, escolhido)
+        self._escolhas[(operacao, escolhido, criterio)] = self._escolhas.get((operacao, escolhido, criterio), 0) + 1
+        return ordem, criterio
+
+    def estado(self) -> Dict[str, Any]:
+        """p95, amostras e escolhas por operação e banco (para GET /admin/roteamento)."""
+        por_operacao: Dict[str, Dict[str, Any]] = {}
+        for (operacao, nome_banco), duracoes in self._duracoes.items():
+            por_operacao.setdefault(operacao, {})[nome_banco] = {
+                "amostras": len(duracoes),
+                "p95_ms": round(_percentil(duracoes, 0.95) * 1000, 3) if duracoes else None,
+                "escolhas": {},
+            }
+        for (operacao, nome_banco, criterio), quantidade in self._escolhas.items():
+            banco = por_operacao.setdefault(operacao, {}).setdefault(
+                nome_banco, {"amostras": 0, "p95_ms": None, "escolhas": {}}
+            )
+            banco["escolhas"][criterio] = quantidade
+        return {
+            "janela": self.janela,
+            "min_amostras": self.min_amostras,
+            "exploracao": self.exploracao,
+            "operacoes": por_operacao,
+        }
+
+
+roteador_latencia = RoteadorLatencia(ROTEAMENTO_JANELA, ROTEAMENTO_MIN_AMOSTRAS, ROTEAMENTO_EXPLORACAO)
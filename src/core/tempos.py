@@ -0,0 +1,114 @@
+# src/core/tempos.py
+"""
+Medição por fases de cada requisição, exposta no cabeçalho Server-Timing.
+
+O middleware (src/api/server_timing.py) abre um registro de medições por requisição numa
+contextvar; como executar_bloqueante copia o contexto para a thread do executor, as fases
+medidas dentro dos CRUDs caem no mesmo registro. Fases por banco:
+  conexao        -> obtenção do cliente/sessão (get_*_db/session/driver/client)
+  fila           -> espera por uma thread livre no executor do banco (modo síncrono)
+  decodificacao  -> conversão das linhas/nós/hashes em dict (_mapear_filme_cassandra, _node_to_dict, _deserialize_redis_filme)
+  filtragem      -> filtros e ordenação feitos no Python (Cassandra e Redis)
+  driver         -> o restante do tempo da chamada ao banco (rede + driver)
+e, sem banco, a serialização da resposta. Fora de uma requisição medida, tudo é no-op.
+"""
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+FASES_POR_BANCO = ("conexao", "fila", "driver", "decodificacao", "filtragem")
+_FASE_EXECUCAO = "execucao" # Tempo total da chamada ao banco; o "driver" é o que sobra dele
+
+_medicoes_requisicao: ContextVar[Optional[Dict[Tuple[Optional[str], str], float]]] = ContextVar(
+    "medicoes_server_timing", default=None
+)
+
+
+def iniciar_medicoes() -> Token:
+    return _medicoes_requisicao.set({})
+
+
+def medicoes_atuais() -> Optional[Dict[Tuple[Optional[str], str], float]]:
+    return _medicoes_requisicao.get()
+
+
+def encerrar_medicoes(token: Token):
+    _medicoes_requisicao.reset(token)
+
+
+def registrar_fase(fase: str, nome_banco: Optional[str], duracao_ms: float):
+    """Soma duracao_ms à fase (do banco, ou da requisição se nome_banco=None)."""
+    medicoes = _medicoes_requisicao.get()
+    if medicoes is not None:
+        chave = (nome_banco, fase)
+        medicoes[chave] = medicoes.get(chave, 0.0) + duracao_ms
+
+
+@contextmanager
+def medir(fase: str, nome_banco: Optional[str] = None) -> Iterator[None]:
+    if _medicoes_requisicao.get() is None:
+        yield
+        return
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar_fase(fase, nome_banco, (time.perf_counter() - inicio) * 1000)
+
+
+def medir_execucao(nome_banco: str):
+    """Mede a chamada inteira ao banco (base para calcular a fase "driver")."""
+    return medir(_FASE_EXECUCAO, nome_banco)
+
+
+def medir_fase(fase: str, nome_banco: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorador: acumula o tempo de cada chamada da função (síncrona ou async) na fase."""
+    def decorador(funcao: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(funcao):
+            @functools.wraps(funcao)
+            async def envolver_async(*args, **kwargs):
+                if _medicoes_requisicao.get() is None:
+                    return await funcao(*args, **kwargs)
+                inicio = time.perf_counter()
+                try:
+                    return await funcao(*args, **kwargs)
+                finally:
+                    registrar_fase(fase, nome_banco, (time.perf_counter() - inicio) * 1000)
+            return envolver_async
+
+        @functools.wraps(funcao)
+        def envolver(*args, **kwargs):
+            if _medicoes_requisicao.get() is None:
+                return funcao(*args, **kwargs)
+            inicio = time.perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                registrar_fase(fase, nome_banco, (time.perf_counter() - inicio) * 1000)
+        return envolver
+    return decorador
+
+
+def cabecalho_server_timing(medicoes: Dict[Tuple[Optional[str], str], float], total_ms: float) -> str:
+    """
+    Valor do Server-Timing, ex.: "redis-conexao;dur=0.02, redis-driver;dur=3.10, ..., serializacao;dur=0.80, total;dur=5.20".
+    """
+    medicoes = dict(medicoes) # Cópia: threads de bancos perdedores (mais_rapido) ainda podem escrever
+    metricas = []
+    bancos = sorted({banco for banco, _ in medicoes if banco is not None})
+    for banco in bancos:
+        fases = {fase: medicoes.get((banco, fase), 0.0) for fase in FASES_POR_BANCO if fase != "driver"}
+        execucao = medicoes.get((banco, _FASE_EXECUCAO))
+        if execucao is not None:
+            fases["driver"] = max(execucao - sum(fases.values()), 0.0)
+        for fase in FASES_POR_BANCO:
+            if fases.get(fase):
+                metricas.append(f"{banco}-{fase};dur={fases[fase]:.2f}")
+    for (banco, fase), duracao in medicoes.items():
+        if banco is None:
+            metricas.append(f"{fase};dur={duracao:.2f}")
+    metricas.append(f"total;dur={total_ms:.2f}")
+    return ", ".join(metricas)
@@ -0,0 +1,137 @@
+# src/databases/cassandra/async_crud.py
+"""
+Consultas de leitura do Cassandra sem ocupar threads do executor (MODO_DRIVER=async).
+O cassandra-driver não tem API asyncio: usamos session.execute_async e ligamos o
+ResponseFuture (callbacks na thread de I/O do driver) a um Future do event loop.
+"""
+import asyncio
+from typing import List, Dict, Any, Optional, Sequence
+from cassandra.cluster import Session
+from cassandra.query import SimpleStatement
+
+from src.databases.cassandra.crud import (
+    _montar_cql_busca_avancada,
+    _mapear_filme_cassandra,
+    _colunas_filme_cql,
+    _colunas_filtros_python,
+    _preparar,
+    _query_filme_por_id_preparada,
+    _ordenar_e_filtrar_resultados_cassandra_com_regra,
+    _contar_linhas_por_ano,
+    _calcular_media_por_genero
+)
+from src.core.exceptions import DatabaseInteractionError
+
+
+async def _executar_cql_async(session: Session, statement: Any, parametros: Optional[Sequence[Any]] = None) -> List[Any]:
+    """
+    Executa a query com execute_async e aguarda todas as páginas sem bloquear o event loop.
+    Os callbacks rodam na thread do driver, então o resultado volta via call_soon_threadsafe.
+    """
+    loop = asyncio.get_running_loop()
+    futuro: asyncio.Future = loop.create_future()
+    linhas: List[Any] = []
+    response_future = session.execute_async(statement, parametros)
+
+    def _definir_resultado(resultado: List[Any]):
+        if not futuro.done():
+            futuro.set_result(resultado)
+
+    def _definir_erro(erro: BaseException):
+        if not futuro.done():
+            futuro.set_exception(erro)
+
+    def _ao_receber_pagina(pagina):
+        linhas.extend(pagina)
+        if response_future.has_more_pages:
+            response_future.start_fetching_next_page() # Próxima página chama este callback de novo
+        else:
+            loop.call_soon_threadsafe(_definir_resultado, linhas)
+
+    def _ao_falhar(erro):
+        loop.call_soon_threadsafe(_definir_erro, erro)
+
+    response_future.add_callbacks(callback=_ao_receber_pagina, errback=_ao_falhar)
+    return await futuro
+
+
+async def buscar_filme_por_id(session: Session, titulo_id: str, tabela: str = "filmes", campos: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    """Busca um filme pelo seu titulo_id (PK). Retorna dict compatível com FilmeResponse ou None."""
+    try:
+        rows = await _executar_cql_async(
+            session, f"SELECT {_colunas_filme_cql(campos)} FROM {tabela} WHERE titulo_id = %s", (titulo_id,)
+        )
+        if rows:
+            return _mapear_filme_cassandra(rows[0]._asdict())
+        return None
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao buscar filme por ID '{titulo_id}' no Cassandra (async): {e}")
+
+
+async def buscar_filmes_por_ids(
+    session: Session, ids_filmes: List[str], tabela: str = "filmes", campos: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """Uma leitura preparada de partição única por id, todas em paralelo no event loop; mantém a ordem dos ids."""
+    if not ids_filmes:
+        return []
+    try:
+        # prepare() é bloqueante, mas só na primeira vez de cada query
+        statement = _preparar(session, _query_filme_por_id_preparada(tabela, campos))
+        resultados = await asyncio.gather(*(_executar_cql_async(session, statement, (id_filme,)) for id_filme in ids_filmes))
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao buscar {len(ids_filmes)} filmes por ID no Cassandra (async): {repr(e)}")
+    return [_mapear_filme_cassandra(rows[0]._asdict()) for rows in resultados if rows]
+
+
+async def buscar_filmes_avancado(
+    session: Session,
+    tabela: str = "filmes",
+    filtros_cql: Optional[Dict[str, Any]] = None,
+    filtros_python: Optional[Dict[str, Any]] = None,
+    ordenar_por: Optional[str] = "nota",
+    ordem: int = -1,
+    limite: int = 10000,
+    limite_fetch_cassandra: int = 5000,
+    ano_corte_futuro_param: int = 2025,
+    campos: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    colunas = _colunas_filme_cql(campos, ordenar_por, *_colunas_filtros_python(filtros_python))
+    query_base_str, cql_values = _montar_cql_busca_avancada(tabela, filtros_cql, limite_fetch_cassandra, colunas)
+
+    try:
+        statement = SimpleStatement(query_base_str, fetch_size=min(100, limite_fetch_cassandra))
+        rows = await _executar_cql_async(session, statement, tuple(cql_values))
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao executar busca base no Cassandra (async): {repr(e)}") from e
+
+    resultados_brutos_do_cassandra = []
+    for row_object in rows:
+        filme_dict_convertido = row_object._asdict()
+        resultados_brutos_do_cassandra.append({"_id": filme_dict_convertido.get("titulo_id"), **filme_dict_convertido})
+
+    return _ordenar_e_filtrar_resultados_cassandra_com_regra(
+        resultados_brutos_do_cassandra,
+        filtros_python.copy() if filtros_python else {},
+        ordenar_por,
+        ordem,
+        limite,
+        ano_corte_futuro=ano_corte_futuro_param
+    )
+
+
+async def contar_filmes_por_ano(session: Session, filmes_tabela: str = "filmes") -> List[Dict[str, Any]]:
+    """Conta filmes por ano de lançamento. Retorna lista de {'_id': ano, 'quantidade': qtd}."""
+    try:
+        rows = await _executar_cql_async(session, SimpleStatement(f"SELECT ano_lancamento FROM {filmes_tabela} ALLOW FILTERING"))
+        return _contar_linhas_por_ano(rows)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao contar filmes por ano (Cassandra async): {e}")
+
+
+async def media_notas_por_genero(session: Session, filmes_tabela: str = "filmes") -> List[Dict[str, Any]]:
+    """Calcula a média de notas por gênero. Retorna lista de {'genero': nome, 'media_nota': media}."""
+    try:
+        rows = await _executar_cql_async(session, SimpleStatement(f"SELECT generos, nota FROM {filmes_tabela} ALLOW FILTERING"))
+        return _calcular_media_por_genero(rows)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao calcular média de notas por gênero (Cassandra async): {e}")
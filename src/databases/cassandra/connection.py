@@ -1,15 +1,55 @@
 # src/databases/cassandra/connection.py
-from cassandra.cluster import Cluster, Session
+import logging
+import asyncio
+import threading
+from typing import Optional
+from cassandra.cluster import Cluster, Session, _NOT_SET
 from cassandra.auth import PlainTextAuthProvider
-from src.core.db_config import CASSANDRA_USER, CASSANDRA_PASSWORD, CASSANDRA_HOST, CASSANDRA_PORT, CASSANDRA_KEYSPACE
+from src.core.db_config import (
+    CASSANDRA_USER, CASSANDRA_PASSWORD, CASSANDRA_HOST, CASSANDRA_PORT, CASSANDRA_KEYSPACE,
+    CASSANDRA_EXECUTOR_THREADS, CASSANDRA_CONNECT_TIMEOUT
+)
+from src.core.prazos import prazo_atual
+from src.core.tempos import medir_fase
+
+logger = logging.getLogger(__name__)
 # Importe as exceções customizadas se for usá-las aqui
 # from src.core.exceptions import DatabaseOperationError, DatabaseInteractionError
 
+cluster_cassandra: Optional[Cluster] = None
+sessao_cassandra: Optional[Session] = None
+_lock_sessao_cassandra = threading.Lock()
+
+
+class _SessaoComPrazo:
+    """
+    Envolve a Session compartilhada para aplicar o prazo da operação em andamento
+    (src/core/prazos.py) como timeout de cada statement que não define o seu.
+    O resto é repassado à Session original.
+    """
+    def __init__(self, session: Session):
+        self._session = session
+
+    def execute(self, query, parameters=None, timeout=_NOT_SET, *args, **kwargs):
+        if timeout is _NOT_SET and prazo_atual() is not None:
+            timeout = prazo_atual()
+        return self._session.execute(query, parameters, timeout, *args, **kwargs)
+
+    def execute_async(self, query, parameters=None, trace=False, custom_payload=None, timeout=_NOT_SET, *args, **kwargs):
+        if timeout is _NOT_SET and prazo_atual() is not None:
+            timeout = prazo_atual()
+        return self._session.execute_async(query, parameters, trace, custom_payload, timeout, *args, **kwargs)
+
+    def __getattr__(self, nome):
+        return getattr(self._session, nome)
+
+sessao_cassandra_com_prazo: Optional[_SessaoComPrazo] = None
+
 
 def _criar_schema_cassandra(session: Session, keyspace: str):
     """
     Cria o keyspace e as tabelas necessárias no Cassandra IF NOT EXISTS.
-    Esta função é chamada internamente ao obter uma sessão.
+    Esta função é chamada internamente na criação da sessão compartilhada.
     """
     try:
         session.execute(f"""
@@ -58,31 +98,70 @@ def _criar_schema_cassandra(session: Session, keyspace: str):
         # Ex: para buscar por titulo_id rapidamente (se não for parte da PK de forma eficiente)
         # session.execute("CREATE INDEX IF NOT EXISTS idx_elenco_titulo_id ON elenco (titulo_id);")
 
-        print(f"Keyspace '{keyspace}' e tabelas verificadas/criadas com sucesso no Cassandra.")
+        logger.info("Keyspace '%s' e tabelas verificadas/criadas com sucesso no Cassandra.", keyspace)
     except Exception as e:
         # Em um app real, logar este erro criticamente.
-        print(f"ALERTA: Falha ao criar/verificar schema no Cassandra para keyspace '{keyspace}': {e}")
+        logger.warning("ALERTA: Falha ao criar/verificar schema no Cassandra para keyspace '%s': %s", keyspace, e)
         # Você pode decidir se quer levantar uma exceção aqui e parar a aplicação
         # ou se a aplicação pode tentar continuar (pode falhar depois).
         # Para o TCC, um print pode ser suficiente, mas o ideal é levantar o erro.
         # raise DatabaseInteractionError(f"Falha ao configurar schema do Cassandra: {e}") from e
 
 
+@medir_fase("conexao", "cassandra")
 def get_cassandra_session() -> Session:
-    """Retorna uma sessão Cassandra conectada e com keyspace/tabelas garantidos."""
-    try:
-        auth_provider = PlainTextAuthProvider(username=CASSANDRA_USER, password=CASSANDRA_PASSWORD)
-        cluster = Cluster([CASSANDRA_HOST], port=CASSANDRA_PORT, auth_provider=auth_provider)
-        session = cluster.connect() # Conecta sem keyspace primeiro para criar o keyspace
-
-        # Garante que o schema (keyspace e tabelas) exista
-        _criar_schema_cassandra(session, CASSANDRA_KEYSPACE)
-        
-        # A função _criar_schema_cassandra já faz o session.set_keyspace()
-        # Se não fizesse, você faria aqui: session.set_keyspace(CASSANDRA_KEYSPACE)
-        
-        return session
-    except Exception as e:
-        print(f"Falha crítica ao conectar ou configurar o Cassandra: {e}")
-        # raise ConnectionError(f"Falha ao conectar no Cassandra: {e}") # Ou sua exceção customizada
-        raise # Re-levanta a exceção original se for crítica para a conexão
\ No newline at end of file
+    """
+    Retorna a sessão Cassandra compartilhada, conectada e com keyspace/tabelas garantidos.
+    O Cluster e a Session são criados uma única vez por processo (a Session é thread-safe
+    e já mantém o pool de conexões por host); o schema só é verificado nessa criação.
+    """
+    global cluster_cassandra, sessao_cassandra, sessao_cassandra_com_prazo
+    if sessao_cassandra is None:
+        with _lock_sessao_cassandra:
+            if sessao_cassandra is None:
+                try:
+                    auth_provider = PlainTextAuthProvider(username=CASSANDRA_USER, password=CASSANDRA_PASSWORD)
+                    cluster = Cluster(
+                        [CASSANDRA_HOST],
+                        port=CASSANDRA_PORT,
+                        auth_provider=auth_provider,
+                        executor_threads=CASSANDRA_EXECUTOR_THREADS,
+                        connect_timeout=CASSANDRA_CONNECT_TIMEOUT
+                    )
+                    session = cluster.connect() # Conecta sem keyspace primeiro para criar o keyspace
+
+                    # Garante que o schema (keyspace e tabelas) exista
+                    # A função _criar_schema_cassandra já faz o session.set_keyspace()
+                    _criar_schema_cassandra(session, CASSANDRA_KEYSPACE)
+
+                    cluster_cassandra = cluster
+                    sessao_cassandra_com_prazo = _SessaoComPrazo(session)
+                    sessao_cassandra = session
+                except Exception as e:
+                    logger.error("Falha crítica ao conectar ou configurar o Cassandra: %s", e)
+                    raise # Re-levanta a exceção original se for crítica para a conexão
+    return sessao_cassandra_com_prazo
+
+
+def close_cassandra_session():
+    """Encerra a sessão e o cluster Cassandra se estiverem abertos."""
+    global cluster_cassandra, sessao_cassandra, sessao_cassandra_com_prazo
+    with _lock_sessao_cassandra:
+        if cluster_cassandra is not None:
+            cluster_cassandra.shutdown()
+            logger.info("Conexão com Cassandra fechada.")
+        cluster_cassandra = None
+        sessao_cassandra = None
+        sessao_cassandra_com_prazo = None
+
+
+@medir_fase("conexao", "cassandra")
+async def get_cassandra_session_async() -> Session:
+    """
+    Versão para o MODO_DRIVER=async. O cassandra-driver não tem cliente asyncio: a mesma
+    Session é usada com execute_async (ver async_crud.py). Só a criação, que é bloqueante,
+    vai para uma thread quando a sessão ainda não existe.
+    """
+    if sessao_cassandra is not None:
+        return sessao_cassandra_com_prazo
+    return await asyncio.to_thread(get_cassandra_session)
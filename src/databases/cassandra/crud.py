@@ -1,10 +1,12 @@
 # src/databases/cassandra/crud.py
+import logging
 from cassandra.cluster import Session
 from cassandra.query import SimpleStatement
 from cassandra.encoder import Encoder # Para lidar com tipos complexos se necessário
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple, Callable
 import re # Para limpar_generos_cassandra
+import weakref
 
 # Importa as exceções centralizadas
 from src.core.exceptions import (
@@ -15,14 +17,21 @@ from src.core.exceptions import (
     DatabaseInteractionError,
     ValidationError
 )
+from src.core.projecao import campos_leitura, validar_campos_atualizacao
+from src.core.filtros_filme import filme_atende_filtros
+from src.core.lote import item_inserido, item_com_erro, item_duplicado
+from src.core.tempos import medir_fase
 
 # Importa os modelos Pydantic para usar em carregar_dados e para referência de estrutura
 from src.models.filme import Filme as FilmeModelPydantic # Renomeando para evitar conflito de nome
 from src.models.ator import Ator as AtorModelPydantic
 from src.models.elenco import Elenco as ElencoModelPydantic
 
+logger = logging.getLogger(__name__)
+
 # --- FUNÇÕES AUXILIARES ---
 
+@medir_fase("filtragem", "cassandra")
 def _ordenar_e_filtrar_resultados_cassandra(
     resultados_brutos: List[Dict[str, Any]],
     filtros_python: Dict[str, Any], # Filtros a serem aplicados em Python
@@ -35,8 +44,8 @@ def _ordenar_e_filtrar_resultados_cassandra(
     Cassandra é limitado em suas capacidades de filtragem e ordenação via CQL diretamente
     em colunas que não fazem parte da chave primária ou de índices específicos.
     """
-    print(f"DEBUG CASSANDRA (_ordenar_e_filtrar): Recebido {len(resultados_brutos)} resultados brutos para filtrar.")
-    print(f"DEBUG CASSANDRA (_ordenar_e_filtrar): Aplicando filtros_python: {filtros_python}")
+    logger.debug("DEBUG CASSANDRA (_ordenar_e_filtrar): Recebido %s resultados brutos para filtrar.", len(resultados_brutos))
+    logger.debug("DEBUG CASSANDRA (_ordenar_e_filtrar): Aplicando filtros_python: %s", filtros_python)
     
     resultados_filtrados = []
     if filtros_python:
@@ -76,8 +85,8 @@ def _ordenar_e_filtrar_resultados_cassandra(
         try:
             resultados_filtrados.sort(key=chave_ordem, reverse=(ordem == -1))
         except TypeError as te:
-            print(f"AVISO CASSANDRA: TypeError durante ordenação Python para o campo '{ordenar_por}': {te}")
-    print(f"DEBUG CASSANDRA (_ordenar_e_filtrar): Retornando {len(resultados_filtrados)} resultados após filtros Python e ordenação.")
+            logger.warning("AVISO CASSANDRA: TypeError durante ordenação Python para o campo '%s': %s", ordenar_por, te)
+    logger.debug("DEBUG CASSANDRA (_ordenar_e_filtrar): Retornando %s resultados após filtros Python e ordenação.", len(resultados_filtrados))
     return resultados_filtrados[:limite_final]
 
 
@@ -90,7 +99,7 @@ def _buscar_ator_id_por_identificador_cassandra(
     Busca o ator_id no Cassandra. Tenta primeiro como PK (ator_id), 
     depois por nome_ator (pode exigir ALLOW FILTERING ou índice secundário).
     """
-    print(f"DEBUG CASSANDRA: Buscando ator com identificador: '{identificador_ator}' na tabela '{atores_tabela}'")
+    logger.debug("DEBUG CASSANDRA: Buscando ator com identificador: '%s' na tabela '%s'", identificador_ator, atores_tabela)
     
     # Tentativa 1: Buscar como se fosse ator_id (PK)
     query_por_id_str = f"SELECT ator_id FROM {atores_tabela} WHERE ator_id = %s"
@@ -98,10 +107,10 @@ def _buscar_ator_id_por_identificador_cassandra(
         statement_id = SimpleStatement(query_por_id_str)
         row_id = session.execute(statement_id, (identificador_ator,)).one()
         if row_id:
-            print(f"DEBUG CASSANDRA: Ator encontrado por ator_id (PK) '{identificador_ator}'")
+            logger.debug("DEBUG CASSANDRA: Ator encontrado por ator_id (PK) '%s'", identificador_ator)
             return row_id.ator_id
     except Exception as e:
-        print(f"DEBUG CASSANDRA: Exceção ao buscar ator por ator_id (PK) '{identificador_ator}': {e}")
+        logger.debug("DEBUG CASSANDRA: Exceção ao buscar ator por ator_id (PK) '%s': %s", identificador_ator, e)
 
     # Tentativa 2: Buscar como se fosse nome_ator
     # Esta query provavelmente precisará de "ALLOW FILTERING" ou um índice secundário em nome_ator.
@@ -113,17 +122,37 @@ def _buscar_ator_id_por_identificador_cassandra(
         # Pegamos o primeiro encontrado para simplificar, mas em um sistema real, isso precisaria de mais tratamento.
         row_nome = session.execute(statement_nome, (identificador_ator,)).one() 
         if row_nome:
-            print(f"DEBUG CASSANDRA: Ator encontrado por nome_ator '{identificador_ator}', ID retornado: {row_nome.ator_id}")
+            logger.debug("DEBUG CASSANDRA: Ator encontrado por nome_ator '%s', ID retornado: %s", identificador_ator, row_nome.ator_id)
             return row_nome.ator_id
     except Exception as e:
-        print(f"DEBUG CASSANDRA: Exceção ao buscar ator por nome_ator '{identificador_ator}': {e}")
+        logger.debug("DEBUG CASSANDRA: Exceção ao buscar ator por nome_ator '%s': %s", identificador_ator, e)
 
-    print(f"DEBUG CASSANDRA: Ator com identificador '{identificador_ator}' não encontrado (nem como _id, nem como nome_ator).")
+    logger.debug("DEBUG CASSANDRA: Ator com identificador '%s' não encontrado (nem como _id, nem como nome_ator).", identificador_ator)
     return None
 
 
 # --- INSERÇÕES ---
 
+_COLUNAS_INSERT_FILME = ("titulo_id", "titulo", "tipo", "ano_lancamento", "generos", "nota", "numero_votos", "duracao", "sinopse")
+
+def _query_insert_filme(marcador: str, tabela: str = "filmes") -> str:
+    """INSERT do filme com `marcador` como placeholder ("%s" para SimpleStatement, "?" para prepare)."""
+    return f"INSERT INTO {tabela} ({', '.join(_COLUNAS_INSERT_FILME)}) VALUES ({', '.join([marcador] * len(_COLUNAS_INSERT_FILME))})"
+
+def _parametros_insert_filme(filme_data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Valores na ordem de _COLUNAS_INSERT_FILME, já convertidos para os tipos das colunas."""
+    return (
+        filme_data.get("titulo_id"),
+        filme_data.get("titulo"),
+        filme_data.get("tipo"),
+        filme_data.get("ano_lancamento"), # Deve ser int ou None
+        list(filme_data.get("generos", [])) if filme_data.get("generos") is not None else None, # Garante que é lista ou None
+        float(filme_data.get("nota")) if filme_data.get("nota") is not None else None,
+        int(filme_data.get("numero_votos")) if filme_data.get("numero_votos") is not None else None,
+        int(filme_data.get("duracao")) if filme_data.get("duracao") is not None else None,
+        filme_data.get("sinopse")
+    )
+
 def inserir_filme(session: Session, filme_data: Dict[str, Any]) -> str:
     """Insere um filme. Levanta ItemAlreadyExistsError ou DatabaseInteractionError."""
     # Validação Pydantic (opcional aqui, mas bom se os dados vierem de fontes não confiáveis)
@@ -145,22 +174,8 @@ def inserir_filme(session: Session, filme_data: Dict[str, Any]) -> str:
         # Preparar os dados para inserção
         # Cassandra lida bem com 'None' para campos não fornecidos, se a tabela permitir.
         # Listas como 'generos' são inseridas diretamente.
-        insert_query_str = """
-        INSERT INTO filmes (titulo_id, titulo, tipo, ano_lancamento, generos, nota, numero_votos, duracao, sinopse)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        params = (
-            filme_data.get("titulo_id"),
-            filme_data.get("titulo"),
-            filme_data.get("tipo"),
-            filme_data.get("ano_lancamento"), # Deve ser int ou None
-            list(filme_data.get("generos", [])) if filme_data.get("generos") is not None else None, # Garante que é lista ou None
-            float(filme_data.get("nota")) if filme_data.get("nota") is not None else None,
-            int(filme_data.get("numero_votos")) if filme_data.get("numero_votos") is not None else None,
-            int(filme_data.get("duracao")) if filme_data.get("duracao") is not None else None,
-            filme_data.get("sinopse")
-        )
-        session.execute(SimpleStatement(insert_query_str), params)
+        insert_query_str = _query_insert_filme("%s")
+        session.execute(SimpleStatement(insert_query_str), _parametros_insert_filme(filme_data))
         return filme_data
     except ItemAlreadyExistsError: # Re-levantar para não ser pego pelo Exception genérico abaixo
         raise
@@ -168,6 +183,52 @@ def inserir_filme(session: Session, filme_data: Dict[str, Any]) -> str:
         raise DatabaseInteractionError(f"Erro ao inserir filme '{titulo_id}' no Cassandra: {e}")
 
 
+def inserir_filmes_em_lote(session: Session, filmes_data: List[Dict[str, Any]], concorrencia: int = 64) -> List[Dict[str, Any]]:
+    """
+    Insere vários filmes com statements preparados disparados em paralelo (execute_async),
+    sem BATCH: cada INSERT vai direto para a réplica da sua partição, e um BATCH
+    multi-partição só sobrecarregaria o coordenador. A checagem de existência (que o
+    inserir_filme faz antes de escrever) também vira leituras preparadas concorrentes.
+    Devolve um resultado por filme (ver src.core.lote).
+    """
+    resultados: List[Optional[Dict[str, Any]]] = [None] * len(filmes_data)
+    validos: List[Tuple[int, str, Tuple[Any, ...]]] = []
+    for posicao, filme_data in enumerate(filmes_data):
+        titulo_id = filme_data.get("titulo_id")
+        if not titulo_id:
+            resultados[posicao] = item_com_erro(None, DataValidationError("titulo_id é obrigatório para inserir filme."))
+            continue
+        try:
+            validos.append((posicao, str(titulo_id), _parametros_insert_filme(filme_data)))
+        except (ValueError, TypeError) as e_conv:
+            resultados[posicao] = item_com_erro(titulo_id, DataValidationError(f"Dados inválidos para o filme '{titulo_id}': {e_conv}"))
+    if not validos:
+        return resultados
+    try:
+        checagem = _preparar(session, _QUERY_FILME_EXISTE)
+        insercao = _preparar(session, _query_insert_filme("?"))
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao preparar a inserção em lote no Cassandra: {repr(e)}")
+
+    existentes = _executar_concorrente(session, checagem, [(titulo_id,) for _, titulo_id, _ in validos], concorrencia)
+    novos = []
+    for (posicao, titulo_id, parametros), existente in zip(validos, existentes):
+        if isinstance(existente, Exception):
+            resultados[posicao] = item_com_erro(titulo_id, DatabaseInteractionError(repr(existente)))
+        elif existente.one():
+            resultados[posicao] = item_duplicado(titulo_id)
+        else:
+            novos.append((posicao, titulo_id, parametros))
+
+    inseridos = _executar_concorrente(session, insercao, [parametros for _, _, parametros in novos], concorrencia)
+    for (posicao, titulo_id, _), resultado in zip(novos, inseridos):
+        if isinstance(resultado, Exception):
+            resultados[posicao] = item_com_erro(titulo_id, DatabaseInteractionError(repr(resultado)))
+        else:
+            resultados[posicao] = item_inserido(titulo_id)
+    return resultados
+
+
 def inserir_ator(session: Session, ator_data: Dict[str, Any]) -> str:
     """Insere um ator. Levanta ItemAlreadyExistsError ou DatabaseInteractionError."""
     ator_id = ator_data.get("ator_id")
@@ -233,28 +294,125 @@ def inserir_elenco(session: Session, relacao_data: Dict[str, Any]) -> Dict[str,
 
 # --- CONSULTAS ---
 
-def buscar_filme_por_id(session: Session, titulo_id: str, tabela: str = "filmes") -> Optional[Dict[str, Any]]:
+@medir_fase("decodificacao", "cassandra")
+def _mapear_filme_cassandra(filme_dict_raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Mapeia uma linha da tabela filmes (row._asdict()) para o formato do FilmeResponse."""
+    return {
+        "_id": filme_dict_raw.get("titulo_id"), # Para o alias 'id' no FilmeResponse
+        "titulo_id": filme_dict_raw.get("titulo_id"), # Pode manter se útil
+        "titulo": filme_dict_raw.get("titulo"),
+        "tipo": filme_dict_raw.get("tipo"),
+        "ano_lancamento": filme_dict_raw.get("ano_lancamento"),
+        "generos": filme_dict_raw.get("generos", []), # Default lista vazia
+        "nota": filme_dict_raw.get("nota"),
+        "numero_votos": filme_dict_raw.get("numero_votos"),
+        "duracao": filme_dict_raw.get("duracao"),
+        "sinopse": filme_dict_raw.get("sinopse")
+    }
+
+# Colunas lidas por cada filtro Python da busca avançada (os de "performance" também dependem
+# da regra de filme futuro sem avaliação: ano_lancamento, nota e numero_votos)
+_COLUNAS_FILTROS_PYTHON = {
+    "titulo_contem": ("titulo",),
+    "tipo": ("tipo",),
+    "generos_contem_todos": ("generos",),
+    "ano_lancamento_min": ("ano_lancamento",),
+    "nota_min": ("nota", "ano_lancamento", "numero_votos"),
+    "duracao_min": ("duracao", "tipo", "ano_lancamento", "nota", "numero_votos"),
+}
+
+def _colunas_filtros_python(filtros_python: Optional[Dict[str, Any]]) -> List[str]:
+    return [
+        coluna for filtro, valor in (filtros_python or {}).items() if valor is not None
+        for coluna in _COLUNAS_FILTROS_PYTHON.get(filtro, ())
+    ]
+
+def _colunas_filme_cql(campos: Optional[List[str]], *necessarias: Optional[str]) -> str:
+    """Lista de colunas do SELECT na tabela filmes: `*` sem projeção, senão titulo_id + campos pedidos + necessárias."""
+    colunas = campos_leitura(campos, *necessarias)
+    if colunas is None:
+        return "*"
+    return ", ".join(["titulo_id", *colunas])
+
+# Statements preparados por sessão (preparar custa uma ida ao servidor; a sessão é compartilhada)
+_statements_preparados: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+def _preparar(session: Session, query_str: str) -> Any:
+    """PreparedStatement de query_str nesta sessão, preparado uma única vez."""
+    preparados = _statements_preparados.setdefault(session, {})
+    statement = preparados.get(query_str)
+    if statement is None:
+        statement = preparados[query_str] = session.prepare(query_str)
+    return statement
+
+def _query_filme_por_id_preparada(tabela: str, campos: Optional[List[str]]) -> str:
+    return f"SELECT {_colunas_filme_cql(campos)} FROM {tabela} WHERE titulo_id = ?"
+
+_QUERY_FILME_EXISTE = "SELECT titulo_id FROM filmes WHERE titulo_id = ?"
+
+def preparar_consultas_frequentes(session: Session) -> int:
+    """
+    Prepara de antemão os statements fixos (leitura por id sem projeção, checagem de existência
+    e inserção), para que a primeira requisição que os usa não pague a ida extra do prepare.
+    Retorna quantos statements estão preparados.
+    """
+    consultas = (_query_filme_por_id_preparada("filmes", None), _QUERY_FILME_EXISTE, _query_insert_filme("?"))
+    for query_str in consultas:
+        _preparar(session, query_str)
+    return len(consultas)
+
+def _executar_concorrente(session: Session, statement: Any, lista_parametros: List[Tuple[Any, ...]], concorrencia: int = 64) -> List[Any]:
+    """
+    Executa o statement uma vez por conjunto de parâmetros com execute_async, até `concorrencia`
+    requisições em voo. Devolve, na ordem, o resultado de cada execução ou a exceção que ela levantou.
+    """
+    resultados: List[Any] = []
+    for inicio in range(0, len(lista_parametros), concorrencia):
+        futuros = [session.execute_async(statement, parametros) for parametros in lista_parametros[inicio:inicio + concorrencia]]
+        for futuro in futuros:
+            try:
+                resultados.append(futuro.result())
+            except Exception as e:
+                resultados.append(e)
+    return resultados
+
+def buscar_filmes_por_ids(
+    session: Session,
+    ids_filmes: List[str],
+    tabela: str = "filmes",
+    campos: Optional[List[str]] = None,
+    concorrencia: int = 64
+) -> List[Dict[str, Any]]:
+    """
+    Vários filmes pelo titulo_id: uma leitura preparada de partição única por id, disparadas
+    em paralelo com execute_async (até `concorrencia` em voo) em vez de um IN multi-partição,
+    que sobrecarrega um único coordenador. Mantém a ordem de ids_filmes.
+    """
+    if not ids_filmes:
+        return []
+    try:
+        statement = _preparar(session, _query_filme_por_id_preparada(tabela, campos))
+        filmes: List[Dict[str, Any]] = []
+        for resultado in _executar_concorrente(session, statement, [(id_filme,) for id_filme in ids_filmes], concorrencia):
+            if isinstance(resultado, Exception):
+                raise resultado
+            row = resultado.one()
+            if row:
+                filmes.append(_mapear_filme_cassandra(row._asdict()))
+        return filmes
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao buscar {len(ids_filmes)} filmes por ID no Cassandra: {repr(e)}")
+
+def buscar_filme_por_id(session: Session, titulo_id: str, tabela: str = "filmes", campos: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
     """Busca um filme pelo seu titulo_id (PK). Retorna dict compatível com FilmeResponse ou None."""
-    query_str = f"SELECT * FROM {tabela} WHERE titulo_id = %s" # Usando %s
+    query_str = f"SELECT {_colunas_filme_cql(campos)} FROM {tabela} WHERE titulo_id = %s" # Usando %s
     try:
         # Passando a query string e params diretamente para execute, como funcionou no teste
         result = session.execute(query_str, (titulo_id,))
         row = result.one()
         if row:
-            filme_dict_raw = row._asdict()
             # Mapeamento para FilmeResponse
-            return {
-                "_id": filme_dict_raw.get("titulo_id"), # Para o alias 'id' no FilmeResponse
-                "titulo_id": filme_dict_raw.get("titulo_id"), # Pode manter se útil
-                "titulo": filme_dict_raw.get("titulo"),
-                "tipo": filme_dict_raw.get("tipo"),
-                "ano_lancamento": filme_dict_raw.get("ano_lancamento"),
-                "generos": filme_dict_raw.get("generos", []), # Default lista vazia
-                "nota": filme_dict_raw.get("nota"),
-                "numero_votos": filme_dict_raw.get("numero_votos"),
-                "duracao": filme_dict_raw.get("duracao"),
-                "sinopse": filme_dict_raw.get("sinopse")
-            }
+            return _mapear_filme_cassandra(row._asdict())
         return None 
     except Exception as e:
         raise DatabaseInteractionError(f"Erro ao buscar filme por ID '{titulo_id}' no Cassandra: {repr(e)}")
@@ -284,72 +442,7 @@ def buscar_ator_por_id(session: Session, ator_id: str, tabela: str = "atores") -
 # src/databases/cassandra/crud.py
 # ... (importações, exceções, _limpar_generos_cassandra) ...
 
-# Função auxiliar para aplicar filtros Python com a nova regra
-def _aplicar_filtros_python_cassandra_com_regra_futuro(
-    filme: Dict[str, Any],
-    filtros_python: Dict[str, Any],
-    ano_corte_futuro: int = 2025
-) -> bool:
-    """Aplica filtros Python a um filme, considerando a regra para filmes futuros."""
-    if not filtros_python:
-        return True # Passa se não há filtros Python
-
-    match = True
-    ano_lancamento_filme = filme.get("ano_lancamento")
-    nota_filme = filme.get("nota")
-    votos_filme = filme.get("numero_votos") # Supondo que você tenha esse campo
-
-    # Verifica se é um filme "futuro/sem avaliação"
-    is_filme_futuro_sem_avaliacao = False
-    if ano_lancamento_filme is not None and ano_lancamento_filme >= ano_corte_futuro:
-        if (nota_filme is None or nota_filme == 0 or nota_filme == 0.0) and \
-           (votos_filme is None or votos_filme == 0):
-            is_filme_futuro_sem_avaliacao = True
-
-    for campo_filtro, valor_filtro in filtros_python.items():
-        if valor_filtro is None: continue # Ignora filtros com valor None
-
-        # Campos que são sempre aplicados
-        if campo_filtro == "titulo_contem" and isinstance(valor_filtro, str):
-            if valor_filtro.lower() not in str(filme.get("titulo", "")).lower():
-                match = False; break
-        elif campo_filtro == "tipo" and isinstance(valor_filtro, str):
-            if filme.get("tipo", "").lower() != valor_filtro.lower():
-                match = False; break
-        elif campo_filtro == "generos_contem_todos" and isinstance(valor_filtro, list) and valor_filtro:
-            filme_generos_set = set(g.lower() for g in filme.get("generos", []))
-            filtro_generos_set = set(g.lower() for g in valor_filtro)
-            if not filtro_generos_set.issubset(filme_generos_set):
-                match = False; break
-        elif campo_filtro == "ano_lancamento_min" and isinstance(valor_filtro, int): # Filtro de ano_min sempre aplicado
-            if ano_lancamento_filme is None or ano_lancamento_filme < valor_filtro:
-                match = False; break
-        
-        # Campos de "performance" que são ignorados para filmes futuros sem avaliação
-        elif campo_filtro in ["nota_min", "numero_votos_min", "duracao_min"]:
-            if is_filme_futuro_sem_avaliacao:
-                continue # Pula este filtro para filmes futuros sem avaliação
-
-            # Aplica o filtro normalmente para outros filmes
-            if campo_filtro == "nota_min" and isinstance(valor_filtro, (int, float)):
-                if nota_filme is None or nota_filme < valor_filtro:
-                    match = False; break
-            # elif campo_filtro == "numero_votos_min" and isinstance(valor_filtro, int):
-            #     if votos_filme is None or votos_filme < valor_filtro:
-            #         match = False; break
-            elif campo_filtro == "duracao_min" and isinstance(valor_filtro, int):
-                tipo_filme = filme.get("tipo", "").lower()
-                if tipo_filme != "jogo": # Duração não se aplica a jogos
-                    if filme.get("duracao") is None or filme.get("duracao") < valor_filtro:
-                        match = False; break
-        else:
-            # Filtro desconhecido, pode logar ou ignorar
-            #print(f"AVISO CASSANDRA: Filtro Python desconhecido '{campo_filtro}'")
-            pass
-
-    return match
-
-
+@medir_fase("filtragem", "cassandra")
 def _ordenar_e_filtrar_resultados_cassandra_com_regra(
     resultados_brutos: List[Dict[str, Any]],
     filtros_python: Dict[str, Any],
@@ -361,7 +454,7 @@ def _ordenar_e_filtrar_resultados_cassandra_com_regra(
     
     resultados_filtrados_py = [
         filme for filme in resultados_brutos 
-        if _aplicar_filtros_python_cassandra_com_regra_futuro(filme, filtros_python, ano_corte_futuro)
+        if filme_atende_filtros(filme, filtros_python, ano_corte_futuro)
     ]
     
     if ordenar_por and resultados_filtrados_py:
@@ -373,28 +466,20 @@ def _ordenar_e_filtrar_resultados_cassandra_com_regra(
         try:
             resultados_filtrados_py.sort(key=sort_key, reverse=(ordem == -1))
         except TypeError:
-            print(f"Aviso CASSANDRA: TypeError durante ordenação Python para o campo '{ordenar_por}'.")
+            logger.warning("Aviso CASSANDRA: TypeError durante ordenação Python para o campo '%s'.", ordenar_por)
 
     return resultados_filtrados_py[:limite_final]
 
 import os,json
 
-def buscar_filmes_avancado(
-    session: Session,
-    tabela: str = "filmes",
-    filtros_cql: Optional[Dict[str, Any]] = None,
-    filtros_python: Optional[Dict[str, Any]] = None, # Este dict terá as chaves do FiltrosBuscaAvancadaPayload
-    ordenar_por: Optional[str] = "nota",
-    ordem: int = -1,
-    limite: int = 10000,
-    limite_fetch_cassandra: int = 5000, # Aumentar para ter mais chance de pegar filmes futuros
-    salvar_em_arquivo: bool = False,
-    nome_arquivo_debug: str = "debug_resultados_cassandra.json",
-    ano_corte_futuro_param: int = 2025 # Passado do serviço
-) -> List[Dict[str, Any]]:
-    # ... (lógica para construir query_base_str e executar a query CQL como antes) ...
-    # ... (para pegar resultados_brutos_do_cassandra) ...
-    query_base_str = f"SELECT * FROM {tabela}"
+def _montar_cql_busca_avancada(
+    tabela: str,
+    filtros_cql: Optional[Dict[str, Any]],
+    limite_fetch_cassandra: Optional[int],
+    colunas: str = "*"
+) -> Tuple[str, List[Any]]:
+    """Monta a query CQL base da busca avançada e a lista de valores dos placeholders (sem LIMIT se limite_fetch_cassandra for None)."""
+    query_base_str = f"SELECT {colunas} FROM {tabela}"
     cql_conditions = []
     cql_values = []
 
@@ -407,7 +492,27 @@ def buscar_filmes_avancado(
         query_base_str += " WHERE " + " AND ".join(cql_conditions)
     
     # Tentamos buscar um pouco mais para a filtragem Python, especialmente se filtros CQL são poucos
-    query_base_str += f" LIMIT {limite_fetch_cassandra} ALLOW FILTERING" 
+    if limite_fetch_cassandra is not None:
+        query_base_str += f" LIMIT {limite_fetch_cassandra}"
+    query_base_str += " ALLOW FILTERING" 
+    return query_base_str, cql_values
+
+def buscar_filmes_avancado(
+    session: Session,
+    tabela: str = "filmes",
+    filtros_cql: Optional[Dict[str, Any]] = None,
+    filtros_python: Optional[Dict[str, Any]] = None, # Este dict terá as chaves do FiltrosBuscaAvancadaPayload
+    ordenar_por: Optional[str] = "nota",
+    ordem: int = -1,
+    limite: int = 10000,
+    limite_fetch_cassandra: int = 5000, # Aumentar para ter mais chance de pegar filmes futuros
+    salvar_em_arquivo: bool = False,
+    nome_arquivo_debug: str = "debug_resultados_cassandra.json",
+    ano_corte_futuro_param: int = 2025, # Passado do serviço
+    campos: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    colunas = _colunas_filme_cql(campos, ordenar_por, *_colunas_filtros_python(filtros_python))
+    query_base_str, cql_values = _montar_cql_busca_avancada(tabela, filtros_cql, limite_fetch_cassandra, colunas)
     
     resultados_brutos_do_cassandra = [] 
     try:
@@ -441,13 +546,122 @@ def buscar_filmes_avancado(
             full_file_path = os.path.join(debug_output_folder, nome_arquivo_debug)
             with open(full_file_path, 'w', encoding='utf-8') as f:
                 json.dump(final_results, f, ensure_ascii=False, indent=4)
-            print(f"DEBUG CASSANDRA: Resultados da busca avançada salvos em '{full_file_path}'")
+            logger.debug("DEBUG CASSANDRA: Resultados da busca avançada salvos em '%s'", full_file_path)
         except Exception as e:
-            print(f"DEBUG CASSANDRA ERRO: Falha ao salvar resultados em arquivo: {e}")
+            logger.warning("DEBUG CASSANDRA ERRO: Falha ao salvar resultados em arquivo: %s", e)
 
     return final_results
 
 
+def iterar_filmes_avancado(
+    session: Session,
+    tabela: str = "filmes",
+    filtros_cql: Optional[Dict[str, Any]] = None,
+    filtros_python: Optional[Dict[str, Any]] = None,
+    ordenar_por: Optional[str] = "nota",
+    ordem: int = -1,
+    limite: int = 10000,
+    limite_fetch_cassandra: int = 5000,
+    ano_corte_futuro_param: int = 2025,
+    tamanho_lote: int = 500,
+    campos: Optional[List[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Versão em streaming de buscar_filmes_avancado. As páginas do resultado são filtradas
+    conforme chegam e só os `limite` melhores ficam em memória, em vez da varredura inteira.
+    Como a ordenação é feita em Python, os filmes só saem depois de percorrer todas as páginas.
+    """
+    colunas = _colunas_filme_cql(campos, ordenar_por, *_colunas_filtros_python(filtros_python))
+    query_base_str, cql_values = _montar_cql_busca_avancada(tabela, filtros_cql, limite_fetch_cassandra, colunas)
+    filtros_python_copia = filtros_python.copy() if filtros_python else {}
+
+    melhores: List[Dict[str, Any]] = []
+    lote: List[Dict[str, Any]] = []
+    try:
+        statement = SimpleStatement(query_base_str, fetch_size=min(tamanho_lote, limite_fetch_cassandra))
+        for row_object in session.execute(statement, tuple(cql_values)):
+            filme_dict_convertido = row_object._asdict()
+            lote.append({"_id": filme_dict_convertido.get("titulo_id"), **filme_dict_convertido})
+            if len(lote) >= tamanho_lote:
+                # Filtrar de novo os que já passaram não muda nada: basta manter os melhores + o lote
+                melhores = _ordenar_e_filtrar_resultados_cassandra_com_regra(
+                    melhores + lote, filtros_python_copia, ordenar_por, ordem, limite, ano_corte_futuro=ano_corte_futuro_param
+                )
+                lote = []
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao executar busca base no Cassandra: {repr(e)}") from e
+
+    yield from _ordenar_e_filtrar_resultados_cassandra_com_regra(
+        melhores + lote, filtros_python_copia, ordenar_por, ordem, limite, ano_corte_futuro=ano_corte_futuro_param
+    )
+
+
+def _paginar_cql(
+    session: Session,
+    query_str: str,
+    valores: Tuple[Any, ...],
+    tamanho_pagina: int,
+    apos: Optional[Dict[str, Any]],
+    processar_linhas: Callable[[List[Any]], List[Dict[str, Any]]]
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Pagina uma query CQL pelo paging_state do driver (fetch_size = tamanho_pagina).
+    processar_linhas converte as linhas de uma página do Cassandra nos itens entregues
+    (descartando as que não passam nos filtros). A posição devolvida guarda o paging_state
+    da página do Cassandra onde a nossa página terminou e quantos itens dela já foram
+    entregues, então cada chamada lê só as páginas necessárias a partir dali.
+    """
+    estado = bytes.fromhex(apos["estado"]) if apos and apos.get("estado") else None
+    pular = apos.get("pular", 0) if apos else 0
+    statement = SimpleStatement(query_str, fetch_size=tamanho_pagina)
+    itens: List[Dict[str, Any]] = []
+    while True:
+        resultado = session.execute(statement, valores, paging_state=estado)
+        disponiveis = processar_linhas(resultado.current_rows)[pular:]
+        faltam = tamanho_pagina - len(itens)
+        if len(disponiveis) > faltam:
+            itens.extend(disponiveis[:faltam])
+            return itens, {"estado": estado.hex() if estado else None, "pular": pular + faltam}
+        itens.extend(disponiveis)
+        estado, pular = resultado.paging_state, 0
+        if estado is None:
+            return itens, None
+        if len(itens) == tamanho_pagina:
+            return itens, {"estado": estado.hex(), "pular": 0}
+
+
+def paginar_filmes_avancado(
+    session: Session,
+    tabela: str = "filmes",
+    filtros_cql: Optional[Dict[str, Any]] = None,
+    filtros_python: Optional[Dict[str, Any]] = None,
+    ano_corte_futuro_param: int = 2025,
+    tamanho_pagina: int = 20,
+    apos: Optional[Dict[str, Any]] = None,
+    campos: Optional[List[str]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Uma página da busca avançada pelo paging_state do Cassandra. Sem ORDER BY fora da
+    chave de clustering, as páginas seguem a ordem do token da partição (não há
+    ordenação por campo); os filtros Python são aplicados página a página.
+    """
+    colunas = _colunas_filme_cql(campos, *_colunas_filtros_python(filtros_python))
+    query_base_str, cql_values = _montar_cql_busca_avancada(tabela, filtros_cql, None, colunas)
+    filtros_python_copia = filtros_python.copy() if filtros_python else {}
+
+    def _filtrar_linhas(linhas: List[Any]) -> List[Dict[str, Any]]:
+        filmes = (_mapear_filme_cassandra(linha._asdict()) for linha in linhas)
+        return [
+            filme for filme in filmes
+            if filme_atende_filtros(filme, filtros_python_copia, ano_corte_futuro_param)
+        ]
+
+    try:
+        return _paginar_cql(session, query_base_str, tuple(cql_values), tamanho_pagina, apos, _filtrar_linhas)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao executar busca avançada paginada no Cassandra: {repr(e)}") from e
+
+
 def buscar_filmes_por_ator(
     session: Session, 
     identificador_ator: str, 
@@ -456,16 +670,17 @@ def buscar_filmes_por_ator(
     filmes_tabela: str = "filmes", 
     ordenar_por: str = 'ano_lancamento', 
     ordem: int = -1, 
-    limite: int = 10000
+    limite: int = 10000,
+    campos: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
-    print(f"--- Iniciando buscar_filmes_por_ator (Cassandra) para identificador: {identificador_ator} ---")
+    logger.debug("--- Iniciando buscar_filmes_por_ator (Cassandra) para identificador: %s ---", identificador_ator)
 
     ator_id_encontrado = _buscar_ator_id_por_identificador_cassandra(session, identificador_ator, atores_tabela)
 
     if not ator_id_encontrado:
         return [] 
 
-    print(f"DEBUG CASSANDRA: Buscando filmes para ator_id: {ator_id_encontrado}")
+    logger.debug("DEBUG CASSANDRA: Buscando filmes para ator_id: %s", ator_id_encontrado)
 
     try:
         # 1. Buscar titulo_ids da tabela elenco
@@ -476,16 +691,16 @@ def buscar_filmes_por_ator(
         titulo_ids = list(set([row.titulo_id for row in elenco_rows])) # set para remover duplicatas se houver
 
         if not titulo_ids:
-            print(f"DEBUG CASSANDRA: Nenhum filme encontrado no elenco para o ator_id: {ator_id_encontrado}")
+            logger.debug("DEBUG CASSANDRA: Nenhum filme encontrado no elenco para o ator_id: %s", ator_id_encontrado)
             return []
 
         if len(titulo_ids) > 100: # Limite para evitar queries IN muito grandes
-            print(f"AVISO CASSANDRA: Ator {ator_id_encontrado} tem {len(titulo_ids)} filmes. Limitando busca IN a 100 títulos para performance.")
+            logger.warning("AVISO CASSANDRA: Ator %s tem %s filmes. Limitando busca IN a 100 títulos para performance.", ator_id_encontrado, len(titulo_ids))
             titulo_ids = titulo_ids[:100]
 
         # 2. Buscar detalhes dos filmes
         placeholders = ', '.join(['%s'] * len(titulo_ids))
-        query_filmes_str = f"SELECT * FROM {filmes_tabela} WHERE titulo_id IN ({placeholders})"
+        query_filmes_str = f"SELECT {_colunas_filme_cql(campos, ordenar_por)} FROM {filmes_tabela} WHERE titulo_id IN ({placeholders})"
         
         filmes_rows = session.execute(SimpleStatement(query_filmes_str), tuple(titulo_ids))
         filmes_formatados = []
@@ -506,7 +721,7 @@ def buscar_filmes_por_ator(
             }
             filmes_formatados.append(filme_mapeado)
         
-        print(f"DEBUG CASSANDRA: {len(filmes_formatados)} filmes formatados encontrados para o ator.")
+        logger.debug("DEBUG CASSANDRA: %s filmes formatados encontrados para o ator.", len(filmes_formatados))
 
         return _ordenar_e_filtrar_resultados_cassandra(filmes_formatados, {}, ordenar_por, ordem, limite)
 
@@ -515,6 +730,45 @@ def buscar_filmes_por_ator(
         raise DatabaseInteractionError(f"Erro ao buscar filmes por ator (Cassandra) para ID '{ator_id_encontrado}': {repr(e)}")
 
 
+def paginar_filmes_por_ator(
+    session: Session,
+    identificador_ator: str,
+    atores_tabela: str = "atores",
+    elenco_tabela: str = "elenco",
+    filmes_tabela: str = "filmes",
+    tamanho_pagina: int = 20,
+    apos: Optional[Dict[str, Any]] = None,
+    campos: Optional[List[str]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Uma página dos filmes do ator pelo paging_state da partição do ator na tabela elenco
+    (ordem da chave de clustering, titulo_id); os detalhes vêm com um IN só dos títulos da página.
+    """
+    ator_id_encontrado = _buscar_ator_id_por_identificador_cassandra(session, identificador_ator, atores_tabela)
+    if not ator_id_encontrado:
+        return [], None
+
+    def _filmes_das_linhas(linhas: List[Any]) -> List[Dict[str, Any]]:
+        titulo_ids = list(dict.fromkeys(linha.titulo_id for linha in linhas)) # Sem repetir filmes com mais de um personagem
+        if not titulo_ids:
+            return []
+        placeholders = ', '.join(['%s'] * len(titulo_ids))
+        filmes_rows = session.execute(
+            SimpleStatement(f"SELECT {_colunas_filme_cql(campos)} FROM {filmes_tabela} WHERE titulo_id IN ({placeholders})"),
+            tuple(titulo_ids)
+        )
+        filmes_por_id = {row.titulo_id: _mapear_filme_cassandra(row._asdict()) for row in filmes_rows}
+        return [filmes_por_id[titulo_id] for titulo_id in titulo_ids if titulo_id in filmes_por_id]
+
+    try:
+        return _paginar_cql(
+            session, f"SELECT titulo_id FROM {elenco_tabela} WHERE ator_id = %s", (ator_id_encontrado,),
+            tamanho_pagina, apos, _filmes_das_linhas
+        )
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao paginar filmes por ator (Cassandra) para ID '{ator_id_encontrado}': {repr(e)}")
+
+
 def buscar_atores_por_filmes( # Atores de UM filme específico
     session: Session, 
     id_filme: str,
@@ -523,7 +777,7 @@ def buscar_atores_por_filmes( # Atores de UM filme específico
     filmes_tabela: str = "filmes" # Embora não usada diretamente para buscar filmes aqui, pode ser útil no futuro
 ) -> List[Dict[str, Any]]:
     """Busca atores de um filme. Retorna lista de dicts (ator + personagem)."""
-    print(f"--- Iniciando buscar_atores_por_filmes (Cassandra) para titulo_id: {id_filme} ---")
+    logger.debug("--- Iniciando buscar_atores_por_filmes (Cassandra) para titulo_id: %s ---", id_filme)
     try:
         # 1. Buscar ator_ids e nome_personagem da tabela elenco para o titulo_id_filme
         #   Esta query pode precisar de ALLOW FILTERING se titulo_id não for PK de elenco.
@@ -532,7 +786,7 @@ def buscar_atores_por_filmes( # Atores de UM filme específico
         elenco_participacoes = list(session.execute(SimpleStatement(query_elenco_str), (id_filme,)))
         
         if not elenco_participacoes:
-            print(f"DEBUG CASSANDRA: Nenhum ator encontrado no elenco para o filme_id: {id_filme}")
+            logger.debug("DEBUG CASSANDRA: Nenhum ator encontrado no elenco para o filme_id: %s", id_filme)
             return []
 
         ator_ids_no_filme = list(set([p.ator_id for p in elenco_participacoes])) # Pega IDs únicos dos atores
@@ -566,7 +820,7 @@ def buscar_atores_por_filmes( # Atores de UM filme específico
                 }
                 resultado_final.append(ator_para_resposta)
         
-        print(f"DEBUG CASSANDRA: {len(resultado_final)} atores encontrados para o filme {id_filme}")
+        logger.debug("DEBUG CASSANDRA: %s atores encontrados para o filme %s", len(resultado_final), id_filme)
         return resultado_final
     except Exception as e:
         raise DatabaseInteractionError(f"Erro ao buscar atores do filme '{id_filme}' (Cassandra): {e}")
@@ -577,9 +831,6 @@ def buscar_atores_por_filmes( # Atores de UM filme específico
 def atualizar_campo_filme(session: Session, titulo_id: str, campo_para_atualizar: str, novo_valor: Any, tabela: str = "filmes") -> bool:
     """Atualiza um campo específico de um filme. Levanta ItemNotFoundError."""
     # 1. Verificar se o filme existe
-    print(session)
-    print(titulo_id)
-    print(tabela)
     filme_existente = buscar_filme_por_id(session, titulo_id, tabela)
     if not filme_existente:
         raise ItemNotFoundError(f"Filme com titulo_id '{titulo_id}' não encontrado para atualização no Cassandra.")
@@ -608,6 +859,45 @@ def atualizar_campo_filme(session: Session, titulo_id: str, campo_para_atualizar
         raise DatabaseInteractionError(f"Erro ao atualizar campo '{campo_para_atualizar}' do filme '{titulo_id}' (Cassandra): {e}")
 
 
+def atualizar_campos_filme(session: Session, titulo_id: str, atualizacoes: Dict[str, Any], tabela: str = "filmes") -> Dict[str, Any]:
+    """
+    Atualiza vários campos com um único UPDATE (atômico na partição). O Cassandra não devolve
+    a linha no UPDATE, então o documento retornado é a linha lida na checagem de existência
+    (que o UPDATE, por ser upsert, exige) com os novos valores aplicados: uma leitura a menos
+    que atualizar_campo_filme + buscar_filme_por_id.
+    """
+    valores = _valores_atualizacao_cassandra(atualizacoes, f"do filme '{titulo_id}'")
+
+    try:
+        row = session.execute(_preparar(session, _query_filme_por_id_preparada(tabela, None)), (titulo_id,)).one()
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao buscar filme '{titulo_id}' para atualização (Cassandra): {repr(e)}")
+    if not row:
+        raise ItemNotFoundError(f"Filme com titulo_id '{titulo_id}' não encontrado para atualização no Cassandra.")
+
+    atribuicoes = ", ".join(f"{campo} = ?" for campo in valores)
+    try:
+        statement = _preparar(session, f"UPDATE {tabela} SET {atribuicoes} WHERE titulo_id = ?")
+        session.execute(statement, (*valores.values(), titulo_id))
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao atualizar campos {sorted(valores)} do filme '{titulo_id}' (Cassandra): {repr(e)}")
+    return {**_mapear_filme_cassandra(row._asdict()), **valores}
+
+def _valores_atualizacao_cassandra(atualizacoes: Dict[str, Any], descricao: str) -> Dict[str, Any]:
+    """Valida a atualização parcial e converte os valores para os tipos das colunas (generos como lista)."""
+    validar_campos_atualizacao(atualizacoes)
+    valores = dict(atualizacoes)
+    if valores.get("generos") is not None and not isinstance(valores["generos"], list):
+        valores["generos"] = [g.strip() for g in str(valores["generos"]).split(",") if g.strip()]
+    try:
+        for campo in ("ano_lancamento", "numero_votos", "duracao"):
+            if valores.get(campo) is not None: valores[campo] = int(valores[campo])
+        if valores.get("nota") is not None: valores["nota"] = float(valores["nota"])
+    except (ValueError, TypeError) as e_conv:
+        raise DataValidationError(f"Valor inválido na atualização {descricao}: {e_conv}")
+    return valores
+
+
 # --- REMOÇÃO ---
 
 def remover_filme(session: Session, titulo_id: str, tabela: str = "filmes") -> bool:
@@ -627,62 +917,162 @@ def remover_filme(session: Session, titulo_id: str, tabela: str = "filmes") -> b
         raise DatabaseInteractionError(f"Erro ao remover filme '{titulo_id}' (Cassandra): {e}")
 
 
+# --- ATUALIZAÇÃO / REMOÇÃO EM MASSA (mesmos filtros da busca avançada, sem limite) ---
+
+def _ids_filmes_por_filtro_cassandra(
+    session: Session,
+    tabela: str,
+    titulo: Optional[str],
+    tipo: Optional[str],
+    ano_min: Optional[int],
+    generos: Optional[List[str]],
+    nota_min: Optional[float],
+    duracao_min: Optional[int],
+    ano_corte_futuro: int,
+    tamanho_pagina: int = 1000
+) -> List[str]:
+    """
+    titulo_id dos filmes que casam com o filtro. O Cassandra não tem UPDATE/DELETE por filtro
+    (só pela chave de partição): varre a tabela em páginas lendo só titulo_id e as colunas
+    dos filtros (tipo vai no WHERE) e aplica os demais filtros em Python, como na busca avançada.
+    """
+    filtros_python = {
+        filtro: valor for filtro, valor in {
+            "titulo_contem": titulo, "tipo": tipo, "ano_lancamento_min": ano_min,
+            "generos_contem_todos": generos or None, "nota_min": nota_min, "duracao_min": duracao_min,
+        }.items() if valor is not None
+    }
+    colunas = _colunas_filme_cql([], *_colunas_filtros_python(filtros_python))
+    query_str, cql_values = _montar_cql_busca_avancada(tabela, {"tipo": tipo} if tipo else None, None, colunas)
+    try:
+        rows = session.execute(SimpleStatement(query_str, fetch_size=tamanho_pagina), tuple(cql_values))
+        return [
+            filme["titulo_id"] for filme in (row._asdict() for row in rows)
+            if filme_atende_filtros(filme, filtros_python, ano_corte_futuro)
+        ]
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao selecionar filmes por filtro no Cassandra: {repr(e)}") from e
+
+def _conferir_execucoes_em_massa(resultados: List[Any], descricao: str) -> int:
+    """Quantas execuções concorrentes deram certo; levanta DatabaseInteractionError se alguma falhou."""
+    falhas = [r for r in resultados if isinstance(r, Exception)]
+    if falhas:
+        raise DatabaseInteractionError(
+            f"{len(falhas)} de {len(resultados)} filmes falharam ao {descricao} no Cassandra (primeiro erro: {repr(falhas[0])})."
+        )
+    return len(resultados)
+
+def atualizar_filmes_por_filtro(
+    session: Session,
+    atualizacoes: Dict[str, Any],
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ano_corte_futuro: int = 2025,
+    tabela: str = "filmes"
+) -> int:
+    """Um UPDATE preparado por partição, em paralelo (execute_async), para cada filme que casa com o filtro."""
+    valores = _valores_atualizacao_cassandra(atualizacoes, "por filtro")
+    ids = _ids_filmes_por_filtro_cassandra(session, tabela, titulo, tipo, ano_min, generos, nota_min, duracao_min, ano_corte_futuro)
+    if not ids:
+        return 0
+    atribuicoes = ", ".join(f"{campo} = ?" for campo in valores)
+    try:
+        statement = _preparar(session, f"UPDATE {tabela} SET {atribuicoes} WHERE titulo_id = ?")
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao preparar atualização por filtro (Cassandra): {repr(e)}")
+    resultados = _executar_concorrente(session, statement, [(*valores.values(), titulo_id) for titulo_id in ids])
+    return _conferir_execucoes_em_massa(resultados, "atualizar")
+
+def remover_filmes_por_filtro(
+    session: Session,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ano_corte_futuro: int = 2025,
+    tabela: str = "filmes"
+) -> int:
+    """Um DELETE preparado por partição, em paralelo (execute_async), para cada filme que casa com o filtro."""
+    ids = _ids_filmes_por_filtro_cassandra(session, tabela, titulo, tipo, ano_min, generos, nota_min, duracao_min, ano_corte_futuro)
+    if not ids:
+        return 0
+    try:
+        statement = _preparar(session, f"DELETE FROM {tabela} WHERE titulo_id = ?")
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao preparar remoção por filtro (Cassandra): {repr(e)}")
+    resultados = _executar_concorrente(session, statement, [(titulo_id,) for titulo_id in ids])
+    return _conferir_execucoes_em_massa(resultados, "remover")
+
+
 # --- AGREGAÇÃO / ANÁLISE ---
 # Estas funções no Cassandra geralmente requerem leitura de muitos dados e processamento em Python.
 # O uso de `ALLOW FILTERING` é comum, mas deve ser notado quanto à performance em grandes datasets.
 
+def _contar_linhas_por_ano(rows: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Agrega linhas com a coluna ano_lancamento em [{'_id': ano, 'quantidade': qtd}]."""
+    contagem = {}
+    for row in rows:
+        ano = row.ano_lancamento
+        if ano is not None: # Ignora filmes sem ano de lançamento definido
+            contagem[ano] = contagem.get(ano, 0) + 1
+    
+    # Formata para o padrão esperado pelo serviço (similar ao MongoDB)
+    # O alias '_id' para 'ano' é para compatibilidade com o ContagemPorAnoResponse
+    return [{"_id": ano, "quantidade": qtd} for ano, qtd in sorted(contagem.items())]
+
 def contar_filmes_por_ano(session: Session, filmes_tabela: str = "filmes") -> List[Dict[str, Any]]:
     """Conta filmes por ano de lançamento. Retorna lista de {'_id': ano, 'quantidade': qtd}."""
     try:
         # Lê todos os anos da tabela. CUIDADO: performance em tabelas grandes!
         query = SimpleStatement(f"SELECT ano_lancamento FROM {filmes_tabela} ALLOW FILTERING")
         rows = session.execute(query)
-        contagem = {}
-        for row in rows:
-            ano = row.ano_lancamento
-            if ano is not None: # Ignora filmes sem ano de lançamento definido
-                contagem[ano] = contagem.get(ano, 0) + 1
-        
-        # Formata para o padrão esperado pelo serviço (similar ao MongoDB)
-        # O alias '_id' para 'ano' é para compatibilidade com o ContagemPorAnoResponse
-        return [{"_id": ano, "quantidade": qtd} for ano, qtd in sorted(contagem.items())]
+        return _contar_linhas_por_ano(rows)
     except Exception as e:
         raise DatabaseInteractionError(f"Erro ao contar filmes por ano (Cassandra): {e}")
 
 
+def _calcular_media_por_genero(rows: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Agrega linhas com as colunas generos e nota em [{'genero': nome, 'media_nota': media}]."""
+    generos_notas_soma_contagem: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        # 'generos' é uma lista e 'nota' é float/int
+        if isinstance(row.generos, list) and row.nota is not None:
+            try:
+                nota_val = float(row.nota) # Garante que nota seja float
+                for genero_item in row.generos:
+                    if genero_item not in generos_notas_soma_contagem:
+                        generos_notas_soma_contagem[genero_item] = {"soma": 0.0, "contagem": 0}
+                    generos_notas_soma_contagem[genero_item]["soma"] += nota_val
+                    generos_notas_soma_contagem[genero_item]["contagem"] += 1
+            except ValueError:
+                logger.warning("AVISO CASSANDRA: Nota inválida '%s' para filme durante cálculo de média por gênero. Pulando.", row.nota)
+                continue
+    
+    resultado_final = []
+    for genero, dados in generos_notas_soma_contagem.items():
+        if dados["contagem"] > 0:
+            media = round(dados["soma"] / dados["contagem"], 2)
+            resultado_final.append({"genero": genero, "media_nota": media})
+        # else: # Opcional: incluir gêneros com contagem 0 e média 0.0
+        #     resultado_final.append({"genero": genero, "media_nota": 0.0}) 
+    
+    # Ordena pelo nome do gênero para consistência, ou pela média_nota se preferir
+    resultado_final.sort(key=lambda x: x.get("media_nota", 0.0), reverse=True)
+    return resultado_final
+
 def media_notas_por_genero(session: Session, filmes_tabela: str = "filmes") -> List[Dict[str, Any]]:
     """Calcula a média de notas por gênero. Retorna lista de {'genero': nome, 'media_nota': media}."""
     try:
         # Lê todos os gêneros e notas. CUIDADO: performance!
         query = SimpleStatement(f"SELECT generos, nota FROM {filmes_tabela} ALLOW FILTERING") 
         rows = session.execute(query)
-        
-        generos_notas_soma_contagem: Dict[str, Dict[str, Any]] = {}
-        for row in rows:
-            # 'generos' é uma lista e 'nota' é float/int
-            if isinstance(row.generos, list) and row.nota is not None:
-                try:
-                    nota_val = float(row.nota) # Garante que nota seja float
-                    for genero_item in row.generos:
-                        if genero_item not in generos_notas_soma_contagem:
-                            generos_notas_soma_contagem[genero_item] = {"soma": 0.0, "contagem": 0}
-                        generos_notas_soma_contagem[genero_item]["soma"] += nota_val
-                        generos_notas_soma_contagem[genero_item]["contagem"] += 1
-                except ValueError:
-                    print(f"AVISO CASSANDRA: Nota inválida '{row.nota}' para filme durante cálculo de média por gênero. Pulando.")
-                    continue
-        
-        resultado_final = []
-        for genero, dados in generos_notas_soma_contagem.items():
-            if dados["contagem"] > 0:
-                media = round(dados["soma"] / dados["contagem"], 2)
-                resultado_final.append({"genero": genero, "media_nota": media})
-            # else: # Opcional: incluir gêneros com contagem 0 e média 0.0
-            #     resultado_final.append({"genero": genero, "media_nota": 0.0}) 
-        
-        # Ordena pelo nome do gênero para consistência, ou pela média_nota se preferir
-        resultado_final.sort(key=lambda x: x.get("media_nota", 0.0), reverse=True)
-        return resultado_final
+        return _calcular_media_por_genero(rows)
     except Exception as e:
         raise DatabaseInteractionError(f"Erro ao calcular média de notas por gênero (Cassandra): {e}")
 
@@ -823,7 +1213,7 @@ def carregar_dados(
     msg = f"Carga Cassandra: {filmes_inseridos_count} filmes, {atores_inseridos_count} atores, {elenco_inserido_count} relações."
     # ... (lógica de status_op e retorno do dicionário completo) ...
     status_op = "concluído_com_erros" if erros_validacao_e_carga else "sucesso"
-    if erros_validacao_e_carga: print(f"LOG DE CARGA CASSANDRA - Erros: {erros_validacao_e_carga[:5]}")
+    if erros_validacao_e_carga: logger.error("LOG DE CARGA CASSANDRA - Erros: %s", erros_validacao_e_carga[:5])
     return {
         "status": status_op, "message": msg,
         "detalhes_carga": {"filmes_inseridos": filmes_inseridos_count, "atores_inseridos": atores_inseridos_count, "elenco_inserido": elenco_inserido_count},
@@ -0,0 +1,152 @@
+# src/databases/conexoes.py
+"""
+Registro único das conexões com os quatro bancos.
+
+Cada módulo connection.py mantém o seu cliente/driver/sessão como um singleton
+por processo (com pool interno configurável via .env). Este módulo apenas abre
+todos eles de uma vez na inicialização da API e os fecha no desligamento.
+Com MODO_DRIVER=async, os clientes asyncio são abertos/fechados pelas versões *_async.
+aquecer_pools() enche os pools antes da primeira requisição (aquecimento da API).
+"""
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict
+
+from src.databases.mongo.connection import (
+    get_mongo_client, close_mongo_client, get_mongo_client_async, close_mongo_client_async
+)
+from src.databases.cassandra.connection import (
+    get_cassandra_session, close_cassandra_session, get_cassandra_session_async
+)
+from src.databases.neo4j.connection import (
+    get_neo4j_driver, close_neo4j_driver, get_neo4j_driver_async, close_neo4j_driver_async
+)
+from src.databases.redis.connection import (
+    get_redis_client, close_redis_client, get_redis_client_async, close_redis_client_async
+)
+from src.core.executores import executar_bloqueante, MAX_WORKERS_POR_BANCO
+
+logger = logging.getLogger(__name__)
+
+_ABRIR_CONEXAO: Dict[str, Callable] = {
+    "mongo": get_mongo_client,
+    "cassandra": get_cassandra_session,
+    "neo4j": get_neo4j_driver,
+    "redis": get_redis_client,
+}
+
+_FECHAR_CONEXAO: Dict[str, Callable] = {
+    "mongo": close_mongo_client,
+    "cassandra": close_cassandra_session,
+    "neo4j": close_neo4j_driver,
+    "redis": close_redis_client,
+}
+
+# A sessão Cassandra é a mesma nos dois modos (execute_async), então é fechada por fechar_conexoes().
+_ABRIR_CONEXAO_ASYNC: Dict[str, Callable[[], Awaitable]] = {
+    "mongo": get_mongo_client_async,
+    "cassandra": get_cassandra_session_async,
+    "neo4j": get_neo4j_driver_async,
+    "redis": get_redis_client_async,
+}
+
+_FECHAR_CONEXAO_ASYNC: Dict[str, Callable[[], Awaitable]] = {
+    "mongo": close_mongo_client_async,
+    "neo4j": close_neo4j_driver_async,
+    "redis": close_redis_client_async,
+}
+
+
+def _pingar_neo4j():
+    with get_neo4j_driver().session(database="neo4j") as session:
+        session.run("RETURN 1").consume()
+
+# Ida e volta mínima ao servidor, que obriga o driver a usar (ou abrir) uma conexão do pool
+_PINGAR_CONEXAO: Dict[str, Callable[[], Any]] = {
+    "mongo": lambda: get_mongo_client().admin.command("ping"),
+    "cassandra": lambda: get_cassandra_session().execute("SELECT release_version FROM system.local"),
+    "neo4j": _pingar_neo4j,
+    "redis": lambda: get_redis_client().ping(),
+}
+
+ESPERA_BARREIRA_SEGUNDOS = 5.0
+
+
+def abrir_conexoes() -> Dict[str, bool]:
+    """
+    Inicializa as conexões de todos os bancos. Um banco indisponível não impede a
+    subida da API: a falha é registrada e a conexão será tentada de novo no primeiro uso.
+    Retorna um dicionário {banco: conectado}.
+    """
+    status = {}
+    for nome_banco, abrir in _ABRIR_CONEXAO.items():
+        try:
+            abrir()
+            status[nome_banco] = True
+        except Exception as e:
+            logger.warning("ALERTA: %s indisponível na inicialização: %s", nome_banco, e)
+            status[nome_banco] = False
+    return status
+
+
+def fechar_conexoes():
+    """Fecha as conexões (e pools) de todos os bancos que estiverem abertas."""
+    for nome_banco, fechar in _FECHAR_CONEXAO.items():
+        try:
+            fechar()
+        except Exception as e:
+            logger.error("Erro ao fechar conexão com %s: %s", nome_banco, e)
+
+
+async def aquecer_pools(conexoes_por_banco: int) -> Dict[str, bool]:
+    """
+    Abre de antemão até conexoes_por_banco conexões no pool de cada banco (limitado às
+    threads do executor do banco). Os pings esperam uns pelos outros numa barreira e saem
+    juntos, então ficam em voo ao mesmo tempo e o driver precisa de uma conexão para cada;
+    sem isso o pool só cresce durante a primeira rajada de requisições reais.
+    Retorna {banco: aquecido}; a falha de um banco não interrompe os outros.
+    """
+    async def _aquecer_banco(nome_banco: str):
+        quantidade = max(1, min(conexoes_por_banco, MAX_WORKERS_POR_BANCO[nome_banco]))
+        barreira = threading.Barrier(quantidade)
+        pingar = _PINGAR_CONEXAO[nome_banco]
+
+        def _pingar_junto():
+            try:
+                barreira.wait(timeout=ESPERA_BARREIRA_SEGUNDOS)
+            except threading.BrokenBarrierError:
+                pass # Algum ping falhou ou demorou: segue sozinho
+            pingar()
+
+        await asyncio.gather(*(executar_bloqueante(nome_banco, _pingar_junto) for _ in range(quantidade)))
+
+    resultados = await asyncio.gather(*(_aquecer_banco(nome) for nome in _PINGAR_CONEXAO), return_exceptions=True)
+    status = {}
+    for nome_banco, resultado in zip(_PINGAR_CONEXAO, resultados):
+        if isinstance(resultado, BaseException):
+            logger.warning("ALERTA: falha ao aquecer o pool de %s: %s", nome_banco, resultado)
+        status[nome_banco] = not isinstance(resultado, BaseException)
+    return status
+
+
+async def abrir_conexoes_async() -> Dict[str, bool]:
+    """Como abrir_conexoes(), para os clientes asyncio (precisa rodar no event loop da API)."""
+    status = {}
+    for nome_banco, abrir in _ABRIR_CONEXAO_ASYNC.items():
+        try:
+            await abrir()
+            status[nome_banco] = True
+        except Exception as e:
+            logger.warning("ALERTA: %s (async) indisponível na inicialização: %s", nome_banco, e)
+            status[nome_banco] = False
+    return status
+
+
+async def fechar_conexoes_async():
+    """Fecha os clientes asyncio que estiverem abertos."""
+    for nome_banco, fechar in _FECHAR_CONEXAO_ASYNC.items():
+        try:
+            await fechar()
+        except Exception as e:
+            logger.error("Erro ao fechar conexão assíncrona com %s: %s", nome_banco, e)
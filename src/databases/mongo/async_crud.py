@@ -0,0 +1,64 @@
+# src/databases/mongo/async_crud.py
+"""
+Consultas de leitura do MongoDB com o driver asyncio nativo do PyMongo (AsyncMongoClient).
+Usado quando MODO_DRIVER=async; a montagem das queries/pipelines é a mesma de crud.py.
+"""
+from typing import List, Dict, Any, Optional
+from pymongo.asynchronous.collection import AsyncCollection
+
+from src.databases.mongo.crud import (
+    _montar_query_busca_avancada,
+    _pipeline_contar_filmes_por_ano,
+    _pipeline_media_notas_por_genero,
+    _converter_objectids_em_doc,
+    _projecao_mongo,
+    _ordenar_pelos_ids
+)
+
+
+async def buscar_filmes_avancado(
+    collection: AsyncCollection,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    ano_max: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ordenar_por: str = "nota",
+    ordem: int = -1,
+    limite: Optional[int] = 10000,
+    ano_corte_futuro: int = 2025,
+    campos: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    query_final_mongo = _montar_query_busca_avancada(
+        titulo, tipo, ano_min, ano_max, generos, nota_min, duracao_min, ano_corte_futuro
+    )
+
+    cursor = collection.find(query_final_mongo, _projecao_mongo(campos)).sort([(ordenar_por, ordem)])
+    if limite is not None:
+        cursor = cursor.limit(limite)
+    return [_converter_objectids_em_doc(doc) async for doc in cursor]
+
+
+async def buscar_filme_por_id(collection: AsyncCollection, id_filme: str, campos: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    """Busca um filme pelo seu _id (que é o titulo_id)."""
+    return await collection.find_one({"_id": id_filme}, _projecao_mongo(campos))
+
+
+async def buscar_filmes_por_ids(collection: AsyncCollection, ids_filmes: List[str], campos: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Vários filmes pelo _id numa única consulta ($in), na ordem de ids_filmes."""
+    if not ids_filmes:
+        return []
+    documentos = await collection.find({"_id": {"$in": ids_filmes}}, _projecao_mongo(campos)).to_list()
+    return _ordenar_pelos_ids(documentos, ids_filmes)
+
+
+async def contar_filmes_por_ano(collection: AsyncCollection) -> List[Dict[str, Any]]:
+    cursor = await collection.aggregate(_pipeline_contar_filmes_por_ano())
+    return await cursor.to_list()
+
+
+async def media_notas_por_genero(collection: AsyncCollection) -> List[Dict[str, Any]]:
+    cursor = await collection.aggregate(_pipeline_media_notas_por_genero())
+    return await cursor.to_list()
@@ -1,30 +1,105 @@
-from pymongo import MongoClient
+import logging
+import asyncio
+import threading
+from pymongo import MongoClient, AsyncMongoClient
+from pymongo.database import Database
+from pymongo.asynchronous.database import AsyncDatabase
 from typing import Optional
+from src.core.tempos import medir_fase
 from src.core.db_config import (
     MONGO_USER,
     MONGO_PASSWORD,
     MONGO_HOST,
     MONGO_PORT,
-    MONGO_DB_NAME
+    MONGO_DB_NAME,
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE
 )
 
+logger = logging.getLogger(__name__)
+
+# Cliente único por processo: o MongoClient já mantém um pool de conexões interno
+# e é thread-safe, então deve ser criado uma vez e reutilizado.
+cliente_mongo: Optional[MongoClient] = None
+_lock_cliente_mongo = threading.Lock()
+
+# Cliente asyncio nativo (MODO_DRIVER=async). Fica preso ao event loop em que foi criado,
+# por isso é aberto no lifespan da API e não nos executores.
+cliente_mongo_async: Optional[AsyncMongoClient] = None
+_lock_cliente_mongo_async = asyncio.Lock()
+
+
 def _get_mongo_uri() -> str:
     return f"mongodb://{MONGO_USER}:{MONGO_PASSWORD}@{MONGO_HOST}:{MONGO_PORT}/admin"
 
 
 def get_mongo_client() -> MongoClient:
-    """Retorna um cliente MongoDB conectado."""
-    uri = _get_mongo_uri()
-    try:
-        client = MongoClient(uri)
-        # Força a conexão para detectar erros na inicialização
-        client.admin.command('ping')
-        return client
-    except Exception as e:
-        raise ConnectionError(f"Falha ao conectar no MongoDB: {e}")
-
-
-def get_mongo_db() -> Optional[MongoClient]:
+    """Retorna o cliente MongoDB compartilhado, inicializando se necessário."""
+    global cliente_mongo
+    if cliente_mongo is None:
+        with _lock_cliente_mongo:
+            if cliente_mongo is None:
+                try:
+                    client = MongoClient(
+                        _get_mongo_uri(),
+                        maxPoolSize=MONGO_MAX_POOL_SIZE,
+                        minPoolSize=MONGO_MIN_POOL_SIZE
+                    )
+                    # Força a conexão para detectar erros na inicialização
+                    client.admin.command('ping')
+                    cliente_mongo = client
+                    logger.info("Conexão com MongoDB estabelecida e verificada.")
+                except Exception as e:
+                    raise ConnectionError(f"Falha ao conectar no MongoDB: {e}")
+    return cliente_mongo
+
+
+@medir_fase("conexao", "mongo")
+def get_mongo_db() -> Database:
     """Retorna o banco de dados MongoDB especificado."""
-    client = get_mongo_client()
-    return client[MONGO_DB_NAME] if client else None
\ No newline at end of file
+    return get_mongo_client()[MONGO_DB_NAME]
+
+
+def close_mongo_client():
+    """Fecha o cliente MongoDB (e seu pool) se estiver aberto."""
+    global cliente_mongo
+    with _lock_cliente_mongo:
+        if cliente_mongo is not None:
+            cliente_mongo.close()
+            cliente_mongo = None
+            logger.info("Conexão com MongoDB fechada.")
+
+
+async def get_mongo_client_async() -> AsyncMongoClient:
+    """Retorna o cliente MongoDB asyncio compartilhado, inicializando se necessário."""
+    global cliente_mongo_async
+    if cliente_mongo_async is None:
+        async with _lock_cliente_mongo_async:
+            if cliente_mongo_async is None:
+                try:
+                    client = AsyncMongoClient(
+                        _get_mongo_uri(),
+                        maxPoolSize=MONGO_MAX_POOL_SIZE,
+                        minPoolSize=MONGO_MIN_POOL_SIZE
+                    )
+                    await client.admin.command('ping')
+                    cliente_mongo_async = client
+                    logger.info("Conexão assíncrona com MongoDB estabelecida e verificada.")
+                except Exception as e:
+                    raise ConnectionError(f"Falha ao conectar (async) no MongoDB: {e}")
+    return cliente_mongo_async
+
+
+@medir_fase("conexao", "mongo")
+async def get_mongo_db_async() -> AsyncDatabase:
+    """Retorna o banco de dados MongoDB especificado, via cliente asyncio."""
+    return (await get_mongo_client_async())[MONGO_DB_NAME]
+
+
+async def close_mongo_client_async():
+    """Fecha o cliente MongoDB asyncio se estiver aberto."""
+    global cliente_mongo_async
+    if cliente_mongo_async is not None:
+        await cliente_mongo_async.close()
+        cliente_mongo_async = None
+        logger.info("Conexão assíncrona com MongoDB fechada.")
@@ -1,10 +1,11 @@
 # src/databases/mongo/crud.py
-from pymongo.collection import Collection
+import logging
+from pymongo.collection import Collection, ReturnDocument
 from pymongo.database import Database
 from pymongo.errors import DuplicateKeyError, BulkWriteError
 import pandas as pd
 from pydantic import ValidationError
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from bson import ObjectId
 import re
 
@@ -19,6 +20,10 @@ from src.core.exceptions import (
     DataValidationError,
     DatabaseInteractionError
 )
+from src.core.projecao import campos_leitura, validar_campos_atualizacao
+from src.core.lote import item_inserido, item_com_erro, item_duplicado
+
+logger = logging.getLogger(__name__)
 
 def _limpar_generos_mongo(valor_generos: Any) -> List[str]:
     if not valor_generos:
@@ -100,7 +105,6 @@ def ordenar_e_processar_resultados(
     
     # O print que você tinha:
     # print("DEBUG CRUD - Resultados processados:", resultados) # Pode manter para debug no console do FastAPI
-    print("antes de salvar")
     # --- LÓGICA PARA SALVAR EM ARQUIVO ---
     if salvar_em_arquivo and resultados: # Só salva se houver resultados e o flag estiver True
         try:
@@ -113,9 +117,9 @@ def ordenar_e_processar_resultados(
 
             with open(caminho_completo_arquivo, 'w', encoding='utf-8') as f:
                 json.dump(resultados, f, ensure_ascii=False, indent=4)
-            print(f"DEBUG CRUD: Resultados da busca salvos em '{caminho_completo_arquivo}'")
+            logger.debug("DEBUG CRUD: Resultados da busca salvos em '%s'", caminho_completo_arquivo)
         except Exception as e:
-            print(f"DEBUG CRUD ERRO: Falha ao salvar resultados em arquivo: {e}")
+            logger.warning("DEBUG CRUD ERRO: Falha ao salvar resultados em arquivo: %s", e)
     # --- FIM DA LÓGICA PARA SALVAR EM ARQUIVO ---
             
     return resultados
@@ -156,6 +160,37 @@ def inserir_filme(collection: Collection, filme_data: Dict[str, Any]) -> Dict[st
         id_filme = documento_para_inserir.get('_id', 'DESCONHECIDO')
         raise DatabaseInteractionError(f"Erro ao inserir filme com _id '{id_filme}': {e}")
 
+def inserir_filmes_em_lote(collection: Collection, filmes_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Insere vários filmes com um único insert_many(ordered=False): um filme repetido ou
+    inválido não interrompe os demais. Devolve um resultado por filme (ver src.core.lote).
+    """
+    resultados: List[Optional[Dict[str, Any]]] = [None] * len(filmes_data)
+    documentos, posicoes = [], []
+    for posicao, filme_data in enumerate(filmes_data):
+        try:
+            documentos.append(_preparar_documento_filme_para_mongo(filme_data))
+            posicoes.append(posicao)
+        except DataValidationError as e_dv:
+            resultados[posicao] = item_com_erro(filme_data.get("titulo_id"), e_dv)
+    erros_por_indice: Dict[int, Dict[str, Any]] = {}
+    if documentos:
+        try:
+            collection.insert_many(documentos, ordered=False)
+        except BulkWriteError as e_bulk:
+            erros_por_indice = {erro["index"]: erro for erro in e_bulk.details.get("writeErrors", [])}
+        except Exception as e:
+            raise DatabaseInteractionError(f"Erro ao inserir lote de {len(documentos)} filmes no MongoDB: {e}")
+    for indice, (posicao, documento) in enumerate(zip(posicoes, documentos)):
+        erro = erros_por_indice.get(indice)
+        if erro is None:
+            resultados[posicao] = item_inserido(documento["_id"])
+        elif erro.get("code") == 11000:
+            resultados[posicao] = item_duplicado(documento["_id"])
+        else:
+            resultados[posicao] = item_com_erro(documento["_id"], DatabaseInteractionError(erro.get("errmsg", "Erro no insert_many.")))
+    return resultados
+
 def inserir_ator(collection: Collection, ator_data: Dict[str, Any]) -> Dict[str, Any]:
     """Insere um ator usando ator_id como _id. Retorna o documento inserido."""
     documento_para_inserir = _preparar_documento_ator_para_mongo(ator_data)
@@ -227,61 +262,20 @@ from pymongo.collection import Collection
 from typing import List, Dict, Any, Optional
 # ... (outras importações, exceções, _limpar_generos_mongo, ordenar_e_processar_resultados) ...
 
-def buscar_filmes_avancado(
-    collection: Collection,
+def _montar_query_busca_avancada(
     titulo: Optional[str] = None,
     tipo: Optional[str] = None,
-    ano_min: Optional[int] = None, # Este é o ano_lancamento_min do payload
-    ano_max: Optional[int] = None, # Adicionar se quiser filtrar por um range de ano exato
+    ano_min: Optional[int] = None,
+    ano_max: Optional[int] = None,
     generos: Optional[List[str]] = None,
     nota_min: Optional[float] = None,
     duracao_min: Optional[int] = None,
-    ordenar_por: str = "nota",
-    ordem: int = -1,
-    limite: Optional[int] = 10000,
-    ano_corte_futuro: int = 2025 # Ano a partir do qual consideramos "futuro/sem avaliação"
-) -> List[Dict[str, Any]]:
-    
-    # Filtros base que se aplicam a todos (futuros ou não)
-    query_base = {}
-    if titulo: query_base["titulo"] = {"$regex": titulo, "$options": "i"}
-    if tipo: query_base["tipo"] = tipo
-    if generos:
-        if len(generos) == 1: query_base["generos"] = {"$in": generos}
-        elif len(generos) > 1: query_base["generos"] = {"$all": generos}
-
-    # Condições para filmes "normais" (antes do ano de corte OU que tenham nota/votos)
-    condicao_filmes_normais = query_base.copy() # Começa com os filtros base
-    if ano_min is not None:
-        condicao_filmes_normais["ano_lancamento"] = {"$gte": ano_min, "$lt": ano_corte_futuro} # Até o ano anterior ao de corte
-    else: # Se não há ano_min, mas queremos diferenciar dos futuros
-        condicao_filmes_normais["ano_lancamento"] = {"$lt": ano_corte_futuro}
-
-    if nota_min is not None:
-        condicao_filmes_normais["nota"] = {"$gte": nota_min}
-    # if numero_votos_min is not None: # Se você adicionar esse filtro
-    #     condicao_filmes_normais["numero_votos"] = {"$gte": numero_votos_min}
-    if duracao_min is not None and (not tipo or tipo.lower() != "jogo"):
-        condicao_filmes_normais["duracao"] = {"$gte": duracao_min}
-
-    # Condições para filmes "futuros" ou "sem avaliação"
-    # (ano >= ano_corte_futuro E nota == 0 E numero_votos == 0)
-    # Para estes, ignoramos nota_min, (votos_min) e duracao_min
-    condicao_filmes_futuros = query_base.copy()
-    condicao_filmes_futuros["ano_lancamento"] = {"$gte": ano_corte_futuro}
-    condicao_filmes_futuros["nota"] = {"$in": [0, 0.0, None]} # Considera 0, 0.0 ou ausente/None como sem nota
-    condicao_filmes_futuros["numero_votos"] = {"$in": [0, None]} # Considera 0 ou ausente/None como sem votos
-    # Opcional: se ano_min for fornecido, filmes futuros também devem respeitá-lo
-    if ano_min is not None:
-        condicao_filmes_futuros["ano_lancamento"]["$gte"] = max(ano_min, ano_corte_futuro)
-
-
-    # Query final combinando as duas condições com $or
-    # No entanto, a lógica acima já segmenta pelo ano_lancamento de forma que um $or
-    # direto entre condicao_filmes_normais e condicao_filmes_futuros pode ser complexo
-    # se ano_min for usado em ambos.
-    # Uma abordagem mais simples é construir a query principal e adicionar a lógica condicional para nota/votos/duração.
-
+    ano_corte_futuro: int = 2025
+) -> Dict[str, Any]:
+    """
+    Monta o filtro MongoDB da busca avançada, incluindo a regra dos filmes futuros/sem avaliação.
+    Compartilhado pelo CRUD síncrono e pelo assíncrono (async_crud.py).
+    """
     # Abordagem Refinada para a Query:
     final_query_conditions = []
     
@@ -345,16 +339,151 @@ def buscar_filmes_avancado(
     query_final_mongo = {"$and": final_query_conditions} if final_query_conditions else {}
     # print("DEBUG MONGO Query:", query_final_mongo) # Para depurar a query
 
-    cursor = collection.find(query_final_mongo).sort([(ordenar_por, ordem)])
+    return query_final_mongo
+
+def _projecao_mongo(campos: Optional[List[str]], *necessarios: Optional[str]) -> Optional[Dict[str, int]]:
+    """Projeção do find/$lookup para `campos` (None = documento inteiro). O _id vem sempre."""
+    campos_lidos = campos_leitura(campos, *necessarios)
+    if campos_lidos is None:
+        return None
+    return {campo: 1 for campo in campos_lidos}
+
+def buscar_filmes_avancado(
+    collection: Collection,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None, # Este é o ano_lancamento_min do payload
+    ano_max: Optional[int] = None, # Adicionar se quiser filtrar por um range de ano exato
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ordenar_por: str = "nota",
+    ordem: int = -1,
+    limite: Optional[int] = 10000,
+    ano_corte_futuro: int = 2025, # Ano a partir do qual consideramos "futuro/sem avaliação"
+    campos: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    query_final_mongo = _montar_query_busca_avancada(
+        titulo, tipo, ano_min, ano_max, generos, nota_min, duracao_min, ano_corte_futuro
+    )
+
+    cursor = collection.find(query_final_mongo, _projecao_mongo(campos)).sort([(ordenar_por, ordem)])
     return ordenar_e_processar_resultados(cursor, limite)
 
+def iterar_filmes_avancado(
+    collection: Collection,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    ano_max: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ordenar_por: str = "nota",
+    ordem: int = -1,
+    limite: Optional[int] = 10000,
+    ano_corte_futuro: int = 2025,
+    tamanho_lote: int = 500,
+    campos: Optional[List[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Versão em streaming de buscar_filmes_avancado: devolve os filmes conforme o cursor
+    avança (o servidor envia lotes de tamanho_lote), sem montar a lista inteira.
+    """
+    query_final_mongo = _montar_query_busca_avancada(
+        titulo, tipo, ano_min, ano_max, generos, nota_min, duracao_min, ano_corte_futuro
+    )
+    cursor = collection.find(query_final_mongo, _projecao_mongo(campos)).sort([(ordenar_por, ordem)]).batch_size(tamanho_lote)
+    if limite is not None:
+        cursor = cursor.limit(limite)
+    try:
+        for doc in cursor:
+            yield _converter_objectids_em_doc(doc)
+    finally:
+        cursor.close()
+
+def _ordenacao_keyset_mongo(ordenar_por: str, ordem: int) -> List[Tuple[str, int]]:
+    """Ordenação da paginação por keyset: o campo pedido e o _id como desempate."""
+    if ordenar_por == "_id":
+        return [("_id", ordem)]
+    return [(ordenar_por, ordem), ("_id", ordem)]
+
+def _condicao_keyset_mongo(ordenar_por: str, ordem: int, apos: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Filtro "depois de (valor, _id)" na ordenação de _ordenacao_keyset_mongo. O MongoDB
+    põe null/ausente antes de qualquer valor: primeiro na ordem crescente, por último na decrescente.
+    """
+    valor, id_apos = apos["valor"], apos["id"]
+    operador = "$gt" if ordem == 1 else "$lt"
+    if ordenar_por == "_id":
+        return {"_id": {operador: id_apos}}
+    if valor is None:
+        if ordem == 1:
+            return {"$or": [{ordenar_por: {"$ne": None}}, {ordenar_por: None, "_id": {"$gt": id_apos}}]}
+        return {ordenar_por: None, "_id": {"$lt": id_apos}}
+    condicoes = [{ordenar_por: {operador: valor}}, {ordenar_por: valor, "_id": {operador: id_apos}}]
+    if ordem == -1:
+        condicoes.append({ordenar_por: None})
+    return {"$or": condicoes}
+
+def _posicao_keyset(filmes: List[Dict[str, Any]], ordenar_por: str, tamanho_pagina: int) -> Optional[Dict[str, Any]]:
+    """Posição do último filme da página (None se a página não veio cheia: não há próxima)."""
+    if len(filmes) < tamanho_pagina:
+        return None
+    return {"valor": filmes[-1].get(ordenar_por), "id": filmes[-1]["_id"]}
+
+def paginar_filmes_avancado(
+    collection: Collection,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    ano_max: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ordenar_por: str = "nota",
+    ordem: int = -1,
+    ano_corte_futuro: int = 2025,
+    tamanho_pagina: int = 20,
+    apos: Optional[Dict[str, Any]] = None,
+    campos: Optional[List[str]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Uma página da busca avançada por keyset: continua depois de `apos` ({"valor", "id"} do
+    último filme da página anterior) em vez de pular documentos, usando o índice (campo, _id).
+    Devolve (filmes, posição para a próxima página ou None).
+    """
+    query_final_mongo = _montar_query_busca_avancada(
+        titulo, tipo, ano_min, ano_max, generos, nota_min, duracao_min, ano_corte_futuro
+    )
+    if apos is not None:
+        condicao_keyset = _condicao_keyset_mongo(ordenar_por, ordem, apos)
+        query_final_mongo = {"$and": [query_final_mongo, condicao_keyset]} if query_final_mongo else condicao_keyset
+    # O campo de ordenação é lido mesmo fora de `campos`: a posição do cursor sai dele
+    projecao = _projecao_mongo(campos, ordenar_por)
+    cursor = collection.find(query_final_mongo, projecao).sort(_ordenacao_keyset_mongo(ordenar_por, ordem)).limit(tamanho_pagina)
+    filmes = [_converter_objectids_em_doc(doc) for doc in cursor]
+    return filmes, _posicao_keyset(filmes, ordenar_por, tamanho_pagina)
+
 
 # --- CONSULTAS ---
-def buscar_filme_por_id(collection: Collection, id_filme: str) -> Optional[Dict[str, Any]]:
+def buscar_filme_por_id(collection: Collection, id_filme: str, campos: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
     """Busca um filme pelo seu _id (que é o titulo_id)."""
-    documento = collection.find_one({"_id": id_filme})
+    documento = collection.find_one({"_id": id_filme}, _projecao_mongo(campos))
     return documento # Já está com _id como string, sem ObjectId para converter aqui
 
+def _ordenar_pelos_ids(filmes: List[Dict[str, Any]], ids_filmes: List[str]) -> List[Dict[str, Any]]:
+    """Filmes na ordem dos ids pedidos ($in não garante ordem); ids inexistentes ficam de fora."""
+    por_id = {filme["_id"]: filme for filme in filmes}
+    return [por_id[id_filme] for id_filme in ids_filmes if id_filme in por_id]
+
+def buscar_filmes_por_ids(collection: Collection, ids_filmes: List[str], campos: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Vários filmes pelo _id numa única consulta ($in sobre o índice de _id), na ordem de ids_filmes."""
+    if not ids_filmes:
+        return []
+    documentos = list(collection.find({"_id": {"$in": ids_filmes}}, _projecao_mongo(campos)))
+    return _ordenar_pelos_ids(documentos, ids_filmes)
+
 def _buscar_documento_ator_por_id_ou_nome(
     atores_collection: Collection, 
     identificador_ator: str
@@ -364,12 +493,12 @@ def _buscar_documento_ator_por_id_ou_nome(
     Tenta primeiro buscar pelo _id. Se não encontrar, tenta buscar pelo nome_ator.
     Retorna o documento do ator ou None se não encontrado.
     """
-    print(f"DEBUG: Buscando ator com identificador: '{identificador_ator}'")
+    logger.debug("DEBUG: Buscando ator com identificador: '%s'", identificador_ator)
     # Tentativa 1: Buscar como se fosse um _id
     # (Lembre-se que no seu setup, o _id do ator É o ator_id)
     documento = atores_collection.find_one({"_id": identificador_ator})
     if documento:
-        print(f"DEBUG: Ator encontrado pelo _id: {documento}")
+        logger.debug("DEBUG: Ator encontrado pelo _id: %s", documento)
         return documento
 
     # Tentativa 2: Buscar como se fosse um nome_ator
@@ -377,10 +506,10 @@ def _buscar_documento_ator_por_id_ou_nome(
     # Exemplo case-insensitive: documento = atores_collection.find_one({"nome_ator": {"$regex": f"^{identificador_ator}$", "$options": "i"}})
     documento = atores_collection.find_one({"nome_ator": identificador_ator})
     if documento:
-        print(f"DEBUG: Ator encontrado pelo nome_ator: {documento}")
+        logger.debug("DEBUG: Ator encontrado pelo nome_ator: %s", documento)
         return documento
     
-    print(f"DEBUG: Nenhum ator encontrado com o identificador '{identificador_ator}' (nem como _id, nem como nome_ator).")
+    logger.debug("DEBUG: Nenhum ator encontrado com o identificador '%s' (nem como _id, nem como nome_ator).", identificador_ator)
     return None
 
 # Sua função buscar_ator_por_id original, se ainda precisar dela em outros lugares:
@@ -396,10 +525,11 @@ def buscar_filmes_por_ator(
     identificador_ator: str, # Pode ser o nome_ator (string) ou o ator_id (string)
     ordenar_por: str = 'ano_lancamento',
     ordem: int = -1,
-    limite: Optional[int] = 10000
+    limite: Optional[int] = 10000,
+    campos: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
-    print(f"--- Iniciando buscar_filmes_por_ator para identificador: {identificador_ator} ---")
-    print(f"Coleções recebidas: Filmes='{filmes_collection.name}', Elenco='{elenco_collection.name}', Atores='{atores_collection.name}'")
+    logger.debug("--- Iniciando buscar_filmes_por_ator para identificador: %s ---", identificador_ator)
+    logger.debug("Coleções recebidas: Filmes='%s', Elenco='%s', Atores='%s'", filmes_collection.name, elenco_collection.name, atores_collection.name)
 
     # 1. Usar a função flexível para buscar o documento do ator
     ator_documento = _buscar_documento_ator_por_id_ou_nome(atores_collection, identificador_ator)
@@ -410,20 +540,94 @@ def buscar_filmes_por_ator(
     
     # Se encontrou, pegamos o _id (que é o ator_id) para usar no pipeline
     ator_id_para_pipeline = ator_documento["_id"] 
-    print(f"DEBUG: Ator processado: {ator_documento}. Usando ator_id '{ator_id_para_pipeline}' para o pipeline.")
+    logger.debug("DEBUG: Ator processado: %s. Usando ator_id '%s' para o pipeline.", ator_documento, ator_id_para_pipeline)
 
-    # Em src/databases/mongo/crud.py, dentro de buscar_filmes_por_ator
-
-    # ... (código para buscar ator_documento e definir ator_id_para_pipeline) ...
+    pipeline = _pipeline_filmes_por_ator(filmes_collection.name, ator_id_para_pipeline, ordenar_por, ordem, limite, campos=campos)
     
+    # print(f"DEBUG: Pipeline de agregação ATUALIZADO: {pipeline}")
+
+    try:
+        resultados_agregados_cursor = elenco_collection.aggregate(pipeline)
+        resultados_agregados = list(resultados_agregados_cursor)
+        logger.debug("DEBUG: Total de filmes ÚNICOS encontrados para o identificador '%s' (usando ator_id '%s'): %s", identificador_ator, ator_id_para_pipeline, len(resultados_agregados))
+        # ... (seu print de amostra, se quiser)
+    except Exception as e:
+        logger.error("ERRO DEBUG: Exceção durante a agregação: %s", e)
+        return []
+
+    return resultados_agregados
+
+def iterar_filmes_por_ator(
+    filmes_collection: Collection,
+    elenco_collection: Collection,
+    atores_collection: Collection,
+    identificador_ator: str,
+    ordenar_por: str = 'ano_lancamento',
+    ordem: int = -1,
+    limite: Optional[int] = 10000,
+    tamanho_lote: int = 500,
+    campos: Optional[List[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Versão em streaming de buscar_filmes_por_ator: percorre o cursor da agregação em lotes."""
+    ator_documento = _buscar_documento_ator_por_id_ou_nome(atores_collection, identificador_ator)
+    if not ator_documento:
+        return
+    pipeline = _pipeline_filmes_por_ator(filmes_collection.name, ator_documento["_id"], ordenar_por, ordem, limite, campos=campos)
+    cursor = elenco_collection.aggregate(pipeline, batchSize=tamanho_lote)
+    try:
+        yield from cursor
+    finally:
+        cursor.close()
+
+def paginar_filmes_por_ator(
+    filmes_collection: Collection,
+    elenco_collection: Collection,
+    atores_collection: Collection,
+    identificador_ator: str,
+    ordenar_por: str = 'ano_lancamento',
+    ordem: int = -1,
+    tamanho_pagina: int = 20,
+    apos: Optional[Dict[str, Any]] = None,
+    campos: Optional[List[str]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Uma página dos filmes do ator por keyset (mesmo formato de paginar_filmes_avancado)."""
+    ator_documento = _buscar_documento_ator_por_id_ou_nome(atores_collection, identificador_ator)
+    if not ator_documento:
+        return [], None
+    pipeline = _pipeline_filmes_por_ator(
+        filmes_collection.name, ator_documento["_id"], ordenar_por, ordem, tamanho_pagina, paginado=True, apos=apos,
+        campos=campos
+    )
+    filmes = list(elenco_collection.aggregate(pipeline))
+    return filmes, _posicao_keyset(filmes, ordenar_por, tamanho_pagina)
+
+def _pipeline_filmes_por_ator(
+    nome_colecao_filmes: str,
+    ator_id_para_pipeline: str,
+    ordenar_por: str,
+    ordem: int,
+    limite: Optional[int],
+    paginado: bool = False,
+    apos: Optional[Dict[str, Any]] = None,
+    campos: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Pipeline (sobre a coleção elenco) que devolve os filmes únicos de um ator, ordenados e limitados.
+    Com paginado=True ordena por (campo, _id) e começa depois de `apos` (paginação por keyset).
+    Com `campos`, o próprio $lookup já projeta o filme (o campo de ordenação vai junto).
+    """
+    lookup_filmes = {
+        "from": nome_colecao_filmes,
+        "localField": "titulo_id",      # Chave no elenco que referencia o _id dos filmes
+        "foreignField": "_id",          # O _id da coleção filmes (que é o titulo_id)
+        "as": "filme_info_array"        # Nome do array resultante do lookup
+    }
+    projecao = _projecao_mongo(campos, ordenar_por)
+    if projecao is not None:
+        lookup_filmes["pipeline"] = [{"$project": projecao}]
     pipeline = [
         {"$match": {"ator_id": ator_id_para_pipeline}}, # Filtra no elenco pelo ator_id
-        {"$lookup": {
-            "from": filmes_collection.name,
-            "localField": "titulo_id",      # Chave no elenco que referencia o _id dos filmes
-            "foreignField": "_id",          # O _id da coleção filmes (que é o titulo_id)
-            "as": "filme_info_array"        # Nome do array resultante do lookup
-        }},
+        {"$lookup": lookup_filmes},
         {"$unwind": "$filme_info_array"}, # Desconstrói o array (ainda pode haver um filme por entrada de elenco)
         
         # Agora, agrupamos por _id do filme para garantir unicidade
@@ -435,25 +639,17 @@ def buscar_filmes_por_ator(
         
         # Substitui a raiz pelo documento do filme que pegamos
         {"$replaceRoot": {"newRoot": "$doc_filme_original"}},
-        
-        # Ordenação e limite no final
-        {"$sort": {ordenar_por: ordem}},
     ]
+    if paginado:
+        if apos is not None:
+            pipeline.append({"$match": _condicao_keyset_mongo(ordenar_por, ordem, apos)})
+        pipeline.append({"$sort": dict(_ordenacao_keyset_mongo(ordenar_por, ordem))})
+    else:
+        # Ordenação e limite no final
+        pipeline.append({"$sort": {ordenar_por: ordem}})
     if limite is not None:
         pipeline.append({"$limit": limite})
-    
-    # print(f"DEBUG: Pipeline de agregação ATUALIZADO: {pipeline}")
-
-    try:
-        resultados_agregados_cursor = elenco_collection.aggregate(pipeline)
-        resultados_agregados = list(resultados_agregados_cursor)
-        print(f"DEBUG: Total de filmes ÚNICOS encontrados para o identificador '{identificador_ator}' (usando ator_id '{ator_id_para_pipeline}'): {len(resultados_agregados)}")
-        # ... (seu print de amostra, se quiser)
-    except Exception as e:
-        print(f"ERRO DEBUG: Exceção durante a agregação: {e}")
-        return []
-
-    return resultados_agregados
+    return pipeline
 
 # --- ATUALIZAÇÃO ---
 def atualizar_campo_filme(collection: Collection, id_filme: str, campo_para_atualizar: str, novo_valor: Any) -> bool:
@@ -467,6 +663,22 @@ def atualizar_campo_filme(collection: Collection, id_filme: str, campo_para_atua
         raise ItemNotFoundError(f"Filme com _id '{id_filme}' não encontrado para atualização.")
     return resultado.modified_count > 0 or resultado.matched_count > 0 # Considera sucesso se encontrou, mesmo que valor não mude
 
+def atualizar_campos_filme(collection: Collection, id_filme: str, atualizacoes: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Atualiza vários campos do filme num único find_one_and_update (atômico no documento)
+    e devolve o documento já atualizado, sem uma segunda leitura.
+    """
+    validar_campos_atualizacao(atualizacoes)
+    try:
+        documento = collection.find_one_and_update(
+            {"_id": id_filme}, {"$set": atualizacoes}, return_document=ReturnDocument.AFTER
+        )
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao atualizar campos {sorted(atualizacoes)} do filme '{id_filme}': {e}")
+    if documento is None:
+        raise ItemNotFoundError(f"Filme com _id '{id_filme}' não encontrado para atualização.")
+    return documento
+
 # --- REMOÇÃO ---
 def remover_filme(collection: Collection, id_filme: str) -> bool:
     """Remove um filme usando seu _id (titulo_id)."""
@@ -476,20 +688,61 @@ def remover_filme(collection: Collection, id_filme: str) -> bool:
         raise ItemNotFoundError(f"Filme com _id '{id_filme}' não encontrado para remoção.")
     return True
 
+# --- ATUALIZAÇÃO / REMOÇÃO EM MASSA (mesmos filtros da busca avançada, sem limite) ---
+def atualizar_filmes_por_filtro(
+    collection: Collection,
+    atualizacoes: Dict[str, Any],
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ano_corte_futuro: int = 2025
+) -> int:
+    """Aplica `atualizacoes` a todos os filmes que casam com o filtro num único update_many; devolve quantos casaram."""
+    validar_campos_atualizacao(atualizacoes)
+    query = _montar_query_busca_avancada(titulo, tipo, ano_min, None, generos, nota_min, duracao_min, ano_corte_futuro)
+    try:
+        resultado = collection.update_many(query, {"$set": atualizacoes})
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao atualizar filmes por filtro: {e}")
+    return resultado.matched_count
+
+def remover_filmes_por_filtro(
+    collection: Collection,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ano_corte_futuro: int = 2025
+) -> int:
+    """Remove todos os filmes que casam com o filtro num único delete_many; devolve quantos foram removidos."""
+    query = _montar_query_busca_avancada(titulo, tipo, ano_min, None, generos, nota_min, duracao_min, ano_corte_futuro)
+    try:
+        resultado = collection.delete_many(query)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao remover filmes por filtro: {e}")
+    return resultado.deleted_count
+
 # --- AGREGAÇÃO / ANÁLISE ---
 # (Contar filmes por ano e Média de notas por gênero não precisam de grandes mudanças,
 # pois não dependem diretamente do formato do _id, mas sim dos campos de dados)
 
-def contar_filmes_por_ano(collection: Collection) -> List[Dict[str, Any]]:
-    pipeline = [
+def _pipeline_contar_filmes_por_ano() -> List[Dict[str, Any]]:
+    return [
         {"$match": {"ano_lancamento": {"$ne": None}}},
         {"$group": {"_id": "$ano_lancamento", "quantidade": {"$sum": 1}}},
         {"$sort": {"_id": 1}}
     ]
-    return list(collection.aggregate(pipeline)) # O _id aqui é o ano, não ObjectId
 
-def media_notas_por_genero(collection: Collection) -> List[Dict[str, Any]]:
-    pipeline = [
+def contar_filmes_por_ano(collection: Collection) -> List[Dict[str, Any]]:
+    return list(collection.aggregate(_pipeline_contar_filmes_por_ano())) # O _id aqui é o ano, não ObjectId
+
+def _pipeline_media_notas_por_genero() -> List[Dict[str, Any]]:
+    return [
         {"$match": {"generos": {"$ne": None, "$not": {"$size": 0}}, "nota": {"$ne": None} }},
         {"$unwind": "$generos"},
         {"$group": {
@@ -505,7 +758,8 @@ def media_notas_por_genero(collection: Collection) -> List[Dict[str, Any]]:
         {"$sort": {"media_nota": -1}}
     ]
 
-    return list(collection.aggregate(pipeline))
+def media_notas_por_genero(collection: Collection) -> List[Dict[str, Any]]:
+    return list(collection.aggregate(_pipeline_media_notas_por_genero()))
 
 
 def buscar_atores_por_filmes( # Atores de UM filme específico
@@ -577,10 +831,11 @@ def carregar_dados_mongo(db: Database, filmes_path: str, atores_path: str, elenc
         )
         campos_ordenacao_filmes = ["titulo", "ano_lancamento", "nota", "numero_votos", "duracao"]
         for campo in campos_ordenacao_filmes:
-            filmes_collection.create_index([(campo, 1)], name=f"idx_filme_{campo}_asc")
+            # _id como desempate: atende também a paginação por keyset (campo, _id)
+            filmes_collection.create_index([(campo, 1), ("_id", 1)], name=f"idx_filme_{campo}_id")
         atores_collection.create_index([("nome_ator", 1)], name="idx_ator_nome")
     except Exception as e:
-        print(f"Aviso: Problema ao criar índices no MongoDB: {e}")
+        logger.warning("Aviso: Problema ao criar índices no MongoDB: %s", e)
 
     erros_carga = []
     filmes_inseridos_count = 0
@@ -685,7 +940,7 @@ def carregar_dados_mongo(db: Database, filmes_path: str, atores_path: str, elenc
     # Retorno final
     msg = f"Carga MongoDB: {filmes_inseridos_count} filmes, {atores_inseridos_count} atores, {elenco_inserido_count} relações."
     status_op = "sucesso" if not erros_carga else "concluído_com_erros"
-    if erros_carga: print(f"LOG DE CARGA MONGO - Erros: {erros_carga}")
+    if erros_carga: logger.error("LOG DE CARGA MONGO - Erros: %s", erros_carga)
 
     return {
         "status": status_op, "message": msg,
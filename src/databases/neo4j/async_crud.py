@@ -0,0 +1,87 @@
+# src/databases/neo4j/async_crud.py
+"""
+Consultas de leitura do Neo4j com o AsyncDriver (MODO_DRIVER=async).
+As queries Cypher são as mesmas de crud.py.
+"""
+from typing import List, Dict, Any, Optional
+from neo4j import AsyncSession, AsyncManagedTransaction
+
+from src.databases.neo4j.crud import (
+    _montar_cypher_busca_avancada,
+    _node_to_dict,
+    _retorno_filme_cypher,
+    QUERY_CONTAGEM_POR_ANO,
+    QUERY_MEDIA_NOTAS_POR_GENERO
+)
+from src.core.exceptions import ItemNotFoundError, DatabaseInteractionError
+
+
+async def _execute_read_query_async(tx: AsyncManagedTransaction, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    result = await tx.run(query, params if params else {})
+    nos = [_node_to_dict(record) async for record in result]
+    return [no for no in nos if no is not None]
+
+async def _execute_single_query_async(tx: AsyncManagedTransaction, query: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+    result = await tx.run(query, params if params else {})
+    record = await result.single()
+    return _node_to_dict(record) if record else None
+
+async def _execute_aggregation_query_async(tx: AsyncManagedTransaction, query: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    result = await tx.run(query, params if params else {})
+    return await result.data()
+
+
+async def buscar_filme_por_id(session: AsyncSession, id_filme: str, campos: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    query = f"MATCH (f:Filme {{_id: $id_filme_param}}) RETURN {_retorno_filme_cypher('f', campos)}"
+    params = {"id_filme_param": str(id_filme)}
+    try:
+        filme_node = await session.execute_read(_execute_single_query_async, query, params)
+        if not filme_node:
+            raise ItemNotFoundError(f"Filme com _id '{id_filme}' não encontrado no Neo4j.")
+        return filme_node
+    except ItemNotFoundError: raise
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao buscar filme por _id '{id_filme}' no Neo4j (async): {e}")
+
+async def buscar_filmes_por_ids(session: AsyncSession, ids_filmes: List[str], campos: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    if not ids_filmes:
+        return []
+    query = f"UNWIND $ids_param AS id_filme MATCH (f:Filme {{_id: id_filme}}) RETURN {_retorno_filme_cypher('f', campos)}"
+    try:
+        return await session.execute_read(_execute_read_query_async, query, {"ids_param": [str(i) for i in ids_filmes]})
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao buscar {len(ids_filmes)} filmes por _id no Neo4j (async): {e}")
+
+async def buscar_filmes_avancado(
+    session: AsyncSession,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ordenar_por: str = "nota",
+    ordem: int = -1,
+    limite: Optional[int] = 10000,
+    ano_corte_futuro: int = 2025,
+    campos: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    query_cypher_str, params_cypher = _montar_cypher_busca_avancada(
+        titulo, tipo, ano_min, generos, nota_min, duracao_min, ordenar_por, ordem, limite, ano_corte_futuro, campos=campos
+    )
+    try:
+        return await session.execute_read(_execute_read_query_async, query_cypher_str, params_cypher)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao executar busca avançada de filmes no Neo4j (async): {e}")
+
+async def contagem_por_ano(session: AsyncSession) -> List[Dict[str, Any]]:
+    try:
+        return await session.execute_read(_execute_aggregation_query_async, QUERY_CONTAGEM_POR_ANO)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao contar filmes por ano no Neo4j (async): {e}")
+
+async def media_notas_por_genero(session: AsyncSession) -> List[Dict[str, Any]]:
+    try:
+        return await session.execute_read(_execute_aggregation_query_async, QUERY_MEDIA_NOTAS_POR_GENERO)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao calcular média de notas por gênero no Neo4j (async): {e}")
@@ -1,37 +1,161 @@
 # src/databases/neo4j/connection.py
-# (Seu código atual está bom)
+import logging
+import asyncio
+import threading
 from neo4j import GraphDatabase, Driver # Adicionei Driver para tipagem
-from src.core.db_config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD    
+from neo4j import AsyncGraphDatabase, AsyncDriver
+from neo4j import Query, unit_of_work
+from src.core.db_config import (
+    NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD,
+    NEO4J_MAX_POOL_SIZE, NEO4J_CONNECTION_ACQUISITION_TIMEOUT
+)
+from src.core.prazos import prazo_atual
+from src.core.tempos import medir_fase
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 # Importe suas exceções customizadas se quiser tratar ConnectionError de forma mais específica aqui
 # from src.core.exceptions import DatabaseInteractionError
 
+
+
+def _funcao_tx_com_prazo(funcao_tx):
+    """Aplica o prazo da operação em andamento como timeout da transação (se a função não definir o seu)."""
+    prazo = prazo_atual()
+    if prazo is None or getattr(funcao_tx, "timeout", None) is not None:
+        return funcao_tx
+    if asyncio.iscoroutinefunction(funcao_tx):
+        async def funcao_com_prazo(tx, *args, **kwargs):
+            return await funcao_tx(tx, *args, **kwargs)
+    else:
+        def funcao_com_prazo(tx, *args, **kwargs):
+            return funcao_tx(tx, *args, **kwargs)
+    return unit_of_work(timeout=prazo)(funcao_com_prazo)
+
+
+class _SessaoComPrazo:
+    """Sessão (síncrona ou async) cujo execute_read/execute_write/run respeita o prazo da operação."""
+    def __init__(self, session):
+        self._session = session
+
+    def execute_read(self, funcao_tx, *args, **kwargs):
+        return self._session.execute_read(_funcao_tx_com_prazo(funcao_tx), *args, **kwargs)
+
+    def execute_write(self, funcao_tx, *args, **kwargs):
+        return self._session.execute_write(_funcao_tx_com_prazo(funcao_tx), *args, **kwargs)
+
+    def run(self, query, parameters=None, **kwargs):
+        # Transação auto-commit (usada no streaming e na carga): o prazo vai no próprio Query
+        prazo = prazo_atual()
+        if prazo is not None and isinstance(query, str):
+            query = Query(query, timeout=prazo)
+        return self._session.run(query, parameters, **kwargs)
+
+    def __enter__(self):
+        self._session.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._session.__exit__(*exc)
+
+    async def __aenter__(self):
+        await self._session.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc):
+        return await self._session.__aexit__(*exc)
+
+    def __getattr__(self, nome):
+        return getattr(self._session, nome)
+
+
+class _DriverComPrazo:
+    """Driver cujas sessões aplicam o prazo da operação em andamento (ver src/core/prazos.py)."""
+    def __init__(self, driver):
+        self._driver = driver
+
+    def session(self, **config):
+        return _SessaoComPrazo(self._driver.session(**config))
+
+    def __getattr__(self, nome):
+        return getattr(self._driver, nome)
+
+
 driver_neo4j: Optional[Driver] = None
+driver_neo4j_com_prazo: Optional[_DriverComPrazo] = None
+_lock_driver_neo4j = threading.Lock()
+
+# Driver asyncio nativo (MODO_DRIVER=async), criado dentro do event loop da API.
+driver_neo4j_async: Optional[AsyncDriver] = None
+driver_neo4j_async_com_prazo: Optional[_DriverComPrazo] = None
+_lock_driver_neo4j_async = asyncio.Lock()
 
+@medir_fase("conexao", "neo4j")
 def get_neo4j_driver() -> Driver:
     """Retorna o driver Neo4j para conexões, inicializando se necessário."""
-    global driver_neo4j
+    global driver_neo4j, driver_neo4j_com_prazo
     if driver_neo4j is None:
-        try:
-            driver_neo4j = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
-            # Verifica a conectividade
-            driver_neo4j.verify_connectivity()
-            print("Conexão com Neo4j estabelecida e verificada.")
-        except Exception as e:
-            # Em vez de ConnectionError genérico, poderia ser uma exceção customizada
-            # raise DatabaseInteractionError(f"Falha ao conectar ou verificar o Neo4j: {e}") from e
-            raise ConnectionError(f"Falha ao conectar no Neo4j: {e}") from e
-    return driver_neo4j
+        with _lock_driver_neo4j:
+            if driver_neo4j is None:
+                try:
+                    driver = GraphDatabase.driver(
+                        NEO4J_URI,
+                        auth=(NEO4J_USER, NEO4J_PASSWORD),
+                        max_connection_pool_size=NEO4J_MAX_POOL_SIZE,
+                        connection_acquisition_timeout=NEO4J_CONNECTION_ACQUISITION_TIMEOUT
+                    )
+                    # Verifica a conectividade
+                    driver.verify_connectivity()
+                    driver_neo4j_com_prazo = _DriverComPrazo(driver)
+                    driver_neo4j = driver
+                    logger.info("Conexão com Neo4j estabelecida e verificada.")
+                except Exception as e:
+                    # Em vez de ConnectionError genérico, poderia ser uma exceção customizada
+                    # raise DatabaseInteractionError(f"Falha ao conectar ou verificar o Neo4j: {e}") from e
+                    raise ConnectionError(f"Falha ao conectar no Neo4j: {e}") from e
+    return driver_neo4j_com_prazo
 
 def close_neo4j_driver():
     """Fecha o driver do Neo4j se estiver aberto."""
-    global driver_neo4j
-    if driver_neo4j is not None:
-        driver_neo4j.close()
-        driver_neo4j = None
-        print("Conexão com Neo4j fechada.")
-
-# Nota: Em uma aplicação FastAPI, o ciclo de vida do driver (abrir ao iniciar, fechar ao desligar)
-# pode ser gerenciado com eventos de startup/shutdown do FastAPI.
-# Por agora, get_neo4j_driver() cria se não existir.
\ No newline at end of file
+    global driver_neo4j, driver_neo4j_com_prazo
+    with _lock_driver_neo4j:
+        if driver_neo4j is not None:
+            driver_neo4j.close()
+            driver_neo4j = None
+            driver_neo4j_com_prazo = None
+            logger.info("Conexão com Neo4j fechada.")
+
+@medir_fase("conexao", "neo4j")
+async def get_neo4j_driver_async() -> AsyncDriver:
+    """Retorna o AsyncDriver do Neo4j, inicializando se necessário."""
+    global driver_neo4j_async, driver_neo4j_async_com_prazo
+    if driver_neo4j_async is None:
+        async with _lock_driver_neo4j_async:
+            if driver_neo4j_async is None:
+                try:
+                    driver = AsyncGraphDatabase.driver(
+                        NEO4J_URI,
+                        auth=(NEO4J_USER, NEO4J_PASSWORD),
+                        max_connection_pool_size=NEO4J_MAX_POOL_SIZE,
+                        connection_acquisition_timeout=NEO4J_CONNECTION_ACQUISITION_TIMEOUT
+                    )
+                    await driver.verify_connectivity()
+                    driver_neo4j_async_com_prazo = _DriverComPrazo(driver)
+                    driver_neo4j_async = driver
+                    logger.info("Conexão assíncrona com Neo4j estabelecida e verificada.")
+                except Exception as e:
+                    raise ConnectionError(f"Falha ao conectar (async) no Neo4j: {e}") from e
+    return driver_neo4j_async_com_prazo
+
+async def close_neo4j_driver_async():
+    """Fecha o AsyncDriver do Neo4j se estiver aberto."""
+    global driver_neo4j_async, driver_neo4j_async_com_prazo
+    if driver_neo4j_async is not None:
+        await driver_neo4j_async.close()
+        driver_neo4j_async = None
+        driver_neo4j_async_com_prazo = None
+        logger.info("Conexão assíncrona com Neo4j fechada.")
+
+# Nota: o ciclo de vida do driver (abrir ao iniciar, fechar ao desligar) é gerenciado
+# pelo lifespan da API (src/api/main.py) através de src/databases/conexoes.py.
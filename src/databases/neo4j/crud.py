@@ -1,7 +1,8 @@
 # src/databases/neo4j/crud.py
+import logging
 from neo4j import Driver, Session, Transaction, Record # Tipagem
 import neo4j
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 import pandas as pd # Para carregar_dados
 from pydantic import ValidationError # Para carregar_dados
 
@@ -14,6 +15,11 @@ import re # Para limpar_generos
 from src.core.exceptions import (
     DataValidationError, DatabaseInteractionError,
     ItemNotFoundError, ItemAlreadyExistsError)
+from src.core.projecao import campos_leitura, validar_campos_atualizacao
+from src.core.lote import item_inserido, item_com_erro, item_duplicado
+from src.core.tempos import medir_fase
+
+logger = logging.getLogger(__name__)
 
 def _limpar_generos_cypher(valor_generos: Any) -> List[str]: # Similar ao do Mongo
     if not valor_generos: return []
@@ -25,63 +31,52 @@ def _limpar_generos_cypher(valor_generos: Any) -> List[str]: # Similar ao do Mon
 
 # src/databases/neo4j/crud.py
 
+@medir_fase("decodificacao", "neo4j")
 def _node_to_dict(node: Record, key_name: str = "node") -> Optional[Dict[str, Any]]:
     """Converte um objeto Node do Neo4j (ou um record contendo um nó) para um dicionário."""
-    #print(f"DEBUG _node_to_dict: Recebido 'node' (Record): {node}, Tipo: {type(node)}") # Log inicial
     if not node:
-        print("DEBUG _node_to_dict: 'node' (Record) é None. Retornando None.")
+        logger.debug("DEBUG _node_to_dict: 'node' (Record) é None. Retornando None.")
         return None
     
     item_data = None
     # Tentativa de extração de item_data
     if isinstance(node, dict):
-        #print("DEBUG _node_to_dict: 'node' é um dict.")
         item_data = node.get(key_name)
         if item_data is None and len(node.keys()) == 1: 
             item_data = node[list(node.keys())[0]] # Corrigido aqui também por segurança
     elif hasattr(node, 'properties'): # Isso seria para um objeto Node direto, não um Record
-        #print("DEBUG _node_to_dict: 'node' tem 'properties' (é um Node direto?).")
         item_data = dict(node.properties)
     elif isinstance(node, Record) and node.keys(): 
-        #print(f"DEBUG _node_to_dict: 'node' é um Record com chaves: {list(node.keys())}.")
         if len(list(node.keys())) == 1:
             chave_principal_record = list(node.keys())[0]
             single_item = node[chave_principal_record]
-            #print(f"DEBUG _node_to_dict: single_item (de Record['{chave_principal_record}']): {single_item}, Tipo: {type(single_item)}")
             
             # --- NOVA ABORDAGEM DE EXTRAÇÃO DE item_data ---
             item_data_extraido = None # Variável temporária
             if isinstance(single_item, neo4j.graph.Node):
-                #print(f"DEBUG _node_to_dict: single_item É um neo4j.graph.Node. Tentando conversão direta para dict(single_item).")
                 try:
                     item_data_extraido = dict(single_item) # Tenta converter o Node diretamente para um dicionário Python
-                    #print(f"DEBUG _node_to_dict: Sucesso! Resultado de dict(single_item): {item_data_extraido}")
                 except Exception as e_conv:
-                    print(f"DEBUG _node_to_dict: ERRO ao tentar dict(single_item): {e_conv}. Isso é inesperado.")
+                    logger.debug("DEBUG _node_to_dict: ERRO ao tentar dict(single_item): %s. Isso é inesperado.", e_conv)
                     # Se a conversão direta falhar, podemos tentar listar os atributos para entender melhor o objeto
                     try:
-                        #print(f"DEBUG _node_to_dict: Atributos disponíveis em single_item (via dir()): {dir(single_item)}")
                         if 'properties' in dir(single_item) and isinstance(single_item.properties, dict): # Verifica se '.properties' existe e é um dict
-                            #print("DEBUG _node_to_dict: Tentando fallback para single_item.properties")
                             item_data_extraido = single_item.properties
                         else:
-                            print("DEBUG _node_to_dict: Fallback para .properties não é um dict ou não existe.")
+                            logger.debug("DEBUG _node_to_dict: Fallback para .properties não é um dict ou não existe.")
                     except Exception as e_dir:
-                        print(f"DEBUG _node_to_dict: Erro ao listar atributos de single_item com dir(): {e_dir}")
+                        logger.debug("DEBUG _node_to_dict: Erro ao listar atributos de single_item com dir(): %s", e_dir)
             elif isinstance(single_item, dict):
-                print(f"DEBUG _node_to_dict: single_item já é um dicionário.")
                 item_data_extraido = single_item
             else:
-                print(f"DEBUG _node_to_dict: single_item (Tipo: {type(single_item)}) não é neo4j.graph.Node nem dict. Não foi possível extrair item_data.")
+                logger.debug("DEBUG _node_to_dict: single_item (Tipo: %s) não é neo4j.graph.Node nem dict. Não foi possível extrair item_data.", type(single_item))
             
             item_data = item_data_extraido # Atribui o resultado da tentativa à variável item_data que o resto da função usa
             # --- FIM DA NOVA ABORDAGEM ---
 
     # Log ANTES das modificações de _id e tipos
-    #print(f"DEBUG _node_to_dict: item_data ANTES das modificações de _id/tipo: {item_data}")
 
     if item_data and isinstance(item_data, dict):
-        #print(f"DEBUG _node_to_dict: 'item_data' é um dict, processando modificações de _id e tipos...")
         # Garante que _id (baseado em titulo_id ou ator_id) exista e os tipos corretos
         if "titulo_id" in item_data:
             item_data["_id"] = str(item_data["titulo_id"])
@@ -92,12 +87,12 @@ def _node_to_dict(node: Record, key_name: str = "node") -> Optional[Dict[str, An
             if field in item_data and item_data[field] is not None:
                 try: item_data[field] = int(item_data[field])
                 except (ValueError, TypeError): 
-                    print(f"DEBUG _node_to_dict: Falha ao converter '{field}' para int (valor: {item_data[field]}). Mantendo original.")
+                    logger.debug("DEBUG _node_to_dict: Falha ao converter '%s' para int (valor: %s). Mantendo original.", field, item_data[field])
                     pass 
         if "nota" in item_data and item_data["nota"] is not None:
             try: item_data["nota"] = float(item_data["nota"])
             except (ValueError, TypeError): 
-                print(f"DEBUG _node_to_dict: Falha ao converter 'nota' para float (valor: {item_data['nota']}). Mantendo original.")
+                logger.debug("DEBUG _node_to_dict: Falha ao converter 'nota' para float (valor: %s). Mantendo original.", item_data['nota'])
                 pass
         
         # --- ADICIONE ESTAS LINHAS ANTES DO RETURN ---
@@ -107,11 +102,10 @@ def _node_to_dict(node: Record, key_name: str = "node") -> Optional[Dict[str, An
         item_data.pop("timestamp_atualizacao", None)
         # --- FIM DA ADIÇÃO ---
 
-        #print(f"DEBUG _node_to_dict: item_data APÓS modificações, PRONTO PARA RETORNAR: {item_data}")
         return item_data
     else: 
-        print(f"DEBUG _node_to_dict: Condição 'if item_data and isinstance(item_data, dict)' FALHOU.")
-        print(f"DEBUG _node_to_dict: item_data final: {item_data}, tipo de item_data: {type(item_data)}. Retornando None.")
+        logger.debug("DEBUG _node_to_dict: Condição 'if item_data and isinstance(item_data, dict)' FALHOU.")
+        logger.debug("DEBUG _node_to_dict: item_data final: %s, tipo de item_data: %s. Retornando None.", item_data, type(item_data))
         return None
 
 
@@ -120,27 +114,23 @@ def _execute_read_query(tx: Transaction, query: str, params: Dict[str, Any] = No
     return [_node_to_dict(record) for record in result if _node_to_dict(record) is not None]
 
 def _execute_write_query_single_return(tx: Transaction, query: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
-    #print(f"DEBUG NEO4J CRUD: Executando query: {query}") # Log 1
-    #print(f"DEBUG NEO4J CRUD: Com params: {params}")     # Log 2
     result = tx.run(query, params if params else {})
     try:
         record = result.single()
         # Veja o que o Neo4j efetivamente retorna ANTES de tentar converter para dict.
-        print(f"DEBUG NEO4J CRUD: result.single() retornou: {record}") # Log 3
+        logger.debug("DEBUG NEO4J CRUD: result.single() retornou: %s", record)
         if record and not record.data(): # Checa se o record está vazio
-             print(f"DEBUG NEO4J CRUD: Record retornado mas está vazio (record.data() é {record.data()}). Keys: {list(record.keys())}")
+             logger.debug("DEBUG NEO4J CRUD: Record retornado mas está vazio (record.data() é %s). Keys: %s", record.data(), list(record.keys()))
              return None # Se o record estiver vazio, _node_to_dict pode falhar ou retornar None
         return _node_to_dict(record) if record else None
     except Exception as e_single:
-        print(f"DEBUG NEO4J CRUD: Erro dentro de result.single() ou _node_to_dict: {e_single}")
-        # traceback.print_exc() # Descomente para ver o traceback completo desta exceção interna
+        logger.debug("DEBUG NEO4J CRUD: Erro dentro de result.single() ou _node_to_dict: %s", e_single)
         raise # Re-levanta para a transação principal tratar
 
-def inserir_filme(session: Session, filme_data: Dict[str, Any]) -> Dict[str, Any]:
+def _preparar_params_filme_neo4j(filme_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Propriedades do nó Filme a partir do payload: _id no lugar de titulo_id e tipos normalizados."""
     if "titulo_id" not in filme_data or not filme_data["titulo_id"]: 
         raise DataValidationError("'titulo_id' é obrigatório para inserir filme no Neo4j.")
-    
-    filme_id_str = str(filme_data["titulo_id"])
 
     # Prepara os parâmetros para o novo filme, usando _id como a propriedade principal no Neo4j
     params_para_criar = filme_data.copy()
@@ -166,7 +156,12 @@ def inserir_filme(session: Session, filme_data: Dict[str, Any]) -> Dict[str, Any
             params_para_criar["generos"] = [str(g) for g in str(params_para_criar["generos"]).split(',') if g.strip()]
         else: # Já é lista, garante que os itens sejam strings
             params_para_criar["generos"] = [str(g).strip() for g in params_para_criar["generos"] if str(g).strip()]
-    
+    return params_para_criar
+
+def inserir_filme(session: Session, filme_data: Dict[str, Any]) -> Dict[str, Any]:
+    params_para_criar = _preparar_params_filme_neo4j(filme_data)
+    filme_id_str = params_para_criar["_id"]
+
     # Função de transação para verificar e criar
     def _check_and_create_film_tx(tx, id_val: str, params_val: Dict[str, Any]):
         # 1. Verifica se o filme já existe
@@ -176,11 +171,11 @@ def inserir_filme(session: Session, filme_data: Dict[str, Any]) -> Dict[str, Any
 
         if existing_film_record:
             # Se encontrou, o filme já existe!
-            print(f"NEO4J CRUD DEBUG (Inserir Filme): Filme com _id '{id_val}' já existe. Levantando ItemAlreadyExistsError.") # DEBUG
+            logger.debug("NEO4J CRUD DEBUG (Inserir Filme): Filme com _id '%s' já existe. Levantando ItemAlreadyExistsError.", id_val)
             raise ItemAlreadyExistsError(f"Filme com _id '{id_val}' já existe no Neo4j.")
         
         # 2. Se não existe, cria o novo filme
-        print(f"NEO4J CRUD DEBUG (Inserir Filme): Filme com _id '{id_val}' não existe. Criando novo filme...") # DEBUG
+        logger.debug("NEO4J CRUD DEBUG (Inserir Filme): Filme com _id '%s' não existe. Criando novo filme...", id_val)
         
         # A query de criação não precisa mais de ON MATCH.
         # O timestamp_criacao é adicionado pelo Cypher.
@@ -213,7 +208,7 @@ def inserir_filme(session: Session, filme_data: Dict[str, Any]) -> Dict[str, Any
             # Isso pode acontecer se _node_to_dict falhar por algum motivo após uma criação bem-sucedida.
             raise DatabaseInteractionError(f"Falha inesperada ao processar o filme '{filme_id_str}' após a criação no Neo4j (filme_criado_props é None).")
         
-        print(f"NEO4J CRUD INFO (Inserir Filme): Filme '{filme_id_str}' inserido com sucesso.") # DEBUG
+        logger.info("NEO4J CRUD INFO (Inserir Filme): Filme '%s' inserido com sucesso.", filme_id_str)
         return filme_criado_props
         
     except ItemAlreadyExistsError: # Se _check_and_create_film_tx levantou
@@ -222,12 +217,52 @@ def inserir_filme(session: Session, filme_data: Dict[str, Any]) -> Dict[str, Any
         raise
     except Exception as e: 
         # Captura outras exceções do driver Neo4j ou DatabaseInteractionError da sub-função
-        print(f"NEO4J CRUD ERROR (Inserir Filme): Exceção ao inserir filme '{filme_id_str}': {e}") # DEBUG
-        # import traceback # Para debug mais profundo
-        # traceback.print_exc()
+        logger.error("NEO4J CRUD ERROR (Inserir Filme): Exceção ao inserir filme '%s': %s", filme_id_str, e)
         raise DatabaseInteractionError(f"Erro ao inserir filme Neo4j _id '{filme_id_str}': {str(e)}")
 
 
+TAMANHO_LOTE_INSERCAO_NEO4J = 1000 # Filmes por transação (um UNWIND) na inserção em lote
+
+def _criar_filmes_novos_tx(tx: Transaction, filmes: List[Dict[str, Any]]) -> List[str]:
+    """Cria, num único UNWIND, os filmes cujo _id ainda não existe; devolve os _id criados."""
+    query = """
+    UNWIND $filmes AS filme
+    OPTIONAL MATCH (existente:Filme {_id: filme._id})
+    WITH filme WHERE existente IS NULL
+    CREATE (f:Filme)
+    SET f = filme, f.timestamp_criacao = timestamp()
+    RETURN f._id AS id
+    """
+    return [record["id"] for record in tx.run(query, {"filmes": filmes})]
+
+def inserir_filmes_em_lote(session: Session, filmes_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Insere vários filmes com UNWIND, uma transação a cada TAMANHO_LOTE_INSERCAO_NEO4J filmes,
+    em vez de uma transação (checagem + CREATE) por filme. Filmes cujo _id já existe ficam
+    de fora do CREATE e voltam como 409. Devolve um resultado por filme (ver src.core.lote).
+    """
+    resultados: List[Optional[Dict[str, Any]]] = [None] * len(filmes_data)
+    validos: List[Tuple[int, Dict[str, Any]]] = []
+    for posicao, filme_data in enumerate(filmes_data):
+        try:
+            validos.append((posicao, _preparar_params_filme_neo4j(filme_data)))
+        except DataValidationError as e_dv:
+            resultados[posicao] = item_com_erro(filme_data.get("titulo_id"), e_dv)
+
+    for inicio in range(0, len(validos), TAMANHO_LOTE_INSERCAO_NEO4J):
+        lote = validos[inicio:inicio + TAMANHO_LOTE_INSERCAO_NEO4J]
+        try:
+            criados = set(session.execute_write(_criar_filmes_novos_tx, [params for _, params in lote]))
+        except Exception as e:
+            # A transação do lote foi desfeita: nenhum filme dele foi criado
+            for posicao, params in lote:
+                resultados[posicao] = item_com_erro(params["_id"], DatabaseInteractionError(f"Erro ao inserir lote no Neo4j: {e}"))
+            continue
+        for posicao, params in lote:
+            resultados[posicao] = item_inserido(params["_id"]) if params["_id"] in criados else item_duplicado(params["_id"])
+    return resultados
+
+
 def inserir_ator(session: Session, ator_data: Dict[str, Any]) -> Dict[str, Any]:
     if "ator_id" not in ator_data: raise DataValidationError("'ator_id' obrigatório.")
     params = ator_data.copy()
@@ -286,9 +321,20 @@ def inserir_elenco(session: Session, elenco_data: Dict[str, Any]) -> Dict[str, A
         raise DatabaseInteractionError(f"Erro ao inserir elenco Neo4j: {e}")
 
 
+def _retorno_filme_cypher(variavel: str, campos: Optional[List[str]], *necessarios: Optional[str]) -> str:
+    """
+    Expressão do RETURN para o nó de filme: o nó inteiro ou, com `campos`, a map projection
+    `f {._id, .titulo, ...} AS f` (os demais atributos nem saem do servidor).
+    """
+    campos_lidos = campos_leitura(campos, *necessarios)
+    if campos_lidos is None:
+        return variavel
+    propriedades = ", ".join(f".{campo}" for campo in ["_id", *campos_lidos])
+    return f"{variavel} {{{propriedades}}} AS {variavel}"
+
 # --- CONSULTAS ---
-def buscar_filme_por_id(session: Session, id_filme: str) -> Optional[Dict[str, Any]]:
-    query = "MATCH (f:Filme {_id: $id_filme_param}) RETURN f"
+def buscar_filme_por_id(session: Session, id_filme: str, campos: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    query = f"MATCH (f:Filme {{_id: $id_filme_param}}) RETURN {_retorno_filme_cypher('f', campos)}"
     params = {"id_filme_param": str(id_filme)} # Garante que é string
     try:
         filme_node = session.execute_read(_execute_write_query_single_return, query, params)
@@ -299,32 +345,122 @@ def buscar_filme_por_id(session: Session, id_filme: str) -> Optional[Dict[str, A
     except Exception as e:
         raise DatabaseInteractionError(f"Erro ao buscar filme por _id '{id_filme}' no Neo4j: {e}")
 
-def buscar_filmes_avancado(
-    session: Session, # Recebe a sessão Neo4j
-    titulo: Optional[str] = None,
-    tipo: Optional[str] = None,
-    ano_min: Optional[int] = None,
-    generos: Optional[List[str]] = None, # Espera uma lista de strings
-    nota_min: Optional[float] = None,
-    duracao_min: Optional[int] = None,
-    ordenar_por: str = "nota",
-    ordem: int = -1,
-    limite: Optional[int] = 10000, # Default do limite
-    ano_corte_futuro: int = 2025 # Vem do query_service
-) -> List[Dict[str, Any]]:
-    
-    print(f"--- NEO4J CRUD: Iniciando buscar_filmes_avancado ---") # DEBUG
-    print(f"Filtros recebidos: Título='{titulo}', Tipo='{tipo}', AnoMin='{ano_min}', Gêneros='{generos}', NotaMin='{nota_min}', DuraçãoMin='{duracao_min}'") # DEBUG
-    print(f"Ordenação: Por='{ordenar_por}', Ordem='{ordem}'. Limite: {limite}. Ano Corte Futuro: {ano_corte_futuro}") # DEBUG
+def buscar_filmes_por_ids(session: Session, ids_filmes: List[str], campos: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Vários filmes pelo _id numa única query (UNWIND dos ids + MATCH pelo índice de _id),
+    na ordem de ids_filmes; ids inexistentes ficam de fora.
+    """
+    if not ids_filmes:
+        return []
+    query = f"UNWIND $ids_param AS id_filme MATCH (f:Filme {{_id: id_filme}}) RETURN {_retorno_filme_cypher('f', campos)}"
+    try:
+        return session.execute_read(_execute_read_query, query, {"ids_param": [str(i) for i in ids_filmes]})
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao buscar {len(ids_filmes)} filmes por _id no Neo4j: {e}")
 
-    conditions = []
+CAMPOS_ORDENACAO_FILME = ["titulo", "ano_lancamento", "nota", "numero_votos", "duracao", "_id"]
+
+def _keyset_cypher(variavel: str, ordenar_por: str, ordem: int, apos: Optional[Dict[str, Any]], params_cypher: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    WHERE "depois de (valor, _id)" e ORDER BY (campo, _id) da paginação por keyset.
+    No Neo4j null fica por último na ordem crescente e primeiro na decrescente.
+    """
+    campo, id_no = f"{variavel}.{ordenar_por}", f"{variavel}._id"
+    direcao, operador = ("DESC", "<") if ordem == -1 else ("ASC", ">")
+    order_by = f"{campo} {direcao}" if ordenar_por == "_id" else f"{campo} {direcao}, {id_no} {direcao}"
+    if apos is None:
+        return "", order_by
+
+    params_cypher["apos_id_param"] = apos["id"]
+    if ordenar_por == "_id":
+        condicao = f"{id_no} {operador} $apos_id_param"
+    elif apos["valor"] is None:
+        if ordem == -1:
+            condicao = f"({campo} IS NOT NULL OR {id_no} < $apos_id_param)"
+        else:
+            condicao = f"({campo} IS NULL AND {id_no} > $apos_id_param)"
+    else:
+        params_cypher["apos_valor_param"] = apos["valor"]
+        condicao = f"{campo} {operador} $apos_valor_param OR ({campo} = $apos_valor_param AND {id_no} {operador} $apos_id_param)"
+        if ordem == 1:
+            condicao += f" OR {campo} IS NULL"
+        condicao = f"({condicao})"
+    return f"WHERE {condicao} ", order_by
+
+def _posicao_keyset(filmes: List[Dict[str, Any]], ordenar_por: str, tamanho_pagina: int) -> Optional[Dict[str, Any]]:
+    """Posição do último filme da página (None se a página não veio cheia: não há próxima)."""
+    if len(filmes) < tamanho_pagina:
+        return None
+    return {"valor": filmes[-1].get(ordenar_por), "id": filmes[-1]["_id"]}
+
+def _montar_cypher_busca_avancada(
+    titulo: Optional[str],
+    tipo: Optional[str],
+    ano_min: Optional[int],
+    generos: Optional[List[str]],
+    nota_min: Optional[float],
+    duracao_min: Optional[int],
+    ordenar_por: str,
+    ordem: int,
+    limite: Optional[int],
+    ano_corte_futuro: int,
+    paginado: bool = False,
+    apos: Optional[Dict[str, Any]] = None,
+    campos: Optional[List[str]] = None
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Monta a query Cypher da busca avançada e seus parâmetros (compartilhado com async_crud.py).
+    Com paginado=True ordena por (campo, _id) e começa depois de `apos` (paginação por keyset).
+    Com `campos`, devolve só esses atributos (mais o de ordenação, usado no ORDER BY sobre o map).
+    """
+    conditions, params_cypher = _condicoes_cypher_busca_avancada(
+        titulo, tipo, ano_min, generos, nota_min, duracao_min, ano_corte_futuro
+    )
     # Usamos o 'limite' da assinatura da função. Se for None, o Cypher lida com isso (sem LIMIT) ou podemos definir um default alto.
     # Para consistência, se limite for None, não adicionaremos LIMIT à query, ou usaremos um default bem alto.
     # O parâmetro 'limite_param' no Cypher espera um valor.
-    params_cypher: Dict[str, Any] = {
-        "limite_param": limite if limite is not None and limite > 0 else 10000, # Default alto se limite for None ou inválido
-        "ano_corte_futuro_param": ano_corte_futuro
-    }
+    params_cypher["limite_param"] = limite if limite is not None and limite > 0 else 10000 # Default alto se limite for None ou inválido
+
+    # Montagem da Query Cypher
+    query_cypher_str = "MATCH (f:Filme) "
+    if conditions:
+        query_cypher_str += "WHERE " + " AND ".join(conditions) + " "
+    
+    # --- A MÁGICA DO 'WITH f' PARA GARANTIR UNICIDADE ANTES DO RETURN ---
+    query_cypher_str += "WITH f " 
+    
+    # Adicionar Ordenação e Limite
+    if ordenar_por not in CAMPOS_ORDENACAO_FILME: 
+        logger.warning("NEO4J CRUD WARN: Campo de ordenação '%s' inválido para Filme. Usando 'nota' como padrão.", ordenar_por)
+        ordenar_por = "nota" 
+    
+    if paginado:
+        where_keyset, order_by = _keyset_cypher("f", ordenar_por, ordem, apos, params_cypher)
+        query_cypher_str += where_keyset
+    else:
+        order_direction_str = "DESC" if ordem == -1 else "ASC"
+        order_by = f"f.{ordenar_por} {order_direction_str}"
+    query_cypher_str += f"RETURN {_retorno_filme_cypher('f', campos, ordenar_por)} " # O DISTINCT aqui é redundante se WITH f já garante, mas inofensivo.
+                                  # Pode ser só "RETURN f"
+    query_cypher_str += f"ORDER BY {order_by} "
+    query_cypher_str += "LIMIT $limite_param"
+    return query_cypher_str, params_cypher
+
+def _condicoes_cypher_busca_avancada(
+    titulo: Optional[str],
+    tipo: Optional[str],
+    ano_min: Optional[int],
+    generos: Optional[List[str]],
+    nota_min: Optional[float],
+    duracao_min: Optional[int],
+    ano_corte_futuro: int
+) -> Tuple[List[str], Dict[str, Any]]:
+    """
+    Condições do WHERE (sobre o nó `f`) e parâmetros dos filtros da busca avançada, com a regra
+    dos filmes futuros/sem avaliação. Usado pela busca e pela atualização/remoção por filtro.
+    """
+    conditions = []
+    params_cypher: Dict[str, Any] = {"ano_corte_futuro_param": ano_corte_futuro}
 
     if titulo:
         conditions.append("toLower(f.titulo) CONTAINS toLower($titulo_param)")
@@ -353,7 +489,7 @@ def buscar_filmes_avancado(
             perf_filters_cypher_conditions.append("f.duracao >= $duracao_min_param")
             params_cypher["duracao_min_param"] = int(duracao_min)
         else:
-            print(f"NEO4J CRUD DEBUG: Filtro de duracao_min não aplicado pois tipo é '{tipo}'.")
+            logger.debug("NEO4J CRUD DEBUG: Filtro de duracao_min não aplicado pois tipo é '%s'.", tipo)
     
     if perf_filters_cypher_conditions: # Somente adiciona a lógica OR complexa se houver filtros de performance
         cond_normais_com_perf = f"""
@@ -374,126 +510,259 @@ def buscar_filmes_avancado(
     if ano_min is not None:
         conditions.append("f.ano_lancamento >= $ano_min_param")
         params_cypher["ano_min_param"] = int(ano_min)
+    return conditions, params_cypher
 
-    # Montagem da Query Cypher
-    query_cypher_str = "MATCH (f:Filme) "
-    if conditions:
-        query_cypher_str += "WHERE " + " AND ".join(conditions) + " "
-    
-    # --- A MÁGICA DO 'WITH f' PARA GARANTIR UNICIDADE ANTES DO RETURN ---
-    query_cypher_str += "WITH f " 
-    query_cypher_str += "RETURN f " # O DISTINCT aqui é redundante se WITH f já garante, mas inofensivo.
-                                  # Pode ser só "RETURN f"
-    
-    # Adicionar Ordenação e Limite
-    valid_sort_fields = ["titulo", "ano_lancamento", "nota", "numero_votos", "duracao", "_id"]
-    if ordenar_por not in valid_sort_fields: 
-        print(f"NEO4J CRUD WARN: Campo de ordenação '{ordenar_por}' inválido para Filme. Usando 'nota' como padrão.")
-        ordenar_por = "nota" 
+def buscar_filmes_avancado(
+    session: Session, # Recebe a sessão Neo4j
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None, # Espera uma lista de strings
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ordenar_por: str = "nota",
+    ordem: int = -1,
+    limite: Optional[int] = 10000, # Default do limite
+    ano_corte_futuro: int = 2025, # Vem do query_service
+    campos: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     
-    order_direction_str = "DESC" if ordem == -1 else "ASC"
-    query_cypher_str += f"ORDER BY f.{ordenar_por} {order_direction_str} "
-    query_cypher_str += "LIMIT $limite_param"
+    logger.debug("--- NEO4J CRUD: Iniciando buscar_filmes_avancado ---")
+    logger.debug("Filtros recebidos: Título='%s', Tipo='%s', AnoMin='%s', Gêneros='%s', NotaMin='%s', DuraçãoMin='%s'", titulo, tipo, ano_min, generos, nota_min, duracao_min)
+    logger.debug("Ordenação: Por='%s', Ordem='%s'. Limite: %s. Ano Corte Futuro: %s", ordenar_por, ordem, limite, ano_corte_futuro)
 
-    #print("NEO4J CRUD DEBUG: Query FINAL MONTADA para busca avançada (com WITH f):\n", query_cypher_str)
-    print("NEO4J CRUD DEBUG: Parâmetros FINAIS para busca avançada:\n", params_cypher)
+    query_cypher_str, params_cypher = _montar_cypher_busca_avancada(
+        titulo, tipo, ano_min, generos, nota_min, duracao_min, ordenar_por, ordem, limite, ano_corte_futuro, campos=campos
+    )
+
+    logger.debug("NEO4J CRUD DEBUG: Parâmetros FINAIS para busca avançada:\n %s", params_cypher)
     
     try:
         # _execute_read_query já itera sobre os resultados e chama _node_to_dict
         resultados = session.execute_read(_execute_read_query, query_cypher_str, params_cypher)
-        print(f"NEO4J CRUD DEBUG: buscar_filmes_avancado (com WITH f) retornou {len(resultados)} filmes.")
+        logger.debug("NEO4J CRUD DEBUG: buscar_filmes_avancado (com WITH f) retornou %s filmes.", len(resultados))
         return resultados
     except Exception as e:
-        print(f"NEO4J CRUD ERROR: Exceção em buscar_filmes_avancado (com WITH f): {e}")
-        # import traceback # Para debug mais profundo se necessário
-        # traceback.print_exc()
+        logger.error("NEO4J CRUD ERROR: Exceção em buscar_filmes_avancado (com WITH f): %s", e)
         raise DatabaseInteractionError(f"Erro ao executar busca avançada de filmes no Neo4j: {e}")
 
-def buscar_filmes_por_ator(session: Session, id_ator: str, ordenar_por: str = 'ano_lancamento', ordem: int = -1, limite: Optional[int] = 10000) -> List[Dict[str, Any]]:
-    # AGORA O PARÂMETRO É id_ator E ESPERA O "nm..."
-    print(f"--- NEO4J CRUD: Iniciando buscar_filmes_por_ator para ID_ATOR: '{id_ator}' ---")
-    
+def iterar_filmes_avancado(
+    driver: Driver,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ordenar_por: str = "nota",
+    ordem: int = -1,
+    limite: Optional[int] = 10000,
+    ano_corte_futuro: int = 2025,
+    tamanho_lote: int = 500,
+    campos: Optional[List[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Versão em streaming de buscar_filmes_avancado: usa uma transação auto-commit (session.run)
+    e devolve os registros conforme chegam do servidor, em lotes de tamanho_lote (fetch_size).
+    A sessão fica aberta até o gerador terminar ou ser fechado.
+    """
+    query_cypher_str, params_cypher = _montar_cypher_busca_avancada(
+        titulo, tipo, ano_min, generos, nota_min, duracao_min, ordenar_por, ordem, limite, ano_corte_futuro, campos=campos
+    )
+    try:
+        with driver.session(database="neo4j", fetch_size=tamanho_lote) as session:
+            for record in session.run(query_cypher_str, params_cypher):
+                filme = _node_to_dict(record)
+                if filme is not None:
+                    yield filme
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao executar busca avançada de filmes no Neo4j: {e}")
+
+def paginar_filmes_avancado(
+    session: Session,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ordenar_por: str = "nota",
+    ordem: int = -1,
+    ano_corte_futuro: int = 2025,
+    tamanho_pagina: int = 20,
+    apos: Optional[Dict[str, Any]] = None,
+    campos: Optional[List[str]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Uma página da busca avançada por keyset: continua depois de `apos` ({"valor", "id"} do
+    último filme da página anterior) em vez de usar SKIP. Devolve (filmes, posição seguinte ou None).
+    """
+    ordenar_por = ordenar_por if ordenar_por in CAMPOS_ORDENACAO_FILME else "nota"
+    query_cypher_str, params_cypher = _montar_cypher_busca_avancada(
+        titulo, tipo, ano_min, generos, nota_min, duracao_min, ordenar_por, ordem, tamanho_pagina, ano_corte_futuro,
+        paginado=True, apos=apos, campos=campos
+    )
+    try:
+        filmes = session.execute_read(_execute_read_query, query_cypher_str, params_cypher)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao executar busca avançada paginada de filmes no Neo4j: {e}")
+    return filmes, _posicao_keyset(filmes, ordenar_por, tamanho_pagina)
+
+QUERY_ATOR_EXISTE = "MATCH (a:Ator {_id: $id_param}) RETURN count(a) > 0 AS ator_existe"
+
+def _montar_cypher_filmes_por_ator(
+    id_ator: str,
+    ordenar_por: str,
+    ordem: int,
+    limite: Optional[int],
+    paginado: bool = False,
+    apos: Optional[Dict[str, Any]] = None,
+    campos: Optional[List[str]] = None
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Monta a query Cypher dos filmes de um ator (pelo _id) e seus parâmetros.
+    Com paginado=True ordena por (campo, _id) e começa depois de `apos` (paginação por keyset).
+    """
     order_direction = "DESC" if ordem == -1 else "ASC"
-    valid_sort_fields_filme = ["titulo", "ano_lancamento", "nota", "numero_votos", "duracao", "_id"]
-    if ordenar_por not in valid_sort_fields_filme: 
-        print(f"NEO4J CRUD WARN: Campo de ordenação '{ordenar_por}' inválido. Usando 'ano_lancamento'.")
+    if ordenar_por not in CAMPOS_ORDENACAO_FILME: 
+        logger.warning("NEO4J CRUD WARN: Campo de ordenação '%s' inválido. Usando 'ano_lancamento'.", ordenar_por)
         ordenar_por = "ano_lancamento"
 
+    params_cypher = {"id_ator_param": str(id_ator), "limite_param": limite} # Passa o ID como parâmetro
+    where_keyset, order_by = "", f"filme.{ordenar_por} {order_direction}"
+    if paginado:
+        where_keyset, order_by = _keyset_cypher("filme", ordenar_por, ordem, apos, params_cypher)
+
+    query_cypher = f"""
+    MATCH (ator:Ator {{_id: $id_ator_param}})-[r:ACTED_IN]->(filme:Filme) 
+    {where_keyset}
+    RETURN {_retorno_filme_cypher('filme', campos, ordenar_por)}, r.nome_personagem AS nome_personagem_rel
+    ORDER BY {order_by}
+    LIMIT $limite_param
+    """
+    return query_cypher, params_cypher
+
+def _filme_de_registro_ator(record_item: Record) -> Optional[Dict[str, Any]]:
+    """Converte um registro (filme, nome_personagem_rel) da query de filmes por ator em dicionário."""
+    filme_node_obj = record_item.get("filme")
+    nome_personagem = record_item.get("nome_personagem_rel")
+    if not filme_node_obj:
+        logger.warning("NEO4J CRUD WARN (process_results_tx): Record sem 'filme': %s", record_item.data())
+        return None
+    try:
+        filme_dict = dict(filme_node_obj)
+        # Aplicar conversões de tipo e _id (mantenha sua lógica aqui)
+        if "_id" not in filme_dict and "titulo_id" in filme_dict:
+             filme_dict["_id"] = str(filme_dict["titulo_id"])
+        elif "_id" in filme_dict:
+             filme_dict["_id"] = str(filme_dict["_id"])
+        for field_key in ["ano_lancamento", "numero_votos", "duracao"]:
+            if field_key in filme_dict and filme_dict[field_key] is not None:
+                try: filme_dict[field_key] = int(filme_dict[field_key])
+                except: pass # Seria bom logar essa falha de conversão
+        if "nota" in filme_dict and filme_dict["nota"] is not None:
+            try: filme_dict["nota"] = float(filme_dict["nota"])
+            except: pass # Seria bom logar essa falha de conversão
+        if nome_personagem is not None:
+            filme_dict["nome_personagem"] = nome_personagem
+        return filme_dict
+    except Exception as e_conv:
+        logger.warning("NEO4J CRUD WARN (process_results_tx): Falha ao converter Node: %s", e_conv)
+        return None
+
+def buscar_filmes_por_ator(
+    session: Session, id_ator: str, ordenar_por: str = 'ano_lancamento', ordem: int = -1, limite: Optional[int] = 10000,
+    campos: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    # AGORA O PARÂMETRO É id_ator E ESPERA O "nm..."
+    logger.debug("--- NEO4J CRUD: Iniciando buscar_filmes_por_ator para ID_ATOR: '%s' ---", id_ator)
+
     # Etapa 1: Verificar se o ator realmente existe no banco PELO _ID
     def check_ator_exists_tx(tx: Transaction, ator_id_check: str) -> bool:
-        # AGORA BUSCA PELA PROPRIEDADE _id
-        query_check = "MATCH (a:Ator {_id: $id_param}) RETURN count(a) > 0 AS ator_existe"
-        result = tx.run(query_check, {"id_param": ator_id_check}) # Usa id_param
-        record = result.single()
+        record = tx.run(QUERY_ATOR_EXISTE, {"id_param": ator_id_check}).single()
         return record["ator_existe"] if record else False
 
     ator_realmente_existe = session.execute_read(check_ator_exists_tx, str(id_ator)) # Passa o ID
-    print(f"NEO4J CRUD DEBUG: Ator com _id '{str(id_ator)}' EXISTE no DB? {ator_realmente_existe}")
+    logger.debug("NEO4J CRUD DEBUG: Ator com _id '%s' EXISTE no DB? %s", str(id_ator), ator_realmente_existe)
 
     if not ator_realmente_existe:
-        print(f"NEO4J CRUD INFO: Ator com _id '{str(id_ator)}' não encontrado no banco. Retornando lista vazia.")
+        logger.info("NEO4J CRUD INFO: Ator com _id '%s' não encontrado no banco. Retornando lista vazia.", str(id_ator))
         return []
 
     # Etapa 2: Montar e executar a query principal BUSCANDO POR _id
-    query_cypher = f"""
-    MATCH (ator:Ator {{_id: $id_ator_param}})-[r:ACTED_IN]->(filme:Filme) 
-    RETURN filme, r.nome_personagem AS nome_personagem_rel
-    ORDER BY filme.{ordenar_por} {order_direction}
-    LIMIT $limite_param
-    """
-    params_cypher = {"id_ator_param": str(id_ator), "limite_param": limite} # Passa o ID como parâmetro
+    query_cypher, params_cypher = _montar_cypher_filmes_por_ator(id_ator, ordenar_por, ordem, limite, campos=campos)
     
-    #print(f"NEO4J CRUD DEBUG: Query Cypher (buscando por _id):\n{query_cypher}")
-    print(f"NEO4J CRUD DEBUG: Parâmetros: {params_cypher}")
+    logger.debug("NEO4J CRUD DEBUG: Parâmetros: %s", params_cypher)
 
     # Etapa 3: Processar os resultados
     # A sua função process_results_tx interna pode continuar a mesma,
     # pois ela já espera o nó 'filme' e 'nome_personagem_rel' do resultado da query.
     def process_results_tx(tx: Transaction, q: str, p: Dict[str, Any]) -> List[Dict[str, Any]]:
-        filmes_encontrados = []
-        result_cursor = tx.run(q, p)
-        lista_de_records = list(result_cursor)
-        print(f"NEO4J CRUD DEBUG (process_results_tx): Número de records brutos: {len(lista_de_records)}")
+        lista_de_records = list(tx.run(q, p))
+        logger.debug("NEO4J CRUD DEBUG (process_results_tx): Número de records brutos: %s", len(lista_de_records))
         if lista_de_records:
-            print(f"NEO4J CRUD DEBUG (process_results_tx): Exemplo do primeiro record.data(): {lista_de_records[0].data()}")
-        for record_item in lista_de_records:
-            filme_node_obj = record_item.get("filme")
-            nome_personagem = record_item.get("nome_personagem_rel")
-            if filme_node_obj:
-                try:
-                    filme_dict = dict(filme_node_obj)
-                    # Aplicar conversões de tipo e _id (mantenha sua lógica aqui)
-                    if "_id" not in filme_dict and "titulo_id" in filme_dict:
-                         filme_dict["_id"] = str(filme_dict["titulo_id"])
-                    elif "_id" in filme_dict:
-                         filme_dict["_id"] = str(filme_dict["_id"])
-                    for field_key in ["ano_lancamento", "numero_votos", "duracao"]:
-                        if field_key in filme_dict and filme_dict[field_key] is not None:
-                            try: filme_dict[field_key] = int(filme_dict[field_key])
-                            except: pass # Seria bom logar essa falha de conversão
-                    if "nota" in filme_dict and filme_dict["nota"] is not None:
-                        try: filme_dict["nota"] = float(filme_dict["nota"])
-                        except: pass # Seria bom logar essa falha de conversão
-                    if nome_personagem is not None:
-                        filme_dict["nome_personagem"] = nome_personagem
-                    filmes_encontrados.append(filme_dict)
-                except Exception as e_conv:
-                    print(f"NEO4J CRUD WARN (process_results_tx): Falha ao converter Node: {e_conv}")
-            else:
-                print(f"NEO4J CRUD WARN (process_results_tx): Record sem 'filme': {record_item.data()}")
-        return filmes_encontrados
+            logger.debug("NEO4J CRUD DEBUG (process_results_tx): Exemplo do primeiro record.data(): %s", lista_de_records[0].data())
+        filmes_encontrados = [_filme_de_registro_ator(record_item) for record_item in lista_de_records]
+        return [filme for filme in filmes_encontrados if filme is not None]
     # --- Fim da definição de process_results_tx ---
 
     try:
         resultados_finais = session.execute_read(process_results_tx, query_cypher, params_cypher)
-        print(f"--- NEO4J CRUD: buscar_filmes_por_ator (por _id) para '{id_ator}' retornou {len(resultados_finais)} filmes ---")
+        logger.debug("--- NEO4J CRUD: buscar_filmes_por_ator (por _id) para '%s' retornou %s filmes ---", id_ator, len(resultados_finais))
         return resultados_finais
     except Exception as e_main:
-        print(f"NEO4J CRUD ERROR: Exceção em buscar_filmes_por_ator (por _id): {e_main}")
-        # import traceback # Descomente para ver o traceback completo
-        # traceback.print_exc()
+        logger.error("NEO4J CRUD ERROR: Exceção em buscar_filmes_por_ator (por _id): %s", e_main)
         raise DatabaseInteractionError(f"Erro ao buscar filmes do ator '{id_ator}' no Neo4j: {e_main}")
 
+def iterar_filmes_por_ator(
+    driver: Driver,
+    id_ator: str,
+    ordenar_por: str = 'ano_lancamento',
+    ordem: int = -1,
+    limite: Optional[int] = 10000,
+    tamanho_lote: int = 500,
+    campos: Optional[List[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Versão em streaming de buscar_filmes_por_ator (mesma query, registros lidos em lotes)."""
+    query_cypher, params_cypher = _montar_cypher_filmes_por_ator(id_ator, ordenar_por, ordem, limite, campos=campos)
+    try:
+        with driver.session(database="neo4j", fetch_size=tamanho_lote) as session:
+            if not session.run(QUERY_ATOR_EXISTE, {"id_param": str(id_ator)}).single()["ator_existe"]:
+                return
+            for record_item in session.run(query_cypher, params_cypher):
+                filme = _filme_de_registro_ator(record_item)
+                if filme is not None:
+                    yield filme
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao buscar filmes do ator '{id_ator}' no Neo4j: {e}")
+
+def paginar_filmes_por_ator(
+    session: Session,
+    id_ator: str,
+    ordenar_por: str = 'ano_lancamento',
+    ordem: int = -1,
+    tamanho_pagina: int = 20,
+    apos: Optional[Dict[str, Any]] = None,
+    campos: Optional[List[str]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Uma página dos filmes do ator por keyset (mesmo formato de paginar_filmes_avancado)."""
+    ordenar_por = ordenar_por if ordenar_por in CAMPOS_ORDENACAO_FILME else "ano_lancamento"
+    query_cypher, params_cypher = _montar_cypher_filmes_por_ator(
+        id_ator, ordenar_por, ordem, tamanho_pagina, paginado=True, apos=apos, campos=campos
+    )
+
+    def _pagina_tx(tx: Transaction) -> List[Dict[str, Any]]:
+        if not tx.run(QUERY_ATOR_EXISTE, {"id_param": str(id_ator)}).single()["ator_existe"]:
+            return []
+        filmes = (_filme_de_registro_ator(record_item) for record_item in tx.run(query_cypher, params_cypher))
+        return [filme for filme in filmes if filme is not None]
+
+    try:
+        filmes = session.execute_read(_pagina_tx)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao buscar filmes do ator '{id_ator}' no Neo4j: {e}")
+    return filmes, _posicao_keyset(filmes, ordenar_por, tamanho_pagina)
+
 def buscar_atores_por_filmes(session: Session, id_filme: str, limite: Optional[int] = 10000) -> List[Dict[str, Any]]:
     query = """
     MATCH (filme:Filme {_id: $id_filme_param})<-[r_atuou:ACTED_IN]-(ator:Ator)
@@ -549,6 +818,76 @@ def atualizar_campo_filme(session: Session, id_filme: str, campo_para_atualizar:
     except Exception as e:
         raise DatabaseInteractionError(f"Erro ao atualizar campo '{campo_para_atualizar}' do filme '{id_filme}' no Neo4j: {e}")
 
+def atualizar_campos_filme(session: Session, id_filme: str, atualizacoes: Dict[str, Any]) -> Dict[str, Any]:
+    """Atualiza vários campos com SET f += $props numa única transação e devolve o nó atualizado."""
+    validar_campos_atualizacao(atualizacoes)
+    query_update = """
+    MATCH (f:Filme {_id: $id_filme_param})
+    SET f += $props_param
+    RETURN f
+    """
+    params = {"id_filme_param": str(id_filme), "props_param": atualizacoes}
+    try:
+        filme_atualizado = session.execute_write(_execute_write_query_single_return, query_update, params)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao atualizar campos {sorted(atualizacoes)} do filme '{id_filme}' no Neo4j: {e}")
+    if not filme_atualizado:
+        raise ItemNotFoundError(f"Filme com _id '{id_filme}' não encontrado para atualização no Neo4j.")
+    return filme_atualizado
+
+# --- ATUALIZAÇÃO / REMOÇÃO EM MASSA (mesmos filtros da busca avançada, sem limite) ---
+TAMANHO_LOTE_ESCRITA_NEO4J = 1000 # Filmes por transação interna do CALL {...} IN TRANSACTIONS
+
+def _executar_por_filtro_cypher(session: Session, acao: str, conditions: List[str], params: Dict[str, Any]) -> int:
+    """
+    Um único MATCH com os filtros e a ação (SET/DETACH DELETE) num CALL {...} IN TRANSACTIONS,
+    que o próprio servidor quebra em transações de TAMANHO_LOTE_ESCRITA_NEO4J nós. Precisa de
+    transação auto-commit (session.run). Devolve quantos filmes casaram com o filtro.
+    """
+    query = "MATCH (f:Filme) "
+    if conditions:
+        query += "WHERE " + " AND ".join(conditions) + " "
+    query += f"CALL {{ WITH f {acao} }} IN TRANSACTIONS OF {TAMANHO_LOTE_ESCRITA_NEO4J} ROWS RETURN count(*) AS total"
+    registro = session.run(query, params).single()
+    return registro["total"] if registro else 0
+
+def atualizar_filmes_por_filtro(
+    session: Session,
+    atualizacoes: Dict[str, Any],
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ano_corte_futuro: int = 2025
+) -> int:
+    """Aplica `atualizacoes` (SET f += $props) a todos os filmes que casam com o filtro; devolve quantos casaram."""
+    validar_campos_atualizacao(atualizacoes)
+    conditions, params = _condicoes_cypher_busca_avancada(titulo, tipo, ano_min, generos, nota_min, duracao_min, ano_corte_futuro)
+    params["props_param"] = atualizacoes
+    try:
+        return _executar_por_filtro_cypher(session, "SET f += $props_param", conditions, params)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao atualizar filmes por filtro no Neo4j: {e}")
+
+def remover_filmes_por_filtro(
+    session: Session,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ano_corte_futuro: int = 2025
+) -> int:
+    """Remove (DETACH DELETE, levando as relações de elenco) todos os filmes que casam com o filtro."""
+    conditions, params = _condicoes_cypher_busca_avancada(titulo, tipo, ano_min, generos, nota_min, duracao_min, ano_corte_futuro)
+    try:
+        return _executar_por_filtro_cypher(session, "DETACH DELETE f", conditions, params)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao remover filmes por filtro no Neo4j: {e}")
+
 # --- REMOÇÃO ---
 def remover_filme(session: Session, id_filme: str) -> bool:
     # Verificar existência primeiro
@@ -578,13 +917,24 @@ def remover_filme(session: Session, id_filme: str) -> bool:
         raise DatabaseInteractionError(f"Erro ao remover filme '{id_filme}' no Neo4j: {e}")
 
 # --- AGREGAÇÕES ---
-def contagem_por_ano(session: Session) -> List[Dict[str, Any]]:
-    query = """
+QUERY_CONTAGEM_POR_ANO = """
     MATCH (f:Filme)
     WHERE f.ano_lancamento IS NOT NULL
     RETURN f.ano_lancamento AS ano, count(f) AS quantidade
     ORDER BY ano ASC
     """
+
+QUERY_MEDIA_NOTAS_POR_GENERO = """
+    MATCH (f:Filme)
+    WHERE f.nota IS NOT NULL AND f.generos IS NOT NULL AND size(f.generos) > 0
+    UNWIND f.generos AS genero_individual
+    WITH genero_individual, avg(f.nota) AS media_da_nota
+    RETURN genero_individual AS genero, round(media_da_nota * 10) / 10.0 AS media_nota // Arredonda para 1 casa decimal
+    ORDER BY media_nota DESC, genero ASC
+    """
+
+def contagem_por_ano(session: Session) -> List[Dict[str, Any]]:
+    query = QUERY_CONTAGEM_POR_ANO
     try:
         # _execute_read_query pode precisar de ajuste se o retorno não for um nó principal
         # Aqui, o retorno é {ano: ..., quantidade: ...}
@@ -597,14 +947,7 @@ def contagem_por_ano(session: Session) -> List[Dict[str, Any]]:
         raise DatabaseInteractionError(f"Erro ao contar filmes por ano no Neo4j: {e}")
 
 def media_notas_por_genero(session: Session) -> List[Dict[str, Any]]:
-    query = """
-    MATCH (f:Filme)
-    WHERE f.nota IS NOT NULL AND f.generos IS NOT NULL AND size(f.generos) > 0
-    UNWIND f.generos AS genero_individual
-    WITH genero_individual, avg(f.nota) AS media_da_nota
-    RETURN genero_individual AS genero, round(media_da_nota * 10) / 10.0 AS media_nota // Arredonda para 1 casa decimal
-    ORDER BY media_nota DESC, genero ASC
-    """
+    query = QUERY_MEDIA_NOTAS_POR_GENERO
     try:
         def _execute_aggregation_query(tx: Transaction, q: str, p: Dict = None) -> List[Dict[str, Any]]:
             result = tx.run(q, p if p else {})
@@ -633,14 +976,17 @@ def carregar_dados_neo4j(
             # Índices para performance de MATCH
             session.run("CREATE INDEX idx_filme_titulo IF NOT EXISTS FOR (f:Filme) ON (f.titulo)")
             session.run("CREATE INDEX idx_filme_ano IF NOT EXISTS FOR (f:Filme) ON (f.ano_lancamento)")
+            # Campos de ordenação: permitem ao planner seguir o índice no ORDER BY da paginação por keyset
+            for campo_ordem in ("nota", "numero_votos", "duracao"):
+                session.run(f"CREATE INDEX idx_filme_{campo_ordem} IF NOT EXISTS FOR (f:Filme) ON (f.{campo_ordem})")
             session.run("CREATE INDEX idx_ator_nome IF NOT EXISTS FOR (a:Ator) ON (a.nome_ator)")
         except Exception as e:
-            print(f"AVISO NEO4J: Problema ao criar constraints/índices (pode ser normal se já existem): {e}")
+            logger.warning("AVISO NEO4J: Problema ao criar constraints/índices (pode ser normal se já existem): %s", e)
     
     # Limpeza opcional
     with driver.session(database="neo4j") as session:
         session.run("MATCH (n) DETACH DELETE n")
-        print("Neo4j limpo.")
+        logger.info("Neo4j limpo.")
 
     # Carregar Filmes em Lotes
     try:
@@ -766,7 +1112,7 @@ def carregar_dados_neo4j(
     
     msg = f"Carga Neo4j: {counts['filmes']} filmes, {counts['atores']} atores, {counts['elenco']} relações."
     status_op = "sucesso" if not erros_carga else "concluído_com_erros"
-    if erros_carga: print(f"LOG DE CARGA NEO4J - Erros: {erros_carga}")
+    if erros_carga: logger.error("LOG DE CARGA NEO4J - Erros: %s", erros_carga)
     return {
         "status": status_op, "message": msg,
         "detalhes_carga": counts,
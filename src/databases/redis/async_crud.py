@@ -0,0 +1,125 @@
+# src/databases/redis/async_crud.py
+"""
+Consultas de leitura do Redis com redis.asyncio (MODO_DRIVER=async).
+Além de não ocupar threads, as leituras por chave são agrupadas em pipelines
+(um round-trip por lote em vez de um por filme), com a mesma filtragem de crud.py.
+"""
+from typing import List, Dict, Any, Optional
+import redis.asyncio as redis_async
+
+from src.databases.redis.crud import (
+    FILME_KEY_PREFIX,
+    _deserialize_redis_filme,
+    _campos_hash_filme,
+    _ler_hash_filme,
+    _hash_lido,
+    _campos_busca_avancada_redis,
+    _chaves_indices_busca_avancada,
+    _finalizar_busca_avancada_redis,
+    _contar_filmes_por_ano_redis,
+    _calcular_media_por_genero_redis
+)
+from src.core.exceptions import ItemNotFoundError, DatabaseInteractionError
+
+
+async def _listar_chaves_filmes(r: redis_async.Redis) -> List[str]:
+    return [chave async for chave in r.scan_iter(match=f"{FILME_KEY_PREFIX}*")]
+
+
+async def buscar_filme_por_id(r: redis_async.Redis, id_filme: str, campos: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    campos_hash = _campos_hash_filme(campos)
+    try:
+        filme_hash = _hash_lido(campos_hash, await _ler_hash_filme(r, str(id_filme), campos_hash))
+        if not filme_hash:
+            raise ItemNotFoundError(f"Filme com ID '{id_filme}' não encontrado no Redis.")
+        return _deserialize_redis_filme(filme_hash)
+    except ItemNotFoundError:
+        raise
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao buscar filme ID '{id_filme}' no Redis (async): {e}")
+
+
+async def buscar_filmes_por_ids(r: redis_async.Redis, ids_filmes: List[str], campos: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Vários filmes com um único pipeline de HGETALL (HMGET com `campos`), na ordem de ids_filmes."""
+    if not ids_filmes:
+        return []
+    campos_hash = _campos_hash_filme(campos)
+    try:
+        async with r.pipeline(transaction=False) as pipe:
+            for id_filme in ids_filmes:
+                _ler_hash_filme(pipe, str(id_filme), campos_hash)
+            hashes = [_hash_lido(campos_hash, resposta) for resposta in await pipe.execute()]
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao buscar {len(ids_filmes)} filmes por ID no Redis (async): {e}")
+    filmes = (_deserialize_redis_filme(filme_hash) for filme_hash in hashes if filme_hash)
+    return [filme for filme in filmes if filme]
+
+
+async def buscar_filmes_avancado(
+    r: redis_async.Redis,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ordenar_por: str = "nota",
+    ordem: int = -1,
+    limite: Optional[int] = 10000,
+    ano_corte_futuro: int = 2025,
+    campos: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    try:
+        chaves_indices_para_intersecao = _chaves_indices_busca_avancada(tipo, generos)
+        if chaves_indices_para_intersecao:
+            if len(chaves_indices_para_intersecao) > 1:
+                ids_candidatos = list(await r.sinter(chaves_indices_para_intersecao))
+            else:
+                ids_candidatos = list(await r.smembers(chaves_indices_para_intersecao[0]))
+            if not ids_candidatos:
+                return []
+        else:
+            chaves_filmes = await _listar_chaves_filmes(r)
+            ids_candidatos = [chave.split(':', 1)[1] for chave in chaves_filmes if ':' in chave]
+
+        # Um HGETALL (ou HMGET dos campos necessários) por candidato, todos no mesmo pipeline
+        campos_hash = _campos_hash_filme(
+            _campos_busca_avancada_redis(campos, ordenar_por, titulo, tipo, ano_min, generos, nota_min, duracao_min)
+        )
+        async with r.pipeline(transaction=False) as pipe:
+            for filme_id in ids_candidatos:
+                _ler_hash_filme(pipe, filme_id, campos_hash)
+            hashes = [_hash_lido(campos_hash, resposta) for resposta in await pipe.execute()]
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao executar busca avançada de filmes no Redis (async): {e}")
+
+    filmes_desserializados = (_deserialize_redis_filme(filme_hash) for filme_hash in hashes if filme_hash)
+    resultados_brutos = [filme for filme in filmes_desserializados if filme]
+    return _finalizar_busca_avancada_redis(
+        resultados_brutos, chaves_indices_para_intersecao, titulo, tipo, ano_min, generos,
+        nota_min, duracao_min, ordenar_por, ordem, limite, ano_corte_futuro
+    )
+
+
+async def contagem_por_ano(r: redis_async.Redis) -> List[Dict[str, Any]]:
+    try:
+        chaves_filmes = await _listar_chaves_filmes(r)
+        async with r.pipeline(transaction=False) as pipe:
+            for chave_filme_str in chaves_filmes:
+                pipe.hget(chave_filme_str, "ano_lancamento")
+            anos = await pipe.execute()
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao contar filmes por ano no Redis (async): {e}")
+    return _contar_filmes_por_ano_redis(zip(chaves_filmes, anos))
+
+
+async def media_notas_por_genero(r: redis_async.Redis) -> List[Dict[str, Any]]:
+    try:
+        chaves_filmes = await _listar_chaves_filmes(r)
+        async with r.pipeline(transaction=False) as pipe:
+            for chave_filme_str in chaves_filmes:
+                pipe.hmget(chave_filme_str, "generos", "nota")
+            valores = await pipe.execute()
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao calcular média de notas por gênero no Redis (async): {e}")
+    return _calcular_media_por_genero_redis(zip(chaves_filmes, valores))
@@ -1,13 +1,117 @@
+import logging
+import asyncio
+import threading
 import redis
-from src.core.db_config import REDIS_HOST, REDIS_PORT, REDIS_DB
+import redis.asyncio as redis_async
+from redis.client import Pipeline
+from typing import Optional
+from src.core.prazos import verificar_prazo
+from src.core.tempos import medir_fase
+from src.core.db_config import REDIS_HOST, REDIS_PORT, REDIS_DB, REDIS_MAX_CONNECTIONS, REDIS_POOL_TIMEOUT, REDIS_SOCKET_TIMEOUT
+
+logger = logging.getLogger(__name__)
 # src/databases/redis/connection.py
 
+# Pool único por processo. O BlockingConnectionPool limita o número de conexões
+# abertas e faz a requisição esperar (até REDIS_POOL_TIMEOUT) quando o pool esgota.
+# O Redis não aceita prazo por comando: REDIS_SOCKET_TIMEOUT limita cada leitura do socket
+# e _RedisComPrazo confere o prazo da operação (src/core/prazos.py) antes de cada comando.
+cliente_redis: Optional[redis.Redis] = None
+_lock_cliente_redis = threading.Lock()
+
+# Cliente redis.asyncio (MODO_DRIVER=async), com pool próprio preso ao event loop da API.
+cliente_redis_async: Optional[redis_async.Redis] = None
+_lock_cliente_redis_async = asyncio.Lock()
+
+
+class _PipelineComPrazo(Pipeline):
+    def execute(self, raise_on_error: bool = True):
+        verificar_prazo("redis")
+        return super().execute(raise_on_error)
+
+
+class _RedisComPrazo(redis.Redis):
+    """
+    Cliente que não envia comandos (nem pipelines) depois que o prazo da operação estourou.
+    Quando o asyncio.wait_for desiste, a thread do executor continua rodando o CRUD: assim ela
+    para no próximo comando (SCAN em lotes, hidratação...) e libera a vaga no executor e a conexão.
+    """
+    def execute_command(self, *args, **options):
+        verificar_prazo("redis")
+        return super().execute_command(*args, **options)
+
+    def pipeline(self, transaction: bool = True, shard_hint=None) -> Pipeline:
+        return _PipelineComPrazo(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+@medir_fase("conexao", "redis")
 def get_redis_client() -> redis.Redis:
-    """Retorna um cliente Redis."""
-    try:
-        client = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, db=REDIS_DB, decode_responses=True)
-        # Testa a conexão
-        client.ping()
-        return client
-    except Exception as e:
-        raise ConnectionError(f"Falha ao conectar no Redis: {e}")
\ No newline at end of file
+    """Retorna o cliente Redis compartilhado, inicializando se necessário."""
+    global cliente_redis
+    if cliente_redis is None:
+        with _lock_cliente_redis:
+            if cliente_redis is None:
+                try:
+                    pool = redis.BlockingConnectionPool(
+                        host=REDIS_HOST,
+                        port=REDIS_PORT,
+                        db=REDIS_DB,
+                        decode_responses=True,
+                        max_connections=REDIS_MAX_CONNECTIONS,
+                        timeout=REDIS_POOL_TIMEOUT,
+                        socket_timeout=REDIS_SOCKET_TIMEOUT
+                    )
+                    client = _RedisComPrazo(connection_pool=pool)
+                    # Testa a conexão
+                    client.ping()
+                    cliente_redis = client
+                    logger.info("Conexão com Redis estabelecida e verificada.")
+                except Exception as e:
+                    raise ConnectionError(f"Falha ao conectar no Redis: {e}")
+    return cliente_redis
+
+
+def close_redis_client():
+    """Fecha o cliente Redis e desconecta o pool se estiver aberto."""
+    global cliente_redis
+    with _lock_cliente_redis:
+        if cliente_redis is not None:
+            cliente_redis.connection_pool.disconnect()
+            cliente_redis = None
+            logger.info("Conexão com Redis fechada.")
+
+
+@medir_fase("conexao", "redis")
+async def get_redis_client_async() -> redis_async.Redis:
+    """Retorna o cliente redis.asyncio compartilhado, inicializando se necessário."""
+    global cliente_redis_async
+    if cliente_redis_async is None:
+        async with _lock_cliente_redis_async:
+            if cliente_redis_async is None:
+                try:
+                    pool = redis_async.BlockingConnectionPool(
+                        host=REDIS_HOST,
+                        port=REDIS_PORT,
+                        db=REDIS_DB,
+                        decode_responses=True,
+                        max_connections=REDIS_MAX_CONNECTIONS,
+                        timeout=REDIS_POOL_TIMEOUT,
+                        socket_timeout=REDIS_SOCKET_TIMEOUT
+                    )
+                    client = redis_async.Redis(connection_pool=pool)
+                    await client.ping()
+                    cliente_redis_async = client
+                    logger.info("Conexão assíncrona com Redis estabelecida e verificada.")
+                except Exception as e:
+                    raise ConnectionError(f"Falha ao conectar (async) no Redis: {e}")
+    return cliente_redis_async
+
+
+async def close_redis_client_async():
+    """Fecha o cliente redis.asyncio e desconecta o pool se estiver aberto."""
+    global cliente_redis_async
+    if cliente_redis_async is not None:
+        await cliente_redis_async.aclose()
+        await cliente_redis_async.connection_pool.disconnect()
+        cliente_redis_async = None
+        logger.info("Conexão assíncrona com Redis fechada.")
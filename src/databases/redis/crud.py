@@ -1,8 +1,11 @@
 # src/databases/redis/crud.py
+import logging
 import redis, pandas as pd
 import json # Necessário para _serialize_redis_value se lidar com dict/list
 import re   # Necessário para _limpar_generos_redis
-from typing import List, Dict, Any, Optional
+import itertools
+import threading
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
 from src.models.filme import Filme # Importa seu modelo de Filme
 from src.models.ator import Ator # Importa seu modelo de Ator
 from src.models.elenco import Elenco # Importa seu modelo de Elenco
@@ -12,6 +15,11 @@ from src.models.elenco import Elenco # Importa seu modelo de Elenco
 from src.core.exceptions import (
     DataValidationError, DatabaseInteractionError,
     ItemNotFoundError, ItemAlreadyExistsError)
+from src.core.projecao import campos_leitura, validar_campos_atualizacao
+from src.core.lote import item_inserido, item_com_erro, item_duplicado
+from src.core.tempos import medir_fase
+
+logger = logging.getLogger(__name__)
 
 # --- PREFIXOS DE CHAVE (COMO VOCÊ DEFINIU) ---
 FILME_KEY_PREFIX = "filme:"
@@ -24,6 +32,11 @@ PERSONAGEM_PROPS_KEY_PREFIX = "personagem_props:"   # Usado para nome_personagem
 IDX_FILME_ANO_PREFIX = "idx:filme:ano:"
 IDX_FILME_GENERO_PREFIX = "idx:filme:genero:"
 IDX_FILME_TIPO_PREFIX = "idx:filme:tipo:"
+# Índices de ordenação (ZSET por campo) usados na paginação por cursor
+IDX_FILME_ORDEM_PREFIX = "idx:filme:ordem:"
+CAMPOS_ORDEM_NUMERICOS = ["nota", "ano_lancamento", "numero_votos", "duracao"]
+SEPARADOR_MEMBRO_TITULO = "\x1f" # Membro do ZSET de título: "<titulo minúsculo>\x1f<_id>" (ordem lexicográfica, score 0)
+CHAVES_ORDEM = [f"{IDX_FILME_ORDEM_PREFIX}{campo}" for campo in CAMPOS_ORDEM_NUMERICOS + ["titulo"]]
 
 # --- FUNÇÕES AUXILIARES (COMO VOCÊ JÁ TEM OU PRECISA) ---
 def _limpar_generos_redis(valor_generos: Any) -> List[str]:
@@ -39,6 +52,7 @@ def _serialize_redis_value(value: Any) -> str:
     if value is None: return ""
     return str(value)
 
+@medir_fase("decodificacao", "redis")
 def _deserialize_redis_filme(filme_hash: Dict[str, str]) -> Optional[Dict[str, Any]]:
     if not filme_hash: return None
     filme = {}
@@ -62,6 +76,47 @@ def _deserialize_redis_filme(filme_hash: Dict[str, str]) -> Optional[Dict[str, A
     elif "_id" in filme and "titulo_id" not in filme: filme["titulo_id"] = filme["_id"]
     return filme
 
+def _campos_hash_filme(campos: Optional[List[str]]) -> Optional[List[str]]:
+    """Campos do hash do filme lidos com HMGET; None quando não há projeção (HGETALL)."""
+    if campos is None:
+        return None
+    return ["_id", "titulo_id", *campos]
+
+def _ler_hash_filme(r_ou_pipe: Any, filme_id: str, campos_hash: Optional[List[str]]) -> Any:
+    """HGETALL do filme, ou HMGET só dos campos pedidos (também serve para enfileirar num pipeline)."""
+    chave_filme = f"{FILME_KEY_PREFIX}{filme_id}"
+    if campos_hash is None:
+        return r_ou_pipe.hgetall(chave_filme)
+    return r_ou_pipe.hmget(chave_filme, campos_hash)
+
+def _hash_lido(campos_hash: Optional[List[str]], resposta: Any) -> Dict[str, str]:
+    """Resposta de _ler_hash_filme como dict: o HMGET devolve uma lista com None nos campos ausentes."""
+    if campos_hash is None:
+        return resposta
+    return {campo: valor for campo, valor in zip(campos_hash, resposta) if valor is not None}
+
+def _campos_busca_avancada_redis(
+    campos: Optional[List[str]],
+    ordenar_por: Optional[str],
+    titulo: Optional[str],
+    tipo: Optional[str],
+    ano_min: Optional[int],
+    generos: Optional[List[str]],
+    nota_min: Optional[float],
+    duracao_min: Optional[int]
+) -> Optional[List[str]]:
+    """Campos pedidos mais os que a filtragem Python e a ordenação da busca avançada leem."""
+    necessarios = [ordenar_por]
+    if titulo: necessarios.append("titulo")
+    if tipo: necessarios.append("tipo")
+    if generos: necessarios.append("generos")
+    if ano_min is not None: necessarios.append("ano_lancamento")
+    if nota_min is not None or duracao_min is not None:
+        # Regra do filme futuro sem avaliação
+        necessarios += ["ano_lancamento", "nota", "numero_votos"]
+    if duracao_min is not None: necessarios += ["duracao", "tipo"]
+    return campos_leitura(campos, *necessarios)
+
 def _deserialize_redis_ator(ator_hash: Dict[str, str]) -> Optional[Dict[str, Any]]:
     if not ator_hash: return None
     ator = {}
@@ -76,12 +131,73 @@ def _deserialize_redis_ator(ator_hash: Dict[str, str]) -> Optional[Dict[str, Any
     elif "_id" in ator and "ator_id" not in ator: ator["ator_id"] = ator["_id"]
     return ator
 
+def _membros_ordenacao_filme(filme_id: str, filme_dados: Dict[str, Any]) -> Dict[str, Tuple[str, float]]:
+    """(membro, score) do filme em cada ZSET de ordenação. Campo numérico ausente vira -inf."""
+    indices = {}
+    for campo in CAMPOS_ORDEM_NUMERICOS:
+        valor = filme_dados.get(campo)
+        indices[f"{IDX_FILME_ORDEM_PREFIX}{campo}"] = (filme_id, float(valor) if valor is not None else float("-inf"))
+    titulo = str(filme_dados.get("titulo") or "").lower()
+    indices[f"{IDX_FILME_ORDEM_PREFIX}titulo"] = (f"{titulo}{SEPARADOR_MEMBRO_TITULO}{filme_id}", 0.0)
+    return indices
+
+def _indexar_ordenacao_filme(r: redis.Redis, filme_id: str, filme_dados: Dict[str, Any]):
+    """Inclui o filme nos ZSETs de ordenação (r pode ser um pipeline)."""
+    for chave, (membro, score) in _membros_ordenacao_filme(filme_id, filme_dados).items():
+        r.zadd(chave, {membro: score})
+
+def _desindexar_ordenacao_filme(r: redis.Redis, filme_id: str, filme_dados: Dict[str, Any]):
+    """Remove o filme dos ZSETs de ordenação, a partir dos dados com que foi indexado."""
+    for chave, (membro, _) in _membros_ordenacao_filme(filme_id, filme_dados).items():
+        r.zrem(chave, membro)
+
+def reconstruir_indices_ordenacao(r: redis.Redis, tamanho_lote: int = 1000) -> int:
+    """
+    Recria os ZSETs de ordenação a partir dos hashes de filme (SCAN + pipeline de HMGET em
+    lotes). Usado para bases carregadas antes de existirem esses índices. Retorna quantos filmes indexou.
+    """
+    campos = CAMPOS_ORDEM_NUMERICOS + ["titulo"]
+    ids = [chave.split(":", 1)[1] for chave in r.scan_iter(match=f"{FILME_KEY_PREFIX}*", count=tamanho_lote)]
+    for inicio in range(0, len(ids), tamanho_lote):
+        lote = ids[inicio:inicio + tamanho_lote]
+        pipe = r.pipeline(transaction=False)
+        for filme_id in lote:
+            pipe.hmget(f"{FILME_KEY_PREFIX}{filme_id}", campos)
+        valores = pipe.execute()
+        pipe = r.pipeline(transaction=False)
+        for filme_id, resposta in zip(lote, valores):
+            filme = _deserialize_redis_filme(dict(zip(campos, resposta)))
+            _indexar_ordenacao_filme(pipe, filme_id, filme or {})
+        pipe.execute()
+    return len(ids)
+
+_indices_ordenacao_conferidos = False
+_trava_indices_ordenacao = threading.Lock()
+
+def _garantir_indices_ordenacao(r: redis.Redis):
+    """
+    Na primeira paginação do processo, reconstrói os ZSETs de ordenação se algum estiver
+    ausente mas houver filmes (base carregada antes dos índices): sem isso a página viria vazia.
+    """
+    global _indices_ordenacao_conferidos
+    if _indices_ordenacao_conferidos:
+        return
+    with _trava_indices_ordenacao:
+        if _indices_ordenacao_conferidos:
+            return
+        if r.exists(*CHAVES_ORDEM) < len(CHAVES_ORDEM):
+            if next(r.scan_iter(match=f"{FILME_KEY_PREFIX}*", count=1000), None) is None:
+                return # Base vazia: confere de novo na próxima paginação
+            logger.warning("Índices de ordenação do Redis ausentes; reconstruindo a partir dos filmes...")
+            total = reconstruir_indices_ordenacao(r)
+            logger.info("Índices de ordenação do Redis reconstruídos: %s filmes.", total)
+        _indices_ordenacao_conferidos = True
+
 # src/databases/redis/crud.py
 # ... (imports e outras funções auxiliares) ...
 
-def inserir_filme(r: redis.Redis, filme_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Insere um filme no Redis. Usa _id ou titulo_id como fonte para a chave e padroniza para _id."""
-
+def _preparar_filme_redis(filme_data: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """(_id, dados) do filme a salvar: o ID vem de _id ou titulo_id e é padronizado para _id."""
     dados_para_salvar = filme_data.copy()
 
     # --- LÓGICA DE ID MAIS ROBUSTA ---
@@ -98,31 +214,37 @@ def inserir_filme(r: redis.Redis, filme_data: Dict[str, Any]) -> Dict[str, Any]:
     if "titulo_id" in dados_para_salvar:
         dados_para_salvar.pop("titulo_id")
     # --- FIM DA LÓGICA DE ID ---
+    return filme_id, dados_para_salvar
 
-    chave_filme = f"{FILME_KEY_PREFIX}{filme_id}"
+def _salvar_filme_redis(r: redis.Redis, filme_id: str, dados_para_salvar: Dict[str, Any]):
+    """Grava o hash do filme e os índices secundários (gênero, ano, tipo e ordenação); r pode ser um pipeline."""
+    payload_redis = {k: _serialize_redis_value(v) for k, v in dados_para_salvar.items() if v is not None}
+    r.hmset(f"{FILME_KEY_PREFIX}{filme_id}", payload_redis)
+
+    if "generos" in dados_para_salvar and dados_para_salvar["generos"]:
+        for genero in dados_para_salvar["generos"]:
+            if genero and str(genero).strip():
+                r.sadd(f"{IDX_FILME_GENERO_PREFIX}{_serialize_redis_value(str(genero).strip())}", filme_id)
+
+    if "ano_lancamento" in dados_para_salvar and dados_para_salvar["ano_lancamento"] is not None:
+        r.sadd(f"{IDX_FILME_ANO_PREFIX}{dados_para_salvar['ano_lancamento']}", filme_id)
+
+    if "tipo" in dados_para_salvar and dados_para_salvar["tipo"]:
+        if str(dados_para_salvar["tipo"]).strip():
+             r.sadd(f"{IDX_FILME_TIPO_PREFIX}{_serialize_redis_value(str(dados_para_salvar['tipo']).strip())}", filme_id)
+    _indexar_ordenacao_filme(r, filme_id, dados_para_salvar)
+
+def inserir_filme(r: redis.Redis, filme_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Insere um filme no Redis. Usa _id ou titulo_id como fonte para a chave e padroniza para _id."""
+    filme_id, dados_para_salvar = _preparar_filme_redis(filme_data)
 
     # 1. Verifica se já existe
-    if r.exists(chave_filme):
+    if r.exists(f"{FILME_KEY_PREFIX}{filme_id}"):
         raise ItemAlreadyExistsError(f"Filme com ID '{filme_id}' já existe no Redis.")
     
-    # 2. Prepara e insere o payload já limpo
-    payload_redis = {k: _serialize_redis_value(v) for k, v in dados_para_salvar.items() if v is not None}
-    
     try:
-        r.hmset(chave_filme, payload_redis)
-        
-        # 3. Atualizar índices secundários (agora usando 'dados_para_salvar')
-        if "generos" in dados_para_salvar and dados_para_salvar["generos"]:
-            for genero in dados_para_salvar["generos"]:
-                if genero and str(genero).strip():
-                    r.sadd(f"{IDX_FILME_GENERO_PREFIX}{_serialize_redis_value(str(genero).strip())}", filme_id)
-        
-        if "ano_lancamento" in dados_para_salvar and dados_para_salvar["ano_lancamento"] is not None:
-            r.sadd(f"{IDX_FILME_ANO_PREFIX}{dados_para_salvar['ano_lancamento']}", filme_id)
-        
-        if "tipo" in dados_para_salvar and dados_para_salvar["tipo"]:
-            if str(dados_para_salvar["tipo"]).strip():
-                 r.sadd(f"{IDX_FILME_TIPO_PREFIX}{_serialize_redis_value(str(dados_para_salvar['tipo']).strip())}", filme_id)
+        # 2. Insere o payload já limpo e atualiza os índices secundários
+        _salvar_filme_redis(r, filme_id, dados_para_salvar)
         
         # Retorna o dicionário limpo e padronizado
         return dados_para_salvar
@@ -130,6 +252,42 @@ def inserir_filme(r: redis.Redis, filme_data: Dict[str, Any]) -> Dict[str, Any]:
         raise DatabaseInteractionError(f"Erro ao inserir novo filme '{filme_id}' no Redis: {e}")
 
 
+def inserir_filmes_em_lote(r: redis.Redis, filmes_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Insere vários filmes em dois round-trips: um pipeline de EXISTS para achar os que já
+    existem e um único pipeline não transacional com os hashes e todos os índices
+    (gênero, ano, tipo e ordenação) dos novos. Devolve um resultado por filme (ver src.core.lote).
+    """
+    resultados: List[Optional[Dict[str, Any]]] = [None] * len(filmes_data)
+    validos: List[Tuple[int, str, Dict[str, Any]]] = []
+    for posicao, filme_data in enumerate(filmes_data):
+        try:
+            validos.append((posicao, *_preparar_filme_redis(filme_data)))
+        except DataValidationError as e_dv:
+            resultados[posicao] = item_com_erro(filme_data.get("titulo_id"), e_dv)
+    if not validos:
+        return resultados
+    try:
+        pipe = r.pipeline(transaction=False)
+        for _, filme_id, _ in validos:
+            pipe.exists(f"{FILME_KEY_PREFIX}{filme_id}")
+        existentes = pipe.execute()
+
+        novos = []
+        for (posicao, filme_id, dados_para_salvar), existe in zip(validos, existentes):
+            if existe:
+                resultados[posicao] = item_duplicado(filme_id)
+            else:
+                _salvar_filme_redis(pipe, filme_id, dados_para_salvar)
+                novos.append((posicao, filme_id))
+        pipe.execute()
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao inserir lote de {len(validos)} filmes no Redis: {e}")
+    for posicao, filme_id in novos:
+        resultados[posicao] = item_inserido(filme_id)
+    return resultados
+
+
 def inserir_ator(r: redis.Redis, ator_data: Dict[str, Any]) -> Dict[str, Any]:
     """Insere um ator no Redis. Usa _id ou ator_id como fonte para a chave e padroniza para _id."""
     
@@ -206,10 +364,10 @@ def inserir_elenco(r: redis.Redis, elenco_data: Dict[str, Any]) -> bool:
         raise DatabaseInteractionError(f"Erro ao inserir relação de elenco para ator '{ator_id}' e filme '{titulo_id}' no Redis: {e}")
 
 # --- CONSULTAS ---
-def buscar_filme_por_id(r: redis.Redis, id_filme: str) -> Optional[Dict[str, Any]]:
-    chave_filme = f"{FILME_KEY_PREFIX}{str(id_filme)}"
+def buscar_filme_por_id(r: redis.Redis, id_filme: str, campos: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    campos_hash = _campos_hash_filme(campos)
     try:
-        filme_hash = r.hgetall(chave_filme)
+        filme_hash = _hash_lido(campos_hash, _ler_hash_filme(r, str(id_filme), campos_hash))
         if not filme_hash:
             raise ItemNotFoundError(f"Filme com ID '{id_filme}' não encontrado no Redis.")
         # Converte chaves e valores de bytes para string
@@ -219,6 +377,21 @@ def buscar_filme_por_id(r: redis.Redis, id_filme: str) -> Optional[Dict[str, Any
     except Exception as e:
         raise DatabaseInteractionError(f"Erro ao buscar filme ID '{id_filme}' no Redis: {e}")
 
+def buscar_filmes_por_ids(r: redis.Redis, ids_filmes: List[str], campos: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Vários filmes com um único pipeline de HGETALL (HMGET com `campos`), na ordem de ids_filmes."""
+    if not ids_filmes:
+        return []
+    campos_hash = _campos_hash_filme(campos)
+    try:
+        pipe = r.pipeline(transaction=False)
+        for id_filme in ids_filmes:
+            _ler_hash_filme(pipe, str(id_filme), campos_hash)
+        hashes = (_hash_lido(campos_hash, resposta) for resposta in pipe.execute())
+        filmes = (_deserialize_redis_filme(filme_hash) for filme_hash in hashes if filme_hash)
+        return [filme for filme in filmes if filme]
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao buscar {len(ids_filmes)} filmes por ID no Redis: {e}")
+
 # (buscar_ator_por_id similar)
 def buscar_ator_por_id(r: redis.Redis, id_ator: str) -> Optional[Dict[str, Any]]:
     chave_ator = f"{ATOR_KEY_PREFIX}{str(id_ator)}"
@@ -255,7 +428,7 @@ def _aplicar_filtros_python_redis(
         if (nota_filme is None or nota_filme == 0 or nota_filme == 0.0) and \
            (votos_filme is None or votos_filme == 0):
             is_filme_futuro_sem_avaliacao = True
-            print(f"DEBUG FILTRO REDIS: Filme '{filme.get('_id')}' (ano: {ano_lancamento_filme}) é futuro sem avaliação.") #DEBUG
+            logger.debug("DEBUG FILTRO REDIS: Filme '%s' (ano: %s) é futuro sem avaliação.", filme.get('_id'), ano_lancamento_filme)
 
     for campo_filtro, valor_filtro in filtros_aplicar.items():
         # Pula filtros com valor None ou listas de gênero vazias, pois não filtram nada.
@@ -282,7 +455,7 @@ def _aplicar_filtros_python_redis(
         # Filtros de "performance" que são ignorados para filmes futuros sem avaliação
         elif campo_filtro in ["nota_min", "duracao_min"]: # Adicione "numero_votos_min" se for implementar
             if is_filme_futuro_sem_avaliacao:
-                print(f"DEBUG FILTRO REDIS: Pulando filtro '{campo_filtro}' para filme futuro sem avaliação '{filme.get('_id')}'.") #DEBUG
+                logger.debug("DEBUG FILTRO REDIS: Pulando filtro '%s' para filme futuro sem avaliação '%s'.", campo_filtro, filme.get('_id'))
                 continue 
 
             if campo_filtro == "nota_min": # nota_filme já é float ou None
@@ -293,90 +466,43 @@ def _aplicar_filtros_python_redis(
                 if tipo_filme_atual != "jogo": 
                     if filme.get("duracao") is None or filme.get("duracao") < valor_filtro:
                         match = False; break
-        # else:
-        #     print(f"DEBUG FILTRO REDIS: Filtro Python não reconhecido ou não aplicável: '{campo_filtro}'")
 
-    # if not match: print(f"DEBUG FILTRO REDIS: Filme '{filme.get('_id')}' REPROVADO pelos filtros Python.") #DEBUG
     return match
 
 # --- FUNÇÃO buscar_filmes_avancado ATUALIZADA ---
-def buscar_filmes_avancado(
-    r: redis.Redis,
-    titulo: Optional[str] = None, 
-    tipo: Optional[str] = None, # Parâmetro vindo do serviço
-    ano_min: Optional[int] = None, # Parâmetro vindo do serviço (era ano_lancamento_min no payload)
-    generos: Optional[List[str]] = None, # Parâmetro vindo do serviço
-    nota_min: Optional[float] = None, # Parâmetro vindo do serviço
-    duracao_min: Optional[int] = None, # Parâmetro vindo do serviço
-    ordenar_por: str = "nota", 
-    ordem: int = -1,
-    limite: Optional[int] = 10000, 
-    ano_corte_futuro: int = 2025 # Parâmetro vindo do serviço
-) -> List[Dict[str, Any]]:
-    
-    print("INFO REDIS (Avançada): Iniciando busca avançada. Nota: Pode ser ineficiente sem RediSearch para múltiplos filtros complexos.")
-    
-    ids_candidatos_set: Optional[set] = set() # Inicia como set vazio para SINTER
-    usou_indice_primario = False
-
-    # Tenta usar o índice mais seletivo primeiro ou uma combinação.
-    # Exemplo: se 'tipo' for fornecido, usa como filtro primário.
-    # Se 'generos' (único) for fornecido, usa.
-    # Se ambos, pode fazer SINTER.
-    
+def _chaves_indices_busca_avancada(tipo: Optional[str], generos: Optional[List[str]]) -> List[str]:
+    """Seleciona as chaves de índice (SET) usadas como filtro primário da busca avançada."""
     chaves_indices_para_intersecao = []
     if tipo:
         chave_idx_tipo = f"{IDX_FILME_TIPO_PREFIX}{_serialize_redis_value(tipo)}"
         chaves_indices_para_intersecao.append(chave_idx_tipo)
-        print(f"DEBUG REDIS (Avançada): Usando índice de TIPO: {chave_idx_tipo}")
-        usou_indice_primario = True # Marca que pelo menos um índice foi usado
+        logger.debug("DEBUG REDIS (Avançada): Usando índice de TIPO: %s", chave_idx_tipo)
 
     if generos and len(generos) == 1: # Se UM gênero específico foi fornecido
         chave_idx_genero = f"{IDX_FILME_GENERO_PREFIX}{_serialize_redis_value(generos[0])}"
         chaves_indices_para_intersecao.append(chave_idx_genero)
-        print(f"DEBUG REDIS (Avançada): Usando índice de GÊNERO único: {chave_idx_genero}")
-        usou_indice_primario = True
+        logger.debug("DEBUG REDIS (Avançada): Usando índice de GÊNERO único: %s", chave_idx_genero)
 
     # Adicione outros índices aqui se tiver (ex: ano_min poderia ser um range com ZSET, mas é mais complexo)
-
-    if chaves_indices_para_intersecao:
-        if len(chaves_indices_para_intersecao) > 1:
-            print(f"DEBUG REDIS (Avançada): Executando SINTER em chaves: {chaves_indices_para_intersecao}")
-            ids_candidatos_set = r.sinter(chaves_indices_para_intersecao) # Retorna set de strings
-        else:
-            ids_candidatos_set = r.smembers(chaves_indices_para_intersecao[0]) # Retorna set de strings
-        print(f"DEBUG REDIS (Avançada): IDs candidatos via SINTER/SMEMBERS: {len(ids_candidatos_set) if ids_candidatos_set else 0}")
-    
-    ids_candidatos_str_list: List[str]
-
-    if not usou_indice_primario: # Se nenhum índice primário foi usado (tipo ou genero único)
-        print("AVISO REDIS (Avançada): Nenhum índice primário utilizado. Recorrendo a SCAN de todas as chaves de filme. Isso PODE ser LENTO!")
-        chaves_filmes_com_prefixo = list(r.scan_iter(match=f"{FILME_KEY_PREFIX}*")) # Já são strings
-        ids_candidatos_str_list = [key_str.split(':', 1)[1] for key_str in chaves_filmes_com_prefixo if ':' in key_str]
-        print(f"DEBUG REDIS (Avançada): IDs obtidos via SCAN: {len(ids_candidatos_str_list)}")
-    else:
-        ids_candidatos_str_list = list(ids_candidatos_set if ids_candidatos_set is not None else []) # Converte set para lista
-        if not ids_candidatos_str_list and chaves_indices_para_intersecao: # Se usou índice mas SINTER deu vazio
-             print(f"INFO REDIS (Avançada): Interseção de índices resultou em zero IDs. Retornando lista vazia.")
-             return []
-
-
-    resultados_brutos = []
-    print(f"DEBUG REDIS (Avançada): Buscando detalhes para até {len(ids_candidatos_str_list)} IDs candidatos...")
-    for filme_id_str in ids_candidatos_str_list:
-        try:
-            # buscar_filme_por_id já desserializa os campos corretamente
-            filme_dict = buscar_filme_por_id(r, filme_id_str) 
-            if filme_dict: 
-                resultados_brutos.append(filme_dict)
-        except ItemNotFoundError: 
-            print(f"DEBUG REDIS (Avançada): Filme ID '{filme_id_str}' (de índice/scan) não encontrado ao buscar detalhes. Pulando.")
-            continue
-        except Exception as e_busca_detalhe:
-            print(f"DEBUG REDIS (Avançada): Erro ao buscar detalhes do filme_id '{filme_id_str}': {e_busca_detalhe}")
-            continue
-    
-    print(f"DEBUG REDIS (Avançada): {len(resultados_brutos)} filmes brutos recuperados antes da filtragem Python.")
+    return chaves_indices_para_intersecao
+
+@medir_fase("filtragem", "redis")
+def _finalizar_busca_avancada_redis(
+    resultados_brutos: List[Dict[str, Any]],
+    chaves_indices_para_intersecao: List[str],
+    titulo: Optional[str],
+    tipo: Optional[str],
+    ano_min: Optional[int],
+    generos: Optional[List[str]],
+    nota_min: Optional[float],
+    duracao_min: Optional[int],
+    ordenar_por: str,
+    ordem: int,
+    limite: Optional[int],
+    ano_corte_futuro: int
+) -> List[Dict[str, Any]]:
+    """Aplica os filtros Python, a ordenação e o limite sobre os filmes candidatos (compartilhado com async_crud.py)."""
+    usou_indice_primario = bool(chaves_indices_para_intersecao)
 
     # Preparar o dicionário de filtros para a função _aplicar_filtros_python_redis
     # Os nomes das chaves aqui devem bater com os esperados por _aplicar_filtros_python_redis
@@ -392,20 +518,20 @@ def buscar_filmes_avancado(
     }
     # Limpa Nones, exceto para generos_contem_todos que pode ser lista vazia se não for filtrar
     filtros_para_python_limpos = {k: v for k, v in filtros_para_python.items() if v is not None or (k == "generos_contem_todos" and isinstance(v, list))}
-    print(f"DEBUG REDIS (Avançada): Filtros que serão aplicados em Python: {filtros_para_python_limpos}")
+    logger.debug("DEBUG REDIS (Avançada): Filtros que serão aplicados em Python: %s", filtros_para_python_limpos)
 
     resultados_filtrados_py = []
     if not resultados_brutos: # Se não tem nada pra filtrar, retorna vazio
-        print(f"DEBUG REDIS (Avançada): Nenhum resultado bruto para filtrar em Python.")
+        logger.debug("DEBUG REDIS (Avançada): Nenhum resultado bruto para filtrar em Python.")
     elif not filtros_para_python_limpos: # Se não há filtros Python a aplicar
-        print(f"DEBUG REDIS (Avançada): Nenhum filtro Python a aplicar. Usando todos os {len(resultados_brutos)} resultados brutos.")
+        logger.debug("DEBUG REDIS (Avançada): Nenhum filtro Python a aplicar. Usando todos os %s resultados brutos.", len(resultados_brutos))
         resultados_filtrados_py = resultados_brutos
     else:
         for filme_item in resultados_brutos:
             if _aplicar_filtros_python_redis(filme_item, filtros_para_python_limpos, ano_corte_futuro):
                 resultados_filtrados_py.append(filme_item)
     
-    print(f"DEBUG REDIS (Avançada): {len(resultados_filtrados_py)} filmes após filtragem Python.")
+    logger.debug("DEBUG REDIS (Avançada): %s filmes após filtragem Python.", len(resultados_filtrados_py))
             
     # Ordenação
     if ordenar_por and resultados_filtrados_py:
@@ -427,11 +553,11 @@ def buscar_filmes_avancado(
 
         try:
             resultados_filtrados_py.sort(key=sort_key_redis, reverse=(ordem == -1))
-            print(f"DEBUG REDIS (Avançada): Ordenação por '{ordenar_por}' (ordem: {ordem}) concluída.")
+            logger.debug("DEBUG REDIS (Avançada): Ordenação por '%s' (ordem: %s) concluída.", ordenar_por, ordem)
         except TypeError as te:
-            print(f"AVISO REDIS (Avançada): TypeError durante ordenação para '{ordenar_por}': {te}. A lista pode não estar ordenada como esperado.")
+            logger.warning("AVISO REDIS (Avançada): TypeError durante ordenação para '%s': %s. A lista pode não estar ordenada como esperado.", ordenar_por, te)
     else:
-        print(f"DEBUG REDIS (Avançada): Sem ordenação a aplicar ou lista vazia.")
+        logger.debug("DEBUG REDIS (Avançada): Sem ordenação a aplicar ou lista vazia.")
 
     # Limite final
     limite_final_int = len(resultados_filtrados_py) # Default é pegar todos os filtrados
@@ -439,50 +565,324 @@ def buscar_filmes_avancado(
         limite_final_int = limite
     
     filmes_finais = resultados_filtrados_py[:limite_final_int]
-    print(f"DEBUG REDIS (Avançada): Retornando {len(filmes_finais)} filmes dos {len(resultados_filtrados_py)} filtrados (limite aplicado: {limite_final_int}).")
+    logger.debug("DEBUG REDIS (Avançada): Retornando %s filmes dos %s filtrados (limite aplicado: %s).", len(filmes_finais), len(resultados_filtrados_py), limite_final_int)
     return filmes_finais
 
+def buscar_filmes_avancado(
+    r: redis.Redis,
+    titulo: Optional[str] = None, 
+    tipo: Optional[str] = None, # Parâmetro vindo do serviço
+    ano_min: Optional[int] = None, # Parâmetro vindo do serviço (era ano_lancamento_min no payload)
+    generos: Optional[List[str]] = None, # Parâmetro vindo do serviço
+    nota_min: Optional[float] = None, # Parâmetro vindo do serviço
+    duracao_min: Optional[int] = None, # Parâmetro vindo do serviço
+    ordenar_por: str = "nota", 
+    ordem: int = -1,
+    limite: Optional[int] = 10000, 
+    ano_corte_futuro: int = 2025, # Parâmetro vindo do serviço
+    campos: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    
+    logger.info("INFO REDIS (Avançada): Iniciando busca avançada. Nota: Pode ser ineficiente sem RediSearch para múltiplos filtros complexos.")
+    
+    # Tenta usar o índice mais seletivo primeiro ou uma combinação.
+    # Exemplo: se 'tipo' for fornecido, usa como filtro primário.
+    # Se 'generos' (único) for fornecido, usa.
+    # Se ambos, pode fazer SINTER.
+    
+    chaves_indices_para_intersecao = _chaves_indices_busca_avancada(tipo, generos)
+    ids_candidatos_str_list = _listar_ids_candidatos_busca_avancada(r, chaves_indices_para_intersecao)
+    if not ids_candidatos_str_list and chaves_indices_para_intersecao:
+        return []
+
+    campos_lidos = _campos_busca_avancada_redis(campos, ordenar_por, titulo, tipo, ano_min, generos, nota_min, duracao_min)
+    resultados_brutos = []
+    logger.debug("DEBUG REDIS (Avançada): Buscando detalhes para até %s IDs candidatos...", len(ids_candidatos_str_list))
+    for filme_id_str in ids_candidatos_str_list:
+        try:
+            # buscar_filme_por_id já desserializa os campos corretamente
+            filme_dict = buscar_filme_por_id(r, filme_id_str, campos=campos_lidos) 
+            if filme_dict: 
+                resultados_brutos.append(filme_dict)
+        except ItemNotFoundError: 
+            logger.debug("DEBUG REDIS (Avançada): Filme ID '%s' (de índice/scan) não encontrado ao buscar detalhes. Pulando.", filme_id_str)
+            continue
+        except Exception as e_busca_detalhe:
+            logger.debug("DEBUG REDIS (Avançada): Erro ao buscar detalhes do filme_id '%s': %s", filme_id_str, e_busca_detalhe)
+            continue
+    
+    logger.debug("DEBUG REDIS (Avançada): %s filmes brutos recuperados antes da filtragem Python.", len(resultados_brutos))
+
+    return _finalizar_busca_avancada_redis(
+        resultados_brutos, chaves_indices_para_intersecao, titulo, tipo, ano_min, generos,
+        nota_min, duracao_min, ordenar_por, ordem, limite, ano_corte_futuro
+    )
+
+def iterar_filmes_avancado(
+    r: redis.Redis,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ordenar_por: str = "nota",
+    ordem: int = -1,
+    limite: Optional[int] = 10000,
+    ano_corte_futuro: int = 2025,
+    tamanho_lote: int = 500,
+    campos: Optional[List[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Versão em streaming de buscar_filmes_avancado. Os candidatos são hidratados com um
+    pipeline de HGETALL (HMGET com `campos`) a cada tamanho_lote IDs e filtrados lote a lote; só os `limite`
+    melhores ficam em memória. Como a ordenação é feita em Python, os filmes só saem
+    depois de percorrer todos os candidatos.
+    """
+    chaves_indices_para_intersecao = _chaves_indices_busca_avancada(tipo, generos)
+    ids_candidatos_str_list = _listar_ids_candidatos_busca_avancada(r, chaves_indices_para_intersecao)
+    campos_hash = _campos_hash_filme(
+        _campos_busca_avancada_redis(campos, ordenar_por, titulo, tipo, ano_min, generos, nota_min, duracao_min)
+    )
+
+    melhores: List[Dict[str, Any]] = []
+    try:
+        for lote in _hidratar_filmes_em_lotes(r, ids_candidatos_str_list, tamanho_lote, campos_hash):
+            # Filtrar de novo os que já passaram não muda nada: basta manter os melhores + o lote
+            melhores = _finalizar_busca_avancada_redis(
+                melhores + lote, chaves_indices_para_intersecao, titulo, tipo, ano_min, generos,
+                nota_min, duracao_min, ordenar_por, ordem, limite, ano_corte_futuro
+            )
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro na busca avançada (streaming) no Redis: {e}")
+    yield from melhores
+
+def _hidratar_filmes_em_lotes(
+    r: redis.Redis, ids_filmes: List[str], tamanho_lote: int, campos_hash: Optional[List[str]] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """Lê os hashes dos filmes com um pipeline por lote de IDs; IDs sem hash são ignorados."""
+    for inicio in range(0, len(ids_filmes), tamanho_lote):
+        pipe = r.pipeline(transaction=False)
+        for filme_id_str in ids_filmes[inicio:inicio + tamanho_lote]:
+            _ler_hash_filme(pipe, filme_id_str, campos_hash)
+        hashes = (_hash_lido(campos_hash, resposta) for resposta in pipe.execute())
+        filmes = (_deserialize_redis_filme(filme_hash) for filme_hash in hashes if filme_hash)
+        yield [filme for filme in filmes if filme]
+
+def _listar_ids_candidatos_busca_avancada(r: redis.Redis, chaves_indices_para_intersecao: List[str]) -> List[str]:
+    """IDs candidatos da busca avançada: interseção dos índices escolhidos ou, sem índice, SCAN de todos os filmes."""
+    usou_indice_primario = bool(chaves_indices_para_intersecao)
+    ids_candidatos_set: Optional[set] = set() # Inicia como set vazio para SINTER
+
+    if chaves_indices_para_intersecao:
+        if len(chaves_indices_para_intersecao) > 1:
+            logger.debug("DEBUG REDIS (Avançada): Executando SINTER em chaves: %s", chaves_indices_para_intersecao)
+            ids_candidatos_set = r.sinter(chaves_indices_para_intersecao) # Retorna set de strings
+        else:
+            ids_candidatos_set = r.smembers(chaves_indices_para_intersecao[0]) # Retorna set de strings
+        logger.debug("DEBUG REDIS (Avançada): IDs candidatos via SINTER/SMEMBERS: %s", len(ids_candidatos_set) if ids_candidatos_set else 0)
+    
+    ids_candidatos_str_list: List[str]
+
+    if not usou_indice_primario: # Se nenhum índice primário foi usado (tipo ou genero único)
+        logger.warning("AVISO REDIS (Avançada): Nenhum índice primário utilizado. Recorrendo a SCAN de todas as chaves de filme. Isso PODE ser LENTO!")
+        chaves_filmes_com_prefixo = list(r.scan_iter(match=f"{FILME_KEY_PREFIX}*")) # Já são strings
+        ids_candidatos_str_list = [key_str.split(':', 1)[1] for key_str in chaves_filmes_com_prefixo if ':' in key_str]
+        logger.debug("DEBUG REDIS (Avançada): IDs obtidos via SCAN: %s", len(ids_candidatos_str_list))
+    else:
+        ids_candidatos_str_list = list(ids_candidatos_set if ids_candidatos_set is not None else []) # Converte set para lista
+        if not ids_candidatos_str_list and chaves_indices_para_intersecao: # Se usou índice mas SINTER deu vazio
+             logger.info("INFO REDIS (Avançada): Interseção de índices resultou em zero IDs. Retornando lista vazia.")
+    return ids_candidatos_str_list
+
 # ... (suas outras funções como buscar_filmes_por_ator, buscar_atores_por_filme, contagem_por_ano, etc.)
 # Lembre-se de que a função `buscar_filmes_por_ator` no Redis também precisa da lógica de ordenação
 # que estava como 'pass' anteriormente, similar à que foi adicionada aqui.
 
-def buscar_filmes_por_ator(r: redis.Redis, id_ator: str, ordenar_por: str = 'ano_lancamento', ordem: int = -1, limite: Optional[int] = 10000) -> List[Dict[str, Any]]:
+def _chave_ordenacao_redis(ordenar_por: str) -> str:
+    """ZSET de ordenação do campo; a paginação por cursor só existe para os campos indexados."""
+    if ordenar_por not in CAMPOS_ORDEM_NUMERICOS and ordenar_por != "titulo":
+        raise DataValidationError(f"Paginação por cursor no Redis não suporta ordenar por '{ordenar_por}'.")
+    return f"{IDX_FILME_ORDEM_PREFIX}{ordenar_por}"
+
+def _id_do_membro_ordenacao(membro: str) -> str:
+    return membro.rsplit(SEPARADOR_MEMBRO_TITULO, 1)[-1]
+
+def _posicao_inicial_zset(r: redis.Redis, chave: str, ordem: int, apos: Optional[Dict[str, Any]]) -> Tuple[int, bool]:
+    """
+    Índice (na ordem pedida) de onde a página começa e se os empates do score do cursor
+    devem ser descartados. Se o último membro entregue continua no ZSET com o mesmo score,
+    basta o ZRANK dele; senão (removido ou alterado) recomeça pelo score com ZCOUNT.
+    """
+    if apos is None:
+        return 0, False
+    membro, score = apos["membro"], float(apos["score"])
+    if r.zscore(chave, membro) == score:
+        rank = r.zrevrank(chave, membro) if ordem == -1 else r.zrank(chave, membro)
+        if rank is not None:
+            return rank + 1, False
+    if ordem == -1:
+        return r.zcount(chave, f"({score}", "+inf"), True
+    return r.zcount(chave, "-inf", f"({score}"), True
+
+def paginar_filmes_avancado(
+    r: redis.Redis,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ordenar_por: str = "nota",
+    ordem: int = -1,
+    ano_corte_futuro: int = 2025,
+    tamanho_pagina: int = 20,
+    apos: Optional[Dict[str, Any]] = None,
+    tamanho_lote: int = 200,
+    campos: Optional[List[str]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Uma página da busca avançada percorrendo o ZSET de ordenação do campo a partir do cursor
+    ({"membro", "score"} do último filme entregue): lê faixas de tamanho_lote membros já na
+    ordem pedida, hidrata cada faixa com um pipeline de HGETALL e aplica os filtros em Python
+    até completar a página, sem SCAN nem ordenação de todos os candidatos.
+    """
+    chave = _chave_ordenacao_redis(ordenar_por)
+    filtros_para_python = {
+        "titulo_contem": titulo, "tipo": tipo, "ano_lancamento_min": ano_min,
+        "generos_contem_todos": generos, "nota_min": nota_min, "duracao_min": duracao_min,
+    }
+    filtros_para_python = {k: v for k, v in filtros_para_python.items() if v is not None}
+    ler_faixa = r.zrevrange if ordem == -1 else r.zrange
+    # A ordem vem do ZSET: do hash só precisam sair os campos pedidos e os dos filtros
+    campos_hash = _campos_hash_filme(
+        _campos_busca_avancada_redis(campos, None, titulo, tipo, ano_min, generos, nota_min, duracao_min)
+    )
+
+    try:
+        _garantir_indices_ordenacao(r)
+        posicao, descartar_empates = _posicao_inicial_zset(r, chave, ordem, apos)
+        filmes: List[Dict[str, Any]] = []
+        ultimo: Optional[Tuple[str, float]] = None
+        while len(filmes) < tamanho_pagina:
+            membros = ler_faixa(chave, posicao, posicao + max(tamanho_lote, tamanho_pagina) - 1, withscores=True)
+            if not membros:
+                return filmes, None
+            posicao += len(membros)
+            if descartar_empates:
+                # Empates do score do cursor que vêm antes do último membro entregue já saíram na página anterior
+                score_apos, membro_apos = float(apos["score"]), apos["membro"]
+                ja_entregue = (lambda m: m >= membro_apos) if ordem == -1 else (lambda m: m <= membro_apos)
+                membros = list(itertools.dropwhile(lambda ms: ms[1] == score_apos and ja_entregue(ms[0]), membros))
+                descartar_empates = not membros
+
+            pipe = r.pipeline(transaction=False)
+            for membro, _ in membros:
+                _ler_hash_filme(pipe, _id_do_membro_ordenacao(membro), campos_hash)
+            for (membro, score), resposta in zip(membros, pipe.execute()):
+                filme = _deserialize_redis_filme(_hash_lido(campos_hash, resposta))
+                if filme and _aplicar_filtros_python_redis(filme, filtros_para_python, ano_corte_futuro):
+                    filmes.append(filme)
+                    ultimo = (membro, score)
+                    if len(filmes) == tamanho_pagina:
+                        break
+    except DataValidationError: raise
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro na busca avançada paginada no Redis: {e}")
+    return filmes, {"membro": ultimo[0], "score": ultimo[1]}
+
+def paginar_filmes_por_ator(
+    r: redis.Redis,
+    id_ator: str,
+    ordenar_por: str = 'ano_lancamento',
+    ordem: int = -1,
+    tamanho_pagina: int = 20,
+    apos: Optional[Dict[str, Any]] = None,
+    campos: Optional[List[str]] = None
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Uma página dos filmes do ator: a chave de ordenação (score do ZSET, ou o título) de cada
+    filme do SET do ator vem num único pipeline, o keyset (score, membro) é aplicado sobre ela
+    e só os filmes da página são hidratados.
+    """
+    chave = _chave_ordenacao_redis(ordenar_por)
+    try:
+        _garantir_indices_ordenacao(r)
+        filme_ids = list(r.smembers(f"{ELENCO_ATOR_FILMES_PREFIX}{str(id_ator)}"))
+        if not filme_ids:
+            return [], None
+        pipe = r.pipeline(transaction=False)
+        for filme_id in filme_ids:
+            if ordenar_por == "titulo":
+                pipe.hget(f"{FILME_KEY_PREFIX}{filme_id}", "titulo")
+            else:
+                pipe.zscore(chave, filme_id)
+        posicoes = []
+        for filme_id, valor in zip(filme_ids, pipe.execute()):
+            if ordenar_por == "titulo":
+                posicoes.append((0.0, f"{str(valor or '').lower()}{SEPARADOR_MEMBRO_TITULO}{filme_id}"))
+            else:
+                posicoes.append((valor if valor is not None else float("-inf"), filme_id))
+        posicoes.sort(reverse=(ordem == -1))
+        if apos is not None:
+            chave_apos = (float(apos["score"]), apos["membro"])
+            posicoes = [p for p in posicoes if (p < chave_apos if ordem == -1 else p > chave_apos)]
+        pagina = posicoes[:tamanho_pagina]
+
+        campos_hash = _campos_hash_filme(campos)
+        pipe = r.pipeline(transaction=False)
+        for _, membro in pagina:
+            _ler_hash_filme(pipe, _id_do_membro_ordenacao(membro), campos_hash)
+        hashes = (_hash_lido(campos_hash, resposta) for resposta in pipe.execute())
+        filmes = [filme for filme in (_deserialize_redis_filme(h) for h in hashes) if filme]
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao paginar filmes do ator '{id_ator}' no Redis: {e}")
+    if len(pagina) < tamanho_pagina:
+        return filmes, None
+    score, membro = pagina[-1]
+    return filmes, {"membro": membro, "score": score}
+
+def buscar_filmes_por_ator(
+    r: redis.Redis, id_ator: str, ordenar_por: str = 'ano_lancamento', ordem: int = -1, limite: Optional[int] = 10000,
+    campos: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     # USA O MESMO PREFIXO DA FUNÇÃO inserir_elenco
     chave_ator_filmes = f"{ELENCO_ATOR_FILMES_PREFIX}{str(id_ator)}" 
-    print(f"DEBUG REDIS: Buscando filmes para o ator '{id_ator}' usando a chave: {chave_ator_filmes}") # DEBUG
+    logger.debug("DEBUG REDIS: Buscando filmes para o ator '%s' usando a chave: %s", id_ator, chave_ator_filmes)
 
     try:
         # r.smembers já retorna um set de strings devido a decode_responses=True
         filme_ids_strings = r.smembers(chave_ator_filmes) 
         
-        print(f"DEBUG REDIS: IDs de filmes encontrados no set para o ator '{id_ator}': {filme_ids_strings}") # DEBUG
+        logger.debug("DEBUG REDIS: IDs de filmes encontrados no set para o ator '%s': %s", id_ator, filme_ids_strings)
 
         if not filme_ids_strings: 
-            print(f"DEBUG REDIS: Nenhum ID de filme encontrado para o ator '{id_ator}'. Retornando lista vazia.") # DEBUG
+            logger.debug("DEBUG REDIS: Nenhum ID de filme encontrado para o ator '%s'. Retornando lista vazia.", id_ator)
             return []
         
+        campos_lidos = campos_leitura(campos, ordenar_por) # O campo de ordenação é lido para ordenar em Python
         filmes_do_ator = []
         for filme_id_str in filme_ids_strings: # filme_id_str já é uma string
             # Não precisa mais de .decode()
             try:
-                filme_data = buscar_filme_por_id(r, filme_id_str) # buscar_filme_por_id espera uma string
+                filme_data = buscar_filme_por_id(r, filme_id_str, campos=campos_lidos) # buscar_filme_por_id espera uma string
                 if filme_data: 
                     filmes_do_ator.append(filme_data)
                 else:
-                    print(f"DEBUG REDIS: buscar_filme_por_id retornou None para filme_id: {filme_id_str}") # DEBUG
+                    logger.debug("DEBUG REDIS: buscar_filme_por_id retornou None para filme_id: %s", filme_id_str)
             except ItemNotFoundError:
-                print(f"DEBUG REDIS: ItemNotFoundError para filme_id: {filme_id_str}. Continuando...") # DEBUG
+                logger.debug("DEBUG REDIS: ItemNotFoundError para filme_id: %s. Continuando...", filme_id_str)
                 continue 
             except Exception as e_busca_filme: # Pega outros erros na busca individual
-                print(f"DEBUG REDIS: Erro ao buscar detalhes do filme_id '{filme_id_str}': {e_busca_filme}")
+                logger.debug("DEBUG REDIS: Erro ao buscar detalhes do filme_id '%s': %s", filme_id_str, e_busca_filme)
                 continue
         
-        print(f"DEBUG REDIS: Número de filmes recuperados para o ator '{id_ator}' antes da ordenação/limite: {len(filmes_do_ator)}") # DEBUG
+        logger.debug("DEBUG REDIS: Número de filmes recuperados para o ator '%s' antes da ordenação/limite: %s", id_ator, len(filmes_do_ator))
 
         # Lembre-se de implementar a lógica de ordenação aqui se precisar!
         # Atualmente está como 'pass'. Seus filmes não serão ordenados.
         if ordenar_por and filmes_do_ator:
-            print(f"DEBUG REDIS: Aplicando ordenação por '{ordenar_por}', ordem '{ordem}'...") # DEBUG
+            logger.debug("DEBUG REDIS: Aplicando ordenação por '%s', ordem '%s'...", ordenar_por, ordem)
             # Substitua 'pass' pela sua função de ordenação, ex:
             # filmes_do_ator.sort(key=lambda x: (x.get(ordenar_por, 0) is None, x.get(ordenar_por, 0)), reverse=(ordem == -1))
             # (A chave de ordenação acima lida com Nones, colocando-os no início se crescente, ou fim se decrescente)
@@ -508,38 +908,36 @@ def buscar_filmes_por_ator(r: redis.Redis, id_ator: str, ordenar_por: str = 'ano
 
             try:
                 filmes_do_ator.sort(key=sort_key_redis, reverse=(ordem == -1))
-                print(f"DEBUG REDIS: Ordenação concluída.")
+                logger.debug("DEBUG REDIS: Ordenação concluída.")
             except TypeError as te:
-                print(f"AVISO REDIS: TypeError durante ordenação para o campo '{ordenar_por}': {te}. Lista pode não estar ordenada como esperado.")
+                logger.warning("AVISO REDIS: TypeError durante ordenação para o campo '%s': %s. Lista pode não estar ordenada como esperado.", ordenar_por, te)
 
 
         final_limit = limite if limite is not None else len(filmes_do_ator)
         filmes_finais = filmes_do_ator[:final_limit]
-        print(f"DEBUG REDIS: Retornando {len(filmes_finais)} filmes para o ator '{id_ator}' após limite.") # DEBUG
+        logger.debug("DEBUG REDIS: Retornando %s filmes para o ator '%s' após limite.", len(filmes_finais), id_ator)
         return filmes_finais
         
     except AttributeError as ae: # Pega especificamente o erro de 'str' object has no attribute 'decode'
-        print(f"ERRO DE CODIFICAÇÃO NO REDIS ao buscar filmes do ator '{id_ator}': {ae}") # DEBUG
+        logger.error("ERRO DE CODIFICAÇÃO NO REDIS ao buscar filmes do ator '%s': %s", id_ator, ae)
         # Isso não deveria mais acontecer após a correção, mas é um bom catch
         raise DatabaseInteractionError(f"Erro de atributo (provavelmente decode) ao buscar filmes do ator '{id_ator}' no Redis: {ae}")
     except Exception as e:
-        print(f"ERRO GERAL NO REDIS ao buscar filmes do ator '{id_ator}': {e}") # DEBUG
-        # import traceback
-        # traceback.print_exc() # Descomente para ver o traceback completo no log do FastAPI
+        logger.error("ERRO GERAL NO REDIS ao buscar filmes do ator '%s': %s", id_ator, e)
         raise DatabaseInteractionError(f"Erro ao buscar filmes do ator '{id_ator}' no Redis: {e}")
 
 def buscar_atores_por_filmes(r: redis.Redis, id_filme: str, limite: Optional[int] = 10000) -> List[Dict[str, Any]]:
     # USA O MESMO PREFIXO DA FUNÇÃO inserir_elenco para filme->atores
     chave_filme_atores = f"{ELENCO_FILME_ATORES_PREFIX}{str(id_filme)}" 
-    print(f"DEBUG REDIS: Buscando atores para o filme '{id_filme}' usando a chave: {chave_filme_atores}") # DEBUG
+    logger.debug("DEBUG REDIS: Buscando atores para o filme '%s' usando a chave: %s", id_filme, chave_filme_atores)
 
     try:
         # r.smembers já retorna um set de strings devido a decode_responses=True
         ator_ids_strings = r.smembers(chave_filme_atores)
-        print(f"DEBUG REDIS: IDs de atores encontrados no set para o filme '{id_filme}': {ator_ids_strings}") # DEBUG
+        logger.debug("DEBUG REDIS: IDs de atores encontrados no set para o filme '%s': %s", id_filme, ator_ids_strings)
 
         if not ator_ids_strings:
-            print(f"DEBUG REDIS: Nenhum ID de ator encontrado para o filme '{id_filme}'.") #DEBUG
+            logger.debug("DEBUG REDIS: Nenhum ID de ator encontrado para o filme '%s'.", id_filme)
             return []
 
         atores_do_filme_com_personagem = []
@@ -559,15 +957,15 @@ def buscar_atores_por_filmes(r: redis.Redis, id_filme: str, limite: Optional[int
                     # mas se precisar, essa lógica entraria aqui.
                     atores_do_filme_com_personagem.append(ator_data)
                 else:
-                    print(f"DEBUG REDIS: buscar_ator_por_id retornou None para ator_id: {ator_id_str}") # DEBUG
+                    logger.debug("DEBUG REDIS: buscar_ator_por_id retornou None para ator_id: %s", ator_id_str)
             except ItemNotFoundError:
-                print(f"DEBUG REDIS: ItemNotFoundError para ator_id: {ator_id_str} ao buscar detalhes. Continuando...") # DEBUG
+                logger.debug("DEBUG REDIS: ItemNotFoundError para ator_id: %s ao buscar detalhes. Continuando...", ator_id_str)
                 continue
             except Exception as e_busca_ator:
-                print(f"DEBUG REDIS: Erro ao buscar detalhes do ator_id '{ator_id_str}': {e_busca_ator}")
+                logger.debug("DEBUG REDIS: Erro ao buscar detalhes do ator_id '%s': %s", ator_id_str, e_busca_ator)
                 continue
         
-        print(f"DEBUG REDIS: Atores com personagem recuperados para o filme '{id_filme}': {len(atores_do_filme_com_personagem)}") # DEBUG
+        logger.debug("DEBUG REDIS: Atores com personagem recuperados para o filme '%s': %s", id_filme, len(atores_do_filme_com_personagem))
 
         # Limite (aplicado após buscar todos, pois não há ordenação fácil antes)
         final_limit = limite if limite is not None and limite >= 0 else len(atores_do_filme_com_personagem)
@@ -576,16 +974,14 @@ def buscar_atores_por_filmes(r: redis.Redis, id_filme: str, limite: Optional[int
         # Ex: atores_do_filme_com_personagem.sort(key=lambda x: x.get('nome_ator', '').lower())
         
         filmes_finais = atores_do_filme_com_personagem[:final_limit]
-        print(f"DEBUG REDIS: Retornando {len(filmes_finais)} atores para o filme '{id_filme}' após limite.") # DEBUG
+        logger.debug("DEBUG REDIS: Retornando %s atores para o filme '%s' após limite.", len(filmes_finais), id_filme)
         return filmes_finais
         
     except AttributeError as ae:
-        print(f"ERRO DE ATRIBUTO NO REDIS (provavelmente decode) ao buscar atores do filme '{id_filme}': {ae}") # DEBUG
+        logger.error("ERRO DE ATRIBUTO NO REDIS (provavelmente decode) ao buscar atores do filme '%s': %s", id_filme, ae)
         raise DatabaseInteractionError(f"Erro de atributo ao buscar atores do filme '{id_filme}' no Redis: {ae}")
     except Exception as e:
-        print(f"ERRO GERAL NO REDIS ao buscar atores do filme '{id_filme}': {e}") # DEBUG
-        # import traceback
-        # traceback.print_exc()
+        logger.error("ERRO GERAL NO REDIS ao buscar atores do filme '%s': %s", id_filme, e)
         raise DatabaseInteractionError(f"Erro ao buscar atores do filme '{id_filme}' no Redis: {e}")
     
 # --- ATUALIZAÇÃO ---
@@ -622,11 +1018,78 @@ def atualizar_campo_filme(r: redis.Redis, id_filme: str, campo_para_atualizar: s
             valor_serializado = _serialize_redis_value(novo_valor)
 
         r.hset(chave_filme, campo_para_atualizar, valor_serializado)
-        return buscar_filme_por_id(r, id_filme) # Retorna o filme atualizado
+        filme_atualizado = buscar_filme_por_id(r, id_filme)
+        if campo_para_atualizar in CAMPOS_ORDEM_NUMERICOS or campo_para_atualizar == "titulo":
+            _desindexar_ordenacao_filme(r, id_filme, filme_antigo_dict)
+            _indexar_ordenacao_filme(r, id_filme, filme_atualizado)
+        return filme_atualizado # Retorna o filme atualizado
     except ItemNotFoundError: raise
     except Exception as e:
         raise DatabaseInteractionError(f"Erro ao atualizar campo '{campo_para_atualizar}' do filme '{id_filme}' no Redis: {e}")
 
+def atualizar_campos_filme(r: redis.Redis, id_filme: str, atualizacoes: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Atualiza vários campos lendo o hash uma vez (para saber de quais índices tirar o filme)
+    e aplicando o HSET e toda a manutenção de índices num único pipeline MULTI/EXEC.
+    Devolve o filme atualizado montado a partir do estado lido, sem reler o hash.
+    """
+    validar_campos_atualizacao(atualizacoes)
+    id_filme = str(id_filme)
+    chave_filme = f"{FILME_KEY_PREFIX}{id_filme}"
+    valores = dict(atualizacoes)
+    if "generos" in valores:
+        valores["generos"] = _limpar_generos_redis(valores["generos"])
+    try:
+        filme_antigo_dict = _deserialize_redis_filme(r.hgetall(chave_filme))
+        if not filme_antigo_dict:
+            raise ItemNotFoundError(f"Filme com ID '{id_filme}' não encontrado no Redis para atualização.")
+
+        pipe = r.pipeline()
+        filme_atualizado = _enfileirar_atualizacao_filme(pipe, id_filme, filme_antigo_dict, valores)
+        pipe.execute()
+        return filme_atualizado
+    except ItemNotFoundError: raise
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao atualizar campos {sorted(valores)} do filme '{id_filme}' no Redis: {e}")
+
+def _enfileirar_atualizacao_filme(pipe: Any, id_filme: str, filme_antigo_dict: Dict[str, Any], valores: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Enfileira no pipeline o HSET dos novos valores e a manutenção dos índices (gênero, ano,
+    tipo e ZSETs de ordenação) a partir do estado antigo do filme. Devolve o filme atualizado.
+    """
+    filme_atualizado = {**filme_antigo_dict, **valores}
+    if "generos" in valores:
+        generos_antigos, generos_novos = set(filme_antigo_dict.get("generos") or []), set(valores["generos"])
+        for g_antigo in generos_antigos - generos_novos:
+            pipe.srem(f"{IDX_FILME_GENERO_PREFIX}{_serialize_redis_value(g_antigo)}", id_filme)
+        for g_novo in generos_novos - generos_antigos:
+            pipe.sadd(f"{IDX_FILME_GENERO_PREFIX}{_serialize_redis_value(g_novo)}", id_filme)
+    if "ano_lancamento" in valores:
+        if filme_antigo_dict.get("ano_lancamento") is not None:
+            pipe.srem(f"{IDX_FILME_ANO_PREFIX}{filme_antigo_dict['ano_lancamento']}", id_filme)
+        pipe.sadd(f"{IDX_FILME_ANO_PREFIX}{int(valores['ano_lancamento'])}", id_filme)
+    if "tipo" in valores:
+        if filme_antigo_dict.get("tipo"):
+            pipe.srem(f"{IDX_FILME_TIPO_PREFIX}{_serialize_redis_value(filme_antigo_dict['tipo'])}", id_filme)
+        if valores["tipo"]:
+            pipe.sadd(f"{IDX_FILME_TIPO_PREFIX}{_serialize_redis_value(valores['tipo'])}", id_filme)
+    if any(campo in CAMPOS_ORDEM_NUMERICOS or campo == "titulo" for campo in valores):
+        _desindexar_ordenacao_filme(pipe, id_filme, filme_antigo_dict)
+        _indexar_ordenacao_filme(pipe, id_filme, filme_atualizado)
+    pipe.hset(f"{FILME_KEY_PREFIX}{id_filme}", mapping={campo: _serialize_redis_value(valor) for campo, valor in valores.items()})
+    return filme_atualizado
+
+def _desindexar_filme(r: redis.Redis, id_filme: str, filme_dados: Dict[str, Any]):
+    """Tira o filme dos índices de gênero, ano, tipo e ordenação (r pode ser um pipeline)."""
+    if "generos" in filme_dados and filme_dados["generos"]:
+        for genero in filme_dados["generos"]: 
+            r.srem(f"{IDX_FILME_GENERO_PREFIX}{_serialize_redis_value(genero)}", id_filme)
+    if "ano_lancamento" in filme_dados and filme_dados["ano_lancamento"] is not None:
+        r.srem(f"{IDX_FILME_ANO_PREFIX}{filme_dados['ano_lancamento']}", id_filme) # ano_lancamento já é string ou int aqui, _serialize_redis_value não é estritamente necessário mas não quebra
+    if "tipo" in filme_dados and filme_dados["tipo"]:
+        r.srem(f"{IDX_FILME_TIPO_PREFIX}{_serialize_redis_value(filme_dados['tipo'])}", id_filme)
+    _desindexar_ordenacao_filme(r, id_filme, filme_dados)
+
 # src/databases/redis/crud.py
 
 def remover_filme(r: redis.Redis, id_filme: str) -> bool:
@@ -644,72 +1107,159 @@ def remover_filme(r: redis.Redis, id_filme: str) -> bool:
             raise ItemNotFoundError(f"Filme com ID '{id_filme}' não pôde ser removido (já não existia após checagem inicial?).")
 
         # Limpar dos índices (OK, _serialize_redis_value e os valores de filme_dados já são strings)
-        if "generos" in filme_dados and filme_dados["generos"]:
-            for genero in filme_dados["generos"]: 
-                r.srem(f"{IDX_FILME_GENERO_PREFIX}{_serialize_redis_value(genero)}", id_filme)
-        if "ano_lancamento" in filme_dados and filme_dados["ano_lancamento"] is not None:
-            r.srem(f"{IDX_FILME_ANO_PREFIX}{filme_dados['ano_lancamento']}", id_filme) # ano_lancamento já é string ou int aqui, _serialize_redis_value não é estritamente necessário mas não quebra
-        if "tipo" in filme_dados and filme_dados["tipo"]:
-            r.srem(f"{IDX_FILME_TIPO_PREFIX}{_serialize_redis_value(filme_dados['tipo'])}", id_filme)
+        _desindexar_filme(r, id_filme, filme_dados)
 
         # Remover das listas de elenco (ator_filmes)
         # A chave ELENCO_FILME_ATORES_PREFIX deve ser a mesma usada em inserir_elenco
         atores_deste_filme_ids_strings = r.smembers(f"{ELENCO_FILME_ATORES_PREFIX}{id_filme}") # Já retorna Set[str]
         
-        print(f"DEBUG REDIS (Remover): Atores encontrados para o filme '{id_filme}': {atores_deste_filme_ids_strings}") # DEBUG
+        logger.debug("DEBUG REDIS (Remover): Atores encontrados para o filme '%s': %s", id_filme, atores_deste_filme_ids_strings)
 
         for ator_id_str_loop in atores_deste_filme_ids_strings: # ator_id_str_loop JÁ É UMA STRING
             # A chave ELENCO_ATOR_FILMES_PREFIX deve ser a mesma usada em inserir_elenco
             r.srem(f"{ELENCO_ATOR_FILMES_PREFIX}{ator_id_str_loop}", id_filme) # SEM .decode()
-            print(f"DEBUG REDIS (Remover): Removendo filme '{id_filme}' do set do ator '{ator_id_str_loop}'") # DEBUG
+            logger.debug("DEBUG REDIS (Remover): Removendo filme '%s' do set do ator '%s'", id_filme, ator_id_str_loop)
         
         r.delete(f"{ELENCO_FILME_ATORES_PREFIX}{id_filme}") # Deleta o set de atores para este filme
         
-        print(f"INFO REDIS (Remover): Filme '{id_filme}' e suas referências de elenco removidos.") # DEBUG
+        logger.info("INFO REDIS (Remover): Filme '%s' e suas referências de elenco removidos.", id_filme)
         return True
     except ItemNotFoundError: 
         raise # Re-levanta para ser tratado pelo serviço/API
     except Exception as e:
-        print(f"ERRO REDIS (Remover): Erro ao remover filme '{id_filme}': {e}") # DEBUG
-        # import traceback # Descomente para debug mais profundo
-        # traceback.print_exc()
+        logger.error("ERRO REDIS (Remover): Erro ao remover filme '%s': %s", id_filme, e)
         raise DatabaseInteractionError(f"Erro ao remover filme '{id_filme}' do Redis: {e}")
 
+# --- ATUALIZAÇÃO / REMOÇÃO EM MASSA (mesmos filtros da busca avançada, sem limite) ---
+TAMANHO_LOTE_ESCRITA_REDIS = 500 # Filmes lidos/escritos por pipeline
+
+def _filmes_por_filtro_redis(
+    r: redis.Redis,
+    titulo: Optional[str],
+    tipo: Optional[str],
+    ano_min: Optional[int],
+    generos: Optional[List[str]],
+    nota_min: Optional[float],
+    duracao_min: Optional[int],
+    ano_corte_futuro: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Filmes que casam com o filtro, em lotes: candidatos pela interseção dos índices (SINTER),
+    hashes completos lidos por pipeline (o estado antigo é o que diz de quais índices sair)
+    e os demais filtros aplicados em Python, sem ordenação nem limite.
+    """
+    chaves_indices = _chaves_indices_busca_avancada(tipo, generos)
+    ids_candidatos = _listar_ids_candidatos_busca_avancada(r, chaves_indices)
+    for lote in _hidratar_filmes_em_lotes(r, ids_candidatos, TAMANHO_LOTE_ESCRITA_REDIS):
+        yield _finalizar_busca_avancada_redis(
+            lote, chaves_indices, titulo, tipo, ano_min, generos,
+            nota_min, duracao_min, None, -1, None, ano_corte_futuro
+        )
+
+def atualizar_filmes_por_filtro(
+    r: redis.Redis,
+    atualizacoes: Dict[str, Any],
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ano_corte_futuro: int = 2025
+) -> int:
+    """Aplica `atualizacoes` a todos os filmes que casam com o filtro, um pipeline MULTI/EXEC (HSET + índices) por lote."""
+    validar_campos_atualizacao(atualizacoes)
+    valores = dict(atualizacoes)
+    if "generos" in valores:
+        valores["generos"] = _limpar_generos_redis(valores["generos"])
+    total = 0
+    try:
+        for lote in _filmes_por_filtro_redis(r, titulo, tipo, ano_min, generos, nota_min, duracao_min, ano_corte_futuro):
+            if not lote:
+                continue
+            pipe = r.pipeline()
+            for filme in lote:
+                _enfileirar_atualizacao_filme(pipe, str(filme["_id"]), filme, valores)
+            pipe.execute()
+            total += len(lote)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao atualizar filmes por filtro no Redis ({total} já atualizados): {e}")
+    return total
+
+def remover_filmes_por_filtro(
+    r: redis.Redis,
+    titulo: Optional[str] = None,
+    tipo: Optional[str] = None,
+    ano_min: Optional[int] = None,
+    generos: Optional[List[str]] = None,
+    nota_min: Optional[float] = None,
+    duracao_min: Optional[int] = None,
+    ano_corte_futuro: int = 2025
+) -> int:
+    """
+    Remove todos os filmes que casam com o filtro, com as mesmas limpezas de remover_filme
+    (índices e sets de elenco): por lote, um pipeline lê os atores de cada filme e outro
+    (MULTI/EXEC) apaga hashes, índices e referências de elenco.
+    """
+    total = 0
+    try:
+        for lote in _filmes_por_filtro_redis(r, titulo, tipo, ano_min, generos, nota_min, duracao_min, ano_corte_futuro):
+            if not lote:
+                continue
+            pipe_leitura = r.pipeline(transaction=False)
+            for filme in lote:
+                pipe_leitura.smembers(f"{ELENCO_FILME_ATORES_PREFIX}{filme['_id']}")
+            atores_por_filme = pipe_leitura.execute()
+
+            pipe = r.pipeline()
+            for filme, atores_ids in zip(lote, atores_por_filme):
+                id_filme = str(filme["_id"])
+                pipe.delete(f"{FILME_KEY_PREFIX}{id_filme}")
+                _desindexar_filme(pipe, id_filme, filme)
+                for ator_id in atores_ids:
+                    pipe.srem(f"{ELENCO_ATOR_FILMES_PREFIX}{ator_id}", id_filme)
+                pipe.delete(f"{ELENCO_FILME_ATORES_PREFIX}{id_filme}")
+            pipe.execute()
+            total += len(lote)
+    except Exception as e:
+        raise DatabaseInteractionError(f"Erro ao remover filmes por filtro no Redis ({total} já removidos): {e}")
+    logger.info("INFO REDIS (Remover por filtro): %s filmes e suas referências de elenco removidos.", total)
+    return total
+
 # --- AGREGAÇÕES (Muito ineficientes no Redis sem RediSearch ou modelagem específica) ---
 # src/databases/redis/crud.py
 
-def contagem_por_ano(r: redis.Redis) -> List[Dict[str, Any]]:
-    print("INFO REDIS: Iniciando contagem por ano (via SCAN, pode ser ineficiente).")
+def _contar_filmes_por_ano_redis(pares_chave_ano: Iterable[Tuple[str, Optional[str]]]) -> List[Dict[str, Any]]:
+    """Agrega pares (chave do filme, ano_lancamento em string) em [{'ano': ano, 'quantidade': qtd}]."""
     anos_contagem: Dict[int, int] = {} # Tipagem para clareza
-    
-    # r.scan_iter com decode_responses=True já retorna chaves como strings
-    for chave_filme_str in r.scan_iter(match=f"{FILME_KEY_PREFIX}*"): 
-        # r.hget com decode_responses=True já retorna o valor como string (ou None)
-        ano_como_string = r.hget(chave_filme_str, "ano_lancamento") 
-        
+    for chave_filme_str, ano_como_string in pares_chave_ano:
         if ano_como_string: # Verifica se não é None e não é string vazia
             try:
                 ano = int(ano_como_string) # Converte a string diretamente para int
                 anos_contagem[ano] = anos_contagem.get(ano, 0) + 1
             except ValueError:
-                print(f"DEBUG REDIS (Contagem Ano): Valor de ano não numérico '{ano_como_string}' na chave '{chave_filme_str}'. Pulando.")
+                logger.debug("DEBUG REDIS (Contagem Ano): Valor de ano não numérico '%s' na chave '%s'. Pulando.", ano_como_string, chave_filme_str)
                 continue
     
     resultado_formatado = [{"ano": k, "quantidade": v} for k, v in sorted(anos_contagem.items())]
-    print(f"INFO REDIS (Contagem Ano): Contagem finalizada. {len(resultado_formatado)} anos distintos encontrados.") # DEBUG
+    logger.info("INFO REDIS (Contagem Ano): Contagem finalizada. %s anos distintos encontrados.", len(resultado_formatado))
     return resultado_formatado
 
+def contagem_por_ano(r: redis.Redis) -> List[Dict[str, Any]]:
+    logger.info("INFO REDIS: Iniciando contagem por ano (via SCAN, pode ser ineficiente).")
+    # r.scan_iter com decode_responses=True já retorna chaves como strings
+    # r.hget com decode_responses=True já retorna o valor como string (ou None)
+    return _contar_filmes_por_ano_redis(
+        (chave_filme_str, r.hget(chave_filme_str, "ano_lancamento"))
+        for chave_filme_str in r.scan_iter(match=f"{FILME_KEY_PREFIX}*")
+    )
+
 # src/databases/redis/crud.py
 
-def media_notas_por_genero(r: redis.Redis) -> List[Dict[str, Any]]:
-    print("INFO REDIS: Iniciando média de notas por gênero (via SCAN, pode ser ineficiente).")
+def _calcular_media_por_genero_redis(pares_chave_valores: Iterable[Tuple[str, List[Optional[str]]]]) -> List[Dict[str, Any]]:
+    """Agrega pares (chave do filme, [generos JSON, nota]) em [{'genero': nome, 'media_nota': media}]."""
     generos_data: Dict[str, Dict[str, Any]] = {} 
-    
-    # r.scan_iter já retorna chaves como strings
-    for chave_filme_str in r.scan_iter(match=f"{FILME_KEY_PREFIX}*"):
-        # r.hmget com decode_responses=True retorna uma lista de strings (ou Nones)
-        valores_hash_str = r.hmget(chave_filme_str, "generos", "nota") 
-        
+    for chave_filme_str, valores_hash_str in pares_chave_valores:
         generos_json_string = valores_hash_str[0] # Já é string (pode ser None)
         nota_como_string = valores_hash_str[1]    # Já é string (pode ser None)
 
@@ -724,7 +1274,7 @@ def media_notas_por_genero(r: redis.Redis) -> List[Dict[str, Any]]:
                 generos_filme_lista = json.loads(generos_json_string) if generos_json_string else []
                 
                 if not isinstance(generos_filme_lista, list): # Checagem extra
-                    print(f"DEBUG REDIS (Media Gênero): 'generos' não é uma lista após json.loads para chave '{chave_filme_str}'. Valor: '{generos_json_string}'. Pulando.")
+                    logger.debug("DEBUG REDIS (Media Gênero): 'generos' não é uma lista após json.loads para chave '%s'. Valor: '%s'. Pulando.", chave_filme_str, generos_json_string)
                     continue
 
                 for genero_item in generos_filme_lista:
@@ -735,10 +1285,10 @@ def media_notas_por_genero(r: redis.Redis) -> List[Dict[str, Any]]:
                     generos_data[genero_item]["soma_nota"] += nota_filme
                     generos_data[genero_item]["contagem"] += 1
             except json.JSONDecodeError:
-                print(f"DEBUG REDIS (Media Gênero): Erro ao decodificar JSON de generos '{generos_json_string}' na chave '{chave_filme_str}'. Pulando.")
+                logger.debug("DEBUG REDIS (Media Gênero): Erro ao decodificar JSON de generos '%s' na chave '%s'. Pulando.", generos_json_string, chave_filme_str)
                 continue
             except (ValueError, TypeError) as e_conv: # Erro ao converter nota para float, por exemplo
-                print(f"DEBUG REDIS (Media Gênero): Erro de conversão (nota: '{nota_como_string}') na chave '{chave_filme_str}': {e_conv}. Pulando.")
+                logger.debug("DEBUG REDIS (Media Gênero): Erro de conversão (nota: '%s') na chave '%s': %s. Pulando.", nota_como_string, chave_filme_str, e_conv)
                 continue
     
     resultado_final = []
@@ -748,9 +1298,18 @@ def media_notas_por_genero(r: redis.Redis) -> List[Dict[str, Any]]:
             resultado_final.append({"genero": genero, "media_nota": media})
     
     resultado_ordenado = sorted(resultado_final, key=lambda x: x.get("media_nota", 0.0), reverse=True)
-    print(f"INFO REDIS (Media Gênero): Cálculo finalizado. {len(resultado_ordenado)} gêneros com médias calculadas.") # DEBUG
+    logger.info("INFO REDIS (Media Gênero): Cálculo finalizado. %s gêneros com médias calculadas.", len(resultado_ordenado))
     return resultado_ordenado
 
+def media_notas_por_genero(r: redis.Redis) -> List[Dict[str, Any]]:
+    logger.info("INFO REDIS: Iniciando média de notas por gênero (via SCAN, pode ser ineficiente).")
+    # r.scan_iter já retorna chaves como strings
+    # r.hmget com decode_responses=True retorna uma lista de strings (ou Nones)
+    return _calcular_media_por_genero_redis(
+        (chave_filme_str, r.hmget(chave_filme_str, "generos", "nota"))
+        for chave_filme_str in r.scan_iter(match=f"{FILME_KEY_PREFIX}*")
+    )
+
 # src/databases/redis/crud.py
 
 # ... (todas as outras importações e funções auxiliares como _limpar_generos_redis, etc., permanecem iguais) ...
@@ -775,11 +1334,11 @@ def carregar_dados_redis(
     elenco_path: str
 ) -> Dict[str, Any]:
     # Limpeza seletiva (sem alterações)
-    print("Limpando dados antigos do Redis para nova carga...")
+    logger.info("Limpando dados antigos do Redis para nova carga...")
     for key_pattern in [
         f"{FILME_KEY_PREFIX}*", f"{ATOR_KEY_PREFIX}*", f"{ELENCO_FILME_ATORES_PREFIX}*",
         f"{ELENCO_ATOR_FILMES_PREFIX}*", f"{PERSONAGEM_PROPS_KEY_PREFIX}*",
-        "idx:filme:genero:*", "idx:filme:ano:*", "idx:filme:tipo:*"
+        "idx:filme:genero:*", "idx:filme:ano:*", "idx:filme:tipo:*", f"{IDX_FILME_ORDEM_PREFIX}*"
     ]:
         keys_to_delete = list(r.scan_iter(match=key_pattern))
         if keys_to_delete:
@@ -789,7 +1348,7 @@ def carregar_dados_redis(
     counts = {"filmes": 0, "atores": 0, "elenco": 0}
 
     pipe = r.pipeline()
-    print("Pipeline único inicializado. Processando todos os arquivos...")
+    logger.info("Pipeline único inicializado. Processando todos os arquivos...")
 
     # Processamento dos 3 arquivos (filmes, atores, elenco) - sem alterações
     # ... (cole aqui toda a sua lógica de leitura dos 3 dataframes e adição de comandos ao 'pipe')
@@ -807,6 +1366,7 @@ def carregar_dados_redis(
                     for genero in filme_dados["generos"]: pipe.sadd(f"{IDX_FILME_GENERO_PREFIX}{_serialize_redis_value(genero)}", filme_id)
                 if filme_dados["ano_lancamento"] is not None: pipe.sadd(f"{IDX_FILME_ANO_PREFIX}{filme_dados['ano_lancamento']}", filme_id)
                 if filme_dados["tipo"]: pipe.sadd(f"{IDX_FILME_TIPO_PREFIX}{_serialize_redis_value(filme_dados['tipo'])}", filme_id)
+                _indexar_ordenacao_filme(pipe, filme_id, filme_dados)
                 counts["filmes"] += 1
             except Exception as e_val: erros_carga.append({"arq":"filmes_redis", "ln":idx+2, "id":row.get('titulo_id'), "err":"Val/Prep", "det":str(e_val)})
     except Exception as e_read: erros_carga.append({"arq": "filmes_redis", "tipo": "LeituraDF", "det": str(e_read)})
@@ -842,17 +1402,17 @@ def carregar_dados_redis(
 
 
     # MUDANÇA AQUI: Medindo apenas a execução do pipeline
-    print("Enviando todos os comandos para o Redis de uma só vez...")
+    logger.info("Enviando todos os comandos para o Redis de uma só vez...")
     start_redis_exec = time.perf_counter()
     pipe.execute()
     end_redis_exec = time.perf_counter()
     redis_exec_time = end_redis_exec - start_redis_exec
-    print(f"Todos os dados foram carregados no Redis. Tempo de execução PURO do pipeline: {redis_exec_time:.4f}s")
+    logger.info("Todos os dados foram carregados no Redis. Tempo de execução PURO do pipeline: %.4fs", redis_exec_time)
 
     # --- Mensagem Final e Retorno ---
     msg = f"Carga Redis Otimizada (Pipeline Único): {counts['filmes']} filmes, {counts['atores']} atores, {counts['elenco']} relações."
     status_op = "sucesso" if not erros_carga else "concluído_com_erros"
-    if erros_carga: print(f"LOG DE CARGA REDIS - Erros: {erros_carga[:5]}")
+    if erros_carga: logger.error("LOG DE CARGA REDIS - Erros: %s", erros_carga[:5])
     
     # MUDANÇA AQUI: Adicionando o tempo de execução puro aos detalhes
     detalhes_finais = {**counts, "tempo_execucao_redis_ms": redis_exec_time * 1000}
@@ -45,6 +45,54 @@ class AtualizarFilmePayload(BaseModel):
     class Config: from_attributes = True
 
 
+class InserirFilmesLotePayload(BaseModel):
+    filmes: List[FilmePayload] = Field(..., min_length=1, description="Filmes a inserir; cada um recebe seu próprio resultado.")
+
+class BuscarFilmesPorIdsPayload(BaseModel):
+    ids: List[str] = Field(..., min_length=1, description="IDs (_id) dos filmes, na ordem desejada.")
+
+class AtualizarCamposFilmePayload(BaseModel):
+    """Payload do PATCH: só os campos enviados (e não nulos) são alterados, todos de uma vez."""
+    titulo: Optional[str] = None
+    tipo: Optional[str] = None
+    ano_lancamento: Optional[int] = None
+    generos: Optional[List[str]] = None
+    nota: Optional[float] = None
+    numero_votos: Optional[int] = None
+    duracao: Optional[int] = None
+    sinopse: Optional[str] = None
+    class Config:
+        from_attributes = True
+        extra = "forbid" # Campo desconhecido (ou o próprio titulo_id) é erro 422, não ignorado em silêncio
+
+class AtualizarFilmesPorFiltroPayload(BaseModel):
+    """Atualização em massa: os mesmos campos do PATCH aplicados a todos os filmes que casam com `filtros`."""
+    filtros: FiltrosBuscaAvancadaPayload
+    atualizacoes: AtualizarCamposFilmePayload
+
+class RemoverFilmesPorFiltroPayload(BaseModel):
+    """Remoção em massa de todos os filmes que casam com `filtros` (ordenar_por/ordem são ignorados)."""
+    filtros: FiltrosBuscaAvancadaPayload
+
+class OperacaoLotePayload(BaseModel):
+    operacao: str = Field(..., description="busca_avancada, detalhes_filme, filmes_por_ids, atores_de_filme, filmes_por_ator, contagem_por_ano ou media_notas_por_genero.")
+    banco: str = Field("mongo", description="mongo, cassandra, neo4j, redis, todos, mais_rapido ou auto (conforme a operação).")
+    parametros: Dict[str, Any] = Field(default_factory=dict, description="Os mesmos parâmetros do endpoint equivalente (ex.: id_filme, campos).")
+
+class ExecutarLotePayload(BaseModel):
+    operacoes: List[OperacaoLotePayload] = Field(..., min_length=1, description="Operações executadas em paralelo; os resultados voltam nesta ordem.")
+
+class ConsultaFederadaPayload(BaseModel):
+    """Pergunta composta resolvida pelo planejador federado, cada etapa no banco mais indicado."""
+    filtros: FiltrosBuscaAvancadaPayload = Field(default_factory=FiltrosBuscaAvancadaPayload)
+    id_ator: Optional[str] = Field(None, description="Restringe o resultado aos filmes deste ator.")
+    limite: int = Field(20, ge=1, le=100)
+    incluir_elenco: bool = Field(False, description="Traz os atores de cada filme do resultado.")
+    campos: Optional[str] = Field(None, description="Campos do filme a devolver, separados por vírgula (o id vem sempre).")
+    bancos: Dict[str, str] = Field(default_factory=dict, description="Fixa o banco de uma etapa: relacionamentos, hidratacao, filtro ou elenco.")
+    somente_plano: bool = Field(False, description="Devolve só o plano escolhido, sem executar (explain).")
+
+
 class CarregarBasePayload(BaseModel):
     filmes_path: str
     atores_path: str
@@ -0,0 +1,152 @@
+# src/services/aquecimento.py
+"""
+Aquecimento da API na inicialização.
+
+A primeira rodada de cada teste sempre saía mais lenta (conexões sendo abertas, prepares do
+Cassandra, cache de planos do Neo4j vazio, working set do MongoDB fora da memória) e era
+descartada na análise. Aqui a API paga esse custo antes de se declarar pronta:
+  1. enche os pools de conexão de cada banco (src/databases/conexoes.py);
+  2. prepara os statements fixos do Cassandra;
+  3. roda uma vez, em cada banco, cada consulta de leitura pelo mesmo caminho dos endpoints
+     (busca avançada, detalhes, busca por ids, atores do filme, filmes do ator, páginas e,
+     se AQUECIMENTO_ANALYTICS, as agregações), o que popula o cache de planos do Cypher e
+     traz índices e documentos quentes para a memória;
+  4. descarta o que o aquecimento colocou no cache de resultados, para que a primeira
+     requisição real ainda meça o banco.
+As chamadas do aquecimento rodam sob sem_contabilidade(): não entram em /metrics, nas janelas
+do roteador de latência (banco=auto) nem nas contagens dos disjuntores.
+GET /health/ready só responde 200 depois disso (estado_prontidao()).
+"""
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from fastapi import HTTPException
+
+from src.core.cache import cache_resultados
+from src.core.db_config import AQUECIMENTO_ANALYTICS, AQUECIMENTO_CONEXOES_POR_BANCO, MODO_DRIVER
+from src.core.executores import executar_bloqueante
+from src.core.metricas import sem_contabilidade
+from src.databases.cassandra.connection import get_cassandra_session
+from src.databases.cassandra.crud import preparar_consultas_frequentes
+from src.databases.conexoes import aquecer_pools
+from src.models.api_models import FiltrosBuscaAvancadaPayload
+from src.services.query_service import (
+    BANCOS_SUPORTADOS,
+    servico_geral_busca_avancada_filmes,
+    servico_buscar_detalhes_filme,
+    servico_buscar_filmes_por_ids,
+    servico_buscar_atores_de_filme,
+    servico_listar_filmes_por_ator,
+    servico_paginar_busca_avancada,
+    servico_paginar_filmes_por_ator,
+    servico_contar_filmes_por_ano,
+    servico_media_notas_por_genero,
+)
+
+logger = logging.getLogger(__name__)
+
+# Ids que não existem na base do IMDB: usados quando a busca de aquecimento não devolve nada
+ID_FILME_INEXISTENTE = "tt0000000"
+ID_ATOR_INEXISTENTE = "nm0000000"
+
+# Formatos de busca avançada aquecidos (o texto do Cypher/CQL muda com os filtros presentes):
+# o dos testes de desempenho e um com os filtros de título e duração
+FILTROS_AQUECIMENTO = (
+    FiltrosBuscaAvancadaPayload(tipo="Filme", ano_lancamento_min=2000, generos=["Drama"], nota_min=6.0, ordenar_por="nota", ordem=-1),
+    FiltrosBuscaAvancadaPayload(titulo="a", duracao_min=90, ordenar_por="ano_lancamento", ordem=1),
+)
+
+_estado: Dict[str, Any] = {"pronto": False, "em_andamento": False, "duracao_s": None, "etapas": []}
+
+
+def estado_prontidao() -> Dict[str, Any]:
+    """Situação do aquecimento para GET /health/ready (pronto, duração e o resultado de cada etapa)."""
+    return {**_estado, "etapas": list(_estado["etapas"])}
+
+
+def marcar_pronto():
+    """Usado quando o aquecimento está desligado (AQUECIMENTO_ATIVO=false)."""
+    _estado["pronto"] = True
+
+
+async def _etapa(etapa: str, banco: Optional[str], executar: Callable[[], Awaitable[Any]]) -> Any:
+    """Executa uma etapa registrando duração e erro; 404 (id sem dados) conta como sucesso."""
+    inicio = time.perf_counter()
+    erro = None
+    resultado = None
+    try:
+        resultado = await executar()
+    except HTTPException as e:
+        if e.status_code != 404:
+            erro = f"HTTP {e.status_code}: {e.detail}"
+    except Exception as e:
+        erro = repr(e)
+    if erro:
+        logger.warning("AVISO: aquecimento '%s' falhou em %s: %s", etapa, banco or "todos", erro)
+    _estado["etapas"].append({
+        "etapa": etapa, "banco": banco,
+        "duracao_ms": round((time.perf_counter() - inicio) * 1000, 1), "erro": erro,
+    })
+    return resultado
+
+
+def _primeiro_id(itens: Any, padrao: str) -> str:
+    if isinstance(itens, list) and itens and isinstance(itens[0], dict):
+        return str(itens[0].get("_id") or itens[0].get("id") or padrao)
+    return padrao
+
+
+async def _aquecer_leituras(nome_banco: str):
+    """Uma passada por cada consulta de leitura do banco, encadeando ids reais quando possível."""
+    filmes = None
+    for indice, filtros in enumerate(FILTROS_AQUECIMENTO):
+        resultado = await _etapa(f"busca_avancada_{indice + 1}", nome_banco,
+                                 lambda filtros=filtros: servico_geral_busca_avancada_filmes(filtros, nome_banco))
+        filmes = filmes or resultado
+        await _etapa(f"busca_avancada_paginada_{indice + 1}", nome_banco,
+                     lambda filtros=filtros: servico_paginar_busca_avancada(filtros, nome_banco, None, None))
+    id_filme = _primeiro_id(filmes, ID_FILME_INEXISTENTE)
+
+    await _etapa("detalhes_filme", nome_banco, lambda: servico_buscar_detalhes_filme(id_filme, nome_banco))
+    await _etapa("filmes_por_ids", nome_banco, lambda: servico_buscar_filmes_por_ids([id_filme], nome_banco))
+    atores = await _etapa("atores_de_filme", nome_banco, lambda: servico_buscar_atores_de_filme(id_filme, nome_banco))
+    id_ator = _primeiro_id(atores, ID_ATOR_INEXISTENTE)
+
+    await _etapa("filmes_por_ator", nome_banco, lambda: servico_listar_filmes_por_ator(id_ator, nome_banco, "nota", -1, 100))
+    await _etapa("filmes_por_ator_paginado", nome_banco,
+                 lambda: servico_paginar_filmes_por_ator(id_ator, nome_banco, "nota", -1, None, None))
+
+
+async def _executar_etapas():
+    if MODO_DRIVER != "async": # No modo async as leituras não passam pelos executores/pools síncronos
+        await _etapa("pools", None, lambda: aquecer_pools(AQUECIMENTO_CONEXOES_POR_BANCO))
+    await _etapa("prepares_cassandra", "cassandra",
+                 lambda: executar_bloqueante("cassandra", lambda: preparar_consultas_frequentes(get_cassandra_session())))
+
+    # Bancos em sequência: aquecer os quatro juntos disputaria CPU/disco da mesma máquina
+    for nome_banco in BANCOS_SUPORTADOS:
+        await _aquecer_leituras(nome_banco)
+    if AQUECIMENTO_ANALYTICS:
+        await _etapa("contagem_por_ano", None, lambda: servico_contar_filmes_por_ano("todos"))
+        await _etapa("media_notas_por_genero", None, lambda: servico_media_notas_por_genero("todos"))
+
+
+async def aquecer_api():
+    """Roda todas as etapas do aquecimento e só então marca a API como pronta."""
+    if _estado["em_andamento"] or _estado["pronto"]:
+        return
+    _estado["em_andamento"] = True
+    inicio = time.perf_counter()
+    logger.info("Aquecimento iniciado.")
+    try:
+        with sem_contabilidade():
+            await _executar_etapas()
+    finally:
+        for nome_banco in BANCOS_SUPORTADOS:
+            cache_resultados.invalidar(nome_banco)
+        _estado["duracao_s"] = round(time.perf_counter() - inicio, 3)
+        _estado["em_andamento"] = False
+    # Etapas com erro não seguram a prontidão (o banco pode estar fora): ficam listadas em /health/ready
+    _estado["pronto"] = True
+    logger.info("Aquecimento concluído em %.1fs.", _estado["duracao_s"])
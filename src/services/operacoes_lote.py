@@ -0,0 +1,125 @@
+# src/services/operacoes_lote.py
+"""
+Execução de várias operações de leitura numa única requisição (POST /api/v1/batch).
+
+A página de detalhes do Streamlit fazia uma chamada para o filme e outra para o elenco, e
+as telas de comparação uma por banco. Aqui o cliente manda a lista de operações (nome da
+operação, banco e parâmetros) e o servidor roda todas ao mesmo tempo pelos mesmos
+servico_* dos endpoints (cache, disjuntor, prazos e métricas incluídos). Cada operação
+tem o seu resultado, status e duração; o erro de uma não derruba as outras.
+Só leituras: as operações não têm ordem de execução entre si.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from fastapi import HTTPException
+from pydantic import ValidationError as PydanticValidationError
+
+from src.core.exceptions import DataValidationError
+from src.core.projecao import normalizar_campos
+from src.models.api_models import FiltrosBuscaAvancadaPayload
+from src.services.query_service import (
+    servico_geral_busca_avancada_filmes,
+    servico_buscar_detalhes_filme,
+    servico_buscar_filmes_por_ids,
+    servico_buscar_atores_de_filme,
+    servico_listar_filmes_por_ator,
+    servico_contar_filmes_por_ano,
+    servico_media_notas_por_genero,
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_OPERACOES_POR_LOTE = 50 # Limite de operações por chamada de POST /batch
+
+
+async def _busca_avancada(banco: str, parametros: Dict[str, Any]) -> Any:
+    filtros = {chave: valor for chave, valor in parametros.items() if chave != "campos"}
+    return await servico_geral_busca_avancada_filmes(
+        FiltrosBuscaAvancadaPayload(**filtros), banco, normalizar_campos(parametros.get("campos"))
+    )
+
+
+async def _detalhes_filme(banco: str, parametros: Dict[str, Any]) -> Any:
+    return await servico_buscar_detalhes_filme(parametros["id_filme"], banco, normalizar_campos(parametros.get("campos")))
+
+
+async def _filmes_por_ids(banco: str, parametros: Dict[str, Any]) -> Any:
+    return await servico_buscar_filmes_por_ids(list(parametros["ids"]), banco, normalizar_campos(parametros.get("campos")))
+
+
+async def _atores_de_filme(banco: str, parametros: Dict[str, Any]) -> Any:
+    return await servico_buscar_atores_de_filme(parametros["id_filme"], banco)
+
+
+async def _filmes_por_ator(banco: str, parametros: Dict[str, Any]) -> Any:
+    return await servico_listar_filmes_por_ator(
+        parametros["id_ator"], banco,
+        parametros.get("ordenar_por", "nota"), int(parametros.get("ordem", -1)), int(parametros.get("limite", 100)),
+        normalizar_campos(parametros.get("campos"))
+    )
+
+
+async def _contagem_por_ano(banco: str, parametros: Dict[str, Any]) -> Any:
+    return await servico_contar_filmes_por_ano(banco)
+
+
+async def _media_notas_por_genero(banco: str, parametros: Dict[str, Any]) -> Any:
+    return await servico_media_notas_por_genero(banco)
+
+
+# Nome da operação no payload -> execução (os parâmetros são os mesmos dos endpoints equivalentes)
+OPERACOES_LOTE: Dict[str, Callable[[str, Dict[str, Any]], Awaitable[Any]]] = {
+    "busca_avancada": _busca_avancada,
+    "detalhes_filme": _detalhes_filme,
+    "filmes_por_ids": _filmes_por_ids,
+    "atores_de_filme": _atores_de_filme,
+    "filmes_por_ator": _filmes_por_ator,
+    "contagem_por_ano": _contagem_por_ano,
+    "media_notas_por_genero": _media_notas_por_genero,
+}
+
+
+async def _executar_operacao(operacao: str, banco: str, parametros: Dict[str, Any]) -> Dict[str, Any]:
+    """Uma operação do lote: {"operacao", "banco", "status_code", "duracao_ms"} mais "data" ou "error"."""
+    resultado: Dict[str, Any] = {"operacao": operacao, "banco": banco}
+    inicio = time.perf_counter()
+    try:
+        executar = OPERACOES_LOTE.get(operacao)
+        if executar is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Operação '{operacao}' não suportada. Disponíveis: {', '.join(OPERACOES_LOTE)}."
+            )
+        resultado["data"] = await executar(banco, parametros)
+        resultado["status_code"] = 200
+    except HTTPException as e:
+        resultado.update(status_code=e.status_code, error=str(e.detail))
+    except KeyError as e:
+        resultado.update(status_code=400, error=f"Parâmetro obrigatório ausente: {e.args[0]}.")
+    except (DataValidationError, PydanticValidationError, TypeError, ValueError) as e:
+        resultado.update(status_code=400, error=f"Parâmetros inválidos: {e}")
+    except Exception as e:
+        logger.exception("Erro interno na operação '%s' do lote", operacao)
+        resultado.update(status_code=500, error=f"Falha inesperada: {e}")
+    resultado["duracao_ms"] = round((time.perf_counter() - inicio) * 1000, 3)
+    return resultado
+
+
+async def servico_executar_lote(operacoes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Roda as operações ao mesmo tempo (cada banco continua limitado pelo próprio executor)
+    e devolve os resultados na ordem em que foram pedidas.
+    """
+    if not operacoes:
+        raise HTTPException(status_code=400, detail="Informe ao menos uma operação em 'operacoes'.")
+    if len(operacoes) > MAX_OPERACOES_POR_LOTE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"No máximo {MAX_OPERACOES_POR_LOTE} operações por lote ({len(operacoes)} recebidas)."
+        )
+    return list(await asyncio.gather(*(
+        _executar_operacao(op["operacao"], op["banco"], op.get("parametros") or {}) for op in operacoes
+    )))
@@ -0,0 +1,232 @@
+# src/services/planejador_federado.py
+"""
+Planejador de consultas federadas (POST /api/v1/consultas/federadas).
+
+Uma pergunta composta ("filmes do ator X com nota >= 7 no gênero Y, com o elenco") é quebrada
+em etapas e cada etapa roda no banco mais indicado para ela, pelos mesmos servico_* dos
+endpoints (cache, disjuntor, prazos e métricas incluídos):
+  1. relacionamentos  filmes do ator, só os ids (grafo do Neo4j, sets de elenco do Redis...);
+  2. hidratacao       os filmes candidatos pelos ids, só com os campos pedidos e os usados no filtro;
+  3. filtro           filtros, ordenação e limite: no planejador, sobre os candidatos, quando há
+                      ator (nenhum CRUD filtra um conjunto de ids), ou busca avançada num banco;
+  4. elenco           atores de cada filme do resultado, em paralelo.
+A escolha do banco de cada etapa vem de CAPACIDADES (quem sabe fazer e o custo relativo medido
+nos testes oficiais) e, quando todos os candidatos já têm amostras suficientes, do p95 recente
+do roteador de latência (src/core/roteamento.py). Bancos com o disjuntor aberto ficam de fora.
+A resposta traz o plano escolhido (explain) com o critério, os custos considerados e a duração
+e o volume de cada etapa; somente_plano=True devolve só o plano.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import HTTPException
+
+from src.core.disjuntor import disjuntores
+from src.core.filtros_filme import filme_atende_filtros
+from src.core.metricas import operacao_medida
+from src.core.projecao import campos_leitura, projetar_filme
+from src.core.roteamento import roteador_latencia
+from src.models.api_models import FiltrosBuscaAvancadaPayload
+from src.services.query_service import (
+    ANO_CORTE_FILMES_FUTUROS,
+    MAX_IDS_POR_BUSCA,
+    servico_geral_busca_avancada_filmes,
+    servico_buscar_filmes_por_ids,
+    servico_buscar_atores_de_filme,
+    servico_listar_filmes_por_ator,
+)
+
+logger = logging.getLogger(__name__)
+
+BANCO_PLANEJADOR = "planejador" # Etapa executada em memória, sem ir a um banco
+MAX_FILMES_DO_ATOR = 1000 # Filmes do ator considerados na etapa de relacionamentos
+
+# Operação (rótulo do servico_*) -> bancos capazes e custo relativo (1 = mais rápido nos
+# resultados oficiais). Vale enquanto o roteador não tem amostras de todos os candidatos.
+CAPACIDADES: Dict[str, Dict[str, int]] = {
+    "filmes_por_ator": {"redis": 1, "neo4j": 2, "cassandra": 3, "mongo": 4},
+    "filmes_por_ids": {"redis": 1, "cassandra": 2, "mongo": 3, "neo4j": 4},
+    "busca_avancada": {"neo4j": 1, "mongo": 2, "redis": 3, "cassandra": 4},
+    "atores_de_filme": {"neo4j": 1, "redis": 2, "mongo": 3, "cassandra": 4},
+}
+
+# Etapa do plano -> operação cujo desempenho decide o banco
+OPERACAO_DA_ETAPA = {
+    "relacionamentos": "filmes_por_ator",
+    "hidratacao": "filmes_por_ids",
+    "filtro": "busca_avancada",
+    "elenco": "atores_de_filme",
+}
+
+
+def _escolher_banco(etapa: str, bancos_fixados: Dict[str, str]) -> Dict[str, Any]:
+    """Banco da etapa, o critério da escolha e os custos de cada candidato (para o explain)."""
+    operacao = OPERACAO_DA_ETAPA[etapa]
+    capazes = CAPACIDADES[operacao]
+    custos = {}
+    for nome, custo_estatico in capazes.items():
+        p95 = roteador_latencia.p95(operacao, nome)
+        custos[nome] = {
+            "custo_estatico": custo_estatico,
+            "p95_ms": None if p95 == float("inf") else round(p95 * 1000, 3),
+            "amostras": roteador_latencia.amostras(operacao, nome),
+            "degradado": disjuntores[nome].degradado,
+        }
+
+    if etapa in bancos_fixados:
+        escolhido, criterio = bancos_fixados[etapa], "fixado"
+    else:
+        disponiveis = [nome for nome in capazes if not custos[nome]["degradado"]] or list(capazes)
+        if all(custos[nome]["amostras"] >= roteador_latencia.min_amostras for nome in disponiveis):
+            escolhido, criterio = min(disponiveis, key=lambda nome: custos[nome]["p95_ms"]), "p95"
+        else:
+            escolhido, criterio = min(disponiveis, key=lambda nome: capazes[nome]), "custo_estatico"
+    return {"etapa": etapa, "operacao": operacao, "banco": escolhido, "criterio": criterio, "custos": custos}
+
+
+def _validar_bancos_fixados(bancos_fixados: Dict[str, str]) -> Dict[str, str]:
+    normalizados = {}
+    for etapa, banco in bancos_fixados.items():
+        if etapa not in OPERACAO_DA_ETAPA:
+            raise HTTPException(
+                status_code=400, detail=f"Etapa '{etapa}' inexistente. Disponíveis: {', '.join(OPERACAO_DA_ETAPA)}."
+            )
+        capazes = CAPACIDADES[OPERACAO_DA_ETAPA[etapa]]
+        if banco.lower() not in capazes:
+            raise HTTPException(
+                status_code=400, detail=f"Banco '{banco}' não atende a etapa '{etapa}'. Disponíveis: {', '.join(capazes)}."
+            )
+        normalizados[etapa] = banco.lower()
+    return normalizados
+
+
+def _planejar(id_ator: Optional[str], incluir_elenco: bool, bancos_fixados: Dict[str, str]) -> List[Dict[str, Any]]:
+    if id_ator:
+        plano = [
+            _escolher_banco("relacionamentos", bancos_fixados),
+            _escolher_banco("hidratacao", bancos_fixados),
+            {"etapa": "filtro", "operacao": "filtro_em_memoria", "banco": BANCO_PLANEJADOR,
+             "criterio": "candidatos_do_ator", "custos": {}},
+        ]
+    else:
+        plano = [_escolher_banco("filtro", bancos_fixados)]
+    if incluir_elenco:
+        plano.append(_escolher_banco("elenco", bancos_fixados))
+    return plano
+
+
+def _filtros_python(filtros: FiltrosBuscaAvancadaPayload) -> Dict[str, Any]:
+    """Os filtros da busca avançada no formato do filtro em Python (mesma regra dos filmes futuros)."""
+    return {
+        "titulo_contem": filtros.titulo, "tipo": filtros.tipo,
+        "ano_lancamento_min": filtros.ano_lancamento_min, "generos_contem_todos": filtros.generos,
+        "nota_min": filtros.nota_min, "duracao_min": filtros.duracao_min,
+    }
+
+
+def _filtrar_e_ordenar(filmes: List[Dict[str, Any]], filtros: FiltrosBuscaAvancadaPayload, limite: int) -> List[Dict[str, Any]]:
+    filtros_python = _filtros_python(filtros)
+    selecionados = [filme for filme in filmes if filme_atende_filtros(filme, filtros_python, ANO_CORTE_FILMES_FUTUROS)]
+    ordenar_por = filtros.ordenar_por or "nota"
+    descendente = (filtros.ordem or -1) == -1
+    # Filmes sem o campo de ordenação vão para o fim nos dois sentidos
+    com_valor = [filme for filme in selecionados if filme.get(ordenar_por) is not None]
+    sem_valor = [filme for filme in selecionados if filme.get(ordenar_por) is None]
+    com_valor.sort(key=lambda filme: filme[ordenar_por], reverse=descendente)
+    return (com_valor + sem_valor)[:limite]
+
+
+async def _hidratar(ids: List[str], banco: str, campos: Optional[List[str]]) -> List[Dict[str, Any]]:
+    """Busca os filmes pelos ids em lotes de MAX_IDS_POR_BUSCA, todos ao mesmo tempo."""
+    lotes = [ids[inicio:inicio + MAX_IDS_POR_BUSCA] for inicio in range(0, len(ids), MAX_IDS_POR_BUSCA)]
+    resultados = await asyncio.gather(*(servico_buscar_filmes_por_ids(lote, banco, campos) for lote in lotes))
+    return [filme for lote in resultados for filme in lote]
+
+
+async def _elenco_do_filme(id_filme: str, banco: str) -> List[Dict[str, Any]]:
+    try:
+        return await servico_buscar_atores_de_filme(id_filme, banco)
+    except HTTPException as e:
+        if e.status_code == 404: # Filme sem elenco cadastrado
+            return []
+        raise
+
+
+async def _executar_etapa(etapa: Dict[str, Any], entrada: int, executar: Callable[[], Awaitable[Any]]) -> Any:
+    """Roda a etapa e completa o explain com o volume de entrada/saída e a duração."""
+    inicio = time.perf_counter()
+    resultado = await executar()
+    etapa.update(
+        entrada=entrada,
+        saida=len(resultado) if isinstance(resultado, (list, dict)) else None,
+        duracao_ms=round((time.perf_counter() - inicio) * 1000, 3),
+    )
+    return resultado
+
+
+@operacao_medida("consulta_federada")
+async def servico_consulta_federada(
+    filtros: FiltrosBuscaAvancadaPayload,
+    id_ator: Optional[str] = None,
+    limite: int = 20,
+    incluir_elenco: bool = False,
+    campos: Optional[List[str]] = None,
+    bancos_fixados: Optional[Dict[str, str]] = None,
+    somente_plano: bool = False
+) -> Dict[str, Any]:
+    """
+    Executa o plano e devolve {"plano": [...], "data": filmes} mais "elenco" ({id_filme: atores})
+    quando incluir_elenco. Erro de uma etapa interrompe a consulta com o status do serviço.
+    """
+    plano = _planejar(id_ator, incluir_elenco, _validar_bancos_fixados(bancos_fixados or {}))
+    if somente_plano:
+        return {"plano": plano, "data": None}
+    etapas = {etapa["etapa"]: etapa for etapa in plano}
+
+    # Campos que as etapas seguintes leem, além dos pedidos pelo cliente
+    campos_filtro = [campo for campo, valor in (
+        ("titulo", filtros.titulo), ("tipo", filtros.tipo or filtros.duracao_min), ("generos", filtros.generos),
+        ("nota", filtros.nota_min), ("duracao", filtros.duracao_min),
+    ) if valor] + ["ano_lancamento", "nota", "numero_votos", filtros.ordenar_por]
+    campos_lidos = campos_leitura(campos, *campos_filtro)
+
+    if id_ator:
+        relacionamentos = etapas["relacionamentos"]
+        filmes_do_ator = await _executar_etapa(relacionamentos, 1, lambda: servico_listar_filmes_por_ator(
+            id_ator, relacionamentos["banco"], "nota", -1, MAX_FILMES_DO_ATOR, []
+        ))
+        ids = list(dict.fromkeys(filme["_id"] for filme in filmes_do_ator if filme.get("_id")))
+        candidatos = []
+        if ids:
+            hidratacao = etapas["hidratacao"]
+            candidatos = await _executar_etapa(
+                hidratacao, len(ids), lambda: _hidratar(ids, hidratacao["banco"], campos_lidos)
+            )
+        else:
+            etapas["hidratacao"].update(entrada=0, saida=0, duracao_ms=0.0)
+
+        async def _filtrar() -> List[Dict[str, Any]]:
+            return _filtrar_e_ordenar(candidatos, filtros, limite)
+        filmes = await _executar_etapa(etapas["filtro"], len(candidatos), _filtrar)
+    else:
+        filtro = etapas["filtro"]
+        # O limite vai para o banco: ele não devolve mais filmes do que a resposta usa
+        encontrados = await _executar_etapa(
+            filtro, 1, lambda: servico_geral_busca_avancada_filmes(filtros, filtro["banco"], campos_lidos, limite=limite)
+        )
+        filmes = encontrados[:limite]
+    # Os campos lidos só para filtrar/ordenar não vão para a resposta
+    filmes = [projetar_filme(filme, campos) for filme in filmes]
+
+    resposta: Dict[str, Any] = {"plano": plano, "data": filmes}
+    if incluir_elenco:
+        elenco = etapas["elenco"]
+
+        async def _buscar_elencos() -> Dict[str, List[Dict[str, Any]]]:
+            ids_resultado = [filme["_id"] for filme in filmes]
+            atores = await asyncio.gather(*(_elenco_do_filme(id_filme, elenco["banco"]) for id_filme in ids_resultado))
+            return dict(zip(ids_resultado, atores))
+        resposta["elenco"] = await _executar_etapa(elenco, len(filmes), _buscar_elencos)
+    return resposta
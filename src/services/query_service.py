@@ -1,18 +1,30 @@
 # src/services/query_service.py
+import logging
 from fastapi import HTTPException
-from typing import Dict, Any, List, Optional, Union # Adicionado Union
-import traceback
+from typing import Dict, Any, List, Optional, Union, Callable, Awaitable, AsyncIterator, Iterator # Adicionado Union
+import asyncio
+import itertools
+import time
 
 # --- Importações dos CRUDs e Conexões ---
 from src.databases.mongo.crud import (
     buscar_filmes_avancado as mongo_buscar_filmes_avancado,
     carregar_dados_mongo,
     inserir_filme as mongo_inserir_filme,
+    inserir_filmes_em_lote as mongo_inserir_filmes_em_lote,
     buscar_filme_por_id as mongo_buscar_filme_por_id,
+    buscar_filmes_por_ids as mongo_buscar_filmes_por_ids,
     buscar_atores_por_filmes as mongo_buscar_atores_por_filmes,
     atualizar_campo_filme as mongo_atualizar_campo_filme,
+    atualizar_campos_filme as mongo_atualizar_campos_filme,
     remover_filme as mongo_remover_filme,
+    atualizar_filmes_por_filtro as mongo_atualizar_filmes_por_filtro,
+    remover_filmes_por_filtro as mongo_remover_filmes_por_filtro,
     buscar_filmes_por_ator as mongo_buscar_filmes_por_ator,
+    iterar_filmes_avancado as mongo_iterar_filmes_avancado,
+    iterar_filmes_por_ator as mongo_iterar_filmes_por_ator,
+    paginar_filmes_avancado as mongo_paginar_filmes_avancado,
+    paginar_filmes_por_ator as mongo_paginar_filmes_por_ator,
     contar_filmes_por_ano as mongo_contar_filmes_por_ano,
     media_notas_por_genero as mongo_media_notas_por_genero
 )
@@ -22,11 +34,19 @@ from src.databases.cassandra.crud import (
     buscar_filmes_avancado as cassandra_buscar_filmes_avancado,
     carregar_dados as cassandra_carregar_dados,
     inserir_filme as cassandra_inserir_filme,
+    inserir_filmes_em_lote as cassandra_inserir_filmes_em_lote,
     buscar_filme_por_id as cassandra_buscar_filme_por_id,
+    buscar_filmes_por_ids as cassandra_buscar_filmes_por_ids,
     buscar_atores_por_filmes as cassandra_buscar_atores_por_filmes,
     atualizar_campo_filme as cassandra_atualizar_campo_filme,
+    atualizar_campos_filme as cassandra_atualizar_campos_filme,
     remover_filme as cassandra_remover_filme,
+    atualizar_filmes_por_filtro as cassandra_atualizar_filmes_por_filtro,
+    remover_filmes_por_filtro as cassandra_remover_filmes_por_filtro,
     buscar_filmes_por_ator as cassandra_buscar_filmes_por_ator,
+    iterar_filmes_avancado as cassandra_iterar_filmes_avancado,
+    paginar_filmes_avancado as cassandra_paginar_filmes_avancado,
+    paginar_filmes_por_ator as cassandra_paginar_filmes_por_ator,
     contar_filmes_por_ano as cassandra_contar_filmes_por_ano,
     media_notas_por_genero as cassandra_media_notas_por_genero
 )
@@ -34,11 +54,20 @@ from src.databases.cassandra.connection import get_cassandra_session
 
 from src.databases.neo4j.crud import (
     inserir_filme as neo4j_inserir_filme,
+    inserir_filmes_em_lote as neo4j_inserir_filmes_em_lote,
     buscar_filme_por_id as neo4j_buscar_filme_por_id,
+    buscar_filmes_por_ids as neo4j_buscar_filmes_por_ids,
     buscar_atores_por_filmes as neo4j_buscar_atores_por_filmes,
     atualizar_campo_filme as neo4j_atualizar_campo_filme,
+    atualizar_campos_filme as neo4j_atualizar_campos_filme,
     remover_filme as neo4j_remover_filme,
+    atualizar_filmes_por_filtro as neo4j_atualizar_filmes_por_filtro,
+    remover_filmes_por_filtro as neo4j_remover_filmes_por_filtro,
     buscar_filmes_por_ator as neo4j_buscar_filmes_por_ator,
+    iterar_filmes_avancado as neo4j_iterar_filmes_avancado,
+    iterar_filmes_por_ator as neo4j_iterar_filmes_por_ator,
+    paginar_filmes_avancado as neo4j_paginar_filmes_avancado,
+    paginar_filmes_por_ator as neo4j_paginar_filmes_por_ator,
     contagem_por_ano as neo4j_contagem_por_ano,
     media_notas_por_genero as neo4j_media_notas_por_genero,
     buscar_filmes_avancado as neo4j_buscar_filmes_avancado,
@@ -48,11 +77,19 @@ from src.databases.neo4j.connection import get_neo4j_driver
 
 from src.databases.redis.crud import (
     inserir_filme as redis_inserir_filme,
+    inserir_filmes_em_lote as redis_inserir_filmes_em_lote,
     buscar_filme_por_id as redis_buscar_filme_por_id,
+    buscar_filmes_por_ids as redis_buscar_filmes_por_ids,
     buscar_atores_por_filmes as redis_buscar_atores_por_filmes,
     atualizar_campo_filme as redis_atualizar_campo_filme,
+    atualizar_campos_filme as redis_atualizar_campos_filme,
     remover_filme as redis_remover_filme,
+    atualizar_filmes_por_filtro as redis_atualizar_filmes_por_filtro,
+    remover_filmes_por_filtro as redis_remover_filmes_por_filtro,
     buscar_filmes_por_ator as redis_buscar_filmes_por_ator,
+    iterar_filmes_avancado as redis_iterar_filmes_avancado,
+    paginar_filmes_avancado as redis_paginar_filmes_avancado,
+    paginar_filmes_por_ator as redis_paginar_filmes_por_ator,
     contagem_por_ano as redis_contagem_por_ano,
     media_notas_por_genero as redis_media_notas_por_genero,
     buscar_filmes_avancado as redis_buscar_filmes_avancado,
@@ -60,86 +97,416 @@ from src.databases.redis.crud import (
 )
 from src.databases.redis.connection import get_redis_client
 
+# --- Camada asyncio nativa (MODO_DRIVER=async), só para as consultas de leitura ---
+from src.databases.mongo import async_crud as mongo_async_crud
+from src.databases.cassandra import async_crud as cassandra_async_crud
+from src.databases.neo4j import async_crud as neo4j_async_crud
+from src.databases.redis import async_crud as redis_async_crud
+from src.databases.mongo.connection import get_mongo_db_async
+from src.databases.cassandra.connection import get_cassandra_session_async
+from src.databases.neo4j.connection import get_neo4j_driver_async
+from src.databases.redis.connection import get_redis_client_async
+
 from src.models.api_models import FiltrosBuscaAvancadaPayload, FilmePayload, CarregarBasePayload, AtualizarFilmePayload
-from src.core.exceptions import ItemNotFoundError, ItemAlreadyExistsError, DataValidationError, DatabaseInteractionError
+from src.core.exceptions import (
+    ItemNotFoundError, ItemAlreadyExistsError, DataValidationError, DatabaseInteractionError, ValidationError
+)
+from src.core.executores import executar_bloqueante
+from src.core.db_config import MODO_DRIVER, BANCOS_MAIS_RAPIDO
+from src.core.cache import cache_resultados, chave_cache
+from src.core.coalescencia import execucao_unica
+from src.core.prazos import executar_com_prazo, prazo_para
+from src.core.disjuntor import disjuntores
+from src.core.roteamento import roteador_latencia, CRITERIO_ALTERNATIVA
+from src.core.cursores import assinatura_consulta, codificar_cursor, decodificar_cursor
+from src.core.lote import item_duplicado
+from src.core.projecao import validar_campos_atualizacao
+from src.core.tempos import medir_execucao
+from src.core.rastreamento import span
+from src.core.metricas import (
+    operacao_medida, operacao_atual, na_operacao, endpoint_atual, tamanho_resultado, contabilizando,
+    duracao_operacao, itens_operacao, erros_operacao, operacoes_em_andamento
+)
+
+logger = logging.getLogger(__name__)
 
 ANO_CORTE_FILMES_FUTUROS = 2025
+BANCOS_SUPORTADOS = ["mongo", "cassandra", "neo4j", "redis"]
+BANCO_MAIS_RAPIDO = "mais_rapido" # banco_alvo especial: consulta vários bancos e usa a primeira resposta
+BANCO_AUTO = "auto" # banco_alvo especial: consulta o banco com o menor p95 recente para a operação
+TAMANHO_LOTE_STREAMING = 500 # Filmes lidos do banco por ida ao executor no modo streaming (NDJSON)
+TAMANHO_PAGINA_PADRAO = 20 # Filmes por página na paginação por cursor quando o cliente não informa
+MAX_FILMES_POR_LOTE = 10000 # Limite de filmes por chamada de POST /filmes/lote
+MAX_IDS_POR_BUSCA = 500 # Limite de ids por chamada de busca em lote (GET /filmes?ids=... e POST /filmes/buscar-por-ids)
+
+# --- Utilitários do fan-out para "todos" ---
+
+def _bancos_do_alvo(banco_alvo: str) -> List[str]:
+    """Lista dos bancos atingidos por banco_alvo (um só, ou todos quando "todos"). Vazia se inválido."""
+    alvo = banco_alvo.lower()
+    return [nome for nome in BANCOS_SUPORTADOS if alvo in (nome, "todos")]
+
+def _resolver_bancos(banco_alvo: str, descricao_operacao: str) -> List[str]:
+    """Como _bancos_do_alvo, mas levanta HTTP 400 para banco não suportado."""
+    bancos = _bancos_do_alvo(banco_alvo)
+    if not bancos:
+        raise HTTPException(status_code=400, detail=f"Banco '{banco_alvo}' não suportado para {descricao_operacao}.")
+    return bancos
+
+async def _executar_nos_bancos(bancos: List[str], processar_banco: Callable[[str], Awaitable[None]]) -> None:
+    """
+    Executa processar_banco(nome) para todos os bancos ao mesmo tempo, de modo que o
+    modo "todos" leve o tempo do banco mais lento, e não a soma dos quatro
+    (cada banco usa o seu próprio executor, ver src/core/executores.py).
+    Cada processar_banco trata os próprios erros no modo "todos"; no modo de banco único
+    a HTTPException levantada por ele é propagada normalmente.
+    """
+    await asyncio.gather(*(processar_banco(nome) for nome in bancos))
+
+def _ordenar_por_banco(resultados_por_banco: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reordena os resultados (que chegam por ordem de término) na ordem fixa dos bancos
+    e marca com "degradado" os bancos cujo disjuntor não está fechado.
+    """
+    ordenados = {}
+    for nome in BANCOS_SUPORTADOS:
+        if nome in resultados_por_banco:
+            resultado = resultados_por_banco[nome]
+            if disjuntores[nome].degradado and isinstance(resultado, dict):
+                resultado = {**resultado, "degradado": True}
+            ordenados[nome] = resultado
+    return ordenados
+
+# Erros que são respostas válidas do banco (não contam como falha para o disjuntor)
+ERROS_DE_DOMINIO = (ItemNotFoundError, ItemAlreadyExistsError, DataValidationError, ValidationError, ValueError, HTTPException)
+
+def _logar_erro_servico(erro: Exception, mensagem: str, *args: Any):
+    """
+    Erros de domínio (404, 400...) são resultados normais: WARNING sem traceback. Erros de
+    banco e inesperados vão com o traceback (logger.exception, chamado dentro do except).
+    """
+    if isinstance(erro, ERROS_DE_DOMINIO):
+        logger.warning(mensagem + ": %s", *args, erro)
+    else:
+        logger.exception(mensagem + ": %s", *args, erro)
+
+def _registrar_latencia(nome_banco: str, tipo_operacao: str, operacao: str, duracao: float, falhou: bool):
+    """
+    Amostra da janela do banco=auto. Falha de banco (prazo estourado, disjuntor aberto, erro
+    do driver) entra com pelo menos o prazo da operação: um banco que falha rápido não pode
+    parecer o mais rápido.
+    """
+    if tipo_operacao not in ("leitura", "analytics"):
+        return
+    if falhou:
+        duracao = max(duracao, prazo_para(nome_banco, tipo_operacao) or 0.0)
+    roteador_latencia.registrar(operacao, nome_banco, duracao)
+
+async def _executar_protegido(nome_banco: str, tipo_operacao: str, executar: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Executa a chamada ao banco sob o disjuntor e o prazo de (banco, tipo de operação),
+    registrando duração, tamanho do resultado, erros e chamadas em andamento em /metrics
+    (e um span "banco.<nome>" quando a operação está sendo rastreada).
+    """
+    if not contabilizando():
+        # Aquecimento: só o prazo, sem métricas, janela do roteador ou contagem no disjuntor
+        return await executar_com_prazo(nome_banco, tipo_operacao, executar)
+    rotulos = (endpoint_atual(), nome_banco, operacao_atual())
+    operacoes_em_andamento.incrementar(*rotulos)
+    inicio = time.perf_counter()
+    with span(f"banco.{nome_banco}", operacao=rotulos[2], tipo=tipo_operacao) as span_banco:
+        try:
+            resultado = await _executar_sob_disjuntor(nome_banco, tipo_operacao, executar)
+        except asyncio.CancelledError:
+            # Perdedores do mais_rapido (ou cliente que desistiu): não é erro do banco e a
+            # duração seria truncada, então nem erro nem duração são registrados
+            operacoes_em_andamento.decrementar(*rotulos)
+            raise
+        except BaseException as e:
+            operacoes_em_andamento.decrementar(*rotulos)
+            duracao = time.perf_counter() - inicio
+            duracao_operacao.observar(duracao, *rotulos)
+            erros_operacao.incrementar(*rotulos, type(e).__name__)
+            if isinstance(e, Exception):
+                _registrar_latencia(nome_banco, tipo_operacao, rotulos[2], duracao, falhou=not isinstance(e, ERROS_DE_DOMINIO))
+            raise
+        operacoes_em_andamento.decrementar(*rotulos)
+        duracao = time.perf_counter() - inicio
+        duracao_operacao.observar(duracao, *rotulos)
+        itens = tamanho_resultado(resultado)
+        span_banco.definir(itens=itens)
+    itens_operacao.observar(itens, *rotulos)
+    _registrar_latencia(nome_banco, tipo_operacao, rotulos[2], duracao, falhou=False)
+    return resultado
+
+async def _executar_sob_disjuntor(nome_banco: str, tipo_operacao: str, executar: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Com o disjuntor aberto falha na hora (BancoIndisponivelError); erros de banco e prazos
+    estourados contam como falha, erros de domínio (404, duplicado, validação) não.
+    """
+    disjuntor = disjuntores[nome_banco]
+    disjuntor.verificar()
+    try:
+        with medir_execucao(nome_banco):
+            resultado = await executar_com_prazo(nome_banco, tipo_operacao, executar)
+    except ERROS_DE_DOMINIO:
+        disjuntor.registrar_sucesso()
+        raise
+    except asyncio.CancelledError:
+        disjuntor.registrar_cancelamento()
+        raise
+    except Exception as e:
+        disjuntor.registrar_falha(e)
+        raise
+    disjuntor.registrar_sucesso()
+    return resultado
+
+async def _executar_leitura(
+    nome_banco: str,
+    tipo_operacao: str,
+    funcao_sincrona: Callable[..., Any],
+    funcao_async: Optional[Callable[..., Awaitable[Any]]],
+    *args: Any
+) -> Any:
+    """
+    Executa uma consulta de leitura no modo configurado em MODO_DRIVER: "async" aguarda
+    o driver asyncio nativo direto no event loop; "sincrono" (padrão), ou quando não há
+    versão async da consulta, roda a versão síncrona no executor do banco.
+    tipo_operacao ("leitura" ou "analytics") escolhe o prazo aplicado.
+    """
+    if MODO_DRIVER == "async" and funcao_async is not None:
+        return await _executar_protegido(nome_banco, tipo_operacao, lambda: funcao_async(*args))
+    return await _executar_protegido(nome_banco, tipo_operacao, lambda: executar_bloqueante(nome_banco, funcao_sincrona, *args))
+
+async def _ler_com_cache(
+    nome_banco: str,
+    operacao: str,
+    parametros: Dict[str, Any],
+    executar: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Devolve o resultado em cache para (banco, operação, parâmetros) ou executa a leitura e guarda.
+    Leituras idênticas simultâneas compartilham uma única execução no banco; a geração do cache
+    entra na chave para que uma requisição posterior a uma escrita não pegue carona numa
+    leitura iniciada antes dela.
+    """
+    chave = chave_cache(operacao, parametros)
+    encontrado, valor = cache_resultados.buscar(nome_banco, operacao, chave)
+    if encontrado:
+        return valor
+    geracao = cache_resultados.geracao(nome_banco)
+
+    async def _executar_e_guardar() -> Any:
+        resultado = await executar()
+        cache_resultados.guardar(nome_banco, chave, resultado, geracao)
+        return resultado
+
+    return await execucao_unica.executar(f"{nome_banco}:{geracao}:{chave}", _executar_e_guardar)
+
+async def _executar_escrita(nome_banco: str, tipo_operacao: str, funcao_sincrona: Callable[..., Any], *args: Any) -> Any:
+    """
+    Executa uma escrita no executor do banco e invalida o cache de leituras desse banco.
+    A invalidação acontece mesmo em caso de erro (ou prazo estourado), pois a escrita
+    pode ter sido parcial. tipo_operacao ("escrita" ou "carga") escolhe o prazo aplicado.
+    """
+    try:
+        return await _executar_protegido(nome_banco, tipo_operacao, lambda: executar_bloqueante(nome_banco, funcao_sincrona, *args))
+    finally:
+        cache_resultados.invalidar(nome_banco)
+
+# --- Leitura "mais_rapido" (requisições em paralelo, vence a primeira resposta válida) ---
+
+async def _servico_mais_rapido(
+    servico_no_banco: Callable[[str], Awaitable[Any]],
+    descricao_operacao: str
+) -> Dict[str, Any]:
+    """
+    Dispara servico_no_banco(nome) (o próprio serviço em modo banco único) em paralelo nos
+    bancos de BANCOS_MAIS_RAPIDO e devolve {"banco_vencedor": nome, "data": resultado} com a
+    primeira resposta bem-sucedida. As demais tarefas são canceladas; as que já estão rodando
+    numa thread do executor terminam lá, mas o resultado delas é ignorado.
+    Se todos falharem: 404 se todos responderam 404, senão 503 com o erro de cada banco.
+    """
+    bancos = [nome for nome in BANCOS_MAIS_RAPIDO if nome in BANCOS_SUPORTADOS] or BANCOS_SUPORTADOS
+    tarefas = {asyncio.ensure_future(servico_no_banco(nome)): nome for nome in bancos}
+    erros: Dict[str, Exception] = {}
+    try:
+        pendentes = set(tarefas)
+        while pendentes:
+            concluidas, pendentes = await asyncio.wait(pendentes, return_when=asyncio.FIRST_COMPLETED)
+            for tarefa in concluidas:
+                erro = tarefa.exception()
+                if erro is None:
+                    return {"banco_vencedor": tarefas[tarefa], "data": tarefa.result()}
+                erros[tarefas[tarefa]] = erro
+    finally:
+        for tarefa in tarefas:
+            if not tarefa.done():
+                tarefa.cancel()
+
+    detalhes = "; ".join(
+        f"{nome}: {erro.detail if isinstance(erro, HTTPException) else erro}" for nome, erro in erros.items()
+    )
+    todos_404 = all(isinstance(erro, HTTPException) and erro.status_code == 404 for erro in erros.values())
+    raise HTTPException(
+        status_code=404 if todos_404 else 503,
+        detail=f"Nenhum banco respondeu com sucesso para {descricao_operacao} ({detalhes})."
+    )
+
+# --- Leitura "auto" (banco com o menor p95 recente para a operação) ---
+
+async def _servico_auto(
+    servico_no_banco: Callable[[str], Awaitable[Any]],
+    descricao_operacao: str
+) -> Dict[str, Any]:
+    """
+    Executa servico_no_banco(nome) no banco escolhido pelo roteador de latência para a
+    operação atual (src/core/roteamento.py) e devolve {"banco_vencedor": nome, "criterio": ...,
+    "data": resultado}, no mesmo formato do mais_rapido. Se o banco falhar (erro de banco,
+    disjuntor aberto, prazo estourado) tenta o próximo da ordem; 404 e erros de validação
+    são a resposta da operação e voltam direto.
+    """
+    bancos, criterio = roteador_latencia.ordenar(operacao_atual(), BANCOS_SUPORTADOS)
+    erros: Dict[str, HTTPException] = {}
+    for nome in bancos:
+        try:
+            return {"banco_vencedor": nome, "criterio": criterio, "data": await servico_no_banco(nome)}
+        except Exception as e:
+            erro_http = _erro_http_do_banco(nome, e)
+            if erro_http.status_code < 500:
+                raise erro_http
+            erros[nome] = erro_http
+            criterio = CRITERIO_ALTERNATIVA
+    detalhes = "; ".join(f"{nome}: {erro.detail}" for nome, erro in erros.items())
+    raise HTTPException(status_code=503, detail=f"Nenhum banco respondeu com sucesso para {descricao_operacao} ({detalhes}).")
+
+def _filtros_crud_busca_avancada(
+    filtros: FiltrosBuscaAvancadaPayload, campos: Optional[List[str]] = None, limite: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Filtros comuns aos CRUDs de busca avançada (e a projeção `campos`), montados uma vez a partir
+    do payload. `limite` é interno (planejador federado); sem ele valem os 100 filmes por banco.
+    """
+    payload_filtros_dict = filtros.model_dump(exclude_none=True) 
+
+    filtros_comuns_para_crud = {
+        "titulo": payload_filtros_dict.get("titulo"),
+        "tipo": payload_filtros_dict.get("tipo"),
+        "ano_min": payload_filtros_dict.get("ano_lancamento_min"),
+        "generos": payload_filtros_dict.get("generos") or [],
+        "nota_min": payload_filtros_dict.get("nota_min"),
+        "duracao_min": payload_filtros_dict.get("duracao_min"),
+        "ordenar_por": payload_filtros_dict.get("ordenar_por", "nota"),
+        "ordem": payload_filtros_dict.get("ordem", -1),
+        "limite": limite or 100,
+        "ano_corte_futuro": ANO_CORTE_FILMES_FUTUROS
+    }
+    filtros_crud_limpos = {k: v for k, v in filtros_comuns_para_crud.items() if v is not None}
+    if "generos" in filtros_comuns_para_crud: filtros_crud_limpos["generos"] = filtros_comuns_para_crud["generos"] # Garante que lista vazia passe, se CRUD tratar
+    filtros_crud_limpos["ordenar_por"] = filtros_comuns_para_crud["ordenar_por"]
+    filtros_crud_limpos["ordem"] = filtros_comuns_para_crud["ordem"]
+    filtros_crud_limpos["limite"] = filtros_comuns_para_crud["limite"]
+    filtros_crud_limpos["ano_corte_futuro"] = filtros_comuns_para_crud["ano_corte_futuro"]
+    filtros_crud_limpos["campos"] = campos
+    return filtros_crud_limpos
+
+def _argumentos_busca_cassandra(filtros_crud_limpos: Dict[str, Any]) -> Dict[str, Any]:
+    """Argumentos do CRUD de busca avançada do Cassandra."""
+    # O Cassandra recebe os filtros separados entre o WHERE (CQL) e a filtragem em Python
+    filtros_cql_cass = {}
+    if filtros_crud_limpos.get("tipo"): filtros_cql_cass["tipo"] = filtros_crud_limpos["tipo"]
+    filtros_py_cass = {
+        "titulo_contem": filtros_crud_limpos.get("titulo"), "tipo": filtros_crud_limpos.get("tipo"), 
+        "ano_lancamento_min": filtros_crud_limpos.get("ano_min"),
+        "generos_contem_todos": filtros_crud_limpos.get("generos"),
+        "nota_min": filtros_crud_limpos.get("nota_min"), "duracao_min": filtros_crud_limpos.get("duracao_min"),
+    }
+    filtros_py_cass_limpos = {k:v for k,v in filtros_py_cass.items() if v is not None or k == "generos_contem_todos"}
+    return dict(
+        tabela="filmes",
+        filtros_cql=filtros_cql_cass, filtros_python=filtros_py_cass_limpos,
+        ordenar_por=filtros_crud_limpos["ordenar_por"], ordem=filtros_crud_limpos["ordem"],
+        limite=filtros_crud_limpos["limite"], ano_corte_futuro_param=filtros_crud_limpos["ano_corte_futuro"],
+        campos=filtros_crud_limpos.get("campos")
+    )
 
 # --- FUNÇÕES "GERAIS" (já lidam com "todos") ---
 # src/services/query_service.py
 # ... (imports e outras funções no início do arquivo) ...
 
+@operacao_medida("busca_avancada")
 async def servico_geral_busca_avancada_filmes(
-    filtros: FiltrosBuscaAvancadaPayload, banco_alvo: str
+    filtros: FiltrosBuscaAvancadaPayload, banco_alvo: str, campos: Optional[List[str]] = None, *, limite: Optional[int] = None
 ) -> Union[List[Dict[str, Any]], Dict[str, Any]]: # Tipo de retorno ajustado
+    if banco_alvo.lower() == BANCO_MAIS_RAPIDO:
+        return await _servico_mais_rapido(lambda nome: servico_geral_busca_avancada_filmes(filtros, nome, campos, limite=limite), "busca avançada")
+    if banco_alvo.lower() == BANCO_AUTO:
+        return await _servico_auto(lambda nome: servico_geral_busca_avancada_filmes(filtros, nome, campos, limite=limite), "busca avançada")
+
     resultados_por_banco: Dict[str, Any] = {}
-    payload_filtros_dict = filtros.model_dump(exclude_none=True) 
+    filtros_crud_limpos = _filtros_crud_busca_avancada(filtros, campos, limite)
+    # A ordem dos gêneros não muda o resultado ("contém todos"), então não deve mudar a chave do cache
+    parametros_cache = {**filtros_crud_limpos, "generos": sorted(filtros_crud_limpos["generos"])}
+
+    def _executar_busca_avancada_sincrono(nome_banco: str) -> List[Dict[str, Any]]:
+        # Parte bloqueante (driver síncrono): chama o CRUD específico.
+        # Roda no executor do banco para não bloquear o event loop.
+        funcao_crud_busca_avancada, obter_conexao_ou_referencia_db = cruds_busca_avancada[nome_banco]
+        dados_retornados_pelo_crud = None
+        if nome_banco == "mongo":
+            db_mongo = obter_conexao_ou_referencia_db()
+            if db_mongo is None: raise DatabaseInteractionError("Falha ao obter db MongoDB.")
+            collection_filmes = db_mongo["filmes"]
+            dados_retornados_pelo_crud = funcao_crud_busca_avancada(collection_filmes, **filtros_crud_limpos)
+        elif nome_banco == "cassandra":
+            session_cassandra = obter_conexao_ou_referencia_db()
+            if session_cassandra is None: raise DatabaseInteractionError("Falha ao obter sessão Cassandra.")
+            dados_retornados_pelo_crud = funcao_crud_busca_avancada(session=session_cassandra, **_argumentos_busca_cassandra(filtros_crud_limpos))
+        elif nome_banco == "neo4j":
+            driver_neo4j = obter_conexao_ou_referencia_db()
+            if driver_neo4j is None: raise DatabaseInteractionError("Falha ao obter driver Neo4j.")
+            with driver_neo4j.session(database="neo4j") as session_neo:
+                dados_retornados_pelo_crud = funcao_crud_busca_avancada(session_neo, **filtros_crud_limpos)
+        elif nome_banco == "redis":
+            r_client = obter_conexao_ou_referencia_db()
+            if r_client is None: raise DatabaseInteractionError("Falha ao obter cliente Redis.")
+            dados_retornados_pelo_crud = funcao_crud_busca_avancada(r_client, **filtros_crud_limpos)
+        else:
+            raise ValueError(f"Busca avançada não configurada para: {nome_banco}")
+        return dados_retornados_pelo_crud
+
+    async def _executar_busca_avancada_async(nome_banco: str) -> List[Dict[str, Any]]:
+        # Mesma busca com os drivers asyncio nativos (MODO_DRIVER=async)
+        if nome_banco == "mongo":
+            db_mongo = await get_mongo_db_async()
+            return await mongo_async_crud.buscar_filmes_avancado(db_mongo["filmes"], **filtros_crud_limpos)
+        elif nome_banco == "cassandra":
+            session_cassandra = await get_cassandra_session_async()
+            return await cassandra_async_crud.buscar_filmes_avancado(session=session_cassandra, **_argumentos_busca_cassandra(filtros_crud_limpos))
+        elif nome_banco == "neo4j":
+            driver_neo4j = await get_neo4j_driver_async()
+            async with driver_neo4j.session(database="neo4j") as session_neo:
+                return await neo4j_async_crud.buscar_filmes_avancado(session_neo, **filtros_crud_limpos)
+        elif nome_banco == "redis":
+            r_client = await get_redis_client_async()
+            return await redis_async_crud.buscar_filmes_avancado(r_client, **filtros_crud_limpos)
+        raise ValueError(f"Busca avançada não configurada para: {nome_banco}")
 
-    async def executar_busca_avancada_especifica(
-        nome_banco: str, 
-        funcao_crud_busca_avancada: callable, 
-        obter_conexao_ou_referencia_db: callable 
-    ):
-        # ... (lógica interna da sub-função, como estava, para obter dados_retornados_pelo_crud)
-        # A lógica para preparar filtros_crud_limpos e chamar o CRUD específico permanece
+    cruds_busca_avancada = {
+        "mongo": (mongo_buscar_filmes_avancado, get_mongo_db),
+        "cassandra": (cassandra_buscar_filmes_avancado, get_cassandra_session),
+        "neo4j": (neo4j_buscar_filmes_avancado, get_neo4j_driver),
+        "redis": (redis_buscar_filmes_avancado, get_redis_client),
+    }
+
+    async def executar_busca_avancada_especifica(nome_banco: str):
         # No final da sub-função, ela popula resultados_por_banco:
         # resultados_por_banco[nome_banco] = {"data": dados_retornados_pelo_crud, "message": ...}
-        # Esta parte interna continua igual, pois o tratamento de erro por banco no modo "todos" é útil.
         try:
-            dados_retornados_pelo_crud = None
-            filtros_comuns_para_crud = {
-                "titulo": payload_filtros_dict.get("titulo"),
-                "tipo": payload_filtros_dict.get("tipo"),
-                "ano_min": payload_filtros_dict.get("ano_lancamento_min"),
-                "generos": payload_filtros_dict.get("generos") or [],
-                "nota_min": payload_filtros_dict.get("nota_min"),
-                "duracao_min": payload_filtros_dict.get("duracao_min"),
-                "ordenar_por": payload_filtros_dict.get("ordenar_por", "nota"),
-                "ordem": payload_filtros_dict.get("ordem", -1),
-                "limite": payload_filtros_dict.get("limite", 100),
-                "ano_corte_futuro": ANO_CORTE_FILMES_FUTUROS
-            }
-            filtros_crud_limpos = {k: v for k, v in filtros_comuns_para_crud.items() if v is not None}
-            if "generos" in filtros_comuns_para_crud: filtros_crud_limpos["generos"] = filtros_comuns_para_crud["generos"] # Garante que lista vazia passe, se CRUD tratar
-            filtros_crud_limpos["ordenar_por"] = filtros_comuns_para_crud["ordenar_por"]
-            filtros_crud_limpos["ordem"] = filtros_comuns_para_crud["ordem"]
-            filtros_crud_limpos["limite"] = filtros_comuns_para_crud["limite"]
-            filtros_crud_limpos["ano_corte_futuro"] = filtros_comuns_para_crud["ano_corte_futuro"]
-
-            if nome_banco == "mongo":
-                db_mongo = obter_conexao_ou_referencia_db()
-                if db_mongo is None: raise DatabaseInteractionError("Falha ao obter db MongoDB.")
-                collection_filmes = db_mongo["filmes"]
-                dados_retornados_pelo_crud = funcao_crud_busca_avancada(collection_filmes, **filtros_crud_limpos)
-            elif nome_banco == "cassandra":
-                session_cassandra = obter_conexao_ou_referencia_db()
-                if session_cassandra is None: raise DatabaseInteractionError("Falha ao obter sessão Cassandra.")
-                filtros_cql_cass = {}
-                if filtros_crud_limpos.get("tipo"): filtros_cql_cass["tipo"] = filtros_crud_limpos["tipo"]
-                filtros_py_cass = {
-                    "titulo_contem": filtros_crud_limpos.get("titulo"), "tipo": filtros_crud_limpos.get("tipo"), 
-                    "ano_lancamento_min": filtros_crud_limpos.get("ano_min"),
-                    "generos_contem_todos": filtros_crud_limpos.get("generos"),
-                    "nota_min": filtros_crud_limpos.get("nota_min"), "duracao_min": filtros_crud_limpos.get("duracao_min"),
-                }
-                filtros_py_cass_limpos = {k:v for k,v in filtros_py_cass.items() if v is not None or k == "generos_contem_todos"}
-                dados_retornados_pelo_crud = funcao_crud_busca_avancada(
-                    session=session_cassandra, tabela="filmes",
-                    filtros_cql=filtros_cql_cass, filtros_python=filtros_py_cass_limpos,
-                    ordenar_por=filtros_crud_limpos["ordenar_por"], ordem=filtros_crud_limpos["ordem"],
-                    limite=filtros_crud_limpos["limite"], ano_corte_futuro_param=filtros_crud_limpos["ano_corte_futuro"]
-                )
-            elif nome_banco == "neo4j":
-                driver_neo4j = obter_conexao_ou_referencia_db()
-                if driver_neo4j is None: raise DatabaseInteractionError("Falha ao obter driver Neo4j.")
-                with driver_neo4j.session(database="neo4j") as session_neo:
-                    dados_retornados_pelo_crud = funcao_crud_busca_avancada(session_neo, **filtros_crud_limpos)
-            elif nome_banco == "redis":
-                r_client = obter_conexao_ou_referencia_db()
-                if r_client is None: raise DatabaseInteractionError("Falha ao obter cliente Redis.")
-                dados_retornados_pelo_crud = funcao_crud_busca_avancada(r_client, **filtros_crud_limpos)
-            else:
-                raise ValueError(f"Busca avançada não configurada para: {nome_banco}")
+            dados_retornados_pelo_crud = await _ler_com_cache(
+                nome_banco, "busca_avancada", parametros_cache,
+                lambda: _executar_leitura(nome_banco, "leitura", _executar_busca_avancada_sincrono, _executar_busca_avancada_async, nome_banco)
+            )
             resultados_por_banco[nome_banco] = {"data": dados_retornados_pelo_crud, "message": f"Busca avançada em {nome_banco.capitalize()} concluída."}
         except (ItemNotFoundError, DataValidationError, ValueError, DatabaseInteractionError) as e_domain:
             if banco_alvo.lower() == "todos":
@@ -148,22 +515,15 @@ async def servico_geral_busca_avancada_filmes(
                 raise HTTPException(status_code=(404 if isinstance(e_domain, ItemNotFoundError) else 400 if isinstance(e_domain, (DataValidationError, ValueError)) else 503),
                                     detail=f"({nome_banco.capitalize()}) {str(e_domain)}")
         except Exception as e_gen:
-            traceback.print_exc()
+            logger.exception("Erro inesperado na busca avançada em '%s'.", nome_banco)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco] = {"error": f"({nome_banco.capitalize()}) Falha inesperada: {str(e_gen)}", "data": []}
             else:
                 raise HTTPException(status_code=500, detail=f"({nome_banco.capitalize()}) Falha inesperada: {str(e_gen)}")
 
-    # ... (chamadas a executar_busca_avancada_especifica para cada banco) ...
-    if banco_alvo.lower() == "mongo" or banco_alvo.lower() == "todos":
-        await executar_busca_avancada_especifica("mongo", mongo_buscar_filmes_avancado, get_mongo_db)
-    if banco_alvo.lower() == "cassandra" or banco_alvo.lower() == "todos":
-        await executar_busca_avancada_especifica("cassandra", cassandra_buscar_filmes_avancado, get_cassandra_session)
-    if banco_alvo.lower() == "neo4j" or banco_alvo.lower() == "todos":
-        await executar_busca_avancada_especifica("neo4j", neo4j_buscar_filmes_avancado, get_neo4j_driver)
-    if banco_alvo.lower() == "redis" or banco_alvo.lower() == "todos":
-        await executar_busca_avancada_especifica("redis", redis_buscar_filmes_avancado, get_redis_client)
-
+    # Dispara a busca em todos os bancos do alvo ao mesmo tempo
+    await _executar_nos_bancos(_bancos_do_alvo(banco_alvo), executar_busca_avancada_especifica)
+    resultados_por_banco = _ordenar_por_banco(resultados_por_banco)
 
     # --- AJUSTE NO RETORNO PARA BANCO ÚNICO ---
     if banco_alvo.lower() != "todos":
@@ -186,16 +546,28 @@ async def servico_geral_busca_avancada_filmes(
             
     return resultados_por_banco # Para "todos", retorna o dicionário completo
 
+@operacao_medida("carregar_base")
 async def servico_geral_carregar_base(payload: CarregarBasePayload, banco_alvo: str) -> Dict[str, Any]:
     resultados_por_banco: Dict[str, Any] = {}
-    async def executar_carga(nome_banco: str, funcao_crud: callable, obter_conexao_driver_ou_session: callable):
-        try:
-            conexao_ou_db = obter_conexao_driver_ou_session() # Recebe DB, Session, Driver ou Client
-            if conexao_ou_db is None:
-                raise DatabaseInteractionError(f"Falha ao obter conexão/referência para o banco {nome_banco}")
+    cruds_carga = {
+        "mongo": (carregar_dados_mongo, get_mongo_db),
+        "cassandra": (cassandra_carregar_dados, get_cassandra_session),
+        "neo4j": (carregar_dados_neo4j, get_neo4j_driver),
+        "redis": (carregar_dados_redis, get_redis_client),
+    }
+
+    def _executar_carga_sincrono(nome_banco: str) -> Dict[str, Any]:
+        funcao_crud, obter_conexao_driver_ou_session = cruds_carga[nome_banco]
+        conexao_ou_db = obter_conexao_driver_ou_session() # Recebe DB, Session, Driver ou Client
+        if conexao_ou_db is None:
+            raise DatabaseInteractionError(f"Falha ao obter conexão/referência para o banco {nome_banco}")
+
+        # Os CRUDs de carga esperam a referência direta (db, session, driver, client)
+        return funcao_crud(conexao_ou_db, payload.filmes_path, payload.atores_path, payload.elenco_path)
 
-            # Os CRUDs de carga esperam a referência direta (db, session, driver, client)
-            resultado_crud = funcao_crud(conexao_ou_db, payload.filmes_path, payload.atores_path, payload.elenco_path)
+    async def executar_carga(nome_banco: str):
+        try:
+            resultado_crud = await _executar_escrita(nome_banco, "carga", _executar_carga_sincrono, nome_banco)
             resultados_por_banco[nome_banco] = resultado_crud 
         except (DataValidationError, ValueError) as e_val:
             if banco_alvo.lower() == "todos":
@@ -203,26 +575,20 @@ async def servico_geral_carregar_base(payload: CarregarBasePayload, banco_alvo:
             else:
                 raise HTTPException(status_code=400, detail=f"({nome_banco.capitalize()}) {str(e_val)}")
         except DatabaseInteractionError as e_db:
-            traceback.print_exc()
+            logger.exception("Erro de banco ao carregar dados em '%s'.", nome_banco)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco] = {"error": f"({nome_banco.capitalize()}) Erro de DB: {str(e_db)}", "status": "falha"}
             else:
                 raise HTTPException(status_code=503, detail=f"Serviço indisponível para {nome_banco.capitalize()} ao carregar dados: {str(e_db)}")
         except Exception as e_gen:
-            traceback.print_exc()
+            logger.exception("Erro inesperado ao carregar dados em '%s'.", nome_banco)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco] = {"error": f"({nome_banco.capitalize()}) Falha crítica: {str(e_gen)}", "status": "falha"}
             else:
                 raise HTTPException(status_code=500, detail=f"({nome_banco.capitalize()}) Falha crítica: {str(e_gen)}")
 
-    if banco_alvo.lower() == "mongo" or banco_alvo.lower() == "todos":
-        await executar_carga("mongo", carregar_dados_mongo, get_mongo_db)
-    if banco_alvo.lower() == "cassandra" or banco_alvo.lower() == "todos":
-        await executar_carga("cassandra", cassandra_carregar_dados, get_cassandra_session)
-    if banco_alvo.lower() == "neo4j" or banco_alvo.lower() == "todos":
-        await executar_carga("neo4j", carregar_dados_neo4j, get_neo4j_driver)
-    if banco_alvo.lower() == "redis" or banco_alvo.lower() == "todos":
-        await executar_carga("redis", carregar_dados_redis, get_redis_client)
+    await _executar_nos_bancos(_bancos_do_alvo(banco_alvo), executar_carga)
+    resultados_por_banco = _ordenar_por_banco(resultados_por_banco)
 
     if not resultados_por_banco and banco_alvo.lower() != "todos":
         raise HTTPException(status_code=400, detail=f"Nenhuma operação de carga realizada para '{banco_alvo}'.")
@@ -235,34 +601,39 @@ async def servico_geral_carregar_base(payload: CarregarBasePayload, banco_alvo:
         return resultado_especifico
     return resultados_por_banco
 
+@operacao_medida("inserir_filme")
 async def servico_geral_inserir_filme(filme_payload: FilmePayload, banco_alvo: str) -> Dict[str, Any]:
     resultados_por_banco: Dict[str, Any] = {}
     dados_filme_para_crud = filme_payload.model_dump(exclude_unset=True)
     if "titulo_id" in dados_filme_para_crud:
         dados_filme_para_crud["_id"] = dados_filme_para_crud["titulo_id"]
 
-    async def executar_insercao_filme(nome_banco: str, funcao_crud: callable, obter_conexao_ou_referencia_db: callable):
+    def _executar_insercao_sincrono(nome_banco: str) -> Dict[str, Any]:
+        doc_inserido = None
+        if nome_banco == "mongo":
+            db_mongo = get_mongo_db()
+            if db_mongo is None: raise DatabaseInteractionError("Falha ao obter db MongoDB.")
+            doc_inserido = mongo_inserir_filme(db_mongo["filmes"], dados_filme_para_crud)
+        elif nome_banco == "cassandra":
+            session_cassandra = get_cassandra_session()
+            if not session_cassandra: raise DatabaseInteractionError("Falha ao obter sessão Cassandra.")
+            doc_inserido = cassandra_inserir_filme(session_cassandra, dados_filme_para_crud)
+        elif nome_banco == "neo4j":
+            driver_neo4j = get_neo4j_driver()
+            if not driver_neo4j: raise DatabaseInteractionError("Falha ao obter driver Neo4j.")
+            with driver_neo4j.session(database="neo4j") as session_neo:
+                doc_inserido = neo4j_inserir_filme(session_neo, dados_filme_para_crud)
+        elif nome_banco == "redis":
+            r_client = get_redis_client()
+            if not r_client: raise DatabaseInteractionError("Falha ao obter cliente Redis.")
+            doc_inserido = redis_inserir_filme(r_client, dados_filme_para_crud)
+        else:
+            raise ValueError(f"Inserção de filme não configurada para: {nome_banco}")
+        return doc_inserido
+
+    async def executar_insercao_filme(nome_banco: str):
         try:
-            doc_inserido = None
-            if nome_banco == "mongo":
-                db_mongo = obter_conexao_ou_referencia_db()
-                if db_mongo is None: raise DatabaseInteractionError("Falha ao obter db MongoDB.")
-                doc_inserido = funcao_crud(db_mongo["filmes"], dados_filme_para_crud)
-            elif nome_banco == "cassandra":
-                session_cassandra = obter_conexao_ou_referencia_db()
-                if not session_cassandra: raise DatabaseInteractionError("Falha ao obter sessão Cassandra.")
-                doc_inserido = funcao_crud(session_cassandra, dados_filme_para_crud)
-            elif nome_banco == "neo4j":
-                driver_neo4j = obter_conexao_ou_referencia_db()
-                if not driver_neo4j: raise DatabaseInteractionError("Falha ao obter driver Neo4j.")
-                with driver_neo4j.session(database="neo4j") as session_neo:
-                    doc_inserido = funcao_crud(session_neo, dados_filme_para_crud)
-            elif nome_banco == "redis":
-                r_client = obter_conexao_ou_referencia_db()
-                if not r_client: raise DatabaseInteractionError("Falha ao obter cliente Redis.")
-                doc_inserido = funcao_crud(r_client, dados_filme_para_crud)
-            else:
-                raise ValueError(f"Inserção de filme não configurada para: {nome_banco}")
+            doc_inserido = await _executar_escrita(nome_banco, "escrita", _executar_insercao_sincrono, nome_banco)
             resultados_por_banco[nome_banco] = {"data": doc_inserido, "message": f"Filme inserido em {nome_banco.capitalize()}."}
         except ItemAlreadyExistsError as e_iae:
             if banco_alvo.lower() == "todos":
@@ -275,27 +646,21 @@ async def servico_geral_inserir_filme(filme_payload: FilmePayload, banco_alvo: s
             else:
                 raise HTTPException(status_code=400, detail=f"({nome_banco.capitalize()}) {str(e_dv)}")
         except DatabaseInteractionError as e_db:
-            traceback.print_exc()
+            logger.exception("Erro de banco ao inserir filme em '%s'.", nome_banco)
             if banco_alvo.lower() == "todos":
                  resultados_por_banco[nome_banco] = {"error": f"({nome_banco.capitalize()}) Erro de DB: {str(e_db)}", "data": None}
             else:
                 raise HTTPException(status_code=503, detail=f"Serviço indisponível para {nome_banco.capitalize()} ao inserir filme: {str(e_db)}")
         except Exception as e_gen:
-            traceback.print_exc()
+            logger.exception("Erro inesperado ao inserir filme em '%s'.", nome_banco)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco] = {"error": f"({nome_banco.capitalize()}) Falha: {str(e_gen)}", "data": None}
             else:
                 raise HTTPException(status_code=500, detail=f"({nome_banco.capitalize()}) Falha: {str(e_gen)}")
 
-    if banco_alvo.lower() == "mongo" or banco_alvo.lower() == "todos":
-        await executar_insercao_filme("mongo", mongo_inserir_filme, get_mongo_db)
-    if banco_alvo.lower() == "cassandra" or banco_alvo.lower() == "todos":
-        await executar_insercao_filme("cassandra", cassandra_inserir_filme, get_cassandra_session)
-    if banco_alvo.lower() == "neo4j" or banco_alvo.lower() == "todos":
-        await executar_insercao_filme("neo4j", neo4j_inserir_filme, get_neo4j_driver)
-    if banco_alvo.lower() == "redis" or banco_alvo.lower() == "todos":
-        await executar_insercao_filme("redis", redis_inserir_filme, get_redis_client)
-        
+    await _executar_nos_bancos(_bancos_do_alvo(banco_alvo), executar_insercao_filme)
+    resultados_por_banco = _ordenar_por_banco(resultados_por_banco)
+
     if not resultados_por_banco and banco_alvo.lower() != "todos":
          raise HTTPException(status_code=400, detail=f"Nenhuma operação de inserção realizada para '{banco_alvo}'.")
     if banco_alvo.lower() != "todos":
@@ -308,34 +673,137 @@ async def servico_geral_inserir_filme(filme_payload: FilmePayload, banco_alvo: s
         return resultado_especifico
     return resultados_por_banco
 
+@operacao_medida("inserir_filmes_em_lote")
+async def servico_inserir_filmes_em_lote(filmes_payload: List[FilmePayload], banco_alvo: str) -> Dict[str, Any]:
+    """
+    Insere vários filmes pelo caminho de escrita em lote de cada banco (insert_many no Mongo,
+    INSERTs preparados concorrentes no Cassandra, UNWIND no Neo4j, pipeline no Redis).
+    Cada banco devolve {"inseridos", "falhas", "itens"}, com um item por filme na ordem do
+    payload (status_code 201, 409, 400 ou 500); uma falha num filme não derruba o lote.
+    """
+    if not filmes_payload:
+        raise HTTPException(status_code=400, detail="Informe ao menos um filme em 'filmes'.")
+    if len(filmes_payload) > MAX_FILMES_POR_LOTE:
+        raise HTTPException(status_code=400, detail=f"No máximo {MAX_FILMES_POR_LOTE} filmes por lote ({len(filmes_payload)} recebidos).")
+
+    # Repetições dentro do próprio lote: a primeira ocorrência segue para os bancos, as demais voltam como 409
+    filmes_unicos: List[Dict[str, Any]] = []
+    posicao_unica: List[Optional[int]] = []
+    vistos: Dict[str, int] = {}
+    for filme_payload in filmes_payload:
+        dados_filme = filme_payload.model_dump(exclude_unset=True)
+        dados_filme["_id"] = dados_filme["titulo_id"]
+        if dados_filme["_id"] in vistos:
+            posicao_unica.append(None)
+            continue
+        vistos[dados_filme["_id"]] = len(filmes_unicos)
+        posicao_unica.append(len(filmes_unicos))
+        filmes_unicos.append(dados_filme)
+
+    resultados_por_banco: Dict[str, Any] = {}
+
+    def _executar_insercao_lote_sincrono(nome_banco: str) -> List[Dict[str, Any]]:
+        if nome_banco == "mongo":
+            db_mongo = get_mongo_db()
+            if db_mongo is None: raise DatabaseInteractionError("Falha ao obter db MongoDB.")
+            return mongo_inserir_filmes_em_lote(db_mongo["filmes"], filmes_unicos)
+        elif nome_banco == "cassandra":
+            session_cassandra = get_cassandra_session()
+            if not session_cassandra: raise DatabaseInteractionError("Falha ao obter sessão Cassandra.")
+            return cassandra_inserir_filmes_em_lote(session_cassandra, filmes_unicos)
+        elif nome_banco == "neo4j":
+            driver_neo4j = get_neo4j_driver()
+            if not driver_neo4j: raise DatabaseInteractionError("Falha ao obter driver Neo4j.")
+            with driver_neo4j.session(database="neo4j") as session_neo:
+                return neo4j_inserir_filmes_em_lote(session_neo, filmes_unicos)
+        elif nome_banco == "redis":
+            r_client = get_redis_client()
+            if not r_client: raise DatabaseInteractionError("Falha ao obter cliente Redis.")
+            return redis_inserir_filmes_em_lote(r_client, filmes_unicos)
+        raise ValueError(f"Inserção em lote não configurada para: {nome_banco}")
+
+    async def executar_insercao_lote(nome_banco: str):
+        try:
+            itens_unicos = await _executar_escrita(nome_banco, "carga", _executar_insercao_lote_sincrono, nome_banco)
+        except DatabaseInteractionError as e_db:
+            logger.exception("Erro de banco na inserção em lote em '%s'.", nome_banco)
+            if banco_alvo.lower() != "todos":
+                raise HTTPException(status_code=503, detail=f"Serviço indisponível para {nome_banco.capitalize()} ao inserir lote: {str(e_db)}")
+            resultados_por_banco[nome_banco] = {"error": f"({nome_banco.capitalize()}) Erro de DB: {str(e_db)}", "data": None}
+            return
+        except Exception as e_gen:
+            logger.exception("Erro inesperado na inserção em lote em '%s'.", nome_banco)
+            if banco_alvo.lower() != "todos":
+                raise HTTPException(status_code=500, detail=f"({nome_banco.capitalize()}) Falha: {str(e_gen)}")
+            resultados_por_banco[nome_banco] = {"error": f"({nome_banco.capitalize()}) Falha: {str(e_gen)}", "data": None}
+            return
+        itens = [
+            itens_unicos[posicao] if posicao is not None else item_duplicado(filme_payload.titulo_id)
+            for filme_payload, posicao in zip(filmes_payload, posicao_unica)
+        ]
+        inseridos = sum(1 for item in itens if item["status_code"] == 201)
+        resultados_por_banco[nome_banco] = {
+            "data": {"inseridos": inseridos, "falhas": len(itens) - inseridos, "itens": itens},
+            "message": f"{inseridos} de {len(itens)} filmes inseridos em {nome_banco.capitalize()}."
+        }
+
+    await _executar_nos_bancos(_resolver_bancos(banco_alvo, "inserção em lote"), executar_insercao_lote)
+    resultados_por_banco = _ordenar_por_banco(resultados_por_banco)
+    if banco_alvo.lower() != "todos":
+        return resultados_por_banco[banco_alvo.lower()]
+    return resultados_por_banco
+
 # --- FUNÇÕES DE CONSULTA/OPERAÇÃO ESPECÍFICAS (NÃO "GERAIS") ---
 # Estas permanecem como estão para operações em UM banco por vez,
 # pois os endpoints delas no generic_router.py não têm "todos" no enum.
 # Se precisarem suportar "todos", seguirão o padrão das funções de analytics abaixo.
 
-async def servico_buscar_detalhes_filme(id_filme: str, banco_alvo: str) -> Dict[str, Any]:
+@operacao_medida("detalhes_filme")
+async def servico_buscar_detalhes_filme(id_filme: str, banco_alvo: str, campos: Optional[List[str]] = None) -> Dict[str, Any]:
     banco_processado = banco_alvo.lower()
-    try:
-        filme_detalhes: Optional[Dict[str, Any]] = None # Tipagem explícita
+    if banco_processado == BANCO_MAIS_RAPIDO:
+        return await _servico_mais_rapido(lambda nome: servico_buscar_detalhes_filme(id_filme, nome, campos), "buscar detalhes")
+    if banco_processado == BANCO_AUTO:
+        return await _servico_auto(lambda nome: servico_buscar_detalhes_filme(id_filme, nome, campos), "buscar detalhes")
+
+    def _executar_busca_detalhes_sincrono() -> Optional[Dict[str, Any]]:
         if banco_processado == "mongo":
             db_mongo = get_mongo_db()
             if db_mongo is None: raise DatabaseInteractionError("Falha ao obter db MongoDB.")
-            filme_detalhes = mongo_buscar_filme_por_id(db_mongo["filmes"], id_filme=id_filme)
+            return mongo_buscar_filme_por_id(db_mongo["filmes"], id_filme=id_filme, campos=campos)
         elif banco_processado == "cassandra":
             session_cassandra = get_cassandra_session()
             if session_cassandra is None: raise DatabaseInteractionError("Falha ao obter sessão Cassandra.")
-            filme_detalhes = cassandra_buscar_filme_por_id(session_cassandra, titulo_id=id_filme)
+            return cassandra_buscar_filme_por_id(session_cassandra, titulo_id=id_filme, campos=campos)
         elif banco_processado == "neo4j":
             driver_neo4j = get_neo4j_driver()
             if driver_neo4j is None: raise DatabaseInteractionError("Falha ao obter driver Neo4j.")
             with driver_neo4j.session(database="neo4j") as session_neo:
-                filme_detalhes = neo4j_buscar_filme_por_id(session_neo, id_filme=id_filme)
+                return neo4j_buscar_filme_por_id(session_neo, id_filme=id_filme, campos=campos)
         elif banco_processado == "redis":
             r_client = get_redis_client()
             if r_client is None: raise DatabaseInteractionError("Falha ao obter cliente Redis.")
-            filme_detalhes = redis_buscar_filme_por_id(r_client, id_filme=id_filme)
-        else:
-            raise HTTPException(status_code=400, detail=f"Banco '{banco_alvo}' não suportado para buscar detalhes.")
+            return redis_buscar_filme_por_id(r_client, id_filme=id_filme, campos=campos)
+
+    async def _executar_busca_detalhes_async() -> Optional[Dict[str, Any]]:
+        if banco_processado == "mongo":
+            db_mongo = await get_mongo_db_async()
+            return await mongo_async_crud.buscar_filme_por_id(db_mongo["filmes"], id_filme=id_filme, campos=campos)
+        elif banco_processado == "cassandra":
+            return await cassandra_async_crud.buscar_filme_por_id(await get_cassandra_session_async(), titulo_id=id_filme, campos=campos)
+        elif banco_processado == "neo4j":
+            driver_neo4j = await get_neo4j_driver_async()
+            async with driver_neo4j.session(database="neo4j") as session_neo:
+                return await neo4j_async_crud.buscar_filme_por_id(session_neo, id_filme=id_filme, campos=campos)
+        elif banco_processado == "redis":
+            return await redis_async_crud.buscar_filme_por_id(await get_redis_client_async(), id_filme=id_filme, campos=campos)
+
+    if banco_processado not in BANCOS_SUPORTADOS:
+        raise HTTPException(status_code=400, detail=f"Banco '{banco_alvo}' não suportado para buscar detalhes.")
+    try:
+        filme_detalhes: Optional[Dict[str, Any]] = await _executar_leitura(
+            banco_processado, "leitura", _executar_busca_detalhes_sincrono, _executar_busca_detalhes_async
+        )
         
         if filme_detalhes is None: # Checagem explícita para None
             raise ItemNotFoundError(f"Filme ID '{id_filme}' não encontrado em {banco_alvo}.")
@@ -343,48 +811,120 @@ async def servico_buscar_detalhes_filme(id_filme: str, banco_alvo: str) -> Dict[
     except ItemNotFoundError as e: 
         raise HTTPException(status_code=404, detail=str(e))
     except DatabaseInteractionError as e_db: 
-        traceback.print_exc()
+        logger.exception("Erro de banco ao buscar detalhes do filme '%s' em '%s'.", id_filme, banco_alvo)
         raise HTTPException(status_code=503, detail=f"DB error em {banco_alvo} ao buscar detalhes: {str(e_db)}")
     except Exception as e_gen: 
-        traceback.print_exc()
+        logger.exception("Erro inesperado ao buscar detalhes do filme '%s' em '%s'.", id_filme, banco_alvo)
         raise HTTPException(status_code=500, detail=f"Erro interno em {banco_alvo} ao buscar detalhes: {str(e_gen)}")
 
-async def servico_buscar_atores_de_filme(id_filme: str, banco_alvo: str) -> List[Dict[str, Any]]:
+@operacao_medida("filmes_por_ids")
+async def servico_buscar_filmes_por_ids(ids_filmes: List[str], banco_alvo: str, campos: Optional[List[str]] = None) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Vários filmes de uma vez com a leitura em lote nativa de cada banco ($in, pipeline de
+    HGETALL, leituras preparadas concorrentes, UNWIND), em vez de uma chamada por filme.
+    Devolve na ordem dos ids pedidos (sem repetições); ids inexistentes são omitidos.
+    """
+    ids_unicos = list(dict.fromkeys(i.strip() for i in ids_filmes if i and i.strip()))
+    if not ids_unicos:
+        raise HTTPException(status_code=400, detail="Informe ao menos um ID de filme em 'ids'.")
+    if len(ids_unicos) > MAX_IDS_POR_BUSCA:
+        raise HTTPException(status_code=400, detail=f"No máximo {MAX_IDS_POR_BUSCA} IDs por busca ({len(ids_unicos)} recebidos).")
     banco_processado = banco_alvo.lower()
+    if banco_processado == BANCO_MAIS_RAPIDO:
+        return await _servico_mais_rapido(lambda nome: servico_buscar_filmes_por_ids(ids_unicos, nome, campos), "buscar filmes por ids")
+    if banco_processado == BANCO_AUTO:
+        return await _servico_auto(lambda nome: servico_buscar_filmes_por_ids(ids_unicos, nome, campos), "buscar filmes por ids")
+
+    def _executar_busca_por_ids_sincrono() -> List[Dict[str, Any]]:
+        if banco_processado == "mongo":
+            db_mongo = get_mongo_db()
+            if db_mongo is None: raise DatabaseInteractionError("Falha ao obter db MongoDB.")
+            return mongo_buscar_filmes_por_ids(db_mongo["filmes"], ids_unicos, campos=campos)
+        elif banco_processado == "cassandra":
+            session_cassandra = get_cassandra_session()
+            if session_cassandra is None: raise DatabaseInteractionError("Falha ao obter sessão Cassandra.")
+            return cassandra_buscar_filmes_por_ids(session_cassandra, ids_unicos, campos=campos)
+        elif banco_processado == "neo4j":
+            driver_neo4j = get_neo4j_driver()
+            if driver_neo4j is None: raise DatabaseInteractionError("Falha ao obter driver Neo4j.")
+            with driver_neo4j.session(database="neo4j") as session_neo:
+                return neo4j_buscar_filmes_por_ids(session_neo, ids_unicos, campos=campos)
+        elif banco_processado == "redis":
+            r_client = get_redis_client()
+            if r_client is None: raise DatabaseInteractionError("Falha ao obter cliente Redis.")
+            return redis_buscar_filmes_por_ids(r_client, ids_unicos, campos=campos)
+
+    async def _executar_busca_por_ids_async() -> List[Dict[str, Any]]:
+        if banco_processado == "mongo":
+            db_mongo = await get_mongo_db_async()
+            return await mongo_async_crud.buscar_filmes_por_ids(db_mongo["filmes"], ids_unicos, campos=campos)
+        elif banco_processado == "cassandra":
+            return await cassandra_async_crud.buscar_filmes_por_ids(await get_cassandra_session_async(), ids_unicos, campos=campos)
+        elif banco_processado == "neo4j":
+            driver_neo4j = await get_neo4j_driver_async()
+            async with driver_neo4j.session(database="neo4j") as session_neo:
+                return await neo4j_async_crud.buscar_filmes_por_ids(session_neo, ids_unicos, campos=campos)
+        elif banco_processado == "redis":
+            return await redis_async_crud.buscar_filmes_por_ids(await get_redis_client_async(), ids_unicos, campos=campos)
+
+    if banco_processado not in BANCOS_SUPORTADOS:
+        raise HTTPException(status_code=400, detail=f"Banco '{banco_alvo}' não suportado para buscar filmes por ids.")
     try:
-        atores: List[Dict[str, Any]] = []
+        return await _executar_leitura(
+            banco_processado, "leitura", _executar_busca_por_ids_sincrono, _executar_busca_por_ids_async
+        )
+    except DatabaseInteractionError as e_db:
+        logger.exception("Erro de banco ao buscar filmes por ids em '%s'.", banco_alvo)
+        raise HTTPException(status_code=503, detail=f"DB error em {banco_alvo} ao buscar filmes por ids: {str(e_db)}")
+    except Exception as e_gen:
+        logger.exception("Erro inesperado ao buscar filmes por ids em '%s'.", banco_alvo)
+        raise HTTPException(status_code=500, detail=f"Erro interno em {banco_alvo} ao buscar filmes por ids: {str(e_gen)}")
+
+@operacao_medida("atores_de_filme")
+async def servico_buscar_atores_de_filme(id_filme: str, banco_alvo: str) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    banco_processado = banco_alvo.lower()
+    if banco_processado == BANCO_MAIS_RAPIDO:
+        return await _servico_mais_rapido(lambda nome: servico_buscar_atores_de_filme(id_filme, nome), "buscar atores")
+    if banco_processado == BANCO_AUTO:
+        return await _servico_auto(lambda nome: servico_buscar_atores_de_filme(id_filme, nome), "buscar atores")
+
+    def _executar_busca_atores_sincrono() -> List[Dict[str, Any]]:
         if banco_processado == "mongo":
             db_mongo = get_mongo_db()
             if db_mongo is None: raise DatabaseInteractionError("Falha ao obter db MongoDB.")
-            atores = mongo_buscar_atores_por_filmes(db_mongo["filmes"], db_mongo["elenco"], db_mongo["atores"], id_filme)
+            return mongo_buscar_atores_por_filmes(db_mongo["filmes"], db_mongo["elenco"], db_mongo["atores"], id_filme)
         elif banco_processado == "cassandra":
             session_cassandra = get_cassandra_session()
             if session_cassandra is None: raise DatabaseInteractionError("Falha ao obter sessão Cassandra.")
-            atores = cassandra_buscar_atores_por_filmes(session_cassandra, id_filme=id_filme)
+            return cassandra_buscar_atores_por_filmes(session_cassandra, id_filme=id_filme)
         elif banco_processado == "neo4j":
             driver_neo4j = get_neo4j_driver()
             if driver_neo4j is None: raise DatabaseInteractionError("Falha ao obter driver Neo4j.")
             with driver_neo4j.session(database="neo4j") as session_neo:
-                atores = neo4j_buscar_atores_por_filmes(session_neo, id_filme=id_filme)
+                return neo4j_buscar_atores_por_filmes(session_neo, id_filme=id_filme)
         elif banco_processado == "redis":
             r_client = get_redis_client()
             if r_client is None: raise DatabaseInteractionError("Falha ao obter cliente Redis.")
-            atores = redis_buscar_atores_por_filmes(r_client, id_filme=id_filme)
-        else:
-            raise HTTPException(status_code=400, detail=f"Banco '{banco_alvo}' não suportado para buscar atores.")
+            return redis_buscar_atores_por_filmes(r_client, id_filme=id_filme)
+
+    if banco_processado not in BANCOS_SUPORTADOS:
+        raise HTTPException(status_code=400, detail=f"Banco '{banco_alvo}' não suportado para buscar atores.")
+    try:
+        atores: List[Dict[str, Any]] = await _executar_leitura(banco_processado, "leitura", _executar_busca_atores_sincrono, None)
         return atores
     except ItemNotFoundError as e: 
         raise HTTPException(status_code=404, detail=str(e)) 
     except DatabaseInteractionError as e_db: 
-        traceback.print_exc()
+        logger.exception("Erro de banco ao buscar atores do filme '%s' em '%s'.", id_filme, banco_alvo)
         raise HTTPException(status_code=503, detail=f"DB error em {banco_alvo} ao buscar atores: {str(e_db)}")
     except Exception as e_gen: 
-        traceback.print_exc()
+        logger.exception("Erro inesperado ao buscar atores do filme '%s' em '%s'.", id_filme, banco_alvo)
         raise HTTPException(status_code=500, detail=f"Erro interno em {banco_alvo} ao buscar atores: {str(e_gen)}")
 
 # src/services/query_service.py
 # ... (imports e outras funções como estão) ...
 
+@operacao_medida("atualizar_filme")
 async def servico_atualizar_filme(id_filme: str, update_payload: Dict[str, Any], banco_alvo: str) -> Dict[str, Any]:
     resultados_por_banco: Dict[str, Any] = {}
     campo = update_payload.get("campo")
@@ -425,38 +965,33 @@ async def servico_atualizar_filme(id_filme: str, update_payload: Dict[str, Any],
              raise ItemNotFoundError(f"Filme ID '{id_filme}' não encontrado ou falha ao obter após atualização em {nome_b_interno}.")
         return filme_atualizado_dict_interno
 
-    bancos_para_processar: List[str] = []
-    if banco_alvo.lower() == "todos":
-        bancos_para_processar = ["mongo", "cassandra", "neo4j", "redis"]
-    elif banco_alvo.lower() in ["mongo", "cassandra", "neo4j", "redis"]:
-        bancos_para_processar = [banco_alvo.lower()]
-    else:
-        raise HTTPException(status_code=400, detail=f"Banco '{banco_alvo}' não suportado para atualização.")
+    bancos_para_processar = _resolver_bancos(banco_alvo, "atualização")
 
-    for nome_banco_atual in bancos_para_processar:
+    async def _processar_banco(nome_banco_atual: str):
         try:
-            print(f"SERVICE DEBUG: Atualizando filme '{id_filme}' para o banco: {nome_banco_atual}")
-            filme_retornado_do_crud = _executar_atualizacao_sincrono(nome_banco_atual)
+            logger.debug("SERVICE DEBUG: Atualizando filme '%s' para o banco: %s", id_filme, nome_banco_atual)
+            filme_retornado_do_crud = await _executar_escrita(nome_banco_atual, "escrita", _executar_atualizacao_sincrono, nome_banco_atual)
             resultados_por_banco[nome_banco_atual] = {
                 "data": filme_retornado_do_crud, 
                 "message": f"Filme '{id_filme}' atualizado com sucesso em '{nome_banco_atual}'."
             }
         except (ItemNotFoundError, DataValidationError, DatabaseInteractionError) as e_crud:
-            print(f"SERVICE ERROR (CRUD) em '{nome_banco_atual}' para atualização do filme '{id_filme}': {e_crud}")
-            traceback.print_exc()
+            _logar_erro_servico(e_crud, "SERVICE ERROR (CRUD) em '%s' para atualização do filme '%s'", nome_banco_atual, id_filme)
             status_code_http = 404 if isinstance(e_crud, ItemNotFoundError) else 400 if isinstance(e_crud, DataValidationError) else 503
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco_atual] = {"error": str(e_crud), "status_code": status_code_http, "data": None}
             else:
                 raise HTTPException(status_code=status_code_http, detail=f"({nome_banco_atual.capitalize()}) {str(e_crud)}")
         except Exception as e_geral:
-            print(f"SERVICE ERROR (Geral) em '{nome_banco_atual}' para atualização do filme '{id_filme}': {e_geral}")
-            traceback.print_exc()
+            logger.exception("SERVICE ERROR (Geral) em '%s' para atualização do filme '%s': %s", nome_banco_atual, id_filme, e_geral)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco_atual] = {"error": f"Erro geral: {str(e_geral)}", "data": None}
             else:
                 raise HTTPException(status_code=500, detail=f"({nome_banco_atual.capitalize()}) Falha inesperada: {str(e_geral)}")
 
+    await _executar_nos_bancos(bancos_para_processar, _processar_banco)
+    resultados_por_banco = _ordenar_por_banco(resultados_por_banco)
+
     if not resultados_por_banco and banco_alvo.lower() != "todos":
         raise HTTPException(status_code=500, detail=f"Nenhuma operação de atualização concluída para '{banco_alvo}'.")
 
@@ -473,7 +1008,67 @@ async def servico_atualizar_filme(id_filme: str, update_payload: Dict[str, Any],
             
     return resultados_por_banco # Para "todos", retorna o dicionário completo
 
+@operacao_medida("atualizar_campos_filme")
+async def servico_atualizar_campos_filme(id_filme: str, atualizacoes: Dict[str, Any], banco_alvo: str) -> Dict[str, Any]:
+    """
+    Atualização parcial (PATCH) de vários campos de uma vez, atômica no filme em cada banco
+    (find_one_and_update, um único UPDATE, SET f += $props, pipeline MULTI/EXEC). O filme
+    atualizado volta da própria escrita, sem a releitura que servico_atualizar_filme faz.
+    Mesmo formato de retorno de servico_atualizar_filme.
+    """
+    try:
+        validar_campos_atualizacao(atualizacoes)
+    except DataValidationError as e_dv:
+        raise HTTPException(status_code=400, detail=str(e_dv))
+    resultados_por_banco: Dict[str, Any] = {}
+
+    def _executar_atualizacao_campos_sincrono(nome_banco: str) -> Dict[str, Any]:
+        if nome_banco == "mongo":
+            db_mongo = get_mongo_db()
+            if db_mongo is None: raise DatabaseInteractionError("Falha ao obter db MongoDB.")
+            return mongo_atualizar_campos_filme(db_mongo["filmes"], id_filme, atualizacoes)
+        elif nome_banco == "cassandra":
+            session_cassandra = get_cassandra_session()
+            if session_cassandra is None: raise DatabaseInteractionError("Falha ao obter sessão Cassandra.")
+            return cassandra_atualizar_campos_filme(session_cassandra, id_filme, atualizacoes)
+        elif nome_banco == "neo4j":
+            driver_neo4j = get_neo4j_driver()
+            if driver_neo4j is None: raise DatabaseInteractionError("Falha ao obter driver Neo4j.")
+            with driver_neo4j.session(database="neo4j") as session_neo:
+                return neo4j_atualizar_campos_filme(session_neo, id_filme, atualizacoes)
+        elif nome_banco == "redis":
+            r_client = get_redis_client()
+            if r_client is None: raise DatabaseInteractionError("Falha ao obter cliente Redis.")
+            return redis_atualizar_campos_filme(r_client, id_filme, atualizacoes)
+        raise ValueError(f"Atualização parcial não configurada para: {nome_banco}")
+
+    async def _processar_banco(nome_banco: str):
+        try:
+            filme_atualizado = await _executar_escrita(nome_banco, "escrita", _executar_atualizacao_campos_sincrono, nome_banco)
+            resultados_por_banco[nome_banco] = {
+                "data": filme_atualizado,
+                "message": f"Filme '{id_filme}' atualizado ({', '.join(atualizacoes)}) em '{nome_banco}'."
+            }
+        except (ItemNotFoundError, DataValidationError, DatabaseInteractionError) as e_crud:
+            _logar_erro_servico(e_crud, "Erro ao atualizar o filme '%s' em '%s'", id_filme, nome_banco)
+            status_code_http = 404 if isinstance(e_crud, ItemNotFoundError) else 400 if isinstance(e_crud, DataValidationError) else 503
+            if banco_alvo.lower() != "todos":
+                raise HTTPException(status_code=status_code_http, detail=f"({nome_banco.capitalize()}) {str(e_crud)}")
+            resultados_por_banco[nome_banco] = {"error": str(e_crud), "status_code": status_code_http, "data": None}
+        except Exception as e_geral:
+            logger.exception("Erro inesperado ao atualizar o filme '%s' em '%s'.", id_filme, nome_banco)
+            if banco_alvo.lower() != "todos":
+                raise HTTPException(status_code=500, detail=f"({nome_banco.capitalize()}) Falha inesperada: {str(e_geral)}")
+            resultados_por_banco[nome_banco] = {"error": f"Erro geral: {str(e_geral)}", "data": None}
+
+    await _executar_nos_bancos(_resolver_bancos(banco_alvo, "atualização"), _processar_banco)
+    resultados_por_banco = _ordenar_por_banco(resultados_por_banco)
+    if banco_alvo.lower() != "todos":
+        return resultados_por_banco[banco_alvo.lower()]
+    return resultados_por_banco
+
 # src/services/query_service.py
+@operacao_medida("remover_filme")
 async def servico_remover_filme(id_filme: str, banco_alvo: str) -> Dict[str, Any]:
     resultados_por_banco: Dict[str, Any] = {}
 
@@ -501,20 +1096,14 @@ async def servico_remover_filme(id_filme: str, banco_alvo: str) -> Dict[str, Any
             raise ValueError(f"Lógica de remoção não implementada para banco interno '{nome_b_interno}'.")
         # A checagem 'if not sucesso_crud:' foi removida daqui pois os CRUDs devem levantar exceção.
 
-    bancos_para_processar: List[str] = []
-    if banco_alvo.lower() == "todos":
-        bancos_para_processar = ["mongo", "cassandra", "neo4j", "redis"]
-    elif banco_alvo.lower() in ["mongo", "cassandra", "neo4j", "redis"]:
-        bancos_para_processar = [banco_alvo.lower()]
-    else:
-        raise HTTPException(status_code=400, detail=f"Banco '{banco_alvo}' não suportado para remoção.")
+    bancos_para_processar = _resolver_bancos(banco_alvo, "remoção")
 
-    for nome_banco_atual in bancos_para_processar:
+    async def _processar_banco(nome_banco_atual: str):
         try:
-            print(f"SERVICE DEBUG: Removendo filme '{id_filme}' do banco: {nome_banco_atual}")
+            logger.debug("SERVICE DEBUG: Removendo filme '%s' do banco: %s", id_filme, nome_banco_atual)
             # Se _executar_remocao_sincrono não levantar exceção, consideramos sucesso.
             # O valor de retorno booleano dela não é estritamente necessário aqui se ela sempre levanta erro em falha.
-            _executar_remocao_sincrono(nome_banco_atual, id_filme) 
+            await _executar_escrita(nome_banco_atual, "escrita", _executar_remocao_sincrono, nome_banco_atual, id_filme)
             
             # ---- ESTA É A PARTE CRUCIAL PARA O RETORNO ----
             resultados_por_banco[nome_banco_atual] = {
@@ -522,25 +1111,26 @@ async def servico_remover_filme(id_filme: str, banco_alvo: str) -> Dict[str, Any
                 "status": "sucesso"  # <<<< Certifique-se que "status": "sucesso" está aqui!
             }
         except ItemNotFoundError as e_infe:
-            print(f"SERVICE INFO (ItemNotFound) em '{nome_banco_atual}' para remoção do filme '{id_filme}': {e_infe}")
+            logger.info("SERVICE INFO (ItemNotFound) em '%s' para remoção do filme '%s': %s", nome_banco_atual, id_filme, e_infe)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco_atual] = {"error": str(e_infe), "status_code_interno": 404, "message": f"Filme '{id_filme}' não encontrado em {nome_banco_atual}."}
             else: 
                 raise HTTPException(status_code=404, detail=f"({nome_banco_atual.capitalize()}) {str(e_infe)}")
         except (DatabaseInteractionError, ValueError) as e_db_val: 
-            print(f"SERVICE ERROR (DB/Value) em '{nome_banco_atual}' para remoção do filme '{id_filme}': {e_db_val}")
-            # traceback.print_exc() # Descomente para debug se necessário
+            _logar_erro_servico(e_db_val, "SERVICE ERROR (DB/Value) em '%s' para remoção do filme '%s'", nome_banco_atual, id_filme)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco_atual] = {"error": str(e_db_val), "status_code_interno": 503, "message": f"Erro de DB/Valor em {nome_banco_atual}."}
             else:
                 raise HTTPException(status_code=503, detail=f"({nome_banco_atual.capitalize()}) {str(e_db_val)}")
         except Exception as e_geral:
-            print(f"SERVICE ERROR (Geral) em '{nome_banco_atual}' para remoção do filme '{id_filme}': {e_geral}")
-            # traceback.print_exc() # Descomente para debug se necessário
+            logger.exception("SERVICE ERROR (Geral) em '%s' para remoção do filme '%s': %s", nome_banco_atual, id_filme, e_geral)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco_atual] = {"error": f"Erro geral: {str(e_geral)}", "message": f"Erro geral em {nome_banco_atual}."}
             else:
                 raise HTTPException(status_code=500, detail=f"({nome_banco_atual.capitalize()}) Falha inesperada: {str(e_geral)}")
+
+    await _executar_nos_bancos(bancos_para_processar, _processar_banco)
+    resultados_por_banco = _ordenar_por_banco(resultados_por_banco)
     
     if not resultados_por_banco and banco_alvo.lower() != "todos":
         raise HTTPException(status_code=500, detail=f"Nenhuma operação de remoção foi concluída para '{banco_alvo}'.")
@@ -552,15 +1142,150 @@ async def servico_remover_filme(id_filme: str, banco_alvo: str) -> Dict[str, Any
                 raise HTTPException(status_code=resultado_especifico.get("status_code_interno", 500), detail=resultado_especifico["error"])
             
             # Certifique-se que o resultado_especifico tem a chave "status" aqui.
-            print(f"DEBUG SERVICE (Remover Filme - Banco Único): Retornando para endpoint: {resultado_especifico}") # DEBUG
+            logger.debug("DEBUG SERVICE (Remover Filme - Banco Único): Retornando para endpoint: %s", resultado_especifico)
             return resultado_especifico # Deve ser {"message": "...", "status": "sucesso"}
         else: 
              raise HTTPException(status_code=404, detail=f"Resultado para remoção no banco '{banco_alvo}' não encontrado ou erro anterior.")
             
     return resultados_por_banco
 
+# --- Atualização/remoção em massa pelos filtros da busca avançada ---
+
+_CHAVES_FILTRO_EM_MASSA = ("titulo", "tipo", "ano_min", "generos", "nota_min", "duracao_min")
+
+def _filtros_em_massa(filtros: FiltrosBuscaAvancadaPayload) -> Dict[str, Any]:
+    """
+    Filtros da busca avançada (sem ordenação, limite nem projeção) para os CRUDs *_por_filtro.
+    Sem nenhum filtro a operação atingiria a base inteira: isso é recusado com 400.
+    """
+    filtros_crud = _filtros_crud_busca_avancada(filtros)
+    filtro = {chave: filtros_crud.get(chave) for chave in _CHAVES_FILTRO_EM_MASSA}
+    if all(valor is None or valor == [] for valor in filtro.values()):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Informe ao menos um filtro ({', '.join(_CHAVES_FILTRO_EM_MASSA)}); sem filtro a operação atingiria todos os filmes."
+        )
+    filtro["ano_corte_futuro"] = filtros_crud["ano_corte_futuro"]
+    return filtro
+
+async def _executar_em_massa(
+    banco_alvo: str,
+    descricao_operacao: str,
+    executar_sincrono: Callable[[str], int],
+    chave_total: str
+) -> Dict[str, Any]:
+    """Roda a escrita em massa em cada banco (prazo de carga) e devolve a quantidade afetada por banco."""
+    resultados_por_banco: Dict[str, Any] = {}
+
+    async def _processar_banco(nome_banco: str):
+        try:
+            total = await _executar_escrita(nome_banco, "carga", executar_sincrono, nome_banco)
+        except Exception as e:
+            erro_http = _erro_http_do_banco(nome_banco, e)
+            if banco_alvo.lower() != "todos":
+                raise erro_http
+            resultados_por_banco[nome_banco] = {"error": erro_http.detail, "status_code": erro_http.status_code, "data": None}
+            return
+        resultados_por_banco[nome_banco] = {
+            "data": {chave_total: total},
+            "message": f"{total} filmes {chave_total} em {nome_banco.capitalize()}."
+        }
+
+    await _executar_nos_bancos(_resolver_bancos(banco_alvo, descricao_operacao), _processar_banco)
+    resultados_por_banco = _ordenar_por_banco(resultados_por_banco)
+    if banco_alvo.lower() != "todos":
+        return resultados_por_banco[banco_alvo.lower()]
+    return resultados_por_banco
+
+@operacao_medida("atualizar_por_filtro")
+async def servico_atualizar_filmes_por_filtro(
+    filtros: FiltrosBuscaAvancadaPayload, atualizacoes: Dict[str, Any], banco_alvo: str
+) -> Dict[str, Any]:
+    """
+    Aplica a mesma atualização parcial a todos os filmes que casam com os filtros da busca
+    avançada (sem limite), com uma escrita nativa por banco em vez de um PUT por filme:
+    update_many no Mongo, MATCH ... SET em transações em lote no Neo4j, pipelines MULTI/EXEC
+    com a manutenção dos índices no Redis e UPDATEs por partição concorrentes no Cassandra.
+    """
+    filtro = _filtros_em_massa(filtros)
+    try:
+        validar_campos_atualizacao(atualizacoes)
+    except DataValidationError as e_dv:
+        raise HTTPException(status_code=400, detail=str(e_dv))
+
+    def _executar_atualizacao_em_massa_sincrono(nome_banco: str) -> int:
+        if nome_banco == "mongo":
+            db_mongo = get_mongo_db()
+            if db_mongo is None: raise DatabaseInteractionError("Falha ao obter db MongoDB.")
+            return mongo_atualizar_filmes_por_filtro(db_mongo["filmes"], atualizacoes, **filtro)
+        elif nome_banco == "cassandra":
+            session_cassandra = get_cassandra_session()
+            if session_cassandra is None: raise DatabaseInteractionError("Falha ao obter sessão Cassandra.")
+            return cassandra_atualizar_filmes_por_filtro(session_cassandra, atualizacoes, **filtro)
+        elif nome_banco == "neo4j":
+            driver_neo4j = get_neo4j_driver()
+            if driver_neo4j is None: raise DatabaseInteractionError("Falha ao obter driver Neo4j.")
+            with driver_neo4j.session(database="neo4j") as session_neo:
+                return neo4j_atualizar_filmes_por_filtro(session_neo, atualizacoes, **filtro)
+        elif nome_banco == "redis":
+            r_client = get_redis_client()
+            if r_client is None: raise DatabaseInteractionError("Falha ao obter cliente Redis.")
+            return redis_atualizar_filmes_por_filtro(r_client, atualizacoes, **filtro)
+        raise ValueError(f"Atualização por filtro não configurada para: {nome_banco}")
+
+    return await _executar_em_massa(
+        banco_alvo, "atualização por filtro", _executar_atualizacao_em_massa_sincrono, "atualizados"
+    )
+
+@operacao_medida("remover_por_filtro")
+async def servico_remover_filmes_por_filtro(filtros: FiltrosBuscaAvancadaPayload, banco_alvo: str) -> Dict[str, Any]:
+    """
+    Remove todos os filmes que casam com os filtros da busca avançada (sem limite): delete_many
+    no Mongo, MATCH ... DETACH DELETE em transações em lote no Neo4j, pipelines com a limpeza
+    de índices e elenco no Redis e DELETEs por partição concorrentes no Cassandra.
+    """
+    filtro = _filtros_em_massa(filtros)
+
+    def _executar_remocao_em_massa_sincrono(nome_banco: str) -> int:
+        if nome_banco == "mongo":
+            db_mongo = get_mongo_db()
+            if db_mongo is None: raise DatabaseInteractionError("Falha ao obter db MongoDB.")
+            return mongo_remover_filmes_por_filtro(db_mongo["filmes"], **filtro)
+        elif nome_banco == "cassandra":
+            session_cassandra = get_cassandra_session()
+            if session_cassandra is None: raise DatabaseInteractionError("Falha ao obter sessão Cassandra.")
+            return cassandra_remover_filmes_por_filtro(session_cassandra, **filtro)
+        elif nome_banco == "neo4j":
+            driver_neo4j = get_neo4j_driver()
+            if driver_neo4j is None: raise DatabaseInteractionError("Falha ao obter driver Neo4j.")
+            with driver_neo4j.session(database="neo4j") as session_neo:
+                return neo4j_remover_filmes_por_filtro(session_neo, **filtro)
+        elif nome_banco == "redis":
+            r_client = get_redis_client()
+            if r_client is None: raise DatabaseInteractionError("Falha ao obter cliente Redis.")
+            return redis_remover_filmes_por_filtro(r_client, **filtro)
+        raise ValueError(f"Remoção por filtro não configurada para: {nome_banco}")
+
+    return await _executar_em_massa(
+        banco_alvo, "remoção por filtro", _executar_remocao_em_massa_sincrono, "removidos"
+    )
+
+
+@operacao_medida("filmes_por_ator")
+async def servico_listar_filmes_por_ator(
+    identificador_ator: str, banco_alvo: str, ordenar_por: str, ordem: int, limite: int, campos: Optional[List[str]] = None
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]: # Tipo de retorno ajustado
+    if banco_alvo.lower() == BANCO_MAIS_RAPIDO:
+        return await _servico_mais_rapido(
+            lambda nome: servico_listar_filmes_por_ator(identificador_ator, nome, ordenar_por, ordem, limite, campos),
+            "listar filmes por ator"
+        )
+    if banco_alvo.lower() == BANCO_AUTO:
+        return await _servico_auto(
+            lambda nome: servico_listar_filmes_por_ator(identificador_ator, nome, ordenar_por, ordem, limite, campos),
+            "listar filmes por ator"
+        )
 
-async def servico_listar_filmes_por_ator(identificador_ator: str, banco_alvo: str, ordenar_por: str, ordem: int, limite: int) -> Union[List[Dict[str, Any]], Dict[str, Any]]: # Tipo de retorno ajustado
     resultados_por_banco: Dict[str, Any] = {}
 
     # Sub-função síncrona para executar a busca em um banco
@@ -569,64 +1294,56 @@ async def servico_listar_filmes_por_ator(identificador_ator: str, banco_alvo: st
         if nome_b_interno == "mongo":
             db_mongo = get_mongo_db()
             if db_mongo is None: raise DatabaseInteractionError(f"({nome_b_interno}) Falha ao obter db MongoDB.")
-            filmes_lista = mongo_buscar_filmes_por_ator(db_mongo["filmes"], db_mongo["elenco"], db_mongo["atores"], identificador_ator, ordenar_por, ordem, limite)
+            filmes_lista = mongo_buscar_filmes_por_ator(
+                db_mongo["filmes"], db_mongo["elenco"], db_mongo["atores"], identificador_ator, ordenar_por, ordem, limite, campos=campos
+            )
         elif nome_b_interno == "cassandra":
             session_cassandra = get_cassandra_session()
             if session_cassandra is None: raise DatabaseInteractionError(f"({nome_b_interno}) Falha ao obter sessão Cassandra.")
-            filmes_lista = cassandra_buscar_filmes_por_ator(session_cassandra, identificador_ator=identificador_ator, ordenar_por=ordenar_por, ordem=ordem, limite=limite)
+            filmes_lista = cassandra_buscar_filmes_por_ator(session_cassandra, identificador_ator=identificador_ator, ordenar_por=ordenar_por, ordem=ordem, limite=limite, campos=campos)
         elif nome_b_interno == "neo4j":
             driver_neo4j = get_neo4j_driver()
             if driver_neo4j is None: raise DatabaseInteractionError(f"({nome_b_interno}) Falha ao obter driver Neo4j.")
             with driver_neo4j.session(database="neo4j") as session_neo:
-                filmes_lista = neo4j_buscar_filmes_por_ator(session_neo, id_ator=identificador_ator, ordenar_por=ordenar_por, ordem=ordem, limite=limite)
+                filmes_lista = neo4j_buscar_filmes_por_ator(session_neo, id_ator=identificador_ator, ordenar_por=ordenar_por, ordem=ordem, limite=limite, campos=campos)
         elif nome_b_interno == "redis":
             r_client = get_redis_client()
             if r_client is None: raise DatabaseInteractionError(f"({nome_b_interno}) Falha ao obter cliente Redis.")
-            filmes_lista = redis_buscar_filmes_por_ator(r_client, id_ator=identificador_ator, ordenar_por=ordenar_por, ordem=ordem, limite=limite)
+            filmes_lista = redis_buscar_filmes_por_ator(r_client, id_ator=identificador_ator, ordenar_por=ordenar_por, ordem=ordem, limite=limite, campos=campos)
         else:
             raise ValueError(f"Busca de filmes por ator não implementada para banco interno '{nome_b_interno}'.")
         return filmes_lista # Retorna a lista de filmes ou [] se o ator não for encontrado (ItemNotFoundError é tratado abaixo)
 
-    bancos_para_processar: List[str] = []
-    if banco_alvo.lower() == "todos":
-        bancos_para_processar = ["mongo", "cassandra", "neo4j", "redis"]
-    elif banco_alvo.lower() in ["mongo", "cassandra", "neo4j", "redis"]:
-        bancos_para_processar = [banco_alvo.lower()]
-    else:
-        raise HTTPException(status_code=400, detail=f"Banco '{banco_alvo}' não suportado para listar filmes por ator.")
-
-    if not bancos_para_processar:
-        raise HTTPException(status_code=400, detail=f"Nenhum banco válido para processar com alvo: '{banco_alvo}'.")
+    bancos_para_processar = _resolver_bancos(banco_alvo, "listar filmes por ator")
 
-    for nome_banco_atual in bancos_para_processar:
+    async def _processar_banco(nome_banco_atual: str):
         try:
-            print(f"SERVICE DEBUG: Listando filmes por ator '{identificador_ator}' para o banco: {nome_banco_atual}")
-            lista_filmes_do_banco = _executar_busca_sincrono(nome_banco_atual)
+            logger.debug("SERVICE DEBUG: Listando filmes por ator '%s' para o banco: %s", identificador_ator, nome_banco_atual)
+            lista_filmes_do_banco = await _executar_leitura(nome_banco_atual, "leitura", _executar_busca_sincrono, None, nome_banco_atual)
             resultados_por_banco[nome_banco_atual] = {
                 "data": lista_filmes_do_banco, 
                 "message": f"Filmes por ator para '{nome_banco_atual}' processados."
             }
         except ItemNotFoundError as e_infe: # Se o CRUD levantar ItemNotFoundError (ator não encontrado)
-            print(f"SERVICE INFO (ItemNotFound) em '{nome_banco_atual}' para listar filmes do ator '{identificador_ator}': {e_infe}")
-            if banco_alvo.lower() == "todos":
-                resultados_por_banco[nome_banco_atual] = {"data": [], "message": f"Ator '{identificador_ator}' não encontrado ou sem filmes em {nome_banco_atual}."}
-            else: # Se for um banco específico, retorna lista vazia como antes
-                return [] 
+            logger.info("SERVICE INFO (ItemNotFound) em '%s' para listar filmes do ator '%s': %s", nome_banco_atual, identificador_ator, e_infe)
+            # Também no banco específico o resultado é uma lista vazia, como antes
+            resultados_por_banco[nome_banco_atual] = {"data": [], "message": f"Ator '{identificador_ator}' não encontrado ou sem filmes em {nome_banco_atual}."}
         except (DatabaseInteractionError, ValueError) as e_db_val:
-            print(f"SERVICE ERROR (DB/Value) em '{nome_banco_atual}' para listar filmes por ator: {e_db_val}")
-            traceback.print_exc()
+            _logar_erro_servico(e_db_val, "SERVICE ERROR (DB/Value) em '%s' para listar filmes por ator", nome_banco_atual)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco_atual] = {"error": str(e_db_val), "data": []}
             else:
                 raise HTTPException(status_code=503, detail=f"({nome_banco_atual.capitalize()}) {str(e_db_val)}")
         except Exception as e_geral:
-            print(f"SERVICE ERROR (Geral) em '{nome_banco_atual}' para listar filmes por ator: {e_geral}")
-            traceback.print_exc()
+            logger.exception("SERVICE ERROR (Geral) em '%s' para listar filmes por ator: %s", nome_banco_atual, e_geral)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco_atual] = {"error": f"Erro geral: {str(e_geral)}", "data": []}
             else:
                 raise HTTPException(status_code=500, detail=f"({nome_banco_atual.capitalize()}) Falha inesperada: {str(e_geral)}")
 
+    await _executar_nos_bancos(bancos_para_processar, _processar_banco)
+    resultados_por_banco = _ordenar_por_banco(resultados_por_banco)
+
     if not resultados_por_banco and banco_alvo.lower() != "todos":
         raise HTTPException(status_code=500, detail=f"Nenhuma operação de listar filmes por ator foi concluída para '{banco_alvo}'.")
 
@@ -641,8 +1358,293 @@ async def servico_listar_filmes_por_ator(identificador_ator: str, banco_alvo: st
             
     return resultados_por_banco # Para "todos", retorna o dicionário completo
 
+# --- Streaming (NDJSON) de listas grandes de filmes ---
+
+def _erro_http_do_banco(nome_banco: str, erro: Exception) -> HTTPException:
+    """Converte o erro de um banco no HTTPException equivalente ao das rotas não-streaming."""
+    if isinstance(erro, HTTPException):
+        return erro
+    if isinstance(erro, ItemNotFoundError):
+        status = 404
+    elif isinstance(erro, (DataValidationError, ValueError)):
+        status = 400
+    elif isinstance(erro, DatabaseInteractionError):
+        status = 503
+    else:
+        logger.error("Erro inesperado em '%s'.", nome_banco, exc_info=erro)
+        status = 500
+    return HTTPException(status_code=status, detail=f"({nome_banco.capitalize()}) {str(erro)}")
+
+def _banco_unico(banco_alvo: str, descricao_operacao: str, recurso: str) -> str:
+    """
+    Streaming e paginação por cursor trabalham sobre um único banco (o cursor é a posição
+    dentro dele); "todos", "mais_rapido" e "auto" seguem pelo JSON normal.
+    """
+    bancos = _resolver_bancos(banco_alvo, descricao_operacao)
+    if len(bancos) != 1:
+        raise HTTPException(status_code=400, detail=f"{recurso} de {descricao_operacao} disponível apenas para um banco específico.")
+    return bancos[0]
+
+async def _abrir_transmissao(nome_banco: str, criar_gerador: Callable[[], Iterator[Dict[str, Any]]]) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Consome o gerador síncrono do CRUD em lotes de TAMANHO_LOTE_STREAMING, cada lote no executor
+    do banco e sob o prazo/disjuntor de leitura. O primeiro lote é lido aqui, antes de a resposta
+    começar, para que erros do banco ainda virem o status HTTP correto; depois disso os lotes são
+    lidos conforme o cliente consome, sem materializar o resultado inteiro.
+    """
+    gerador: Optional[Iterator[Dict[str, Any]]] = None
+    operacao = operacao_atual() # Os lotes seguintes são lidos depois que o servico_* já retornou
+
+    def _proximo_lote() -> List[Dict[str, Any]]:
+        nonlocal gerador
+        if gerador is None:
+            gerador = criar_gerador()
+        return list(itertools.islice(gerador, TAMANHO_LOTE_STREAMING))
+
+    async def _ler_lote() -> List[Dict[str, Any]]:
+        with na_operacao(operacao):
+            return await _executar_protegido(nome_banco, "leitura", lambda: executar_bloqueante(nome_banco, _proximo_lote))
+
+    async def _fechar():
+        if gerador is None:
+            return
+        try:
+            # Fecha cursor/sessão do driver na thread do banco
+            await executar_bloqueante(nome_banco, gerador.close)
+        except ValueError:
+            pass # Lote anterior ainda rodando na thread (prazo estourado): o gerador é fechado quando for coletado
+
+    try:
+        primeiro_lote = await _ler_lote()
+    except Exception as e:
+        await _fechar()
+        raise _erro_http_do_banco(nome_banco, e) from e
+
+    async def _lotes() -> AsyncIterator[List[Dict[str, Any]]]:
+        try:
+            lote = primeiro_lote
+            while lote:
+                yield lote
+                if len(lote) < TAMANHO_LOTE_STREAMING:
+                    break
+                lote = await _ler_lote()
+        finally:
+            await _fechar()
+
+    return _lotes()
+
+@operacao_medida("busca_avancada_streaming")
+async def servico_transmitir_busca_avancada(
+    filtros: FiltrosBuscaAvancadaPayload, banco_alvo: str, campos: Optional[List[str]] = None
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Busca avançada em streaming: devolve um iterador assíncrono de lotes de filmes de um banco."""
+    nome_banco = _banco_unico(banco_alvo, "busca avançada", "Streaming (application/x-ndjson)")
+    filtros_crud_limpos = _filtros_crud_busca_avancada(filtros, campos)
+
+    def _criar_gerador() -> Iterator[Dict[str, Any]]:
+        if nome_banco == "mongo":
+            return mongo_iterar_filmes_avancado(get_mongo_db()["filmes"], **filtros_crud_limpos, tamanho_lote=TAMANHO_LOTE_STREAMING)
+        elif nome_banco == "cassandra":
+            return cassandra_iterar_filmes_avancado(
+                get_cassandra_session(), **_argumentos_busca_cassandra(filtros_crud_limpos), tamanho_lote=TAMANHO_LOTE_STREAMING
+            )
+        elif nome_banco == "neo4j":
+            return neo4j_iterar_filmes_avancado(get_neo4j_driver(), **filtros_crud_limpos, tamanho_lote=TAMANHO_LOTE_STREAMING)
+        return redis_iterar_filmes_avancado(get_redis_client(), **filtros_crud_limpos, tamanho_lote=TAMANHO_LOTE_STREAMING)
+
+    return await _abrir_transmissao(nome_banco, _criar_gerador)
+
+@operacao_medida("filmes_por_ator_streaming")
+async def servico_transmitir_filmes_por_ator(
+    identificador_ator: str, banco_alvo: str, ordenar_por: str, ordem: int, limite: int, campos: Optional[List[str]] = None
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Filmes de um ator em streaming. Mongo e Neo4j leem o cursor/resultado em lotes; no Cassandra
+    (IN de até 100 títulos) e no Redis (um SET por ator) a lista já é pequena e vem do CRUD normal.
+    """
+    nome_banco = _banco_unico(banco_alvo, "listar filmes por ator", "Streaming (application/x-ndjson)")
+
+    def _lista_do_crud(buscar: Callable[[], List[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+        # Como em servico_listar_filmes_por_ator, ator não encontrado é lista vazia
+        try:
+            return iter(buscar())
+        except ItemNotFoundError:
+            return iter(())
+
+    def _criar_gerador() -> Iterator[Dict[str, Any]]:
+        if nome_banco == "mongo":
+            db_mongo = get_mongo_db()
+            return mongo_iterar_filmes_por_ator(
+                db_mongo["filmes"], db_mongo["elenco"], db_mongo["atores"], identificador_ator,
+                ordenar_por, ordem, limite, tamanho_lote=TAMANHO_LOTE_STREAMING, campos=campos
+            )
+        elif nome_banco == "cassandra":
+            return _lista_do_crud(lambda: cassandra_buscar_filmes_por_ator(
+                get_cassandra_session(), identificador_ator=identificador_ator, ordenar_por=ordenar_por, ordem=ordem, limite=limite,
+                campos=campos
+            ))
+        elif nome_banco == "neo4j":
+            return neo4j_iterar_filmes_por_ator(
+                get_neo4j_driver(), id_ator=identificador_ator, ordenar_por=ordenar_por, ordem=ordem, limite=limite,
+                tamanho_lote=TAMANHO_LOTE_STREAMING, campos=campos
+            )
+        return _lista_do_crud(lambda: redis_buscar_filmes_por_ator(
+            get_redis_client(), id_ator=identificador_ator, ordenar_por=ordenar_por, ordem=ordem, limite=limite, campos=campos
+        ))
+
+    return await _abrir_transmissao(nome_banco, _criar_gerador)
+
+# --- Entrega progressiva do modo "todos" (Server-Sent Events) ---
+
+def servico_transmitir_por_banco(
+    banco_alvo: str,
+    descricao_operacao: str,
+    servico_no_banco: Callable[[str], Awaitable[Any]]
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Dispara servico_no_banco(nome) (o próprio serviço em modo banco único) em paralelo nos
+    bancos do alvo e entrega o resultado de cada um assim que ele termina, em vez de esperar
+    o mais lento como no modo "todos". Cada item: {"banco", "status_code", "duracao_ms"}
+    mais "data" ou "error". Banco inválido levanta 400 já aqui, antes de a resposta começar.
+    """
+    bancos = _resolver_bancos(banco_alvo, descricao_operacao)
+
+    async def _executar(nome_banco: str) -> Dict[str, Any]:
+        inicio = time.perf_counter()
+        try:
+            resultado = {"banco": nome_banco, "status_code": 200, "data": await servico_no_banco(nome_banco)}
+        except Exception as e:
+            erro_http = _erro_http_do_banco(nome_banco, e)
+            resultado = {"banco": nome_banco, "status_code": erro_http.status_code, "error": erro_http.detail}
+        resultado["duracao_ms"] = round((time.perf_counter() - inicio) * 1000, 3)
+        return resultado
+
+    async def _resultados() -> AsyncIterator[Dict[str, Any]]:
+        tarefas = [asyncio.ensure_future(_executar(nome)) for nome in bancos]
+        try:
+            for proxima in asyncio.as_completed(tarefas):
+                yield await proxima
+        finally:
+            # Cliente desconectou no meio: não deixa consultas órfãs rodando
+            for tarefa in tarefas:
+                if not tarefa.done():
+                    tarefa.cancel()
+
+    return _resultados()
+
+# --- Paginação por cursor (keyset) ---
+
+async def _ler_pagina(
+    nome_banco: str,
+    operacao: str,
+    parametros: Dict[str, Any],
+    cursor: Optional[str],
+    ler_pagina_sincrono: Callable[[Optional[Dict[str, Any]]], Any],
+    ordenacao: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Decodifica o cursor, lê a página no executor do banco (prazo/disjuntor de leitura) e
+    devolve {"data": filmes, "proximo_cursor": token ou None, "ordenacao": ordem real das
+    páginas}. As páginas não passam pelo cache: cada uma custa só o tamanho da página no banco.
+    """
+    assinatura = assinatura_consulta(nome_banco, operacao, parametros)
+    try:
+        apos = decodificar_cursor(cursor, assinatura)
+        filmes, proxima_posicao = await _executar_leitura(nome_banco, "leitura", ler_pagina_sincrono, None, apos)
+    except Exception as e:
+        raise _erro_http_do_banco(nome_banco, e) from e
+    return {
+        "data": filmes,
+        "proximo_cursor": codificar_cursor(assinatura, proxima_posicao) if proxima_posicao is not None else None,
+        "ordenacao": ordenacao
+    }
+
+def _ordenacao_pagina(nome_banco: str, ordenar_por: str, ordem: int, campo_cassandra: str) -> Dict[str, Any]:
+    """Ordem em que as páginas saem: o Cassandra pagina pela chave (ordenar_por não se aplica)."""
+    if nome_banco == "cassandra":
+        return {"campo": campo_cassandra, "ordem": 1, "ordenar_por_aplicado": False}
+    return {"campo": ordenar_por, "ordem": ordem, "ordenar_por_aplicado": True}
+
+@operacao_medida("busca_avancada_paginada")
+async def servico_paginar_busca_avancada(
+    filtros: FiltrosBuscaAvancadaPayload, banco_alvo: str, tamanho_pagina: Optional[int], cursor: Optional[str],
+    campos: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Uma página da busca avançada em um banco. Mongo e Neo4j continuam depois do (valor, _id)
+    do último filme; o Cassandra usa o paging_state (sem ordenação por campo, o que a resposta
+    informa em "ordenacao") e o Redis a posição no ZSET de ordenação do campo.
+    """
+    nome_banco = _banco_unico(banco_alvo, "busca avançada", "Paginação por cursor")
+    tamanho_pagina = tamanho_pagina or TAMANHO_PAGINA_PADRAO
+    filtros_crud_limpos = _filtros_crud_busca_avancada(filtros, campos)
+    filtros_pagina = {k: v for k, v in filtros_crud_limpos.items() if k != "limite"}
+    # A projeção não muda a posição: o mesmo cursor vale para outros `campos`
+    parametros = {
+        **{k: v for k, v in filtros_pagina.items() if k != "campos"},
+        "generos": sorted(filtros_pagina["generos"]), "tamanho_pagina": tamanho_pagina
+    }
+
+    def _ler_pagina_sincrono(apos: Optional[Dict[str, Any]]):
+        if nome_banco == "mongo":
+            return mongo_paginar_filmes_avancado(get_mongo_db()["filmes"], **filtros_pagina, tamanho_pagina=tamanho_pagina, apos=apos)
+        elif nome_banco == "cassandra":
+            argumentos = _argumentos_busca_cassandra(filtros_crud_limpos)
+            return cassandra_paginar_filmes_avancado(
+                get_cassandra_session(), tabela=argumentos["tabela"],
+                filtros_cql=argumentos["filtros_cql"], filtros_python=argumentos["filtros_python"],
+                ano_corte_futuro_param=argumentos["ano_corte_futuro_param"], tamanho_pagina=tamanho_pagina, apos=apos,
+                campos=argumentos["campos"]
+            )
+        elif nome_banco == "neo4j":
+            with get_neo4j_driver().session(database="neo4j") as session_neo:
+                return neo4j_paginar_filmes_avancado(session_neo, **filtros_pagina, tamanho_pagina=tamanho_pagina, apos=apos)
+        return redis_paginar_filmes_avancado(get_redis_client(), **filtros_pagina, tamanho_pagina=tamanho_pagina, apos=apos)
+
+    ordenacao = _ordenacao_pagina(nome_banco, filtros_pagina["ordenar_por"], filtros_pagina["ordem"], "token(titulo_id)")
+    return await _ler_pagina(nome_banco, "busca_avancada", parametros, cursor, _ler_pagina_sincrono, ordenacao)
+
+@operacao_medida("filmes_por_ator_paginado")
+async def servico_paginar_filmes_por_ator(
+    identificador_ator: str, banco_alvo: str, ordenar_por: str, ordem: int,
+    tamanho_pagina: Optional[int], cursor: Optional[str], campos: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Uma página dos filmes de um ator em um banco (mesmo formato de servico_paginar_busca_avancada)."""
+    nome_banco = _banco_unico(banco_alvo, "listar filmes por ator", "Paginação por cursor")
+    tamanho_pagina = tamanho_pagina or TAMANHO_PAGINA_PADRAO
+    parametros = {"ator": identificador_ator, "ordenar_por": ordenar_por, "ordem": ordem, "tamanho_pagina": tamanho_pagina}
+
+    def _ler_pagina_sincrono(apos: Optional[Dict[str, Any]]):
+        if nome_banco == "mongo":
+            db_mongo = get_mongo_db()
+            return mongo_paginar_filmes_por_ator(
+                db_mongo["filmes"], db_mongo["elenco"], db_mongo["atores"], identificador_ator,
+                ordenar_por, ordem, tamanho_pagina=tamanho_pagina, apos=apos, campos=campos
+            )
+        elif nome_banco == "cassandra":
+            return cassandra_paginar_filmes_por_ator(
+                get_cassandra_session(), identificador_ator=identificador_ator, tamanho_pagina=tamanho_pagina, apos=apos,
+                campos=campos
+            )
+        elif nome_banco == "neo4j":
+            with get_neo4j_driver().session(database="neo4j") as session_neo:
+                return neo4j_paginar_filmes_por_ator(
+                    session_neo, id_ator=identificador_ator, ordenar_por=ordenar_por, ordem=ordem,
+                    tamanho_pagina=tamanho_pagina, apos=apos, campos=campos
+                )
+        return redis_paginar_filmes_por_ator(
+            get_redis_client(), id_ator=identificador_ator, ordenar_por=ordenar_por, ordem=ordem,
+            tamanho_pagina=tamanho_pagina, apos=apos, campos=campos
+        )
+
+    ordenacao = _ordenacao_pagina(nome_banco, ordenar_por, ordem, "titulo_id")
+    return await _ler_pagina(nome_banco, "filmes_por_ator", parametros, cursor, _ler_pagina_sincrono, ordenacao)
+
 # --- FUNÇÕES DE ANÁLISE (MODIFICADAS PARA LIDAR COM "todos") ---
+@operacao_medida("contagem_por_ano")
 async def servico_contar_filmes_por_ano(banco_alvo: str) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    if banco_alvo.lower() == BANCO_AUTO:
+        return await _servico_auto(servico_contar_filmes_por_ano, "contagem")
     resultados_por_banco: Dict[str, Any] = {}
 
     def _executar_contagem_sincrono(nome_b_interno: str) -> List[Dict[str, Any]]:
@@ -666,36 +1668,49 @@ async def servico_contar_filmes_por_ano(banco_alvo: str) -> Union[List[Dict[str,
         else:
             raise ValueError(f"Contagem por ano não implementada para banco interno '{nome_b_interno}'.")
 
-    bancos_para_processar: List[str] = []
-    if banco_alvo.lower() == "todos":
-        bancos_para_processar = ["mongo", "cassandra", "neo4j", "redis"]
-    elif banco_alvo.lower() in ["mongo", "cassandra", "neo4j", "redis"]:
-        bancos_para_processar = [banco_alvo.lower()]
-    else:
-        raise HTTPException(status_code=400, detail=f"Banco '{banco_alvo}' não suportado para contagem.")
+    async def _executar_contagem_async(nome_b_interno: str) -> List[Dict[str, Any]]:
+        if nome_b_interno == "mongo":
+            db_mongo = await get_mongo_db_async()
+            return await mongo_async_crud.contar_filmes_por_ano(db_mongo["filmes"])
+        elif nome_b_interno == "cassandra":
+            return await cassandra_async_crud.contar_filmes_por_ano(await get_cassandra_session_async())
+        elif nome_b_interno == "neo4j":
+            driver_neo4j = await get_neo4j_driver_async()
+            async with driver_neo4j.session(database="neo4j") as session_neo:
+                return await neo4j_async_crud.contagem_por_ano(session_neo)
+        elif nome_b_interno == "redis":
+            return await redis_async_crud.contagem_por_ano(await get_redis_client_async())
+        else:
+            raise ValueError(f"Contagem por ano não implementada para banco interno '{nome_b_interno}'.")
 
-    for nome_banco_atual in bancos_para_processar:
+    bancos_para_processar = _resolver_bancos(banco_alvo, "contagem")
+
+    async def _processar_banco(nome_banco_atual: str):
         try:
-            print(f"SERVICE DEBUG: Contando filmes por ano para o banco: {nome_banco_atual}")
-            resultado_banco_especifico = _executar_contagem_sincrono(nome_banco_atual)
+            logger.debug("SERVICE DEBUG: Contando filmes por ano para o banco: %s", nome_banco_atual)
+            resultado_banco_especifico = await _ler_com_cache(
+                nome_banco_atual, "contagem_por_ano", {},
+                lambda: _executar_leitura(nome_banco_atual, "analytics", _executar_contagem_sincrono, _executar_contagem_async, nome_banco_atual)
+            )
             resultados_por_banco[nome_banco_atual] = {
                 "data": resultado_banco_especifico, 
                 "message": f"Contagem de filmes por ano para '{nome_banco_atual}' processada."
             }
         except DatabaseInteractionError as e_db_interact:
-            print(f"SERVICE ERROR (DB Interaction) em '{nome_banco_atual}' para contagem: {e_db_interact}")
-            traceback.print_exc()
+            logger.exception("SERVICE ERROR (DB Interaction) em '%s' para contagem: %s", nome_banco_atual, e_db_interact)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco_atual] = {"error": f"Erro de DB: {str(e_db_interact)}", "data": []}
             else:
                 raise HTTPException(status_code=503, detail=f"({nome_banco_atual.capitalize()}) Erro de DB: {str(e_db_interact)}")
         except Exception as e_geral:
-            print(f"SERVICE ERROR (Geral) em '{nome_banco_atual}' para contagem: {e_geral}")
-            traceback.print_exc()
+            logger.exception("SERVICE ERROR (Geral) em '%s' para contagem: %s", nome_banco_atual, e_geral)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco_atual] = {"error": f"Erro geral: {str(e_geral)}", "data": []}
             else:
                 raise HTTPException(status_code=500, detail=f"({nome_banco_atual.capitalize()}) Falha inesperada: {str(e_geral)}")
+
+    await _executar_nos_bancos(bancos_para_processar, _processar_banco)
+    resultados_por_banco = _ordenar_por_banco(resultados_por_banco)
     
     if not resultados_por_banco and banco_alvo.lower() != "todos": # Adicionado if banco_alvo != "todos"
         raise HTTPException(status_code=500, detail=f"Nenhuma operação de contagem foi concluída para '{banco_alvo}'.")
@@ -711,7 +1726,10 @@ async def servico_contar_filmes_por_ano(banco_alvo: str) -> Union[List[Dict[str,
             
     return resultados_por_banco
 
+@operacao_medida("media_notas_por_genero")
 async def servico_media_notas_por_genero(banco_alvo: str) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    if banco_alvo.lower() == BANCO_AUTO:
+        return await _servico_auto(servico_media_notas_por_genero, "média de notas")
     resultados_por_banco: Dict[str, Any] = {}
 
     def _executar_media_para_banco_sincrono(nome_b_interno_sync: str) -> List[Dict[str, Any]]:
@@ -734,40 +1752,50 @@ async def servico_media_notas_por_genero(banco_alvo: str) -> Union[List[Dict[str
             return redis_media_notas_por_genero(r_client)
         else:
             raise ValueError(f"Lógica interna para média de notas para banco síncrono '{nome_b_interno_sync}' não implementada.")
-    
-    bancos_para_processar: List[str] = []
-    if banco_alvo.lower() == "todos":
-        bancos_para_processar = ["mongo", "cassandra", "neo4j", "redis"]
-    elif banco_alvo.lower() in ["mongo", "cassandra", "neo4j", "redis"]:
-        bancos_para_processar = [banco_alvo.lower()]
-    else:
-        raise HTTPException(status_code=400, detail=f"Banco '{banco_alvo}' não suportado para média de notas.")
 
-    if not bancos_para_processar: 
-        raise HTTPException(status_code=400, detail=f"Nenhum banco válido para processar média de notas com alvo: '{banco_alvo}'.")
+    async def _executar_media_para_banco_async(nome_b_interno: str) -> List[Dict[str, Any]]:
+        if nome_b_interno == "mongo":
+            db_mongo = await get_mongo_db_async()
+            return await mongo_async_crud.media_notas_por_genero(db_mongo["filmes"])
+        elif nome_b_interno == "cassandra":
+            return await cassandra_async_crud.media_notas_por_genero(await get_cassandra_session_async())
+        elif nome_b_interno == "neo4j":
+            driver_neo4j = await get_neo4j_driver_async()
+            async with driver_neo4j.session(database="neo4j") as session_neo:
+                return await neo4j_async_crud.media_notas_por_genero(session_neo)
+        elif nome_b_interno == "redis":
+            return await redis_async_crud.media_notas_por_genero(await get_redis_client_async())
+        else:
+            raise ValueError(f"Média de notas (async) não implementada para banco '{nome_b_interno}'.")
+    
+    bancos_para_processar = _resolver_bancos(banco_alvo, "média de notas")
 
-    for nome_banco in bancos_para_processar:
+    async def _processar_banco(nome_banco: str):
         try:
-            print(f"SERVICE DEBUG: Calculando média de notas por gênero para o banco: {nome_banco}")
-            resultado_do_banco = _executar_media_para_banco_sincrono(nome_banco)
+            logger.debug("SERVICE DEBUG: Calculando média de notas por gênero para o banco: %s", nome_banco)
+            resultado_do_banco = await _ler_com_cache(
+                nome_banco, "media_notas_por_genero", {},
+                lambda: _executar_leitura(nome_banco, "analytics", _executar_media_para_banco_sincrono, _executar_media_para_banco_async, nome_banco)
+            )
             resultados_por_banco[nome_banco] = {
                 "data": resultado_do_banco, 
                 "message": f"Média de notas por gênero para '{nome_banco}' processada com sucesso."
             }
         except DatabaseInteractionError as e_db_interact:
-            print(f"SERVICE ERROR (DB Interaction) em '{nome_banco}' para média de notas: {e_db_interact}")
-            traceback.print_exc()
+            logger.exception("SERVICE ERROR (DB Interaction) em '%s' para média de notas: %s", nome_banco, e_db_interact)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco] = {"error": f"Erro de interação com DB: {str(e_db_interact)}", "data": []}
             else:
                 raise HTTPException(status_code=503, detail=f"({nome_banco.capitalize()}) Erro de DB: {str(e_db_interact)}")
         except Exception as e_geral:
-            print(f"SERVICE ERROR (Geral) em '{nome_banco}' para média de notas: {e_geral}")
-            traceback.print_exc()
+            logger.exception("SERVICE ERROR (Geral) em '%s' para média de notas: %s", nome_banco, e_geral)
             if banco_alvo.lower() == "todos":
                 resultados_por_banco[nome_banco] = {"error": f"Erro geral no processamento: {str(e_geral)}", "data": []}
             else:
                 raise HTTPException(status_code=500, detail=f"({nome_banco.capitalize()}) Falha inesperada no servidor: {str(e_geral)}")
+
+    await _executar_nos_bancos(bancos_para_processar, _processar_banco)
+    resultados_por_banco = _ordenar_por_banco(resultados_por_banco)
     
     if not resultados_por_banco and banco_alvo.lower() != "todos": # Adicionado if banco_alvo != "todos"
         raise HTTPException(status_code=500, detail="Nenhuma operação de média de notas foi concluída com sucesso.")
@@ -781,4 +1809,29 @@ async def servico_media_notas_por_genero(banco_alvo: str) -> Union[List[Dict[str
         else:
              raise HTTPException(status_code=404, detail=f"Resultado para o banco '{banco_alvo}' não encontrado para média de notas.")
             
-    return resultados_por_banco
\ No newline at end of file
+    return resultados_por_banco
+
+# --- CACHE DE RESULTADOS ---
+
+def servico_estatisticas_cache() -> Dict[str, Any]:
+    """Hits/misses do cache de resultados de leitura e contadores da coalescência de leituras."""
+    return {**cache_resultados.estatisticas(), "coalescencia": execucao_unica.estatisticas()}
+
+def servico_versao_dados(banco_alvo: str) -> Optional[str]:
+    """
+    Versão dos dados lidos com banco_alvo ("mongo:3", ou a de cada banco no modo "todos"):
+    a geração do cache, que toda escrita em _executar_escrita incrementa. None para
+    mais_rapido e auto (o banco que responde varia) e para banco inválido.
+    """
+    bancos = _bancos_do_alvo(banco_alvo)
+    if not bancos:
+        return None
+    return ",".join(f"{nome}:{cache_resultados.geracao(nome)}" for nome in bancos)
+
+def servico_estado_roteamento() -> Dict[str, Any]:
+    """Janelas de latência e escolhas do banco=auto por operação e banco."""
+    return roteador_latencia.estado()
+
+def servico_estado_disjuntores() -> Dict[str, Any]:
+    """Estado do disjuntor de cada banco (fechado, aberto ou meio_aberto) e o último erro registrado."""
+    return {nome: disjuntores[nome].resumo() for nome in BANCOS_SUPORTADOS}
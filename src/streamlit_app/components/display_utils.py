@@ -5,7 +5,7 @@ import os
 import plotly.express as px
 from typing import Dict, Any, List, Union # Adicione Union aqui
 from PIL import Image # Certifique-se que Pillow está instalado
-from .navigation import paginar_resultados # Supondo que navigation.py está em components
+from .navigation import paginar_resultados, paginar_por_cursor # Supondo que navigation.py está em components
 from config.settings import BANCOS_SUPORTADOS # Importa o mapeamento de bancos
 # src/streamlit_app/components/display_utils.py
 
@@ -128,7 +128,8 @@ def exibir_lista_de_filmes(
     resultados_por_linha: int = 3,
     # Adicione estes parâmetros para saber de onde estamos vindo
     pagina_atual_path_para_voltar: str = "paginas/busca_avancada.py", # Default
-    pagina_atual_label_para_voltar: str = "Busca Avançada" # Default
+    pagina_atual_label_para_voltar: str = "Busca Avançada", # Default
+    paginar_localmente: bool = True # False quando a lista já é uma página devolvida pela API (cursor)
 ): 
     banco_nome_amigavel = BANCOS_SUPORTADOS.get(banco_chave_selecionada, banco_chave_selecionada.capitalize())
     
@@ -140,7 +141,7 @@ def exibir_lista_de_filmes(
     st.markdown(f"### Resultados em {banco_nome_amigavel}")
 
     chave_paginacao = f"paginacao_{banco_nome_amigavel.replace(' ', '_').lower()}"
-    filmes_paginados = paginar_resultados(lista_filmes, tamanho_pagina=9, chave=chave_paginacao)
+    filmes_paginados = paginar_resultados(lista_filmes, tamanho_pagina=9, chave=chave_paginacao) if paginar_localmente else lista_filmes
 
     num_cols = resultados_por_linha
     
@@ -269,6 +270,40 @@ def processar_e_exibir_resposta_simples_api(resposta_api: dict, nome_banco_amiga
         st.info(f"{operacao} processada. Resposta do servidor:")
         st.json(resposta_api)
 
+def exibir_pagina_de_filmes(
+    resposta_api: dict,
+    banco_nome_key: str,
+    chave_cursores: str,
+    pagina_atual_path_para_voltar: str = "paginas/busca_avancada.py",
+    pagina_atual_label_para_voltar: str = "Busca Avançada"
+):
+    """
+    Exibe uma página devolvida pela API paginada ({"data": [...], "proximo_cursor": ...})
+    e os botões Anterior/Próxima, que trocam o cursor no topo de st.session_state[chave_cursores].
+    """
+    if isinstance(resposta_api, dict) and "error" in resposta_api:
+        st.error(f"Falha ao buscar dados: {resposta_api['error']} (Status: {resposta_api.get('status_code', 'N/A')})")
+        return
+
+    filmes_com_origem = []
+    for filme in resposta_api.get("data", []):
+        if isinstance(filme, dict):
+            filme_copy = filme.copy()
+            filme_copy['banco_origem'] = banco_nome_key
+            filmes_com_origem.append(filme_copy)
+
+    ordenacao = resposta_api.get("ordenacao") or {}
+    if ordenacao and not ordenacao.get("ordenar_por_aplicado", True):
+        st.caption(f"ℹ️ Este banco pagina na ordem de `{ordenacao.get('campo')}`; a ordenação escolhida não se aplica.")
+    exibir_lista_de_filmes(
+        filmes_com_origem,
+        banco_nome_key,
+        pagina_atual_path_para_voltar=pagina_atual_path_para_voltar,
+        pagina_atual_label_para_voltar=pagina_atual_label_para_voltar,
+        paginar_localmente=False
+    )
+    paginar_por_cursor(resposta_api.get("proximo_cursor"), chave=chave_cursores)
+
 def processar_e_exibir_resultados_api(
     resposta_api: Any, # Alterado para Any para permitir lista ou dict
     banco_nome_key: str = "mongo",
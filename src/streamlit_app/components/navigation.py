@@ -28,4 +28,25 @@ def paginar_resultados(lista, tamanho_pagina=10, chave="pagina_resultado"):
             st.session_state[chave] = pagina_atual + 1
             st.rerun()
 
-    return lista[inicio:fim]
\ No newline at end of file
+    return lista[inicio:fim]
+
+# Paginação feita no servidor (cursor opaco devolvido pela API)
+def paginar_por_cursor(proximo_cursor, chave="cursores_resultado"):
+    """
+    Botões Anterior/Próxima para resultados paginados pela API.
+    st.session_state[chave] é a pilha de cursores das páginas visitadas; o último é o da página atual
+    (None para a primeira). Quem chama busca de novo a página quando o topo da pilha muda.
+    """
+    pilha = st.session_state.setdefault(chave, [None])
+
+    st.markdown(f"📄 Página {len(pilha)}")
+
+    col1, col2, col3 = st.columns([1, 6, 1])
+    with col1:
+        if st.button("⬅️ Anterior", key=f"{chave}_anterior", disabled=len(pilha) == 1):
+            pilha.pop()
+            st.rerun()
+    with col3:
+        if st.button("Próxima ➡️", key=f"{chave}_proxima", disabled=not proximo_cursor):
+            pilha.append(proximo_cursor)
+            st.rerun()
\ No newline at end of file
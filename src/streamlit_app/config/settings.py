@@ -46,6 +46,12 @@ CAMPOS_ORDENACAO_FILMES = {
 }
 
 # Mapeamento de bancos para exibição, se necessário
+# Tamanho da página pedida à API quando a busca é num único banco (paginação por cursor no servidor)
+TAMANHO_PAGINA_RESULTADOS = 9
+# Campos pedidos à API nas listas de filmes (parâmetro `campos`): os cards não mostram a sinopse,
+# que só é buscada na página de detalhes
+CAMPOS_LISTAGEM_FILMES = "titulo,tipo,ano_lancamento,generos,nota,numero_votos,duracao"
+
 BANCOS_SUPORTADOS = {
     "mongo": "MongoDB",
     "cassandra": "Cassandra",
@@ -1,9 +1,9 @@
 # src/streamlit_app/paginas/busca_avancada.py
 import streamlit as st
 from components.ui_elements import formulario_busca_avancada, seletor_de_banco_global_sidebar
-from components.display_utils import processar_e_exibir_resultados_api
+from components.display_utils import processar_e_exibir_resultados_api, exibir_pagina_de_filmes
 from services.operation_handlers import realizar_busca_avancada
-from config.settings import BANCOS_SUPORTADOS # Importa o mapeamento de bancos
+from config.settings import BANCOS_SUPORTADOS, TAMANHO_PAGINA_RESULTADOS # Importa o mapeamento de bancos
 
 # --- LÓGICA DE NAVEGAÇÃO NO TOPO DA PÁGINA ---
 if st.session_state.get("navegar_para_detalhes"):
@@ -40,15 +40,41 @@ if filtros_da_ui:
     placeholder_resultados = st.empty() # Cria um placeholder para os resultados
     
     st.session_state.banco_em_uso_na_pagina_busca = banco_chave_selecionada # Para display na página atual
-    with st.spinner(f"Buscando filmes em '{nome_amigavel_banco}'... Por favor, aguarde."):
-        # Chama o operation_handler, que por sua vez chama o api_service
-        resposta_do_backend = realizar_busca_avancada(
-            filtros_da_ui=filtros_da_ui,
-            banco_selecionado=banco_chave_selecionada
-        )
+
+    if banco_chave_selecionada != "todos":
+        # Banco único: a API pagina por cursor; as páginas são buscadas abaixo, uma de cada vez
+        st.session_state['busca_avancada_paginada'] = {"filtros": filtros_da_ui, "banco": banco_chave_selecionada}
+        st.session_state['cursores_busca_avancada'] = [None]
+        st.session_state.pop('pagina_api_busca_avancada', None)
+        st.session_state.pop('ultima_resposta_api_busca_avancada', None)
+    else:
+        st.session_state.pop('busca_avancada_paginada', None)
+        with st.spinner(f"Buscando filmes em '{nome_amigavel_banco}'... Por favor, aguarde."):
+            # Chama o operation_handler, que por sua vez chama o api_service
+            resposta_do_backend = realizar_busca_avancada(
+                filtros_da_ui=filtros_da_ui,
+                banco_selecionado=banco_chave_selecionada
+            )
         
-        # Guarda a resposta completa no session_state para debug ou re-exibição
-        st.session_state['ultima_resposta_api_busca_avancada'] = resposta_do_backend
+            # Guarda a resposta completa no session_state para debug ou re-exibição
+            st.session_state['ultima_resposta_api_busca_avancada'] = resposta_do_backend
+
+# Busca paginada (banco único): só vai à API quando o cursor da página atual muda
+if 'busca_avancada_paginada' in st.session_state:
+    busca_paginada = st.session_state['busca_avancada_paginada']
+    cursor_atual = st.session_state.setdefault('cursores_busca_avancada', [None])[-1]
+    pagina_em_cache = st.session_state.get('pagina_api_busca_avancada')
+    if pagina_em_cache is None or pagina_em_cache["cursor"] != cursor_atual:
+        with st.spinner(f"Buscando filmes em '{BANCOS_SUPORTADOS.get(busca_paginada['banco'])}'..."):
+            resposta_pagina = realizar_busca_avancada(
+                filtros_da_ui=busca_paginada["filtros"],
+                banco_selecionado=busca_paginada["banco"],
+                tamanho_pagina=TAMANHO_PAGINA_RESULTADOS,
+                cursor=cursor_atual
+            )
+        pagina_em_cache = {"cursor": cursor_atual, "resposta": resposta_pagina}
+        st.session_state['pagina_api_busca_avancada'] = pagina_em_cache
+    exibir_pagina_de_filmes(pagina_em_cache["resposta"], busca_paginada["banco"], chave_cursores='cursores_busca_avancada')
 
 # Exibe os resultados da última busca (se houver)
 # Isso permite que os resultados persistam mesmo se houver um rerun por outro motivo
@@ -65,6 +91,8 @@ st.markdown("---")
 if st.button("Limpar Resultados da Busca"):
     if 'ultima_resposta_api_busca_avancada' in st.session_state:
         del st.session_state['ultima_resposta_api_busca_avancada']
+    for chave in ('busca_avancada_paginada', 'pagina_api_busca_avancada', 'cursores_busca_avancada'):
+        st.session_state.pop(chave, None)
     if 'form_busca_avancada_principal' in st.session_state: # Limpa o form também, se precisar
         # Você pode querer resetar os campos do form aqui
         pass
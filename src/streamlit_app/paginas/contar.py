@@ -2,7 +2,7 @@
 import streamlit as st
 from components.ui_elements import seletor_de_banco_global_sidebar
 from components.display_utils import exibir_grafico_contagem_por_ano
-from services.operation_handlers import handle_contar_filmes_por_ano_operacao
+from services.operation_handlers import handle_contar_filmes_por_ano_operacao, handle_contar_filmes_por_ano_progressivo
 from config.settings import BANCOS_SUPORTADOS
 
 st.set_page_config(layout="wide", page_title="Contagem de Filmes por Ano")
@@ -16,15 +16,26 @@ nome_banco_amigavel = BANCOS_SUPORTADOS.get(banco_global_atual_chave, banco_glob
 
 # --- BOTÃO E LÓGICA DE BUSCA (AQUI ESTÁ A MUDANÇA) ---
 if st.button("📊 Gerar Gráfico de Contagem"):
-    with st.spinner(f"Calculando contagem em '{nome_banco_amigavel}'..."):
-        resposta = handle_contar_filmes_por_ano_operacao(
-            banco_selecionado=banco_global_atual_chave
+    if banco_global_atual_chave == "todos":
+        # Em "todos" cada banco é desenhado assim que termina (SSE), sem esperar o mais lento
+        resposta = handle_contar_filmes_por_ano_progressivo(
+            lambda resposta_parcial: exibir_grafico_contagem_por_ano(resposta_parcial, "todos")
         )
-        # Em vez de guardar só a resposta, guardamos um "contexto" completo
         st.session_state['contexto_ultima_contagem'] = {
-            "dados_api": resposta, 
-            "banco_chave_usado": banco_global_atual_chave # "Carimba" o resultado com o banco usado
+            "dados_api": resposta,
+            "banco_chave_usado": "todos",
+            "ja_exibido": "error" not in resposta # Sem erro, os gráficos já estão na tela nesta execução
         }
+    else:
+        with st.spinner(f"Calculando contagem em '{nome_banco_amigavel}'..."):
+            resposta = handle_contar_filmes_por_ano_operacao(
+                banco_selecionado=banco_global_atual_chave
+            )
+            # Em vez de guardar só a resposta, guardamos um "contexto" completo
+            st.session_state['contexto_ultima_contagem'] = {
+                "dados_api": resposta, 
+                "banco_chave_usado": banco_global_atual_chave # "Carimba" o resultado com o banco usado
+            }
         
 # --- EXIBIÇÃO DOS RESULTADOS (AQUI ESTÁ A MUDANÇA) ---
 # Verifica se existe um contexto de resultado salvo para exibir
@@ -37,10 +48,12 @@ if 'contexto_ultima_contagem' in st.session_state:
     banco_chave_dos_dados_salvos = contexto_salvo["banco_chave_usado"]
     
     # Chama a função de display passando os dados salvos e o banco ao qual eles pertencem
-    exibir_grafico_contagem_por_ano(
-        resposta_api_completa=resposta_api_salva,
-        banco_selecionado_chave=banco_chave_dos_dados_salvos 
-    )
+    # (a não ser que o streaming de "todos" já tenha desenhado tudo nesta mesma execução)
+    if not contexto_salvo.pop("ja_exibido", False):
+        exibir_grafico_contagem_por_ano(
+            resposta_api_completa=resposta_api_salva,
+            banco_selecionado_chave=banco_chave_dos_dados_salvos 
+        )
 
 # --- 4. (Opcional) Botão para Limpar ---
 st.markdown("---")
@@ -1,6 +1,6 @@
 # src/streamlit_app/paginas/detalhes_filme.py
 import streamlit as st
-from services.operation_handlers import obter_detalhes_filme_handler, obter_atores_do_filme_handler
+from services.operation_handlers import obter_detalhes_e_atores_filme_handler
 from components.display_utils import renderizar_detalhes_do_filme_completo
 from config.settings import BANCOS_SUPORTADOS
 
@@ -34,19 +34,12 @@ else:
     atores_do_filme = None
 
     with st.spinner(f"Carregando detalhes do filme de ID '{id_filme_para_detalhes}' em {nome_banco_amigavel}..."):
-        # 1. Buscar detalhes do filme
-        detalhes_filme = obter_detalhes_filme_handler(
+        # 1 e 2. Detalhes e atores do filme numa única requisição (o backend executa as duas em paralelo)
+        detalhes_filme, atores_do_filme = obter_detalhes_e_atores_filme_handler(
             id_filme=id_filme_para_detalhes,
             banco_selecionado=banco_chave_para_detalhes
         )
-        
-        # 2. Buscar atores do filme (pode ser feito em paralelo se o backend suportar ou sequencialmente)
-        if detalhes_filme and "error" not in detalhes_filme: # Só busca atores se os detalhes do filme foram ok
-            atores_do_filme = obter_atores_do_filme_handler(
-                id_filme=id_filme_para_detalhes,
-                banco_selecionado=banco_chave_para_detalhes
-            )
-        elif not detalhes_filme: # Se detalhes_filme for None ou vazio
+        if not detalhes_filme: # Se detalhes_filme for None ou vazio
             detalhes_filme = {"error": "Resposta vazia do serviço de detalhes do filme."}
 
 
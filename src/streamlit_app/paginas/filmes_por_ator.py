@@ -1,9 +1,9 @@
 # src/streamlit_app/paginas/filmes_por_ator.py
 import streamlit as st
 from components.ui_elements import seletor_ator_para_filmes, seletor_de_banco_global_sidebar
-from components.display_utils import processar_e_exibir_resultados_api # Reutiliza para listas de filmes
+from components.display_utils import processar_e_exibir_resultados_api, exibir_pagina_de_filmes # Reutiliza para listas de filmes
 from services.operation_handlers import handle_listar_filmes_por_ator_operacao
-from config.settings import BANCOS_SUPORTADOS, CAMPOS_ORDENACAO_FILMES
+from config.settings import BANCOS_SUPORTADOS, CAMPOS_ORDENACAO_FILMES, TAMANHO_PAGINA_RESULTADOS
 
 # --- LÓGICA DE NAVEGAÇÃO NO TOPO DA PÁGINA ---
 if st.session_state.get("navegar_para_detalhes"):
@@ -50,7 +50,8 @@ with col_ord:
     ordenar_por_key = CAMPOS_ORDENACAO_FILMES[ordenar_por_label]
     ordem_val = -1 if st.radio("Ordem:", ["Decrescente", "Crescente"], index=0, horizontal=True, key="fpa_ordem") == "Decrescente" else 1
 with col_lim:
-    limite_val = st.number_input("Limite de resultados:", min_value=5, max_value=200, value=40, step=5, key="fpa_limite")
+    limite_val = st.number_input("Limite de resultados (Todos os Bancos):", min_value=5, max_value=200, value=40, step=5, key="fpa_limite")
+    st.caption("Em um único banco os filmes vêm paginados pela API, sem limite.")
 
 
 if st.button(f"🎬 Listar Filmes de {st.session_state.get('ator_nome_selecionado_para_filmes')}"):
@@ -70,7 +71,17 @@ if st.button(f"🎬 Listar Filmes de {st.session_state.get('ator_nome_selecionad
     # Supondo que nome_ator_selecionado é o ID por enquanto:
     #nome_ator_selecionado # Substitua isso pela lógica de obter ID do ator
 
-    if ator_id_para_api: # Verifica se temos um ID/nome válido
+    if ator_id_para_api and banco_chave_selecionada != "todos":
+        # Banco único: a API pagina por cursor; as páginas são buscadas abaixo, uma de cada vez
+        st.session_state['filmes_ator_paginado'] = {
+            "id_ator": ator_id_para_api, "banco": banco_chave_selecionada,
+            "ordenar_por": ordenar_por_key, "ordem": ordem_val
+        }
+        st.session_state['cursores_filmes_ator'] = [None]
+        st.session_state.pop('pagina_api_filmes_ator', None)
+        st.session_state.pop('ultima_resposta_api_filmes_ator', None)
+    elif ator_id_para_api: # Verifica se temos um ID/nome válido
+        st.session_state.pop('filmes_ator_paginado', None)
         placeholder_status = st.empty()
         with st.spinner(f"Buscando filmes de '{nome_ator_display}' em '{nome_amigavel_banco}'..."):
             resposta = handle_listar_filmes_por_ator_operacao(
@@ -85,6 +96,32 @@ if st.button(f"🎬 Listar Filmes de {st.session_state.get('ator_nome_selecionad
     else:
         st.warning("Por favor, selecione um ator.")
         
+# Listagem paginada (banco único): só vai à API quando o cursor da página atual muda
+if 'filmes_ator_paginado' in st.session_state:
+    consulta_paginada = st.session_state['filmes_ator_paginado']
+    cursor_atual = st.session_state.setdefault('cursores_filmes_ator', [None])[-1]
+    pagina_em_cache = st.session_state.get('pagina_api_filmes_ator')
+    if pagina_em_cache is None or pagina_em_cache["cursor"] != cursor_atual:
+        with st.spinner(f"Buscando filmes em '{BANCOS_SUPORTADOS.get(consulta_paginada['banco'])}'..."):
+            resposta_pagina = handle_listar_filmes_por_ator_operacao(
+                id_ator=consulta_paginada["id_ator"],
+                banco_selecionado=consulta_paginada["banco"],
+                ordenar_por=consulta_paginada["ordenar_por"],
+                ordem=consulta_paginada["ordem"],
+                limite=None,
+                tamanho_pagina=TAMANHO_PAGINA_RESULTADOS,
+                cursor=cursor_atual
+            )
+        pagina_em_cache = {"cursor": cursor_atual, "resposta": resposta_pagina}
+        st.session_state['pagina_api_filmes_ator'] = pagina_em_cache
+    exibir_pagina_de_filmes(
+        pagina_em_cache["resposta"],
+        consulta_paginada["banco"],
+        chave_cursores='cursores_filmes_ator',
+        pagina_atual_path_para_voltar="paginas/filmes_por_ator.py",
+        pagina_atual_label_para_voltar="Filmes por Ator"
+    )
+
 if 'ultima_resposta_api_filmes_ator' in st.session_state:
     #st.subheader(f"🎬 Filmes encontrados para {st.session_state['ator_nome_selecionado_para_filmes']} em {st.session_state['banco_em_uso_na_pagina_filmes_ator']}")
     
@@ -2,7 +2,7 @@
 import streamlit as st
 from components.ui_elements import seletor_de_banco_global_sidebar # Importa o seletor global
 from components.display_utils import exibir_grafico_media_notas_genero
-from services.operation_handlers import handle_media_notas_por_genero_operacao
+from services.operation_handlers import handle_media_notas_por_genero_operacao, handle_media_notas_por_genero_progressivo
 from config.settings import BANCOS_SUPORTADOS
 
 st.set_page_config(layout="wide", page_title="Média de Notas por Gênero")
@@ -22,16 +22,27 @@ st.markdown(f"Gere um gráfico de média de notas para **{nome_banco_amigavel.lo
 
 # --- 2. Botão e Lógica de Busca ---
 if st.button("📊 Gerar Gráfico de Média de Notas"):
-    with st.spinner(f"Calculando média de notas por gênero em '{nome_banco_amigavel}'..."):
-        resposta_api = handle_media_notas_por_genero_operacao(
-            banco_selecionado=banco_global_atual_chave
+    if banco_global_atual_chave == "todos":
+        # Em "todos" cada banco é desenhado assim que termina (SSE), sem esperar o mais lento
+        resposta_api = handle_media_notas_por_genero_progressivo(
+            lambda resposta_parcial: exibir_grafico_media_notas_genero(resposta_parcial, "todos")
         )
-        # Salva o CONTEXTO completo: os dados da API e o banco que foi usado para a busca,
-        # sobrescrevendo o contexto antigo.
         st.session_state[CHAVE_SESSAO_CONTEXTO_MEDIA] = {
-            "dados_api": resposta_api, 
-            "banco_chave_usado": banco_global_atual_chave 
+            "dados_api": resposta_api,
+            "banco_chave_usado": "todos",
+            "ja_exibido": "error" not in resposta_api # Sem erro, os gráficos já estão na tela nesta execução
         }
+    else:
+        with st.spinner(f"Calculando média de notas por gênero em '{nome_banco_amigavel}'..."):
+            resposta_api = handle_media_notas_por_genero_operacao(
+                banco_selecionado=banco_global_atual_chave
+            )
+            # Salva o CONTEXTO completo: os dados da API e o banco que foi usado para a busca,
+            # sobrescrevendo o contexto antigo.
+            st.session_state[CHAVE_SESSAO_CONTEXTO_MEDIA] = {
+                "dados_api": resposta_api, 
+                "banco_chave_usado": banco_global_atual_chave 
+            }
         
 # --- 3. Lógica de Exibição (sempre usa o contexto salvo) ---
 # Se existe um contexto salvo no session_state, exibe o resultado dele.
@@ -46,10 +57,12 @@ if CHAVE_SESSAO_CONTEXTO_MEDIA in st.session_state:
     # Chama a função de display passando os dados salvos e o banco ao qual eles PERTENCEM.
     # Assim, o título do gráfico ("Média... - MongoDB") estará sempre correto,
     # mesmo que você já tenha mudado o seletor da sidebar para "Cassandra".
-    exibir_grafico_media_notas_genero(
-        resposta_api_completa=resposta_api_salva,
-        banco_selecionado_chave=banco_chave_dos_dados 
-    )
+    # O streaming de "todos" já desenhou os gráficos na execução em que o botão foi clicado.
+    if not contexto_salvo.pop("ja_exibido", False):
+        exibir_grafico_media_notas_genero(
+            resposta_api_completa=resposta_api_salva,
+            banco_selecionado_chave=banco_chave_dos_dados 
+        )
 
 # --- 4. (Opcional) Botão para Limpar ---
 st.markdown("---")
@@ -1,19 +1,32 @@
 # src/streamlit_app/services/api_service.py
+import copy
+import json
 import requests
-from typing import Any, Dict, List, Optional # Adicionar typing
-from config.settings import FASTAPI_BASE_URL
+from typing import Any, Dict, Iterator, List, Optional # Adicionar typing
+from config.settings import FASTAPI_BASE_URL, CAMPOS_LISTAGEM_FILMES
 
 
 # src/streamlit_app/services/api_service.py
 # ... (imports e outras funções)
 
+# Últimas respostas GET que vieram com ETag: (url, params) -> (etag, corpo). Na próxima
+# chamada igual a API responde 304 sem consultar o banco se nada foi escrito desde então.
+_respostas_com_etag: Dict[str, tuple] = {}
+MAX_RESPOSTAS_COM_ETAG = 256
+
 def _make_request(method: str, endpoint: str, params: dict = None, json_data: dict = None) -> dict:
     url = f"{FASTAPI_BASE_URL}/{endpoint.lstrip('/')}"
     
     #print(f"API Request: {method} {url} | Params: {params} | JSON Body: {json_data}")
 
+    chave_etag = f"{url}?{json.dumps(params, sort_keys=True, default=str)}" if method.upper() == "GET" else None
+    guardada = _respostas_com_etag.get(chave_etag) if chave_etag else None
+
     try:
-        response = requests.request(method, url, params=params, json=json_data, timeout=30)
+        headers = {"If-None-Match": guardada[0]} if guardada else None
+        response = requests.request(method, url, params=params, json=json_data, headers=headers, timeout=30)
+        if response.status_code == 304 and guardada:
+            return copy.deepcopy(guardada[1]) # Cópia: as páginas podem mexer no dict devolvido
 
         # DEBUG: Ver o status e o texto da resposta bruta
         print(f"DEBUG API Response: Status {response.status_code}, URL: {response.url}")
@@ -21,7 +34,13 @@ def _make_request(method: str, endpoint: str, params: dict = None, json_data: di
         #    print(f"DEBUG API Response Text (2xx): '{response.text}'") # <--- IMPORTANTE!
 
         response.raise_for_status() 
-        return response.json()
+        corpo = response.json()
+        etag = response.headers.get("ETag")
+        if chave_etag and etag:
+            if len(_respostas_com_etag) >= MAX_RESPOSTAS_COM_ETAG:
+                _respostas_com_etag.clear()
+            _respostas_com_etag[chave_etag] = (etag, copy.deepcopy(corpo))
+        return corpo
         
     except requests.exceptions.HTTPError as http_err:
         error_status_code = http_err.response.status_code
@@ -94,8 +113,11 @@ def _make_request(method: str, endpoint: str, params: dict = None, json_data: di
         return {"error": f"Falha ao decodificar a resposta JSON do servidor (resposta 2xx não era JSON válido): {json_decode_err}", "status_code": "JSON_DECODE_ERROR_2XX"}
 
 # --- Operações de Leitura (GET) ---
-def buscar_filmes_avancado(filtros_busca: dict, banco_alvo: str):
-    params = {"banco": banco_alvo}
+def buscar_filmes_avancado(filtros_busca: dict, banco_alvo: str, tamanho_pagina: Optional[int] = None, cursor: Optional[str] = None):
+    """Com tamanho_pagina/cursor (um único banco) a API devolve uma página: {"data": [...], "proximo_cursor": ...}."""
+    params = {"banco": banco_alvo, "campos": CAMPOS_LISTAGEM_FILMES}
+    if tamanho_pagina is not None: params["tamanho_pagina"] = tamanho_pagina
+    if cursor: params["cursor"] = cursor
     return _make_request("POST", "filmes/busca-avancada", params=params, json_data=filtros_busca)
 
 def buscar_filmes_simples(campo: str, valor: any, banco_alvo: str, ordenar_por: str = "nota", ordem: int = -1):
@@ -117,16 +139,48 @@ def listar_atores_de_filme(titulo_id: str, banco_alvo: str):
     params = {"banco": banco_alvo}
     return _make_request("GET", f"filmes/{titulo_id}/atores", params=params)
 
-def listar_filmes_por_ator_api(nome_ator: str, banco_alvo: str, ordenar_por: Optional[str] = None, ordem: Optional[int] = None, limite: Optional[int] = None):
-    """Lista filmes de um ator específico."""
+def listar_filmes_por_ator_api(nome_ator: str, banco_alvo: str, ordenar_por: Optional[str] = None, ordem: Optional[int] = None, limite: Optional[int] = None,
+                               tamanho_pagina: Optional[int] = None, cursor: Optional[str] = None):
+    """Lista filmes de um ator específico (paginado por cursor se tamanho_pagina/cursor forem informados)."""
     # O endpoint do backend espera id_ator no path.
     # Os outros são query params.
-    params_query = {"banco": banco_alvo}
+    params_query = {"banco": banco_alvo, "campos": CAMPOS_LISTAGEM_FILMES}
     if ordenar_por: params_query["ordenar_por"] = ordenar_por
     if ordem is not None: params_query["ordem"] = ordem
     if limite is not None: params_query["limite"] = limite
+    if tamanho_pagina is not None: params_query["tamanho_pagina"] = tamanho_pagina
+    if cursor: params_query["cursor"] = cursor
     return _make_request("GET", f"atores/{nome_ator}/filmes", params=params_query)
 
+def executar_lote(operacoes: List[dict]):
+    """Várias leituras numa única requisição (POST /batch); os resultados voltam na ordem das operações."""
+    return _make_request("POST", "batch", json_data={"operacoes": operacoes})
+
+def transmitir_por_banco(endpoint: str, banco_alvo: str = "todos") -> Iterator[dict]:
+    """
+    Versão progressiva (Accept: text/event-stream) de um GET com banco="todos": devolve o
+    resultado de cada banco ({"banco", "status_code", "duracao_ms", "data"/"error"}) assim
+    que ele termina. Erro na requisição vira um único item {"error": ...}, sem "banco".
+    """
+    url = f"{FASTAPI_BASE_URL}/{endpoint.lstrip('/')}"
+    try:
+        with requests.get(url, params={"banco": banco_alvo}, headers={"Accept": "text/event-stream"},
+                          stream=True, timeout=30) as response:
+            response.raise_for_status()
+            evento, linhas_dados = None, []
+            for linha in response.iter_lines(decode_unicode=True):
+                if linha.startswith("event:"):
+                    evento = linha[len("event:"):].strip()
+                elif linha.startswith("data:"):
+                    linhas_dados.append(linha[len("data:"):].strip())
+                elif not linha and linhas_dados: # Linha em branco fecha o evento
+                    if evento == "banco":
+                        yield json.loads("\n".join(linhas_dados))
+                    evento, linhas_dados = None, []
+    except requests.exceptions.RequestException as req_err:
+        print(f"API Request Exception (SSE): GET {url}, Error: {req_err}")
+        yield {"error": f"Erro na requisição para a API: {req_err}", "status_code": "REQUEST_ERROR"}
+
 def contar_filmes_por_ano(banco_alvo: str):
     params = {"banco": banco_alvo}
     return _make_request("GET", "analytics/filmes/contagem-por-ano", params=params) # Rota sugerida
@@ -1,9 +1,9 @@
 # src/streamlit_app/services/operation_handlers.py
 from . import api_service # Usando . para import relativo
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 # Exemplo para busca avançada
-def realizar_busca_avancada(filtros_da_ui: dict, banco_selecionado: str):
+def realizar_busca_avancada(filtros_da_ui: dict, banco_selecionado: str, tamanho_pagina: Optional[int] = None, cursor: Optional[str] = None):
     # Aqui você pode adicionar lógicas de transformação de dados da UI para API, se necessário
     # Por exemplo, converter uma string de gêneros "Ação, Comédia" para uma lista ["Ação", "Comédia"]
     # if isinstance(filtros_da_ui.get("generos"), str):
@@ -11,7 +11,9 @@ def realizar_busca_avancada(filtros_da_ui: dict, banco_selecionado: str):
 
     return api_service.buscar_filmes_avancado(
         filtros_busca=filtros_da_ui,
-        banco_alvo=banco_selecionado
+        banco_alvo=banco_selecionado,
+        tamanho_pagina=tamanho_pagina,
+        cursor=cursor
     )
 
 def carregar_base_de_dados_handler(filmes_path: str, atores_path: str, elenco_path: str, banco_selecionado: str):
@@ -23,6 +25,21 @@ def obter_detalhes_filme_handler(id_filme: str, banco_selecionado: str):
 def obter_atores_do_filme_handler(id_filme: str, banco_selecionado: str):
     return api_service.listar_atores_de_filme(id_filme, banco_alvo=banco_selecionado)
 
+def obter_detalhes_e_atores_filme_handler(id_filme: str, banco_selecionado: str):
+    """Filme e elenco numa única chamada (POST /batch); cada um volta como os dados ou {"error": ...}."""
+    resposta = api_service.executar_lote([
+        {"operacao": "detalhes_filme", "banco": banco_selecionado, "parametros": {"id_filme": id_filme}},
+        {"operacao": "atores_de_filme", "banco": banco_selecionado, "parametros": {"id_filme": id_filme}},
+    ])
+    if "error" in resposta:
+        return resposta, resposta
+    detalhes, atores = (
+        resultado["data"] if "data" in resultado
+        else {"error": f"Erro HTTP ({resultado['status_code']}): {resultado['error']}", "status_code": resultado["status_code"]}
+        for resultado in resposta["resultados"]
+    )
+    return detalhes, atores
+
 # ... e assim por diante para todas as operações (inserir, atualizar, deletar, contagens, médias)
 # Cada função aqui chama a função correspondente em api_service.py, passando o banco_selecionado.
 
@@ -38,12 +55,14 @@ def handle_listar_filmes_por_ator_operacao(
     banco_selecionado: str,
     ordenar_por: Optional[str] = "nota", # Defaults podem ser definidos aqui ou na UI
     ordem: Optional[int] = -1,
-    limite: Optional[int] = 50
+    limite: Optional[int] = 50,
+    tamanho_pagina: Optional[int] = None,
+    cursor: Optional[str] = None
 ):
     # Se a UI sempre fornecer ID, ótimo. Se fornecer nome, este handler
     # poderia chamar um outro api_service para buscar o ID do ator pelo nome primeiro,
     # ou o backend lida com a busca por nome.
-    return api_service.listar_filmes_por_ator_api(id_ator, banco_selecionado, ordenar_por, ordem, limite)
+    return api_service.listar_filmes_por_ator_api(id_ator, banco_selecionado, ordenar_por, ordem, limite, tamanho_pagina, cursor)
 
 def handle_contar_filmes_por_ano_operacao(banco_selecionado: str):
     return api_service.contar_filmes_por_ano(banco_alvo=banco_selecionado)
@@ -51,6 +70,25 @@ def handle_contar_filmes_por_ano_operacao(banco_selecionado: str):
 def handle_media_notas_por_genero_operacao(banco_selecionado: str):
     return api_service.calcular_media_notas_por_genero(banco_alvo=banco_selecionado)
 
+def _receber_todos_progressivo(endpoint: str, ao_receber_banco: Callable[[dict], None]) -> dict:
+    """
+    Monta a mesma resposta do modo "todos" ({"status", banco: {...}}) a partir dos eventos SSE,
+    chamando ao_receber_banco com a resposta parcial de cada banco assim que ele termina.
+    """
+    resposta = {"status": "sucesso", "mensagem": "Resultados recebidos por banco."}
+    for resultado_banco in api_service.transmitir_por_banco(endpoint):
+        if "banco" not in resultado_banco: # Erro na requisição
+            return resultado_banco
+        resposta[resultado_banco["banco"]] = resultado_banco
+        ao_receber_banco({"status": "sucesso", resultado_banco["banco"]: resultado_banco})
+    return resposta
+
+def handle_contar_filmes_por_ano_progressivo(ao_receber_banco: Callable[[dict], None]):
+    return _receber_todos_progressivo("analytics/filmes/contagem-por-ano", ao_receber_banco)
+
+def handle_media_notas_por_genero_progressivo(ao_receber_banco: Callable[[dict], None]):
+    return _receber_todos_progressivo("analytics/filmes/media-notas-por-genero", ao_receber_banco)
+
 # src/streamlit_app/services/operation_handlers.py
 from . import api_service 
 # ... (outros handlers como realizar_busca_avancada, carregar_base_de_dados_handler, etc.)
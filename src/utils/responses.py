@@ -2,7 +2,9 @@ import inspect
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
 from functools import wraps
-import traceback
+import logging
+
+logger = logging.getLogger(__name__)
 
 def resposta_sucesso(mensagem: str, dados: dict = None):
     response = {"status": "sucesso", "mensagem": mensagem}
@@ -50,7 +52,7 @@ def tratar_erros(func):
             except HTTPException as http_exc:
                 return resposta_erro(str(http_exc.detail), status_code=http_exc.status_code)
             except Exception:
-                print("Erro interno:", traceback.format_exc())
+                logger.exception("Erro interno")
                 return resposta_erro("Erro interno no servidor", status_code=500)
         return async_wrapper
     else:
@@ -61,6 +63,6 @@ def tratar_erros(func):
             except HTTPException as http_exc:
                 return resposta_erro(str(http_exc.detail), status_code=http_exc.status_code)
             except Exception:
-                print("Erro interno:", traceback.format_exc())
+                logger.exception("Erro interno")
                 return resposta_erro("Erro interno no servidor", status_code=500)
         return sync_wrapper
@@ -0,0 +1,78 @@
+# src/utils/serializacao.py
+"""
+Caminho rápido de serialização das respostas de leitura.
+
+Em vez de criar um FilmeResponse por linha, voltar para dict com model_dump() e deixar o
+FastAPI validar tudo de novo contra o response_model, as listas são convertidas de uma vez:
+  - VALIDACAO_RESPOSTAS=completa: um TypeAdapter(List[modelo]) em cache valida e exporta a
+    lista inteira no pydantic-core;
+  - VALIDACAO_RESPOSTAS=nenhuma: a saída dos CRUDs é tratada como confiável e só é projetada
+    nos campos do modelo (sem coerção de tipos).
+Os endpoints devolvem o resultado direto numa ORJSONResponse, que não passa pelo
+response_model nem pelo jsonable_encoder. Com `campos` (projeção pedida pelo cliente),
+a saída fica só com esses campos do modelo.
+"""
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from src.core.db_config import VALIDACAO_RESPOSTAS
+from src.core.tempos import medir_fase
+
+
+@lru_cache(maxsize=None)
+def _adaptador_lista(modelo: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[modelo])
+
+
+@lru_cache(maxsize=None)
+def _campos_projecao(modelo: Type[BaseModel], por_alias: bool) -> Tuple[Tuple[str, str, str], ...]:
+    """(nome no modelo, chave de entrada, chave de saída) de cada campo do modelo."""
+    campos = []
+    for nome, info in modelo.model_fields.items():
+        entrada = info.alias or nome
+        campos.append((nome, entrada, entrada if por_alias else nome))
+    return tuple(campos)
+
+
+@medir_fase("serializacao")
+def serializar_lista(
+    modelo: Type[BaseModel],
+    itens: Iterable[Dict[str, Any]],
+    por_alias: bool = False,
+    campos: Optional[Iterable[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Lista de dicts no formato de `modelo` (como [modelo(**i).model_dump(by_alias=por_alias) ...]),
+    sem instanciar e descartar um modelo por linha no Python. `campos` são nomes de campos do
+    modelo (não aliases) a manter na saída; None mantém todos.
+    """
+    incluir = set(campos) if campos is not None else None
+    if VALIDACAO_RESPOSTAS == "nenhuma":
+        projecao = _campos_projecao(modelo, por_alias)
+        if incluir is not None:
+            projecao = tuple(campo for campo in projecao if campo[0] in incluir)
+        return [
+            {saida: item[entrada] if entrada in item else item.get(nome) for nome, entrada, saida in projecao}
+            for item in itens
+        ]
+    adaptador = _adaptador_lista(modelo)
+    return adaptador.dump_python(
+        adaptador.validate_python(list(itens)), by_alias=por_alias,
+        include={"__all__": incluir} if incluir is not None else None
+    )
+
+
+@medir_fase("serializacao")
+def serializar_item(
+    modelo: Type[BaseModel], item: Dict[str, Any], por_alias: bool = False, campos: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
+    return serializar_lista(modelo, [item], por_alias=por_alias, campos=campos)[0]
+
+
+@medir_fase("serializacao")
+def resposta_rapida(conteudo: Any, status_code: int = 200) -> ORJSONResponse:
+    """Resposta já serializada: o FastAPI não revalida contra o response_model."""
+    return ORJSONResponse(content=conteudo, status_code=status_code)
@@ -0,0 +1,70 @@
+import asyncio
+
+from src.core.coalescencia import ExecucaoUnica
+
+
+def test_chamadas_concorrentes_compartilham_a_execucao():
+    async def cenario():
+        execucao = ExecucaoUnica()
+        chamadas = 0
+        liberar = asyncio.Event()
+
+        async def ler():
+            nonlocal chamadas
+            chamadas += 1
+            await liberar.wait()
+            return ["filme"]
+
+        tarefas = [asyncio.ensure_future(execucao.executar("chave", ler)) for _ in range(3)]
+        await asyncio.sleep(0)
+        liberar.set()
+        resultados = await asyncio.gather(*tarefas)
+        return execucao, chamadas, resultados
+
+    execucao, chamadas, resultados = asyncio.run(cenario())
+    assert chamadas == 1
+    assert resultados == [["filme"]] * 3
+    assert execucao.estatisticas() == {"execucoes": 1, "coalescidas": 2, "em_andamento": 0}
+
+
+def test_excecao_chega_a_todos_e_chave_e_liberada():
+    async def cenario():
+        execucao = ExecucaoUnica()
+
+        async def falhar():
+            await asyncio.sleep(0)
+            raise RuntimeError("banco fora")
+
+        resultados = await asyncio.gather(
+            execucao.executar("chave", falhar), execucao.executar("chave", falhar), return_exceptions=True
+        )
+
+        async def ler():
+            return "de novo"
+        return resultados, await execucao.executar("chave", ler)
+
+    resultados, depois = asyncio.run(cenario())
+    assert all(isinstance(r, RuntimeError) for r in resultados)
+    assert depois == "de novo" # Terminada a execução, a próxima chamada roda outra vez
+
+
+def test_cancelar_um_interessado_nao_cancela_os_outros():
+    async def cenario():
+        execucao = ExecucaoUnica()
+        liberar = asyncio.Event()
+
+        async def ler():
+            await liberar.wait()
+            return 42
+
+        desistente = asyncio.ensure_future(execucao.executar("chave", ler))
+        paciente = asyncio.ensure_future(execucao.executar("chave", ler))
+        await asyncio.sleep(0)
+        desistente.cancel()
+        await asyncio.sleep(0)
+        liberar.set()
+        return desistente, await paciente
+
+    desistente, resultado = asyncio.run(cenario())
+    assert desistente.cancelled()
+    assert resultado == 42
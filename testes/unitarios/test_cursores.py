@@ -0,0 +1,41 @@
+import pytest
+
+from src.core.cursores import assinatura_consulta, codificar_cursor, decodificar_cursor
+from src.core.exceptions import DataValidationError
+
+
+def test_cursor_ida_e_volta():
+    assinatura = assinatura_consulta("redis", "busca_avancada", {"ordenar_por": "nota", "generos": ["Drama"]})
+    posicao = {"membro": "tt0111161", "score": 9.3}
+    cursor = codificar_cursor(assinatura, posicao)
+    assert "=" not in cursor # Sem padding: vai direto na query string
+    assert decodificar_cursor(cursor, assinatura) == posicao
+
+
+def test_sem_cursor_e_primeira_pagina():
+    assert decodificar_cursor(None, "qualquer") is None
+    assert decodificar_cursor("", "qualquer") is None
+
+
+def test_assinatura_independe_da_ordem_dos_parametros():
+    a = assinatura_consulta("mongo", "filmes_por_ator", {"ator": "nm1", "ordem": -1})
+    b = assinatura_consulta("mongo", "filmes_por_ator", {"ordem": -1, "ator": "nm1"})
+    assert a == b
+
+
+@pytest.mark.parametrize("outro_banco, outros_parametros", [
+    ("neo4j", {"ordenar_por": "nota"}),
+    ("mongo", {"ordenar_por": "titulo"}),
+])
+def test_cursor_de_outra_consulta_e_rejeitado(outro_banco, outros_parametros):
+    assinatura = assinatura_consulta("mongo", "busca_avancada", {"ordenar_por": "nota"})
+    cursor = codificar_cursor(assinatura, {"valor": 8.0, "_id": "tt1"})
+    outra = assinatura_consulta(outro_banco, "busca_avancada", outros_parametros)
+    with pytest.raises(DataValidationError):
+        decodificar_cursor(cursor, outra)
+
+
+@pytest.mark.parametrize("cursor", ["nao-e-base64!", "e30", "W10"]) # lixo, {} e []
+def test_cursor_corrompido_e_rejeitado(cursor):
+    with pytest.raises(DataValidationError):
+        decodificar_cursor(cursor, "abc")
@@ -0,0 +1,33 @@
+import pytest
+
+from src.core.exceptions import DataValidationError
+from src.core.projecao import campos_leitura, normalizar_campos, projetar_filme
+
+
+def test_normalizar_campos_sem_parametro():
+    assert normalizar_campos(None) is None
+
+
+def test_normalizar_campos_texto_segue_ordem_do_filme_sem_repetir():
+    assert normalizar_campos(" nota,titulo , nota,,") == ["titulo", "nota"]
+
+
+def test_normalizar_campos_ignora_ids():
+    assert normalizar_campos(["_id", "id", "titulo_id", "generos"]) == ["generos"]
+    assert normalizar_campos("_id") == []
+
+
+def test_normalizar_campos_invalidos():
+    with pytest.raises(DataValidationError, match="orcamento"):
+        normalizar_campos("titulo,orcamento")
+
+
+def test_campos_leitura_acrescenta_so_os_necessarios():
+    assert campos_leitura(None, "nota") is None
+    assert campos_leitura(["titulo"], "nota", "titulo", None, "nao_existe", "nota") == ["titulo", "nota"]
+
+
+def test_projetar_filme_tira_os_campos_extras():
+    filme = {"_id": "tt1", "titulo": "A", "nota": 7.5, "numero_votos": 10}
+    assert projetar_filme(filme, ["titulo"]) == {"_id": "tt1", "titulo": "A"}
+    assert projetar_filme(filme, None) is filme
@@ -0,0 +1,78 @@
+"""Paginação por cursor do Redis (ZSETs de ordenação) sobre um Redis em memória (fakeredis)."""
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from src.databases.redis import crud # noqa: E402
+
+# Notas repetidas para exercitar os empates de score entre páginas
+FILMES = [
+    {"_id": f"tt{numero:02d}", "titulo": f"Filme {numero:02d}", "tipo": "Filme", "ano_lancamento": 2000 + numero,
+     "generos": ["Drama"], "nota": nota, "numero_votos": 100 * numero, "duracao": 90 + numero, "sinopse": "..."}
+    for numero, nota in enumerate([8.0, 7.5, 7.5, 7.5, 7.5, 7.0, 6.5, 6.5, 6.0, 5.0], start=1)
+]
+
+
+@pytest.fixture
+def r(monkeypatch):
+    cliente = fakeredis.FakeRedis(decode_responses=True)
+    for filme in FILMES:
+        crud.inserir_filme(cliente, dict(filme))
+    monkeypatch.setattr(crud, "_indices_ordenacao_conferidos", False)
+    return cliente
+
+
+def _todas_as_paginas(r, tamanho_pagina, **kwargs):
+    paginas, apos = [], None
+    while True:
+        filmes, apos = crud.paginar_filmes_avancado(r, tamanho_pagina=tamanho_pagina, apos=apos, tamanho_lote=3, **kwargs)
+        paginas.append([filme["_id"] for filme in filmes])
+        if apos is None:
+            return paginas
+
+
+def _ordem_esperada(ordem):
+    # Empates de nota desempatados pelo membro (o _id), como no ZSET
+    return [f["_id"] for f in sorted(FILMES, key=lambda f: (f["nota"], f["_id"]), reverse=(ordem == -1))]
+
+
+@pytest.mark.parametrize("ordem", [-1, 1])
+def test_paginas_com_empates_nao_repetem_nem_pulam(r, ordem):
+    paginas = _todas_as_paginas(r, 3, ordenar_por="nota", ordem=ordem)
+    assert [id_filme for pagina in paginas for id_filme in pagina] == _ordem_esperada(ordem)
+
+
+def test_filtros_python_aplicados_pagina_a_pagina(r):
+    paginas = _todas_as_paginas(r, 2, ordenar_por="ano_lancamento", ordem=1, nota_min=7.0)
+    assert [id_filme for pagina in paginas for id_filme in pagina] == ["tt01", "tt02", "tt03", "tt04", "tt05", "tt06"]
+
+
+def test_remocao_do_ultimo_entregue_retoma_pelo_score(r):
+    ordem = _ordem_esperada(-1)
+    primeira, apos = crud.paginar_filmes_avancado(r, ordenar_por="nota", ordem=-1, tamanho_pagina=3, apos=None)
+    assert [f["_id"] for f in primeira] == ordem[:3]
+    crud.remover_filme(r, apos["membro"]) # O último entregue some entre uma página e outra
+    segunda, _ = crud.paginar_filmes_avancado(r, ordenar_por="nota", ordem=-1, tamanho_pagina=3, apos=apos)
+    assert [f["_id"] for f in segunda] == ordem[3:6]
+
+
+def test_indices_ausentes_sao_reconstruidos(r):
+    r.delete(*crud.CHAVES_ORDEM) # Base carregada antes dos ZSETs de ordenação
+    filmes, apos = crud.paginar_filmes_avancado(r, ordenar_por="nota", ordem=-1, tamanho_pagina=4)
+    assert [f["_id"] for f in filmes] == _ordem_esperada(-1)[:4]
+    assert apos is not None
+    assert r.zcard(f"{crud.IDX_FILME_ORDEM_PREFIX}titulo") == len(FILMES)
+
+
+def test_filmes_por_ator_por_titulo(r):
+    for filme in FILMES[:5]:
+        r.sadd(f"{crud.ELENCO_ATOR_FILMES_PREFIX}nm1", filme["_id"])
+    primeira, apos = crud.paginar_filmes_por_ator(r, "nm1", ordenar_por="titulo", ordem=1, tamanho_pagina=3)
+    segunda, fim = crud.paginar_filmes_por_ator(r, "nm1", ordenar_por="titulo", ordem=1, tamanho_pagina=3, apos=apos)
+    assert [f["_id"] for f in primeira + segunda] == ["tt01", "tt02", "tt03", "tt04", "tt05"]
+    assert fim is None
+
+
+def test_campo_sem_indice_e_rejeitado(r):
+    with pytest.raises(crud.DataValidationError):
+        crud.paginar_filmes_avancado(r, ordenar_por="sinopse")
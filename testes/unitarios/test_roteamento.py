@@ -0,0 +1,60 @@
+import pytest
+
+from src.core import roteamento
+from src.core.disjuntor import ABERTO, Disjuntor
+from src.core.roteamento import (
+    CRITERIO_EXPLORACAO, CRITERIO_P95, CRITERIO_POUCAS_AMOSTRAS, RoteadorLatencia,
+)
+
+BANCOS = ["mongo", "neo4j", "redis"]
+
+
+@pytest.fixture(autouse=True)
+def disjuntores_fechados(monkeypatch):
+    disjuntores = {nome: Disjuntor(nome, limite_falhas=5, tempo_aberto=30) for nome in BANCOS}
+    monkeypatch.setattr(roteamento, "disjuntores", disjuntores)
+    return disjuntores
+
+
+def _roteador_com_amostras(duracoes_por_banco, exploracao=0.0):
+    roteador = RoteadorLatencia(janela=10, min_amostras=3, exploracao=exploracao)
+    for nome, duracao in duracoes_por_banco.items():
+        for _ in range(3):
+            roteador.registrar("busca", nome, duracao)
+    return roteador
+
+
+def test_menor_p95_vai_primeiro():
+    roteador = _roteador_com_amostras({"mongo": 0.030, "neo4j": 0.010, "redis": 0.020})
+    assert roteador.ordenar("busca", BANCOS) == (["neo4j", "redis", "mongo"], CRITERIO_P95)
+
+
+def test_banco_com_poucas_amostras_e_testado_antes():
+    roteador = _roteador_com_amostras({"mongo": 0.030, "neo4j": 0.010})
+    ordem, criterio = roteador.ordenar("busca", BANCOS)
+    assert ordem[0] == "redis"
+    assert criterio == CRITERIO_POUCAS_AMOSTRAS
+
+
+def test_degradado_fica_por_ultimo(disjuntores_fechados):
+    disjuntores_fechados["neo4j"].estado = ABERTO
+    roteador = _roteador_com_amostras({"mongo": 0.030, "neo4j": 0.001, "redis": 0.020})
+    assert roteador.ordenar("busca", BANCOS) == (["redis", "mongo", "neo4j"], CRITERIO_P95)
+
+
+def test_exploracao_sorteia_outro_banco_saudavel(monkeypatch):
+    roteador = _roteador_com_amostras({"mongo": 0.030, "neo4j": 0.010, "redis": 0.020}, exploracao=0.5)
+    monkeypatch.setattr(roteamento.random, "random", lambda: 0.1)
+    monkeypatch.setattr(roteamento.random, "choice", lambda opcoes: opcoes[-1])
+    ordem, criterio = roteador.ordenar("busca", BANCOS)
+    assert criterio == CRITERIO_EXPLORACAO
+    assert ordem[0] != "neo4j" and sorted(ordem) == sorted(BANCOS)
+
+
+def test_janela_descarta_amostras_antigas():
+    roteador = RoteadorLatencia(janela=3, min_amostras=1, exploracao=0.0)
+    for duracao in (5.0, 5.0, 5.0, 0.1, 0.1, 0.1):
+        roteador.registrar("busca", "mongo", duracao)
+    assert roteador.amostras("busca", "mongo") == 3
+    assert roteador.p95("busca", "mongo") == 0.1
+    assert roteador.p95("busca", "redis") == float("inf")